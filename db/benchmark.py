@@ -0,0 +1,107 @@
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+# consultas do eda1 (load_data) e buscas por coletânea, categoria, número e
+# autor: (antes, depois); antes, o número só com CAST(numero AS int), como na
+# migração 008
+CONSULTAS = {
+    "load_data": (
+        "SELECT hino.id, numero, nome, texto, texto_limpo, categoria_id, "
+        "c.descricao FROM hino LEFT JOIN categoria c ON c.id = categoria_id "
+        "WHERE coletanea_id = 1 ORDER BY hino.id",
+    )
+    * 2,
+    "coletanea": ("SELECT id, numero, nome FROM hino WHERE coletanea_id = 2",) * 2,
+    "categoria": ("SELECT id, numero, nome FROM hino WHERE categoria_id = 5",) * 2,
+    "numero": (
+        "SELECT id, nome FROM hino "
+        "WHERE coletanea_id = 1 AND CAST(numero AS int) = 321",
+        "SELECT id, nome FROM hino WHERE coletanea_id = 1 AND numero_int = 321",
+    ),
+    "faixa": (
+        "SELECT id, nome FROM hino "
+        "WHERE coletanea_id = 1 AND CAST(numero AS int) BETWEEN 57 AND 96",
+        "SELECT id, nome FROM hino "
+        "WHERE coletanea_id = 1 AND numero_int BETWEEN 57 AND 96",
+    ),
+    "hino_autor": ("SELECT autor_id FROM hino_autor WHERE hino_id = 10",) * 2,
+    "autor_hino": ("SELECT hino_id FROM hino_autor WHERE autor_id = 1",) * 2,
+}
+# execuções por medida (as consultas levam menos de 1 ms)
+CONSULTAS_LOOP = 200
+
+
+def time_query(conn, sql, repeat=1):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(CONSULTAS_LOOP):
+            rows = conn.execute(sql).fetchall()
+        elapsed = (time.perf_counter() - start) / CONSULTAS_LOOP
+        best = elapsed if best is None else min(best, elapsed)
+    return rows, best
+
+
+def bench_queries(db, repeat=1):
+    """Compara as consultas num banco sem os índices da migração 012 (e sem
+    numero_int nas consultas) e no banco como está; os resultados têm de ser
+    os mesmos."""
+    tmp = tempfile.mkdtemp()
+    old = os.path.join(tmp, "database.db")
+    shutil.copyfile(db, old)
+    conn = sqlite3.connect(old)
+    indexes = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ).fetchall()
+    for (name,) in indexes:
+        conn.execute(f"DROP INDEX {name}")
+    conn.execute("ANALYZE")
+    conn.commit()
+    new = sqlite3.connect(db)
+    print(f"Benchmarking queries: {db} ({len(indexes)} indexes dropped)")
+
+    ok = True
+    try:
+        for name, (sql_old, sql_new) in CONSULTAS.items():
+            rows_old, time_old = time_query(conn, sql_old, repeat)
+            rows_new, time_new = time_query(new, sql_new, repeat)
+            plan = new.execute(f"EXPLAIN QUERY PLAN {sql_new}").fetchall()
+            print(
+                f"  {name:>10}: {time_old * 1e3:.3f} ms -> {time_new * 1e3:.3f} ms "
+                f"({time_old / time_new:.1f}x, {len(rows_new)} rows; "
+                f"{'; '.join(step[-1] for step in plan)})"
+            )
+            # sem ORDER BY, a ordem depende do plano
+            if sorted(rows_old) != sorted(rows_new):
+                print(f"  {name}: results differ")
+                ok = False
+    finally:
+        conn.close()
+        new.close()
+        os.remove(old)
+        os.rmdir(tmp)
+    return ok
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compara as consultas ao banco sem e com os índices e o "
+        "numero_int da migração 012"
+    )
+    parser.add_argument("--db", default="database.db", help="arquivo do banco")
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not bench_queries(args.db, args.repeat):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
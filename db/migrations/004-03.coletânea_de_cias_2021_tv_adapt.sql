@@ -1,239 +0,0 @@
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('01', 'MEU DEUS, MEU PAI', 'MEU DEUS, MEU PAI,\nA TI CLAMO, MEU SENHOR,\nPELO SANGUE DE JESUS,\nDÁ-ME PAZ E COMUNHÃO.\n\nDÁ-ME PAZ E COMUNHÃO.\nBIS', 'MEU DEUS, MEU PAI, A TI CLAMO, MEU SENHOR, PELO SANGUE DE JESUS, DÁ-ME PAZ E COMUNHÃO. DÁ-ME PAZ E COMUNHÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('02', 'PAI, ESTOU A TE CLAMAR', 'PAI, ESTOU A TE CLAMAR,\nPEDINDO PERDÃO, SOCORRO,\nEU QUERO TE OUVIR.\n\nPAI, ENSINA-ME A ADORAR\nE A GLORIFICAR TEU NOME,\nEU QUERO TE AMAR.\n\nPAI, EU QUERO TE SERVIR,\nOH! DÁ-ME DA TUA GRAÇA\nE ME BASTARÁ, E ME BASTARÁ,\nE ME BASTARÁ.', 'PAI, ESTOU A TE CLAMAR, PEDINDO PERDÃO, SOCORRO, EU QUERO TE OUVIR. PAI, ENSINA-ME A ADORAR E A GLORIFICAR TEU NOME, EU QUERO TE AMAR. PAI, EU QUERO TE SERVIR, OH! DÁ-ME DA TUA GRAÇA E ME BASTARÁ, E ME BASTARÁ, E ME BASTARÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('03', 'CLAMO, Ó SENHOR, POR TEU SANGUE', 'CLAMO, Ó SENHOR, POR TEU SANGUE, (2X)\nSANGUE QUE POR MIM FOI VERTIDO,\nSANGUE DE UMA NOVA ALIANÇA.\n\nSENHOR, DERRAMA TEU SANGUE \nSOBRE MIM, Ó SENHOR.\nBIS', 'CLAMO, Ó SENHOR, POR TEU SANGUE, SANGUE QUE POR MIM FOI VERTIDO, SANGUE DE UMA NOVA ALIANÇA. SENHOR, DERRAMA TEU SANGUE SOBRE MIM, Ó SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('04', 'CLAMO, Ó SENHOR', 'CLAMO, Ó SENHOR, \nPELO SANGUE DE JESUS,\nNA TUA PRESENÇA LIMPO QUERO ESTAR,\nE SÓ LAVADO NESTE SANGUE\nNO SANTO DOS SANTOS POSSO ENTRAR.\n\nLAVA-ME, SENHOR,\nVISITA-ME, SENHOR, \nCOM O ESPÍRITO SANTO,\nO CONSOLADOR.\nTEREI PLENA COMUNHÃO\nE A TUA PROTEÇÃO.\n\nE A TUA PROTEÇÃO.\nE A TUA PROTEÇÃO.\nBIS', 'CLAMO, Ó SENHOR, PELO SANGUE DE JESUS, NA TUA PRESENÇA LIMPO QUERO ESTAR, E SÓ LAVADO NESTE SANGUE NO SANTO DOS SANTOS POSSO ENTRAR. LAVA-ME, SENHOR, VISITA-ME, SENHOR, COM O ESPÍRITO SANTO, O CONSOLADOR. TEREI PLENA COMUNHÃO E A TUA PROTEÇÃO. E A TUA PROTEÇÃO. E A TUA PROTEÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('05', 'ESTOU AQUI PRA CONFESSAR', 'ESTOU AQUI PRA CONFESSAR\nA TI OS MEUS PECADOS,\nPRECISO DO TEU PERDÃO,\nDA TUA COMUNHÃO.\n\nESTOU AQUI PRA TE PEDIR:\nLIMPA MEU CORAÇÃO,\nCOMO A BRANCA LÃ\nTORNA-O, SENHOR.\n\nSUSTENTA-ME EM TUAS MÃOS, JESUS,\nPROTEGIDO EM TEUS BRAÇOS QUERO ESTAR;\nESCONDE-ME DE TODA A MALDADE\nE SEMPRE CONTIGO VOU ANDAR. (BIS)', 'ESTOU AQUI PRA CONFESSAR A TI OS MEUS PECADOS, PRECISO DO TEU PERDÃO, DA TUA COMUNHÃO. ESTOU AQUI PRA TE PEDIR: LIMPA MEU CORAÇÃO, COMO A BRANCA LÃ TORNA-O, SENHOR. SUSTENTA-ME EM TUAS MÃOS, JESUS, PROTEGIDO EM TEUS BRAÇOS QUERO ESTAR; ESCONDE-ME DE TODA A MALDADE E SEMPRE CONTIGO VOU ANDAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('06', 'PERDOA-ME, SENHOR', 'PERDOA-ME, SENHOR\nCLAMO PELO SANGUE DE JESUS\nQUERO RENOVAR\nA MINHA COMUNHÃO.\nPERDOA-ME, SENHOR,\nQUERO DEPOSITAR O MEU CORAÇÃO\nSEMPRE EM TEU ALTAR.\n\nVISITA-ME COM O TEU ESPÍRITO\nE FAZE-ME HABITAR\nAO TEU LADO ETERNAMENTE!', 'PERDOA-ME, SENHOR CLAMO PELO SANGUE DE JESUS QUERO RENOVAR A MINHA COMUNHÃO. PERDOA-ME, SENHOR, QUERO DEPOSITAR O MEU CORAÇÃO SEMPRE EM TEU ALTAR. VISITA-ME COM O TEU ESPÍRITO E FAZE-ME HABITAR AO TEU LADO ETERNAMENTE!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('07', 'É TEU SANGUE, MEU SENHOR JESUS', 'É TEU SANGUE, MEU SENHOR JESUS,\nQUE GARANTE A NOSSA COMUNHÃO.\nÉ TEU SANGUE, MEU SENHOR JESUS,\nQUE NOS TRAZ LIBERTAÇÃO.\n\nPOR ISSO VOU CLAMARE O SENHOR VAI ME \nPURIFICAR, E PRONTO \nESTAREI PRA SERVIR NA \nCASA DO MEU REI!\nBIS', 'É TEU SANGUE, MEU SENHOR JESUS, QUE GARANTE A NOSSA COMUNHÃO. É TEU SANGUE, MEU SENHOR JESUS, QUE NOS TRAZ LIBERTAÇÃO. POR ISSO VOU CLAMARE O SENHOR VAI ME PURIFICAR, E PRONTO ESTAREI PRA SERVIR NA CASA DO MEU REI!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('08', 'DIANTE DO TEU ALTAR', 'DIANTE DO TEU ALTAR, SENHOR,\nOS MEUS JOELHOS VOU DOBRAR\nE POR TEU SANGUE VOU CLAMAR,\nPEDINDO: VEM PURIFICAR\nO MEU CORAÇÃO,QUE ESPERA \nEM TI COM GRATIDÃO!\n\nCORO\nEU CLAMO PELA VIDA,\nA VIDA QUE HÁ EM TI, JESUS!\nPELO PODER DO SANGUE \nVERTIDO NA CRUZ!\nEU CLAMO PELA VIDA\nA VIDA QUE HÁ EM TI, JESUS!\nPELO PODER DO SANGUE\nVERTIDO NA CRUZ!\n\nDIANTE DO TEU ALTAR, SENHOR,\nOS MEUS JOELHOS VOU DOBRAR\nE POR TEU SANGUE VOU CLAMAR,\nPEDINDO: VEM PURIFICAR\nO MEU CORAÇÃO,QUE ESPERA \nEM TI COM GRATIDÃO!\n\nCORO\nEU CLAMO PELA VIDA,\nA VIDA QUE HÁ EM TI, JESUS!\nPELO PODER DO SANGUE \nVERTIDO NA CRUZ!\nEU CLAMO PELA VIDA\nA VIDA QUE HÁ EM TI, JESUS!\nPELO PODER DO SANGUE\nVERTIDO NA CRUZ!', 'DIANTE DO TEU ALTAR, SENHOR, OS MEUS JOELHOS VOU DOBRAR E POR TEU SANGUE VOU CLAMAR, PEDINDO: VEM PURIFICAR O MEU CORAÇÃO,QUE ESPERA EM TI COM GRATIDÃO! EU CLAMO PELA VIDA, A VIDA QUE HÁ EM TI, JESUS! PELO PODER DO SANGUE VERTIDO NA CRUZ! EU CLAMO PELA VIDA A VIDA QUE HÁ EM TI, JESUS! PELO PODER DO SANGUE VERTIDO NA CRUZ! DIANTE DO TEU ALTAR, SENHOR, OS MEUS JOELHOS VOU DOBRAR E POR TEU SANGUE VOU CLAMAR, PEDINDO: VEM PURIFICAR O MEU CORAÇÃO,QUE ESPERA EM TI COM GRATIDÃO! EU CLAMO PELA VIDA, A VIDA QUE HÁ EM TI, JESUS! PELO PODER DO SANGUE VERTIDO NA CRUZ! EU CLAMO PELA VIDA A VIDA QUE HÁ EM TI, JESUS! PELO PODER DO SANGUE VERTIDO NA CRUZ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('09', 'DOBRO OS MEUS JOELHOS', 'DOBRO OS MEUS JOELHOS PARA A TI CLAMAR, SENHOR,\nTOCA O MEU INTERIOR, TOCA-ME, SENHOR,\nDIANTE DE TI ESTOU PARA TE ADORAR;\nGUIA-ME, SENHOR, PELO TEU AMOR,\nPAZ E SEGURANÇA QUERO TER\nCOM JESUS, MEU SENHOR\n\nDOBRO OS MEUS JOELHOS PARA A TI CLAMAR, SENHOR,\nTOCA O MEU INTERIOR, TOCA-ME, SENHOR,\nDIANTE DE TI ESTOU PARA TE ADORAR;\nGUIA-ME, SENHOR, PELO TEU AMOR,\nPAZ E SEGURANÇA QUERO TER \nCOM JESUS.\n\nFINAL:\nGUIA-ME, SENHOR, PELO TEU AMOR,\nPAZ E SEGURANÇA QUERO TER\nCOM JESUS, MEU SENHOR.', 'DOBRO OS MEUS JOELHOS PARA A TI CLAMAR, SENHOR, TOCA O MEU INTERIOR, TOCA-ME, SENHOR, DIANTE DE TI ESTOU PARA TE ADORAR; GUIA-ME, SENHOR, PELO TEU AMOR, PAZ E SEGURANÇA QUERO TER COM JESUS, MEU SENHOR DOBRO OS MEUS JOELHOS PARA A TI CLAMAR, SENHOR, TOCA O MEU INTERIOR, TOCA-ME, SENHOR, DIANTE DE TI ESTOU PARA TE ADORAR; GUIA-ME, SENHOR, PELO TEU AMOR, PAZ E SEGURANÇA QUERO TER COM JESUS. GUIA-ME, SENHOR, PELO TEU AMOR, PAZ E SEGURANÇA QUERO TER COM JESUS, MEU SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('10', 'CLAMA, Ó IGREJA', 'CLAMA, Ó IGREJA,\nCLAMA PELO SANGUE DE JESUS.\nNESTE SANGUE HÁ PODER,\nVIDA, PAZ, LIBERTAÇÃO,\nNESTE SANGUE PODEROSO HÁ PERDÃO.\n\nFINAL:\nNESSE SANGUE PODEROSO HÁ PERDÃO\nBIS', 'CLAMA, Ó IGREJA, CLAMA PELO SANGUE DE JESUS. NESTE SANGUE HÁ PODER, VIDA, PAZ, LIBERTAÇÃO, NESTE SANGUE PODEROSO HÁ PERDÃO. NESSE SANGUE PODEROSO HÁ PERDÃO', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('11', 'CLAMO A TI, MEU SENHOR E PAI  (UMA NOVA CANÇÃO)', 'CLAMO A TI, MEU SENHOR E PAI \nE PROSTRADO AOS TEUS PÉS PEÇO\nPERDÃO. CLAMO PELO SANGUE DE\nJESUS SOBRE MIM E COM LOUVORES\nE CÂNTICOS TE ADORAREI. A TUA\nGRAÇA SEJA SOBRE MIM, MEU SENHOR, \nA TUA LUZ RESPLANDEÇA EM MIM.\n\nCOLOCA NOS MEUS LÁBIOS UMA NOVA\nCANÇÃO, UM HINO DE LOUVOR A DEUS\nPAI, A DEUS PAI. \nE PROSTRADO AOS TEUS PÉS\nEM PLENA COMUNHÃO, MEU\nSENHOR, RENOVA TEU ESPÍRITO\nSOBRE MIM. SOBRE NÓS.\nBIS', 'CLAMO A TI, MEU SENHOR E PAI E PROSTRADO AOS TEUS PÉS PEÇO PERDÃO. CLAMO PELO SANGUE DE JESUS SOBRE MIM E COM LOUVORES E CÂNTICOS TE ADORAREI. A TUA GRAÇA SEJA SOBRE MIM, MEU SENHOR, A TUA LUZ RESPLANDEÇA EM MIM. COLOCA NOS MEUS LÁBIOS UMA NOVA CANÇÃO, UM HINO DE LOUVOR A DEUS PAI, A DEUS PAI. E PROSTRADO AOS TEUS PÉS EM PLENA COMUNHÃO, MEU SENHOR, RENOVA TEU ESPÍRITO SOBRE MIM. SOBRE NÓS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('10', 'PERDOA-ME, SENHOR SEGUNDO O SEU AMOR', 'PERDOA-ME SENHOR, SEGUNDO O\nSEU AMOR, LAVA-ME COM O SANGUE\nDE JESUS E ENVIA A TUA LUZ.\nPURIFICA-ME SENHOR, COM O SANGUE\nDE JESUS NOVA CRIATURA EM TI EU\nSOU PRONTO PARA O TEU LOUVOR.\n\nPOSSO AGORA TE ADORAR,\nPOSSO TE GLORIFICAR,\nMEU CORAÇÃO LIBERTO ESTÁ\nCHEIO DE ALEGRIA E PAZ.\nBIS', 'PERDOA-ME SENHOR, SEGUNDO O SEU AMOR, LAVA-ME COM O SANGUE DE JESUS E ENVIA A TUA LUZ. PURIFICA-ME SENHOR, COM O SANGUE DE JESUS NOVA CRIATURA EM TI EU SOU PRONTO PARA O TEU LOUVOR. POSSO AGORA TE ADORAR, POSSO TE GLORIFICAR, MEU CORAÇÃO LIBERTO ESTÁ CHEIO DE ALEGRIA E PAZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('13', 'PURIFICADO COM SANGUE ESTOU', 'PURIFICADO COM SANGUE ESTOU,\nQUAL NEVE ME TORNOU;\nÁGUA DA VIDA EM JESUS BEBI, SATISFEITO ME SENTI. PARA JESUS, LÁ NA CRUZ, EU OLHEI,\nE O MEU FARDO AO CHÃO DEIXEI;\nCANTANDO VOU: GLÓRIA AO SENHOR! \nGLÓRIA A CRISTO, NOSSO DEUS!\nBIS', 'PURIFICADO COM SANGUE ESTOU, QUAL NEVE ME TORNOU; ÁGUA DA VIDA EM JESUS BEBI, SATISFEITO ME SENTI. PARA JESUS, LÁ NA CRUZ, EU OLHEI, E O MEU FARDO AO CHÃO DEIXEI; CANTANDO VOU: GLÓRIA AO SENHOR! GLÓRIA A CRISTO, NOSSO DEUS!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('14', 'TE SUPLICO, Ó DEUS, EM ORAÇÃO', 'TE SUPLICO, Ó DEUS, EM ORAÇÃO.\nPOIS DESEJO DE TODO O CORAÇÃO\nENTENDER A TUA PALAVRA, \nTER SABEDORIA E TEMOR\nPARA PRESERVAR-ME \nNO TEU CAMINHO, SENHOR.\n\nCOMO PRATA E COMO O OURO BUSCAREI,\nCOMO UM TESOURO ESCONDIDO, PROCURAREI;\nA TUA PALAVRA ENTRARÁ EM MEU CORAÇÃO\nDANDO-ME A LEVEZA DO PERDÃO,\nOS TEUS MANDAMENTOS SUAVES \nSERÃO E UM LOUVOR DE GRATIDÃO \nENTOAREI A TI, SENHOR.\nBIS', 'TE SUPLICO, Ó DEUS, EM ORAÇÃO. POIS DESEJO DE TODO O CORAÇÃO ENTENDER A TUA PALAVRA, TER SABEDORIA E TEMOR PARA PRESERVAR-ME NO TEU CAMINHO, SENHOR. COMO PRATA E COMO O OURO BUSCAREI, COMO UM TESOURO ESCONDIDO, PROCURAREI; A TUA PALAVRA ENTRARÁ EM MEU CORAÇÃO DANDO-ME A LEVEZA DO PERDÃO, OS TEUS MANDAMENTOS SUAVES SERÃO E UM LOUVOR DE GRATIDÃO ENTOAREI A TI, SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('15', 'JESUS VEM ME ABENÇOAR', 'JESUS, VEM ME ABENÇOAR,\nSENTIR A TUA FACE.\nJESUS, VEM FICAR PERTINHO,\nDAS CRIANÇAS VEM CUIDAR.\n\nJESUS É MEU, (3X)\nÉ ELE QUEM CUIDA DE MIM.\nBIS', 'JESUS, VEM ME ABENÇOAR, SENTIR A TUA FACE. JESUS, VEM FICAR PERTINHO, DAS CRIANÇAS VEM CUIDAR. JESUS É MEU, É ELE QUEM CUIDA DE MIM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('16', 'PAI CELESTE', 'PAI CELESTE, PAI CELESTE,\nVEM FICAR COMIGO,\nPAI CELESTE.\n\nJESUS CRISTO, JESUS CRISTO,\nVEM FICAR COMIGO,\nJESUS CRISTO.\n\nSANTO ESPÍRITO, SANTO ESPÍRITO,\nVEM FICAR COMIGO, SANTO ESPÍRITO.', 'PAI CELESTE, PAI CELESTE, VEM FICAR COMIGO, PAI CELESTE. JESUS CRISTO, JESUS CRISTO, VEM FICAR COMIGO, JESUS CRISTO. SANTO ESPÍRITO, SANTO ESPÍRITO, VEM FICAR COMIGO, SANTO ESPÍRITO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('17', 'QUANDO FALO COM DEUS', 'QUANDO FALO COM DEUS AS LÁGRIMAS CORREM,\nA SUA PRESENÇA ME ENVOLVE TÃO FORTE,\nEM PAZ ME DEITO, PEGO NO SONO,\nPOIS EM SEUS BRAÇOS EU DESCANSO;\nBEM CEDO ACORDO E ME LEVANTO,\nPOIS SEI QUE JESUS ME SUSTENTOU.\n\nINSTRUMENTOS\n\nQUANDO FALO COM DEUS A LUZ ME ENVOLVE,\nTRANSPORTO PARA A ETERNIDADE,\nESTOU NO PLANO DE DEUS;\nPEÇO TODO DIA AO MEU SENHOR\nQUE SALVE A MINHA FAMÍLIA\nPRA JUNTOS LOUVARMOS\nAO BOM PASTOR\nQUE CUIDA DE NÓS COM AMOR. (BIS)', 'QUANDO FALO COM DEUS AS LÁGRIMAS CORREM, A SUA PRESENÇA ME ENVOLVE TÃO FORTE, EM PAZ ME DEITO, PEGO NO SONO, POIS EM SEUS BRAÇOS EU DESCANSO; BEM CEDO ACORDO E ME LEVANTO, POIS SEI QUE JESUS ME SUSTENTOU. QUANDO FALO COM DEUS A LUZ ME ENVOLVE, TRANSPORTO PARA A ETERNIDADE, ESTOU NO PLANO DE DEUS; PEÇO TODO DIA AO MEU SENHOR QUE SALVE A MINHA FAMÍLIA PRA JUNTOS LOUVARMOS AO BOM PASTOR QUE CUIDA DE NÓS COM AMOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('18', 'BUSCAI AO SENHOR', 'BUSCAI AO SENHOR \nENQUANTO SE PODE ACHAR,\nINVOCAI-O ENQUANTO ESTÁ PERTO.    \nBUSCAI AO SENHOR \nENQUANTO SE PODE ACHAR,\nINVOCAI-O ENQUANTO ESTÁ PERTO.\n\nDEIXE O ÍMPIO O SEU CAMINHO,\nE O HOMEM MALIGNO OS SEUS PENSAMENTOS\nE SE CONVERTA AO SENHOR,\nQUE DELE SE COMPADECERÁ;\nTORNE PARA O NOSSO DEUS,\nPORQUE GRANDIOSO É EM PERDOAR.\n\nBUSCAI AO SENHOR \nENQUANTO SE PODE ACHAR,\nINVOCAI-O ENQUANTO ESTÁ PERTO.    \nBUSCAI AO SENHOR \nENQUANTO SE PODE ACHAR,\nINVOCAI-O ENQUANTO ESTÁ PERTO.', 'BUSCAI AO SENHOR ENQUANTO SE PODE ACHAR, INVOCAI-O ENQUANTO ESTÁ PERTO. BUSCAI AO SENHOR ENQUANTO SE PODE ACHAR, INVOCAI-O ENQUANTO ESTÁ PERTO. DEIXE O ÍMPIO O SEU CAMINHO, E O HOMEM MALIGNO OS SEUS PENSAMENTOS E SE CONVERTA AO SENHOR, QUE DELE SE COMPADECERÁ; TORNE PARA O NOSSO DEUS, PORQUE GRANDIOSO É EM PERDOAR. BUSCAI AO SENHOR ENQUANTO SE PODE ACHAR, INVOCAI-O ENQUANTO ESTÁ PERTO. BUSCAI AO SENHOR ENQUANTO SE PODE ACHAR, INVOCAI-O ENQUANTO ESTÁ PERTO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('19', 'QUANDO DAVI AO SENHOR ORAVA', 'QUANDO DAVI AO SENHOR ORAVA\nPRA JERUSALÉM ESTAVA O SEU OLHAR,\nPORQUE ELE SABIA QUE EM JERUSALÉM\nO NOME DO SENHOR FIRMADO ESTÁ.\n\nIGUAL DAVI, TAMBEM VOU ORAR\nOLHANDO PRA JERUSALÉM CELESTIAL,\nA CIDADE DE MEU REI E SENHOR,\nQUE DO SEU TRONO IRÁ RESPONDER\nÀ ORAÇÃO DE SEU SERVO FIEL.\n\nEU VOU ORAR, EU VOU ORAR,\nPORQUE EU SEI \nQUE MEU SENHOR VAI ME ESCUTAR\n\nEU VOU ORAR, EU VOU ORAR,\nPORQUE EU SEI \nQUE MEU SENHOR VAI ME ESCUTAR\n\nQUANDO DAVI AO SENHOR ORAVA\nPRA JERUSALÉM ESTAVA O SEU OLHAR,\nPORQUE ELE SABIA QUE EM JERUSALÉM\nO NOME DO SENHOR FIRMADO ESTÁ.\n\nIGUAL DAVI, TAMBEM VOU ORAR\nOLHANDO PRA JERUSALÉM CELESTIAL,\nA CIDADE DE MEU REI E SENHOR,\nQUE DO SEU TRONO IRÁ RESPONDER\nÀ ORAÇÃO DE SEU SERVO FIEL.\n\nEU VOU ORAR, EU VOU ORAR,\nPORQUE EU SEI \nQUE MEU SENHOR VAI ME ESCUTAR\n\nEU VOU ORAR, EU VOU ORAR,\nPORQUE EU SEI \nQUE MEU SENHOR VAI ME ESCUTAR', 'QUANDO DAVI AO SENHOR ORAVA PRA JERUSALÉM ESTAVA O SEU OLHAR, PORQUE ELE SABIA QUE EM JERUSALÉM O NOME DO SENHOR FIRMADO ESTÁ. IGUAL DAVI, TAMBEM VOU ORAR OLHANDO PRA JERUSALÉM CELESTIAL, A CIDADE DE MEU REI E SENHOR, QUE DO SEU TRONO IRÁ RESPONDER À ORAÇÃO DE SEU SERVO FIEL. EU VOU ORAR, EU VOU ORAR, PORQUE EU SEI QUE MEU SENHOR VAI ME ESCUTAR EU VOU ORAR, EU VOU ORAR, PORQUE EU SEI QUE MEU SENHOR VAI ME ESCUTAR QUANDO DAVI AO SENHOR ORAVA PRA JERUSALÉM ESTAVA O SEU OLHAR, PORQUE ELE SABIA QUE EM JERUSALÉM O NOME DO SENHOR FIRMADO ESTÁ. IGUAL DAVI, TAMBEM VOU ORAR OLHANDO PRA JERUSALÉM CELESTIAL, A CIDADE DE MEU REI E SENHOR, QUE DO SEU TRONO IRÁ RESPONDER À ORAÇÃO DE SEU SERVO FIEL. EU VOU ORAR, EU VOU ORAR, PORQUE EU SEI QUE MEU SENHOR VAI ME ESCUTAR EU VOU ORAR, EU VOU ORAR, PORQUE EU SEI QUE MEU SENHOR VAI ME ESCUTAR', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('20', 'QUANDO ORO AO SENHOR', 'QUANDO ORO AO SENHOR\nSINTO PAZ EM MEU CORAÇÃO.\nSUA PRESENÇA É TÃO REAL,\nSUA GRAÇA ME SATISFAZ.\n\nPORQUE JESUS POR MIM MORREU\nE VIVO ESTÁ A INTERCEDER AO PAI POR MIM.\nPOSSO ENTÃO DESCANSAR,\nPORQUE EU SEI QUE O SENHOR\nTODO BEM FARÁ PRA MIM.\n\nFINAL: TODO BEM FARÁ PRA MIM.\nBIS', 'QUANDO ORO AO SENHOR SINTO PAZ EM MEU CORAÇÃO. SUA PRESENÇA É TÃO REAL, SUA GRAÇA ME SATISFAZ. PORQUE JESUS POR MIM MORREU E VIVO ESTÁ A INTERCEDER AO PAI POR MIM. POSSO ENTÃO DESCANSAR, PORQUE EU SEI QUE O SENHOR TODO BEM FARÁ PRA MIM. TODO BEM FARÁ PRA MIM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('21', 'SANTO, JUSTO, PRÍNCIPE DA VIDA', 'SANTO, JUSTO, PRÍNCIPE DA VIDA. \nFILHO DE DEUS, JESUS, EMANUEL. \nHOJE ESTÁ AQUI PARA LIBERTAR \nE ATRAVÉS DO SEU SANGUE\nENTRAMOS DIANTE DO PAI.\nBIS', 'SANTO, JUSTO, PRÍNCIPE DA VIDA. FILHO DE DEUS, JESUS, EMANUEL. HOJE ESTÁ AQUI PARA LIBERTAR E ATRAVÉS DO SEU SANGUE ENTRAMOS DIANTE DO PAI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('22', 'FAZE ORAÇÃO', 'FAZE ORAÇÃO BEM CEDINHO,\nAO MEIO DIA, SIM, TAMBÉM;\nFAZE ORAÇÃO À NOITINHA, \nQUE É DEUS QUE TE SUSTÉM.\n\nJÁ DE MANHÃ DEUS ESCUTA,\nAO MEIO DIA, SIM, TAMBÉM;\nMESMO TE VÊ A NOITINHA, \nDE TUDO TE SUSTÉM.\n\nJÁ DE MANHÃ DEUS RESPONDE,\nAO MEIO DIA, SIM, TAMBÉM;\nFAZE ORAÇÃO À NOITINHA, \nPOIS ELE LOGO VEM.', 'FAZE ORAÇÃO BEM CEDINHO, AO MEIO DIA, SIM, TAMBÉM; FAZE ORAÇÃO À NOITINHA, QUE É DEUS QUE TE SUSTÉM. JÁ DE MANHÃ DEUS ESCUTA, AO MEIO DIA, SIM, TAMBÉM; MESMO TE VÊ A NOITINHA, DE TUDO TE SUSTÉM. JÁ DE MANHÃ DEUS RESPONDE, AO MEIO DIA, SIM, TAMBÉM; FAZE ORAÇÃO À NOITINHA, POIS ELE LOGO VEM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('23', 'QUANDO ISRAEL SAIU DO EGITO', 'QUANDO ISRAEL SAIU DO EGITO,\nISRAEL CANTOU, CANTOU:\nO SENHOR É A MINHA FORÇA.\n\nELE ME FOI POR SALVAÇÃO,\nESTE É O MEU DEUS,\nLHE FAREI UMA HABITAÇÃO.\n\nAO SENHOR TAMBÉM LOUVAREI\nPORQUE É A MINHA SALVAÇÃO,\nMEU REFÚGIO, MINHA FORTALEZA,\nLHE FAREI UMA HABITAÇÃO\nNO MEU CORAÇÃO.\nINSTRUMENTOS\n\nQUANDO ISRAEL SAIU DO EGITO,\nISRAEL CANTOU, CANTOU:\nO SENHOR É A MINHA FORÇA.\n\nELE ME FOI POR SALVAÇÃO,\nESTE É O MEU DEUS,\nLHE FAREI UMA HABITAÇÃO.\n\nAO SENHOR TAMBÉM LOUVAREI\nPORQUE É A MINHA SALVAÇÃO,\nMEU REFÚGIO, MINHA FORTALEZA,\nLHE FAREI UMA HABITAÇÃO\nNO MEU CORAÇÃO.\n\nQUANDO ISRAEL SAIU DO EGITO,\nISRAEL CANTOU, CANTOU:\nO SENHOR É A MINHA FORÇA.', 'QUANDO ISRAEL SAIU DO EGITO, ISRAEL CANTOU, CANTOU: O SENHOR É A MINHA FORÇA. ELE ME FOI POR SALVAÇÃO, ESTE É O MEU DEUS, LHE FAREI UMA HABITAÇÃO. AO SENHOR TAMBÉM LOUVAREI PORQUE É A MINHA SALVAÇÃO, MEU REFÚGIO, MINHA FORTALEZA, LHE FAREI UMA HABITAÇÃO NO MEU CORAÇÃO. QUANDO ISRAEL SAIU DO EGITO, ISRAEL CANTOU, CANTOU: O SENHOR É A MINHA FORÇA. ELE ME FOI POR SALVAÇÃO, ESTE É O MEU DEUS, LHE FAREI UMA HABITAÇÃO. AO SENHOR TAMBÉM LOUVAREI PORQUE É A MINHA SALVAÇÃO, MEU REFÚGIO, MINHA FORTALEZA, LHE FAREI UMA HABITAÇÃO NO MEU CORAÇÃO. QUANDO ISRAEL SAIU DO EGITO, ISRAEL CANTOU, CANTOU: O SENHOR É A MINHA FORÇA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('24', 'UMA OVELHINHA DE JESUS EU SOU', 'UMA OVELHINHA DE JESUS EU SOU,\nSEMPRE ESTÁ COMIGO, É MEU BOM PASTOR;\nME MOSTRA O CAMINHO EM QUE DEVO ANDAR,\nÉ MEU AMADO SALVADOR.\n\nME LIVRA DO PERIGO, ESTENDE O SEU CAJADO,\nÉ MEU MELHOR AMIGO, DO MAL ESTOU GUARDADO;\nEM TODA A MINHA VIDA EU O AMAREI\nE PARA SEMPRE VIVEREI COM JESUS.\n\nE PARA SEMPRE VIVEREI COM JESUS.', 'UMA OVELHINHA DE JESUS EU SOU, SEMPRE ESTÁ COMIGO, É MEU BOM PASTOR; ME MOSTRA O CAMINHO EM QUE DEVO ANDAR, É MEU AMADO SALVADOR. ME LIVRA DO PERIGO, ESTENDE O SEU CAJADO, É MEU MELHOR AMIGO, DO MAL ESTOU GUARDADO; EM TODA A MINHA VIDA EU O AMAREI E PARA SEMPRE VIVEREI COM JESUS. E PARA SEMPRE VIVEREI COM JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('25', 'ONDE QUER QUE TU FORES IREI, JESUS', 'ONDE QUER QUE TU FORES IREI, JESUS,\nA TI MINHA ALMA JÁ DEI;\nSOU PARTE DO TEU CORPO,\nPERTENÇO AO TEU POVO,\nTU ÉS MEU REMIDOR.\n\nCORO\nA TUA PALAVRA ALIMENTA A ALMA DO PECADOR,\nCOLHEMOS EM TEU CAMPO, TRIGO, Ó SENHOR,\nDELÍCIAS EM TUA MESA E CÂNTICOS DE LOUVOR;\nALEGRO-ME CONTIGO, TU ÉS MEU REMIDOR.\n\nAJOELHO-ME A TEUS PÉS, AGRADEÇO A SALVAÇÃO\nQUE DE GRAÇA RECEBI, MEU SENHOR;\nTUA VOZ É PODEROSA,\nORDENAS BÊNÇÃOS PARA MIM\nE ME CONFORTAS NOS TEUS BRAÇOS DE AMOR.\n\nCORO\nA TUA PALAVRA ALIMENTA A ALMA DO PECADOR,\nCOLHEMOS EM TEU CAMPO, TRIGO, Ó SENHOR,\nDELÍCIAS EM TUA MESA E CÂNTICOS DE LOUVOR;\nALEGRO-ME CONTIGO, TU ÉS MEU REMIDOR.', 'ONDE QUER QUE TU FORES IREI, JESUS, A TI MINHA ALMA JÁ DEI; SOU PARTE DO TEU CORPO, PERTENÇO AO TEU POVO, TU ÉS MEU REMIDOR. A TUA PALAVRA ALIMENTA A ALMA DO PECADOR, COLHEMOS EM TEU CAMPO, TRIGO, Ó SENHOR, DELÍCIAS EM TUA MESA E CÂNTICOS DE LOUVOR; ALEGRO-ME CONTIGO, TU ÉS MEU REMIDOR. AJOELHO-ME A TEUS PÉS, AGRADEÇO A SALVAÇÃO QUE DE GRAÇA RECEBI, MEU SENHOR; TUA VOZ É PODEROSA, ORDENAS BÊNÇÃOS PARA MIM E ME CONFORTAS NOS TEUS BRAÇOS DE AMOR. A TUA PALAVRA ALIMENTA A ALMA DO PECADOR, COLHEMOS EM TEU CAMPO, TRIGO, Ó SENHOR, DELÍCIAS EM TUA MESA E CÂNTICOS DE LOUVOR; ALEGRO-ME CONTIGO, TU ÉS MEU REMIDOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('26', 'EU SOU UMA OVELHINHA', 'EU SOU UMA OVELHINHA DE JESUS,\nEU SOU UMA OVELHINHA DE JESUS.\nJESUS É O BOM PASTOR,\nJESUS CUIDA DE MIM.\nEU SOU UMA OVELHINHA\nDO SENHOR.\n\nBEM CEDO, AO LEVANTAR, EU VOU ORAR,\nAGRADECER A NOITE QUE ME DEU;\nEU LOUVO COM AMOR\nE DIGO SEMPRE ASSIM:\nEU SOU UM PEQUENINO DO SENHOR,\nEU SOU UM PEQUENINO DO SENHOR.', 'EU SOU UMA OVELHINHA DE JESUS, EU SOU UMA OVELHINHA DE JESUS. JESUS É O BOM PASTOR, JESUS CUIDA DE MIM. EU SOU UMA OVELHINHA DO SENHOR. BEM CEDO, AO LEVANTAR, EU VOU ORAR, AGRADECER A NOITE QUE ME DEU; EU LOUVO COM AMOR E DIGO SEMPRE ASSIM: EU SOU UM PEQUENINO DO SENHOR, EU SOU UM PEQUENINO DO SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('27', 'ELE É A RAIZ DE DAVI', 'ELE É A RAIZ, A RAIZ DE DAVI,\nELE É O LEÃO, O LEÃO DE JUDÁ,\nELE É A RAIZ, A RAIZ DE DAVI,\nMARAVILHOSO, CONSELHEIRO, \nPRÍNCIPE DA PAZ.\n\nE AGORA QUAL É A RAZÃO DA MINHA FÉ?\n(EU VOU DIZER)\nSIM, CRISTO, MEU AMADO SALVADOR.\n\nFINAL: SIM, CRISTO, MEU AMADO SALVADOR.\nBIS', 'ELE É A RAIZ, A RAIZ DE DAVI, ELE É O LEÃO, O LEÃO DE JUDÁ, ELE É A RAIZ, A RAIZ DE DAVI, MARAVILHOSO, CONSELHEIRO, PRÍNCIPE DA PAZ. E AGORA QUAL É A RAZÃO DA MINHA FÉ? (EU VOU DIZER) SIM, CRISTO, MEU AMADO SALVADOR. SIM, CRISTO, MEU AMADO SALVADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('28', 'SOU UMA CRIANÇA FELIZ', 'SOU UMA CRIANÇA FELIZ\nPORQUE TENHO JESUS EM MEU CORAÇÃO,\nCOMO PROVA DESTE AMOR TÃO GRANDE\nEU CANTO AO MEU SENHOR\nUMA NOVA CANÇÃO.\n\nCORO \nUMA CANÇÃO DE AMOR\nQUE EXPRESSA A MINHA GRATIDÃO,\nOH! QUERIDO SALVADOR,\nPELA GRANDE SALVAÇÃO.\nBIS\n\nJESUS, TU ÉS MELHOR QUE TUDO\nO QUE EXISTE DE MAIS PRECIOSO,\nNADA PODE SE COMPARAR A ESTE AMOR\nQUE FLUI DE UM DEUS TÃO MARAVILHOSO.\n\nCORO \nUMA CANÇÃO DE AMOR\nQUE EXPRESSA A MINHA GRATIDÃO,\nOH! QUERIDO SALVADOR,\nPELA GRANDE SALVAÇÃO.\nBIS', 'SOU UMA CRIANÇA FELIZ PORQUE TENHO JESUS EM MEU CORAÇÃO, COMO PROVA DESTE AMOR TÃO GRANDE EU CANTO AO MEU SENHOR UMA NOVA CANÇÃO. JESUS, TU ÉS MELHOR QUE TUDO O QUE EXISTE DE MAIS PRECIOSO, NADA PODE SE COMPARAR A ESTE AMOR QUE FLUI DE UM DEUS TÃO MARAVILHOSO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('29', 'JESUS, QUANDO ME LEMBRO', 'JESUS, QUANDO ME LEMBRO\nDO DIA EM QUE A TI ME ENTREGUEI,\nLEMBRO DO CALOR QUE SENTIA\nE DO AMOR QUE ME INVADIA,\nLEMBRO QUE A PALAVRA ABRIA\nE TUA VOZ OUVIA DIZER:\n\n“VINDE A MIM,\nOS CANSADOS E OPRIMIDOS,\nE EU VOS ALIVIAREI.\nVINDE A MIM,\nOS CANSADOS E OPRIMIDOS,\nE EU VOS ALIVIAREI.”', 'JESUS, QUANDO ME LEMBRO DO DIA EM QUE A TI ME ENTREGUEI, LEMBRO DO CALOR QUE SENTIA E DO AMOR QUE ME INVADIA, LEMBRO QUE A PALAVRA ABRIA E TUA VOZ OUVIA DIZER: VINDE A MIM, OS CANSADOS E OPRIMIDOS, E EU VOS ALIVIAREI. VINDE A MIM, OS CANSADOS E OPRIMIDOS, E EU VOS ALIVIAREI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('30', 'ELE VIVE EM MIM', 'ELE VIVE EM MIM, (BIS)\nA FLOR DO JARDIM, JESUS,\nELE VIVE EM MIM.\n\nELE É O MEU REI, (BIS)\nSÓ A ELE SERVIREI, ELE É MEU REI.\n\nELE VAI VOLTAR, (BIS)\nVEM A CRISTO SEM TARDAR, \nELE VAI VOLTAR.', 'ELE VIVE EM MIM, A FLOR DO JARDIM, JESUS, ELE VIVE EM MIM. ELE É O MEU REI, SÓ A ELE SERVIREI, ELE É MEU REI. ELE VAI VOLTAR, VEM A CRISTO SEM TARDAR, ELE VAI VOLTAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('31', 'EU QUERO SER O SAL DA TERRA', 'EU QUERO SER O SAL DA TERRA,\nEU QUERO SER A LUZ DO MUNDO,\nEU QUERO SER O SAL DA TERRA,\nEU QUERO SER A LUZ DO MUNDO.\n\nEU QUERO BRILHAR, \nEU QUERO BRILHAR, \nEU QUERO BRILHAR ATÉ JESUS\nVOLTAR.\nBIS', 'EU QUERO SER O SAL DA TERRA, EU QUERO SER A LUZ DO MUNDO, EU QUERO SER O SAL DA TERRA, EU QUERO SER A LUZ DO MUNDO. EU QUERO BRILHAR, EU QUERO BRILHAR, EU QUERO BRILHAR ATÉ JESUS VOLTAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('32', 'PRÍNCIPE DA PAZ', 'PRÍNCIPE DA PAZ, QUERO TE AMAR,\nTEUS MANDAMENTOS, SIM,\nTODOS GUARDAR;\nÓ DEUS, VEM AJUDAR-ME\nA FAZER TUA VONTADE\nE EM TUDO TEU NOME LOUVAR.\n\nJESUS REDENTOR,\nQUERO TE ADORAR\nEM ESPÍRITO E EM VERDADE;\nÓ DEUS, VEM ENSINAR-ME\nA LOUVAR TUA GRANDEZA\nE BENDIZER TEU NOME,\nÓ SENHOR!', 'PRÍNCIPE DA PAZ, QUERO TE AMAR, TEUS MANDAMENTOS, SIM, TODOS GUARDAR; Ó DEUS, VEM AJUDAR-ME A FAZER TUA VONTADE E EM TUDO TEU NOME LOUVAR. JESUS REDENTOR, QUERO TE ADORAR EM ESPÍRITO E EM VERDADE; Ó DEUS, VEM ENSINAR-ME A LOUVAR TUA GRANDEZA E BENDIZER TEU NOME, Ó SENHOR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('33', 'CRISTO, MEU BOM MESTRE', 'CRISTO, MEU BOM MESTRE,\nEU TE AMO E TE QUERO;\nEU TE ADORO, MEU SENHOR E REI.\n\nSENHOR (SENHOR), MEU REI,\nSENHOR (SENHOR), MEU REI.	\n\nREPETIR O HINO\nBIS', 'CRISTO, MEU BOM MESTRE, EU TE AMO E TE QUERO; EU TE ADORO, MEU SENHOR E REI. SENHOR (SENHOR), MEU REI, SENHOR (SENHOR), MEU REI. REPETIR O HINO', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('34', 'TENHO UM SENHOR MUITO FORTE', 'TENHO UM SENHOR MUITO FORTE, \nVENCEU A MORTE\nPARA ME DAR UM LUGAR LÁ NO CÉU.\n\nESTE SENHOR É JESUS QUE ME CONDUZ\nPARA UM LAR DE GOZO E DE PAZ.\n\nQUERO SERVI-LO, QUERO LOUVÁ-LO,\nJUSTO SENHOR, DEUS FORTE, MARAVILHOSO,\nCONSELHEIRO, PAI DA ETERNIDADE,\nPRÍNCIPE DA PAZ, JESUS.', 'TENHO UM SENHOR MUITO FORTE, VENCEU A MORTE PARA ME DAR UM LUGAR LÁ NO CÉU. ESTE SENHOR É JESUS QUE ME CONDUZ PARA UM LAR DE GOZO E DE PAZ. QUERO SERVI-LO, QUERO LOUVÁ-LO, JUSTO SENHOR, DEUS FORTE, MARAVILHOSO, CONSELHEIRO, PAI DA ETERNIDADE, PRÍNCIPE DA PAZ, JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('35', 'QUERO SER COMO DAVI', 'QUERO SER COMO DAVI,\nTÃO PEQUENINO, \nNÃO CONFIAVA EM SI;\nQUERO SER TEMENTE A DEUS\nE ASSIM VENCER O FILISTEU.', 'QUERO SER COMO DAVI, TÃO PEQUENINO, NÃO CONFIAVA EM SI; QUERO SER TEMENTE A DEUS E ASSIM VENCER O FILISTEU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('36', 'EU QUERO ANDAR SEMPRE COM JESUS', 'EU QUERO ANDAR SEMPRE COM JESUS,\nÀ ETERNIDADE ELE ME CONDUZ;\nE QUANDO A LUTA TIVER QUE ENFRENTAR\nELE ESTARÁ A ME PROTEGER.\n\nSUSTENTA-ME, PEGA A MINHA MÃO,\nLEVANTA-ME, DÁ-ME A SALVAÇÃO;\nCRESCER COM ELE É O MAIOR TESOURO,\nTRABALHAR PRA ELE É A MINHA ADORAÇÃO. (2X)', 'EU QUERO ANDAR SEMPRE COM JESUS, À ETERNIDADE ELE ME CONDUZ; E QUANDO A LUTA TIVER QUE ENFRENTAR ELE ESTARÁ A ME PROTEGER. SUSTENTA-ME, PEGA A MINHA MÃO, LEVANTA-ME, DÁ-ME A SALVAÇÃO; CRESCER COM ELE É O MAIOR TESOURO, TRABALHAR PRA ELE É A MINHA ADORAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('37', 'NO MEU CORAÇÃO HÁ UM TESOURO (PRÍNCIPE DA VIDA)', 'NO MEU CORAÇÃO HÁ UM TESOURO\nO MAIOR QUE POSSA EXISTIR\nA MELHOR COISA QUE FIZ FOI ENCONTRÁ-LO\nPOIS VIDA ETERNA ADQUIRI.\n\nPRÍNCIPE DA VIDA, PAI DA ETERNIDADE\nÉ O MEU TESOURO.\nPRÍNCIPE DA VIDA, PAI DA ETERNIDADE\nÉ O MEU TESOURO, É O MEU JESUS.', 'NO MEU CORAÇÃO HÁ UM TESOURO O MAIOR QUE POSSA EXISTIR A MELHOR COISA QUE FIZ FOI ENCONTRÁ-LO POIS VIDA ETERNA ADQUIRI. PRÍNCIPE DA VIDA, PAI DA ETERNIDADE É O MEU TESOURO. PRÍNCIPE DA VIDA, PAI DA ETERNIDADE É O MEU TESOURO, É O MEU JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('38', 'TENHO UM CORAÇÃO ALEGRE', 'TENHO UM CORAÇÃO ALEGRE\nPORQUE ESTOU NA CASA DO PAI;\nO MEU PAI CUIDA DE MIM,\nNELE TENHO PAZ.\n\nNÃO DEIXAREI SUA CASA\nPORQUE AQUI HÁ FARTURA DE PÃO;\nNÃO DEIXAREI JESUS\nPOIS NELE HÁ SALVAÇÃO.\n\nTENHO UM CORAÇÃO ALEGRE\nPORQUE ESTOU NA CASA DO PAI;\nO MEU PAI CUIDA DE MIM,\nNELE TENHO PAZ,\nNELE HÁ SALVAÇÃO.', 'TENHO UM CORAÇÃO ALEGRE PORQUE ESTOU NA CASA DO PAI; O MEU PAI CUIDA DE MIM, NELE TENHO PAZ. NÃO DEIXAREI SUA CASA PORQUE AQUI HÁ FARTURA DE PÃO; NÃO DEIXAREI JESUS POIS NELE HÁ SALVAÇÃO. TENHO UM CORAÇÃO ALEGRE PORQUE ESTOU NA CASA DO PAI; O MEU PAI CUIDA DE MIM, NELE TENHO PAZ, NELE HÁ SALVAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('39', 'NA AREIA NÃO QUERO CONSTRUIR (FIRME, SIM!)', 'NA AREIA NÃO QUERO CONSTRUIR,\nSEI MUITO BEM, A CASA VAI CAIR;\nMINHA BÍBLIA JÁ ME DIZ:\nÉ NA ROCHA QUE DEVO CONSTRUIR.\n\nCORO\nFIRME, SIM! FIRME, SIM!\nMINHA CASA FIRME ESTÁ,\nNÃO NA AREIA, SIM NA ROCHA,\nE JESUS VAI SUSTENTAR;\nFIRME, SIM! FIRME, SIM!\nMINHA CASA FIRME ESTÁ.\n\nEM JESUS, ROCHA ETERNA,\nMINHA CASA FIRME ESTÁ;\nNEM A CHUVA, VENTO OU MAR,\nMINHA CASA VAI DERRUBAR.\n\nCORO\nFIRME, SIM! FIRME, SIM!\nMINHA CASA FIRME ESTÁ,\nNÃO NA AREIA, SIM NA ROCHA,\nE JESUS VAI SUSTENTAR;\nFIRME, SIM! FIRME, SIM!\nMINHA CASA FIRME ESTÁ.', 'NA AREIA NÃO QUERO CONSTRUIR, SEI MUITO BEM, A CASA VAI CAIR; MINHA BÍBLIA JÁ ME DIZ: É NA ROCHA QUE DEVO CONSTRUIR. FIRME, SIM! FIRME, SIM! MINHA CASA FIRME ESTÁ, NÃO NA AREIA, SIM NA ROCHA, E JESUS VAI SUSTENTAR; FIRME, SIM! FIRME, SIM! MINHA CASA FIRME ESTÁ. EM JESUS, ROCHA ETERNA, MINHA CASA FIRME ESTÁ; NEM A CHUVA, VENTO OU MAR, MINHA CASA VAI DERRUBAR. FIRME, SIM! FIRME, SIM! MINHA CASA FIRME ESTÁ, NÃO NA AREIA, SIM NA ROCHA, E JESUS VAI SUSTENTAR; FIRME, SIM! FIRME, SIM! MINHA CASA FIRME ESTÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('40', 'QUERO OUVIR (MEU QUERER)', 'QUERO OUVIR A TUA VOZ, Ó MEU SENHOR,\nA FALAR TÃO PURA E MEIGA AO CORAÇÃO\nE SENTIR O TOQUE DO TEU SANTO ESPÍRITO\nPARA QUE EU POSSA RENOVAR \nA COMUNHÃO.\n\nCORO (2X)\nQUERO LOUVAR, \nCOM ALEGRIA EM MEU VIVER\nRENOVAR A MINHA FÉ, \nENTREGAR TODO O MEU SER.\n\nQUERO FALAR DESTE SEU IMENSO AMOR.\nE DIZER A TODO O MUNDO QUE JESUS \nÉ O SALVADOR.\nQUE LÁ NA CRUZ ELE MORREU \nPARA NOS SALVAR\nDERRAMOU SEU SANGUE PURA \nE A VIDA ETERNA DÁ.\n\nCORO (2X)\nQUERO LOUVAR, \nCOM ALEGRIA EM MEU VIVER\nRENOVAR A MINHA FÉ, \nENTREGAR TODO O MEU SER.', 'QUERO OUVIR A TUA VOZ, Ó MEU SENHOR, A FALAR TÃO PURA E MEIGA AO CORAÇÃO E SENTIR O TOQUE DO TEU SANTO ESPÍRITO PARA QUE EU POSSA RENOVAR A COMUNHÃO. QUERO LOUVAR, COM ALEGRIA EM MEU VIVER RENOVAR A MINHA FÉ, ENTREGAR TODO O MEU SER. QUERO FALAR DESTE SEU IMENSO AMOR. E DIZER A TODO O MUNDO QUE JESUS É O SALVADOR. QUE LÁ NA CRUZ ELE MORREU PARA NOS SALVAR DERRAMOU SEU SANGUE PURA E A VIDA ETERNA DÁ. QUERO LOUVAR, COM ALEGRIA EM MEU VIVER RENOVAR A MINHA FÉ, ENTREGAR TODO O MEU SER.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('41', 'A MINHA CASA FIRME ESTÁ', 'A MINHA CASA FIRME ESTÁ,\nFIRMADA NA ROCHA ELA ESTÁ.\nPODEM A CHUVA E O VENTO SOPRAR,\nQUE ELA NÃO SE ABALARÁ,\nPOIS ESTA CASA É O MEU CORAÇÃO.\nNELA JESUS FAZ HABITAÇÃO.\nQUERO FALAR NESSA MINHA CANÇÃO\nQUE JESUS CRISTO É A SALVAÇÃO.\n\nA MINHA CASA FIRME ESTÁ,\nFIRMADA NA ROCHA ELA ESTÁ.\nPODEM A CHUVA E O VENTO SOPRAR,\nQUE ELA NÃO SE ABALARÁ,\nPOIS ESTA CASA É O MEU CORAÇÃO.\nNELA JESUS FAZ HABITAÇÃO.\nQUERO FALAR NESSA MINHA CANÇÃO\nQUE JESUS CRISTO É A SALVAÇÃO.', 'A MINHA CASA FIRME ESTÁ, FIRMADA NA ROCHA ELA ESTÁ. PODEM A CHUVA E O VENTO SOPRAR, QUE ELA NÃO SE ABALARÁ, POIS ESTA CASA É O MEU CORAÇÃO. NELA JESUS FAZ HABITAÇÃO. QUERO FALAR NESSA MINHA CANÇÃO QUE JESUS CRISTO É A SALVAÇÃO. A MINHA CASA FIRME ESTÁ, FIRMADA NA ROCHA ELA ESTÁ. PODEM A CHUVA E O VENTO SOPRAR, QUE ELA NÃO SE ABALARÁ, POIS ESTA CASA É O MEU CORAÇÃO. NELA JESUS FAZ HABITAÇÃO. QUERO FALAR NESSA MINHA CANÇÃO QUE JESUS CRISTO É A SALVAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('42', 'MINHA VIDA E MEU CORAÇÃO', 'MINHA VIDA E MEU CORAÇÃO\nPERTENCEM A JESUS, \nDIA A DIA, EM MEU VIVER, \nVOU ANDAR EM SUA LUZ.\nÀ PALAVRA VOU OBEDECER,\nCOM AMOR TESTEMUNHAR,\nE PRA SEMPRE, SEMPRE O LOUVAREI,      \nNA ETERNIDADE EU VOU MORAR.\nBIS', 'MINHA VIDA E MEU CORAÇÃO PERTENCEM A JESUS, DIA A DIA, EM MEU VIVER, VOU ANDAR EM SUA LUZ. À PALAVRA VOU OBEDECER, COM AMOR TESTEMUNHAR, E PRA SEMPRE, SEMPRE O LOUVAREI, NA ETERNIDADE EU VOU MORAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('43', 'SOU FELIZ', 'SOU FELIZ  \nTENHO JESUS EM MEU CORAÇÃO \n\nSOU FELIZ, ANDO EM SUA LUZ, \nNÃO ESTAREI NA ESCURIDÃO.\nBIS', 'SOU FELIZ TENHO JESUS EM MEU CORAÇÃO SOU FELIZ, ANDO EM SUA LUZ, NÃO ESTAREI NA ESCURIDÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('44', 'SOU SERVO DO SENHOR', 'SOU SERVO DO SENHOR, SERVI-LO É MEU PRAZER \nPOIS SALVO EM SUA GRAÇA POR SEU FILHO JESUS, \nTORNOU-ME LIVRE.\n\nEM JESUS POSSO IR DIRETO AO PAI, \nCOM OUSADIA ENTRAR NO SANTO DOS SANTOS COMO REI E SACERDOTE O SENHOR ME COLOCOU \n\nPOSSO GOVERNAR, POSSO MINISTRAR, \nAO SENHOR SEMPRE ADORAR, EM ESPÍRITO \nE VERDADE HOJE E ETERNAMENTE.\n\nSOU SERVO DO SENHOR, SERVI-LO É MEU PRAZER \nPOIS SALVO EM SUA GRAÇA POR SEU FILHO JESUS, \nTORNOU-ME LIVRE.\n\nEM JESUS POSSO IR DIRETO AO PAI, \nCOM OUSADIA ENTRAR NO SANTO DOS SANTOS COMO REI E SACERDOTE O SENHOR ME COLOCOU \n\nPOSSO GOVERNAR, POSSO MINISTRAR, AO SENHOR SEMPRE ADORAR, EM ESPÍRITO E VERDADE \nHOJE E ETERNAMENTE. (2X)', 'SOU SERVO DO SENHOR, SERVI-LO É MEU PRAZER POIS SALVO EM SUA GRAÇA POR SEU FILHO JESUS, TORNOU-ME LIVRE. EM JESUS POSSO IR DIRETO AO PAI, COM OUSADIA ENTRAR NO SANTO DOS SANTOS COMO REI E SACERDOTE O SENHOR ME COLOCOU POSSO GOVERNAR, POSSO MINISTRAR, AO SENHOR SEMPRE ADORAR, EM ESPÍRITO E VERDADE HOJE E ETERNAMENTE. SOU SERVO DO SENHOR, SERVI-LO É MEU PRAZER POIS SALVO EM SUA GRAÇA POR SEU FILHO JESUS, TORNOU-ME LIVRE. EM JESUS POSSO IR DIRETO AO PAI, COM OUSADIA ENTRAR NO SANTO DOS SANTOS COMO REI E SACERDOTE O SENHOR ME COLOCOU POSSO GOVERNAR, POSSO MINISTRAR, AO SENHOR SEMPRE ADORAR, EM ESPÍRITO E VERDADE HOJE E ETERNAMENTE.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('45', 'JESUS RESSUSCITOU! (MEU AMIGO JESUS)', 'CORO (2X)\nJESUS RESSUSCITOU! \nCANTAREI EM MEU CORAÇÃO\nTODA GLÓRIA, HONRA E LOUVOR,\nA JESUS, POR SUA PAZ E PERDÃO.\n\nNO MEU CORAÇÃO NÃO HÁ TRISTEZAS, \nPOIS JESUS, COM SEU SANGUE, O LAVOU.\nHOJE EU CANTO COM MUITA ALEGRIA,\nADORANDO AO MEU REI E SENHOR.\n\nHOJE POSSO TESTEMUNHAR\nDE UM AMIGO QUE SÓ ME QUER BEM.\nDEU, NA CRUZ, SUA VIDA POR MIM, \nPRA QUE EU VÁ NO CÉU MORAR TAMBÉM.\n\nCORO\nJESUS RESSUSCITOU! \nCANTAREI EM MEU CORAÇÃO\nTODA GLÓRIA, HONRA E LOUVOR,\nA JESUS, POR SUA PAZ E PERDÃO.\n\nFINAL\nTODA GLÓRIA, HONRA E LOUVOR\nA JESUS, POR SUA PAZ E PERDÃO.', 'JESUS RESSUSCITOU! CANTAREI EM MEU CORAÇÃO TODA GLÓRIA, HONRA E LOUVOR, A JESUS, POR SUA PAZ E PERDÃO. NO MEU CORAÇÃO NÃO HÁ TRISTEZAS, POIS JESUS, COM SEU SANGUE, O LAVOU. HOJE EU CANTO COM MUITA ALEGRIA, ADORANDO AO MEU REI E SENHOR. HOJE POSSO TESTEMUNHAR DE UM AMIGO QUE SÓ ME QUER BEM. DEU, NA CRUZ, SUA VIDA POR MIM, PRA QUE EU VÁ NO CÉU MORAR TAMBÉM. JESUS RESSUSCITOU! CANTAREI EM MEU CORAÇÃO TODA GLÓRIA, HONRA E LOUVOR, A JESUS, POR SUA PAZ E PERDÃO. FINAL TODA GLÓRIA, HONRA E LOUVOR A JESUS, POR SUA PAZ E PERDÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('46', 'COMO É BOM SERVIR A DEUS', 'COMO É BOM SERVIR A DEUS\nCONHECÊ-LO CADA VEZ MAIS\nE VIVENDO NO SEU AMOR\nSENTIR PROTEÇÃO.\n\nCORO (2X)\nQUE ME TRAZ SEGURANÇA, VIDA,\nAMOR, PAZ E ALEGRIA.\n\nCOM MEU DEUS EU SEI QUE SOU\nMAIS QUE VENCEDOR.\nVOU PASSANDO AS PROVAÇÕES\nFIRMADO NO SEU AMOR.', 'COMO É BOM SERVIR A DEUS CONHECÊ-LO CADA VEZ MAIS E VIVENDO NO SEU AMOR SENTIR PROTEÇÃO. QUE ME TRAZ SEGURANÇA, VIDA, AMOR, PAZ E ALEGRIA. COM MEU DEUS EU SEI QUE SOU MAIS QUE VENCEDOR. VOU PASSANDO AS PROVAÇÕES FIRMADO NO SEU AMOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('47', 'TENHO NO MEU CORAÇÃO', 'CORO\nTENHO NO MEU CORAÇÃO O DESEJO \nDE SERVIR AO SENHOR.\nTENHO NO MEU CORAÇÃO O DESEJO \nDE LOUVAR AO SENHOR.\n\nSOU UM SERVO ALEGRE\nPORQUE POSSO SENTIR O AMOR DO SENHOR,\nPORQUE DESDE PEQUENINO POSSO \nOUVIR A VOZ DO SENHOR.\n\nQUANDO TRISTE EU ESTOU\nO SENHOR ME ESTENDE A MÃO.\nQUANDO OLHO PARA OS CÉUS,\nO SENHOR OUVE A MINHA ORAÇÃO.\n\nCORO\nTENHO NO MEU CORAÇÃO O DESEJO \nDE SERVIR AO SENHOR.\nTENHO NO MEU CORAÇÃO O DESEJO \nDE LOUVAR AO SENHOR.\n\nPARA TE LOUVAR.     \nPARA TE LOUVAR.\n\nENTRÃO EU ABRO O MEU CORAÇÃO\nPARA TI, SENHOR, MEU JESUS.\nVEM EM MIM HABITAR,\nPOIS UM SERVO EU SOU.\nPOIS UM SERVO EU SOU.\nQUERO CRESCER NA TUA PRESENÇA Ó PAI,\nPARA TE LOUVAR.\nPARA TE LOUVAR.', 'TENHO NO MEU CORAÇÃO O DESEJO DE SERVIR AO SENHOR. TENHO NO MEU CORAÇÃO O DESEJO DE LOUVAR AO SENHOR. SOU UM SERVO ALEGRE PORQUE POSSO SENTIR O AMOR DO SENHOR, PORQUE DESDE PEQUENINO POSSO OUVIR A VOZ DO SENHOR. QUANDO TRISTE EU ESTOU O SENHOR ME ESTENDE A MÃO. QUANDO OLHO PARA OS CÉUS, O SENHOR OUVE A MINHA ORAÇÃO. TENHO NO MEU CORAÇÃO O DESEJO DE SERVIR AO SENHOR. TENHO NO MEU CORAÇÃO O DESEJO DE LOUVAR AO SENHOR. PARA TE LOUVAR. PARA TE LOUVAR. ENTRÃO EU ABRO O MEU CORAÇÃO PARA TI, SENHOR, MEU JESUS. VEM EM MIM HABITAR, POIS UM SERVO EU SOU. POIS UM SERVO EU SOU. QUERO CRESCER NA TUA PRESENÇA Ó PAI, PARA TE LOUVAR. PARA TE LOUVAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('48', 'JESUS CRISTO É O AMADO', 'JESUS CRISTO É O AMADO\nQUE MORREU PELO PECADOR\nO SEU SANGUE CLAMA AO PAI\nPARA REDENÇÃO,\nPARA OBTERMOS PERDÃO,\nSEGUNDO AS RIQUEZAS DE SUA GRAÇA.\n\nCORO \nPOR ESSE MOTIVO ESCOLHEMOS\nFICAR CONTIGO, JESUS,\nE HONRAR O TEU SACRIFÍCIO\nFEITO NO ALTAR DA CRUZ.\nESCOLHEMOS A VIDA E A BÊNÇÃO\nPARA NÓS E A NOSSA HERANÇA\nVIVERMOS SOB A TUA PROTEÇÃO.\n\nJESUS CRISTO É O AMADO\nQUE MORREU PELO PECADOR\nO SEU SANGUE CLAMA AO PAI\nPARA REDENÇÃO,\nPARA OBTERMOS PERDÃO,\nSEGUNDO AS RIQUEZAS DE SUA GRAÇA.\n\nCORO (2X)\nPOR ESSE MOTIVO ESCOLHEMOS\nFICAR CONTIGO, JESUS,\nE HONRAR O TEU SACRIFÍCIO\nFEITO NO ALTAR DA CRUZ.\nESCOLHEMOS A VIDA E A BÊNÇÃO\nPARA NÓS E A NOSSA HERANÇA\nVIVERMOS SOB A TUA PROTEÇÃO.', 'JESUS CRISTO É O AMADO QUE MORREU PELO PECADOR O SEU SANGUE CLAMA AO PAI PARA REDENÇÃO, PARA OBTERMOS PERDÃO, SEGUNDO AS RIQUEZAS DE SUA GRAÇA. JESUS CRISTO É O AMADO QUE MORREU PELO PECADOR O SEU SANGUE CLAMA AO PAI PARA REDENÇÃO, PARA OBTERMOS PERDÃO, SEGUNDO AS RIQUEZAS DE SUA GRAÇA. POR ESSE MOTIVO ESCOLHEMOS FICAR CONTIGO, JESUS, E HONRAR O TEU SACRIFÍCIO FEITO NO ALTAR DA CRUZ. ESCOLHEMOS A VIDA E A BÊNÇÃO PARA NÓS E A NOSSA HERANÇA VIVERMOS SOB A TUA PROTEÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('49', 'A MINHA ALEGRIA É CRESCER COM O MEU SENHOR!', 'A MINHA ALEGRIA É CRESCER COM O MEU SENHOR!\nSENHOR DA MINHA VIDA, O MEU GRANDE AMOR!\nA TI EU RENDEREI TODA GLÓRIA E LOUVOR.\nAQUI TRABALHAREI NA TUA OBRA COM AMOR.\n\nUSA-ME SENHOR, PRA PREGAR AO PECADOR,\nUSA-ME SENHOR, NA TUA OBRA DE AMOR,\nUSA-ME SENHOR, QUERO TE GLORIFICAR!\nUSA-ME SENHOR, EM TODO E QUALQUER LUGAR,\nUSA-ME SENHOR, ATÉ MEU JESUS VOLTAR!', 'A MINHA ALEGRIA É CRESCER COM O MEU SENHOR! SENHOR DA MINHA VIDA, O MEU GRANDE AMOR! A TI EU RENDEREI TODA GLÓRIA E LOUVOR. AQUI TRABALHAREI NA TUA OBRA COM AMOR. USA-ME SENHOR, PRA PREGAR AO PECADOR, USA-ME SENHOR, NA TUA OBRA DE AMOR, USA-ME SENHOR, QUERO TE GLORIFICAR! USA-ME SENHOR, EM TODO E QUALQUER LUGAR, USA-ME SENHOR, ATÉ MEU JESUS VOLTAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('50', 'DO ALTO CÉU', 'DO ALTO CÉU ELE ME AMOU,\nDO MUNDO MAU ME RETIROU;\nFIZ A ESCOLHA DA SALVAÇÃO.\nEU ACEITEI O CORDEIRO DE DEUS.\n\nSEU SANGUE LAVOU O MEU CORAÇÃO,\nDE TODO PECADO ME PERDOOU;\nE HOJE SOU SALVO PELA GRAÇA DE DEUS.\n\nFINAL\nE HOJE SOU SALVO PELA GRAÇA DE DEUS.', 'DO ALTO CÉU ELE ME AMOU, DO MUNDO MAU ME RETIROU; FIZ A ESCOLHA DA SALVAÇÃO. EU ACEITEI O CORDEIRO DE DEUS. SEU SANGUE LAVOU O MEU CORAÇÃO, DE TODO PECADO ME PERDOOU; E HOJE SOU SALVO PELA GRAÇA DE DEUS. FINAL E HOJE SOU SALVO PELA GRAÇA DE DEUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('51', 'EIS-ME AQUI, SENHOR, EM TEU ALTAR', 'EIS-ME AQUI, SENHOR, \nEM TEU ALTAR, \nEIS-ME AQUI, SENHOR, \nPRONTO A TE ADORAR.\nBIS\n\nSEI QUE A PRESENÇA \nDO SENHOR JESUS\nNÃO FALHARÁ,\nSEI QUE TU ESTÁS AQUI,\nPRONTO A ABENÇOAR.\n\nINSTRUMENTOS\nBIS\n\nSANTO E GLORIOSO ÉS, CONOSCO ESTÁS,\nSANTO E GLORIOSO, VIMOS TE ADORAR,\nSANTO E GLORIOSO ÉS, Ó NOSSO AMADO,\nDO TEU ESPÍRITO TENS DERRAMADO,\nDANDO RENOVO E TRANSFORMANDO;\nSANTO E GLORIOSO ÉS,\nVEM EM NÓS TRANSBORDAR,\nÓ SANTO ESPÍRITO, TOMA O TEU LUGAR.\n\nSEI QUE A PRESENÇA \nDO SENHOR JESUS\nNÃO FALHARÁ,\nSEI QUE TU ESTÁS AQUI,\nPRONTO A ABENÇOAR.\nBIS', 'EIS-ME AQUI, SENHOR, EM TEU ALTAR, EIS-ME AQUI, SENHOR, PRONTO A TE ADORAR. SEI QUE A PRESENÇA DO SENHOR JESUS NÃO FALHARÁ, SEI QUE TU ESTÁS AQUI, PRONTO A ABENÇOAR. SANTO E GLORIOSO ÉS, CONOSCO ESTÁS, SANTO E GLORIOSO, VIMOS TE ADORAR, SANTO E GLORIOSO ÉS, Ó NOSSO AMADO, DO TEU ESPÍRITO TENS DERRAMADO, DANDO RENOVO E TRANSFORMANDO; SANTO E GLORIOSO ÉS, VEM EM NÓS TRANSBORDAR, Ó SANTO ESPÍRITO, TOMA O TEU LUGAR. SEI QUE A PRESENÇA DO SENHOR JESUS NÃO FALHARÁ, SEI QUE TU ESTÁS AQUI, PRONTO A ABENÇOAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('52', 'SEU NOME É MARAVILHOSO', 'SEU NOME É MARAVILHOSO, (3x)\nPAI DA ETERNIDADE, PRÍNCIPE DA PAZ.\n\nSEU NOME É CONSELHEIRO, (3X)\nPAI DA ETERNIDADE, PRÍNCIPE DA PAZ\n\nSEU NOME É DEUS FORTE, (3X)\nPAI DA ETERNIDADE, PRÍNCIPE DA PAZ. \n\nIREI SEGUI-LO PARA SEMPRE\nPOIS ELE DÁ FELICIDADE\nSEU NOME É MARAVILHOSO,\nPAI DA ETERNIDADE, PRÍNCIPE DA PAZ.', 'SEU NOME É MARAVILHOSO, PAI DA ETERNIDADE, PRÍNCIPE DA PAZ. SEU NOME É CONSELHEIRO, PAI DA ETERNIDADE, PRÍNCIPE DA PAZ SEU NOME É DEUS FORTE, PAI DA ETERNIDADE, PRÍNCIPE DA PAZ. IREI SEGUI-LO PARA SEMPRE POIS ELE DÁ FELICIDADE SEU NOME É MARAVILHOSO, PAI DA ETERNIDADE, PRÍNCIPE DA PAZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('53', 'É BOM, É BOM DEMAIS', 'É BOM, É BOM DEMAIS\nÉ MUITO BOM TER JESUS NO CORAÇÃO.\n\nVIVER COM ELE, PERTINHO DELE,\nÉ MUITO BOM TER JESUS NO CORAÇÃO.\nBIS\nBIS', 'É BOM, É BOM DEMAIS É MUITO BOM TER JESUS NO CORAÇÃO. VIVER COM ELE, PERTINHO DELE, É MUITO BOM TER JESUS NO CORAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('54', 'COMO É BOM SABER', 'COMO É BOM SABER QUE JESUS CRISTO\nFOI MENINO ASSIM COMO EU,\nQUE BRINCAVA E TRABALHAVA\nCOMO UM JOVEM GALILEU.\n\nCORO\nQUE PRAZER CONHECER CRISTO\nQUE TAMBÉM FOI MENINO AQUI\nE SABER QUE NO CÉU LINDO,\nQUER TER-ME JUNTO A SI!\n\nE É MELHOR SABER QUE JESUS CRISTO\nJÁ SUBIU LÁ PARA O CÉU\nE PREPARA UM LUGARZINHO\nDE UM MENINO, ASSIM, COMO EU.\n\nCORO\nQUE PRAZER CONHECER CRISTO\nQUE TAMBÉM FOI MENINO AQUI\nE SABER QUE NO CÉU LINDO,\nQUER TER-ME JUNTO A SI!', 'COMO É BOM SABER QUE JESUS CRISTO FOI MENINO ASSIM COMO EU, QUE BRINCAVA E TRABALHAVA COMO UM JOVEM GALILEU. QUE PRAZER CONHECER CRISTO QUE TAMBÉM FOI MENINO AQUI E SABER QUE NO CÉU LINDO, QUER TER-ME JUNTO A SI! E É MELHOR SABER QUE JESUS CRISTO JÁ SUBIU LÁ PARA O CÉU E PREPARA UM LUGARZINHO DE UM MENINO, ASSIM, COMO EU. QUE PRAZER CONHECER CRISTO QUE TAMBÉM FOI MENINO AQUI E SABER QUE NO CÉU LINDO, QUER TER-ME JUNTO A SI!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('55', 'É SOMENTE TEU MEU CORAÇÃO SENHOR', 'É SOMENTE TEU MEU CORAÇÃO, SENHOR,\nÉ SOMENTE TEU MEU CORPO E MEU LOUVOR;\nÉ SOMENTE TEU, MEU PAI, O MEU AMOR,\nSOU SOMENTE TEU, MEU REDENTOR.\n\nQUERO TE AMAR, MEU DEUS, Ó MEU SENHOR,\nQUERO TE ADORAR, PRA SEMPRE, COM ARDOR,\nQUERO A TI ORAR COM FÉ E COM FERVOR,\nSOU SOMENTE TEU, MEU REDENTOR.', 'É SOMENTE TEU MEU CORAÇÃO, SENHOR, É SOMENTE TEU MEU CORPO E MEU LOUVOR; É SOMENTE TEU, MEU PAI, O MEU AMOR, SOU SOMENTE TEU, MEU REDENTOR. QUERO TE AMAR, MEU DEUS, Ó MEU SENHOR, QUERO TE ADORAR, PRA SEMPRE, COM ARDOR, QUERO A TI ORAR COM FÉ E COM FERVOR, SOU SOMENTE TEU, MEU REDENTOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('56', 'CRISTO É O SENHOR', 'CRISTO É O SENHOR,DONO DO MEU VIVER,\nELE ME SALVOU, COM SEU SANGUE ME LAVOU;\n\nINSTRUMENTOS\n\nREPETIR O HINO\n\nFINAL: PRA SEMPRE COM ELE VOU ESTAR.', 'CRISTO É O SENHOR,DONO DO MEU VIVER, ELE ME SALVOU, COM SEU SANGUE ME LAVOU; REPETIR O HINO PRA SEMPRE COM ELE VOU ESTAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('57', 'HÁ UMA LINDA CANÇÃO DE AMOR', 'HÁ UMA LINDA CANÇÃO DE AMOR\nDENTRO DO MEU CORAÇÃO,\nCRISTO ME DEU PLENA PAZ E PERDÃO,\nOH! EU SOU FELIZ!\nOH! EU SOU FELIZ, FELIZ (2x)\nCRISTO ME DEU PLENA PAZ E PERDÃO,\nOH! EU SOU FELIZ!', 'HÁ UMA LINDA CANÇÃO DE AMOR DENTRO DO MEU CORAÇÃO, CRISTO ME DEU PLENA PAZ E PERDÃO, OH! EU SOU FELIZ! OH! EU SOU FELIZ, FELIZ CRISTO ME DEU PLENA PAZ E PERDÃO, OH! EU SOU FELIZ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('58', 'VIVER É TÃO LINDO', 'VIVER É TÃO LINDO QUANDO SE TEM JESUS,\nO MUNDO É TÃO PEQUENO\nPARA O QUE EU TENHO EM MIM;\nE O QUE TENHO\nÉ BEM MAIOR QUE TUDO NA VIDA\nEU TENHO É JESUS\n\nVIVO A CANTAR, VIVO A SORRIR\nTUDO O QUE EU TENHO\nJAMAIS SE ACABARÁ.', 'VIVER É TÃO LINDO QUANDO SE TEM JESUS, O MUNDO É TÃO PEQUENO PARA O QUE EU TENHO EM MIM; E O QUE TENHO É BEM MAIOR QUE TUDO NA VIDA EU TENHO É JESUS VIVO A CANTAR, VIVO A SORRIR TUDO O QUE EU TENHO JAMAIS SE ACABARÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('59', 'O NOME DO MEU SENHOR', 'O NOME DO MEU SENHOR,\nO QUE VENCEU A MORTE E A CRUZ,\nO ÚNICO QUE É DIGNO DE LOUVOR,\nO SEU NOME É JESUS!\n\nCORO\nÉ FIEL, É A PAZ, É AMOR,                                 É O SALVADOR!\nÉ A ESPERANÇA ETERNA.\n\nO MEU SENHOR DERRAMOU\nO SEU PRECIOSO SANGUE NA CRUZ,\nPERDOOU MEUS PECADOS,\nLAVOU-ME, O SEU NOME É JESUS!\n\nCORO\nÉ FIEL, É A PAZ, É AMOR,                                 É O SALVADOR!\nÉ A ESPERANÇA ETERNA.\n\nAGORA VOU, FELIZ, TE ADORAR, \nPOIS O TEU SANGUE ME LIMPOU.\nCAMINHANDO VOU PARA A PÁTRIA,\nÓ JESUS, VEM ME BUSCAR!\n\nCORO\nÉ FIEL, É A PAZ, É AMOR, É O SALVADOR!\nÉ A ESPERANÇA ETERNA.\nÉ FIEL, É A PAZ, É AMOR, É O SALVADOR!\nÉ A ESPERANÇA ETERNA.\nMINHA ESPERANÇA É JESUS,', 'O NOME DO MEU SENHOR, O QUE VENCEU A MORTE E A CRUZ, O ÚNICO QUE É DIGNO DE LOUVOR, O SEU NOME É JESUS! É FIEL, É A PAZ, É AMOR, É O SALVADOR! É A ESPERANÇA ETERNA. O MEU SENHOR DERRAMOU O SEU PRECIOSO SANGUE NA CRUZ, PERDOOU MEUS PECADOS, LAVOU-ME, O SEU NOME É JESUS! É FIEL, É A PAZ, É AMOR, É O SALVADOR! É A ESPERANÇA ETERNA. AGORA VOU, FELIZ, TE ADORAR, POIS O TEU SANGUE ME LIMPOU. CAMINHANDO VOU PARA A PÁTRIA, Ó JESUS, VEM ME BUSCAR! É FIEL, É A PAZ, É AMOR, É O SALVADOR! É A ESPERANÇA ETERNA. É FIEL, É A PAZ, É AMOR, É O SALVADOR! É A ESPERANÇA ETERNA. MINHA ESPERANÇA É JESUS,', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('60', 'DEUS FALOU COMIGO', 'DEUS FALOU COMIGO,\nDEUS QUER FALAR COM VOCÊ;\nDEUS FALOU COMIGO\nQUE A PORTA DO CÉU É JESUS,\nA PORTA DO CÉU É JESUS,\nA PORTA DO CÉU É JESUS.\nBIS', 'DEUS FALOU COMIGO, DEUS QUER FALAR COM VOCÊ; DEUS FALOU COMIGO QUE A PORTA DO CÉU É JESUS, A PORTA DO CÉU É JESUS, A PORTA DO CÉU É JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('61', 'SEI QUE NA CRUZ SEU SANGUE VERTEU', 'SEI QUE NA CRUZ SEU SANGUE VERTEU,\nMORREU ALI MEU SENHOR,\nMAS NO TERCEIRO DIA RESSUCITOU\nPRA ME DAR O CÉU DE AMOR.\n\nEU QUERO JESUS QUE ME SALVA, (3X)\nCOM ELE QUERO IR AO CÉU.\nLÁ NO CÉU, (3X)\nQUERO MORAR COM MEU JESUS.\nLÁ NO CÉU, (3X)\nQUERO MORAR COM MEU JESUS.\n\nSEI QUE NA CRUZ SEU SANGUE VERTEU,\nMORREU ALI MEU SENHOR,\nMAS NO TERCEIRO DIA RESSUCITOU\nPRA ME DAR O CÉU DE AMOR.\n\nEU QUERO JESUS QUE ME SALVA, (3X)\nCOM ELE QUERO IR AO CÉU.\nLÁ NO CÉU, (3X)\nQUERO MORAR COM MEU JESUS.\nLÁ NO CÉU, (3X)\nQUERO MORAR COM MEU JESUS.', 'SEI QUE NA CRUZ SEU SANGUE VERTEU, MORREU ALI MEU SENHOR, MAS NO TERCEIRO DIA RESSUCITOU PRA ME DAR O CÉU DE AMOR. EU QUERO JESUS QUE ME SALVA, COM ELE QUERO IR AO CÉU. LÁ NO CÉU, QUERO MORAR COM MEU JESUS. LÁ NO CÉU, QUERO MORAR COM MEU JESUS. SEI QUE NA CRUZ SEU SANGUE VERTEU, MORREU ALI MEU SENHOR, MAS NO TERCEIRO DIA RESSUCITOU PRA ME DAR O CÉU DE AMOR. EU QUERO JESUS QUE ME SALVA, COM ELE QUERO IR AO CÉU. LÁ NO CÉU, QUERO MORAR COM MEU JESUS. LÁ NO CÉU, QUERO MORAR COM MEU JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('62', 'É TÃO TRISTE NÃO VER A LUZ (O CEGO BARTIMEU)', 'É TÃO TRISTE NÃO VER A LUZ,\nA ESCURIDÃO DESTA VIDA VIVER,\nÀ BEIRA DO CAMINHO \nBARTIMEU VIVIA A SOFRER.\n\nMAS UMA VOZ DE ESPERANÇA\nAOS SEUS OUVIDOS UM DIA CHEGOU,\nA MULTIDÃO O IMPEDIA\nE O CEGO BEM ALTO GRITOU:\n\n- Ó JESUS, FILHO DE DAVI,\nTEM MISERICÓRDIA DE MIM;\nQUERIA VER O SOL NASCER,\nA LUZ DA VIDA RESPLANDECER.\n\nE JESUS TEVE COMPAIXÃO,\nDEU-LHE CURA E REDENÇÃO,\nE FELIZ PELO CAMINHO \nA JESUS SEGUIU.\n\nÉ TÃO TRISTE NÃO VER A LUZ,\nA ESCURIDÃO DESTA VIDA VIVER,\nÀ BEIRA DO CAMINHO \nBARTIMEU VIVIA A SOFRER.\n\nMAS UMA VOZ DE ESPERANÇA\nAOS SEUS OUVIDOS UM DIA CHEGOU,\nA MULTIDÃO O IMPEDIA\nE O CEGO BEM ALTO GRITOU:\n\nÓ JESUS, FILHO DE DAVI,\nTEM MISERICÓRDIA DE MIM;\nQUERIA VER O SOL NASCER,\nA LUZ DA VIDA RESPLANDECER.\n\nE JESUS TEVE COMPAIXÃO,\nDEU-LHE CURA E REDENÇÃO,\nE FELIZ PELO CAMINHO \nA JESUS SEGUIU.', 'É TÃO TRISTE NÃO VER A LUZ, A ESCURIDÃO DESTA VIDA VIVER, À BEIRA DO CAMINHO BARTIMEU VIVIA A SOFRER. MAS UMA VOZ DE ESPERANÇA AOS SEUS OUVIDOS UM DIA CHEGOU, A MULTIDÃO O IMPEDIA E O CEGO BEM ALTO GRITOU: - Ó JESUS, FILHO DE DAVI, TEM MISERICÓRDIA DE MIM; QUERIA VER O SOL NASCER, A LUZ DA VIDA RESPLANDECER. E JESUS TEVE COMPAIXÃO, DEU-LHE CURA E REDENÇÃO, E FELIZ PELO CAMINHO A JESUS SEGUIU. É TÃO TRISTE NÃO VER A LUZ, A ESCURIDÃO DESTA VIDA VIVER, À BEIRA DO CAMINHO BARTIMEU VIVIA A SOFRER. MAS UMA VOZ DE ESPERANÇA AOS SEUS OUVIDOS UM DIA CHEGOU, A MULTIDÃO O IMPEDIA E O CEGO BEM ALTO GRITOU: Ó JESUS, FILHO DE DAVI, TEM MISERICÓRDIA DE MIM; QUERIA VER O SOL NASCER, A LUZ DA VIDA RESPLANDECER. E JESUS TEVE COMPAIXÃO, DEU-LHE CURA E REDENÇÃO, E FELIZ PELO CAMINHO A JESUS SEGUIU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('63', 'TEM BOM ÂNIMO, POBRE PECADOR', 'TEM BOM ÂNIMO, POBRE PECADOR,\nJESUS ESTÁ PRESENTE PARA TE SALVAR;\nSALVOU ZAQUEU, O RICO QUE ERA POBRE,\nBUSCOU UM CEGO À BEIRA DO CAMINHO.\n\n(FALANDO): “BARTIMEU,\nQUE QUERES QUE EU TE FAÇA?”\n\nQUE EU VEJA, FOI A RESPOSTA PRONTA;\nVENDO AGORA O ROSTO DE JESUS,\nLOGO O SEGUIU LOUVANDO ALEGREMENTE.\n\nPODES TER TUDO OU NADA POSSUIR,\nJESUS PERGUNTA AGORA:\n“QUE QUERES QUE EU TE FAÇA?”\nRESPONDE DEPRESSA: A TUA SALVAÇÃO;\nVIDA ETERNA JESUS TE DÁ AGORA.', 'TEM BOM ÂNIMO, POBRE PECADOR, JESUS ESTÁ PRESENTE PARA TE SALVAR; SALVOU ZAQUEU, O RICO QUE ERA POBRE, BUSCOU UM CEGO À BEIRA DO CAMINHO. (FALANDO): BARTIMEU, QUE QUERES QUE EU TE FAÇA? QUE EU VEJA, FOI A RESPOSTA PRONTA; VENDO AGORA O ROSTO DE JESUS, LOGO O SEGUIU LOUVANDO ALEGREMENTE. PODES TER TUDO OU NADA POSSUIR, JESUS PERGUNTA AGORA: QUE QUERES QUE EU TE FAÇA? RESPONDE DEPRESSA: A TUA SALVAÇÃO; VIDA ETERNA JESUS TE DÁ AGORA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('64', 'EU VOU CONTAR UMA HISTÓRIA', 'EU VOU CONTAR UMA HISTÓRIA\nPRA VOCÊ NÃO ESQUECER,\nA HISTÓRIA DE UM HOMEM\nQUE A JESUS QUERIA VER.\n\nSUBIU EM UMA ÁRVORE PRA VER \nJESUS PASSAR POIS ERA TÃO PEQUENO, \nNÃO PODIA O AVISTAR.\n\nOLHANDO PARA CIMA JESUS O ENCONTROU,\nCOM SUA VOZ SUAVE, ENTÃO ELE FALOU:\n\n“- ZAQUEU, DESCE DEPRESSA\nPORQUE HOJE ME CONVÉM\nPOUSAR EM TUA CASA,\nVEM DEPRESSA, Ó SIM, VEM”.\n\nZAQUEU ENTÃO DESCEU\nQUANDO JESUS O CONVIDOU,\nJESUS MUDOU SUA VIDA,\nEM OUTRO HOMEM SE TORNOU.', 'EU VOU CONTAR UMA HISTÓRIA PRA VOCÊ NÃO ESQUECER, A HISTÓRIA DE UM HOMEM QUE A JESUS QUERIA VER. SUBIU EM UMA ÁRVORE PRA VER JESUS PASSAR POIS ERA TÃO PEQUENO, NÃO PODIA O AVISTAR. OLHANDO PARA CIMA JESUS O ENCONTROU, COM SUA VOZ SUAVE, ENTÃO ELE FALOU: - ZAQUEU, DESCE DEPRESSA PORQUE HOJE ME CONVÉM POUSAR EM TUA CASA, VEM DEPRESSA, Ó SIM, VEM. ZAQUEU ENTÃO DESCEU QUANDO JESUS O CONVIDOU, JESUS MUDOU SUA VIDA, EM OUTRO HOMEM SE TORNOU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('65', 'ONDE NASCEU JESUS?', 'ONDE NASCEU JESUS?\nEU LOGO TE RESPONDO:\nEM BELÉM O MEU JESUS NASCEU.\n\nQUEM É SEU PAI?\nEU LOGO TE RESPONDO:\nDE DEUS É FILHO\nE ELE TAMBÉM É DEUS.\n\nEM QUE CIDADE CRESCEU?\nEU LOGO TE RESPONDO:\nEM NAZARÉ\nO MEU JESUS CRESCEU.\n\nQUEM O BATIZOU?\nEU LOGO TE RESPONDO:\nFOI JOÃO BATISTA\nNO RIO JORDÃO.\n\nE DIGO MAIS:\nELE ESTÁ VIVO,\nFALA CONOSCO,\nNOS TRAZENDO A PAZ.', 'ONDE NASCEU JESUS? EU LOGO TE RESPONDO: EM BELÉM O MEU JESUS NASCEU. QUEM É SEU PAI? EU LOGO TE RESPONDO: DE DEUS É FILHO E ELE TAMBÉM É DEUS. EM QUE CIDADE CRESCEU? EU LOGO TE RESPONDO: EM NAZARÉ O MEU JESUS CRESCEU. QUEM O BATIZOU? EU LOGO TE RESPONDO: FOI JOÃO BATISTA NO RIO JORDÃO. E DIGO MAIS: ELE ESTÁ VIVO, FALA CONOSCO, NOS TRAZENDO A PAZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('66', 'NASCEU UM NOVO DIA', 'NASCEU UM NOVO DIA;\nBRILHOU A LUZ DO SEU AMOR;\nA PAZ VEIO ENTÃO REINAR\nQUANDO JESUS EM MIM HABITOU.\nBIS', 'NASCEU UM NOVO DIA; BRILHOU A LUZ DO SEU AMOR; A PAZ VEIO ENTÃO REINAR QUANDO JESUS EM MIM HABITOU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('67', 'MARAVILHA É O AMOR DE DEUS', 'MARAVILHA, MARAVILHA, \nMARAVILHA É O AMOR DE DEUS,                                       REVELADO NO CALVÁRIO, \nJESUS POR NÓS MORREU.\n\nMARAVILHA É ANUNCIAR ESSE  AMOR \nPRA VOCÊ QUE HOJE ESTÁ AQUI; \nVEM CONHECÊ-LO, VEM RECEBÊ-LO,    \nE A ALEGRIA INUNDARÁ TEU SER.\n\nMARAVILHA, MARAVILHA, MARAVILHA\nÉ A SALVAÇÃO. NÃO MORREREMOS! \nSIM, ESTAREMOS ETERNAMENTE \nCOM O NOSSO DEUS!\nBIS', 'MARAVILHA, MARAVILHA, MARAVILHA É O AMOR DE DEUS, REVELADO NO CALVÁRIO, JESUS POR NÓS MORREU. MARAVILHA É ANUNCIAR ESSE AMOR PRA VOCÊ QUE HOJE ESTÁ AQUI; VEM CONHECÊ-LO, VEM RECEBÊ-LO, E A ALEGRIA INUNDARÁ TEU SER. MARAVILHA, MARAVILHA, MARAVILHA É A SALVAÇÃO. NÃO MORREREMOS! SIM, ESTAREMOS ETERNAMENTE COM O NOSSO DEUS!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('68', 'VEM PARA O MEIO', 'VEM PARA O MEIO \nDE UM POVO QUE SABE  \nO CAMINHO DA ETERNIDADE,\nONDE A PROFECIA                                 APONTA  A DIREÇÃO;  \nESSE POVO SEGUE E \nALCANÇA  A SALVAÇÃO.\n\nVEM PARA O MEIO, \nJESUS ESTÁ AQUI,              \nMERGULHA NESSAS ÁGUAS \nDA SALVAÇÃO;\nESSAS ÁGUAS CURAM                            E NOVA CRIATURA SERÁS,            ENTÃO, PARA O LOUVOR DE DEUS.\n\nVEM PARA O MEIO \nDE UM POVO QUE SABE  \nO CAMINHO DA ETERNIDADE,\nONDE A PROFECIA                                 APONTA  A DIREÇÃO;  \nESSE POVO SEGUE E \nALCANÇA  A SALVAÇÃO.\n\nVEM PARA O MEIO, \nJESUS ESTÁ AQUI,              \nMERGULHA NESSAS ÁGUAS \nDA SALVAÇÃO;\nESSAS ÁGUAS CURAM                            E NOVA CRIATURA SERÁS,            ENTÃO, PARA O LOUVOR DE DEUS.', 'VEM PARA O MEIO DE UM POVO QUE SABE O CAMINHO DA ETERNIDADE, ONDE A PROFECIA APONTA A DIREÇÃO; ESSE POVO SEGUE E ALCANÇA A SALVAÇÃO. VEM PARA O MEIO, JESUS ESTÁ AQUI, MERGULHA NESSAS ÁGUAS DA SALVAÇÃO; ESSAS ÁGUAS CURAM E NOVA CRIATURA SERÁS, ENTÃO, PARA O LOUVOR DE DEUS. VEM PARA O MEIO DE UM POVO QUE SABE O CAMINHO DA ETERNIDADE, ONDE A PROFECIA APONTA A DIREÇÃO; ESSE POVO SEGUE E ALCANÇA A SALVAÇÃO. VEM PARA O MEIO, JESUS ESTÁ AQUI, MERGULHA NESSAS ÁGUAS DA SALVAÇÃO; ESSAS ÁGUAS CURAM E NOVA CRIATURA SERÁS, ENTÃO, PARA O LOUVOR DE DEUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('69', 'VOCÊ SABE O QUE É SALVAÇÃO?', 'VOCÊ SABE O QUE É SALVAÇÃO?\nÉ SENTIR UMA GRANDE ALEGRIA\nQUE O MUNDO NÃO CONHECE,\nNELE HÁ TREVAS E SOLIDÃO.\n\nJESUS NOS DEU SALVAÇÃO\nQUANDO LÁ NA CRUZ MORREU,\nLEVOU OS NOSSOS PECADOS,\nLIBERTOS AGORA ESTAMOS.\n\nDÊ A ELE O SEU LOUVOR,\nUMA VIDA DE GRATIDÃO;\nVENHA AGORA E ENTREGUE\nA JESUS SEU CORAÇÃO.\n\nVENHA AGORA E ENTREGUE\nA JESUS SEU CORAÇÃO.', 'VOCÊ SABE O QUE É SALVAÇÃO? É SENTIR UMA GRANDE ALEGRIA QUE O MUNDO NÃO CONHECE, NELE HÁ TREVAS E SOLIDÃO. JESUS NOS DEU SALVAÇÃO QUANDO LÁ NA CRUZ MORREU, LEVOU OS NOSSOS PECADOS, LIBERTOS AGORA ESTAMOS. DÊ A ELE O SEU LOUVOR, UMA VIDA DE GRATIDÃO; VENHA AGORA E ENTREGUE A JESUS SEU CORAÇÃO. VENHA AGORA E ENTREGUE A JESUS SEU CORAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('70', 'O DIA DO SENHOR VIRÁ', 'O DIA DO SENHOR VIRÁ  \nCOM JUÍZO SOBRE TODO MAL;\n\nVEM DEPRESSA,         \nVEM DEPRESSA,                         \nGRANDE BÊNÇÃO\nESTÁ A  TE  ESPERAR.\nBIS\n\nO SOL DA JUSTIÇA NASCERÁ,    \nSALVAÇÃO TRARÁ EM SUAS  ASAS;\n\nVEM DEPRESSA,         \nVEM DEPRESSA,                         \nGRANDE BÊNÇÃO\nESTÁ A  TE  ESPERAR.\n\nO SOL DA JUSTIÇA NASCERÁ,    SALVAÇÃO E LIBERTAÇÃO;\n\nSAIREIS E ANUNCIAREIS,                 \nEM SUAS ASAS \n‘INDA  HÁ LUGAR.\nBIS\n\nVEM DEPRESSA,         \nVEM DEPRESSA,                         \nEM SUAS ASAS \nTE ABRIGAR\n\nVEM DEPRESSA,         \nVEM DEPRESSA,                         \nEM SUAS ASAS \nTE ABRIGAR', 'O DIA DO SENHOR VIRÁ COM JUÍZO SOBRE TODO MAL; VEM DEPRESSA, VEM DEPRESSA, GRANDE BÊNÇÃO ESTÁ A TE ESPERAR. O SOL DA JUSTIÇA NASCERÁ, SALVAÇÃO TRARÁ EM SUAS ASAS; VEM DEPRESSA, VEM DEPRESSA, GRANDE BÊNÇÃO ESTÁ A TE ESPERAR. O SOL DA JUSTIÇA NASCERÁ, SALVAÇÃO E LIBERTAÇÃO; SAIREIS E ANUNCIAREIS, EM SUAS ASAS ‘INDA HÁ LUGAR. VEM DEPRESSA, VEM DEPRESSA, EM SUAS ASAS TE ABRIGAR VEM DEPRESSA, VEM DEPRESSA, EM SUAS ASAS TE ABRIGAR', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('71', 'JESUS VIU A MULTIDÃO', 'JESUS VIU A MULTIDÃO\nE NÃO OS DEIXOU IR,\nESTAVAM TÃO FAMINTOS,\nCOMO PODIAM PARTIR?\n\nENTÃO ELE ORDENOU:\n“DAI-LHES DE COMER”,\nOS DISCÍPULOS PERGUNTARAM: \nSENHOR, O QUE VAMOS FAZER?\n\nINSTRUMENTOS\n\nCINCO PÃES E DOIS PEIXINHOS  \nCINCO MIL ALIMENTOU,\nASSENTADOS SOBRE A RELVA,\nTODO O POVO SE FARTOU.\n\nJESUS É A SOLUÇÃO,\nELE É A PROVISÃO,\nO FILHO DO DEUS VIVO\nFAZ A MULTIPLICAÇÃO.', 'JESUS VIU A MULTIDÃO E NÃO OS DEIXOU IR, ESTAVAM TÃO FAMINTOS, COMO PODIAM PARTIR? ENTÃO ELE ORDENOU: DAI-LHES DE COMER, OS DISCÍPULOS PERGUNTARAM: SENHOR, O QUE VAMOS FAZER? CINCO PÃES E DOIS PEIXINHOS CINCO MIL ALIMENTOU, ASSENTADOS SOBRE A RELVA, TODO O POVO SE FARTOU. JESUS É A SOLUÇÃO, ELE É A PROVISÃO, O FILHO DO DEUS VIVO FAZ A MULTIPLICAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('72', 'TU ÉS O CRISTO, O FILHO DO DEUS VIVO', 'TU ÉS O CRISTO, \nO FILHO DO DEUS VIVO,\nNOSSO SALVADOR, \nJESUS NOME DOCE;\n\nMORRESTE NA CRUZ PRA NOS SALVAR,\nRESSUSCITASTE E NO CÉU ESTÁS,\nVOLTARÁS E NOS LEVARÁS\nPARA CONTIGO HABITAR.\n\nTU ÉS O CRISTO, \nO FILHO DO DEUS VIVO,\nNOSSO SALVADOR, \nJESUS NOME DOCE;\n\nMORRESTE NA CRUZ PRA NOS SALVAR,\nRESSUSCITASTE E NO CÉU ESTÁS,\nVOLTARÁS E NOS LEVARÁS\nPARA CONTIGO HABITAR.', 'TU ÉS O CRISTO, O FILHO DO DEUS VIVO, NOSSO SALVADOR, JESUS NOME DOCE; MORRESTE NA CRUZ PRA NOS SALVAR, RESSUSCITASTE E NO CÉU ESTÁS, VOLTARÁS E NOS LEVARÁS PARA CONTIGO HABITAR. TU ÉS O CRISTO, O FILHO DO DEUS VIVO, NOSSO SALVADOR, JESUS NOME DOCE; MORRESTE NA CRUZ PRA NOS SALVAR, RESSUSCITASTE E NO CÉU ESTÁS, VOLTARÁS E NOS LEVARÁS PARA CONTIGO HABITAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', '.', '73 - DE ETERNIDADE A ETERNIDADE\n\nDE ETERNIDADE A ETERNIDADEJESUS É O NOSSO DEUS.\nTODAS AS COISASPOR ELE FORAM FEITAS \nE SEM ELE NADA DO QUE \nFOI FEITO SE FEZ.\n\nO HOMEM DEUS CRIOU,IGUAL A ELE O FORMOU,PODENDO ASSIMVIVER ETERNAMENTE \nCOM JESUS.\n\nMAS O HOMEM PECOU E DE DEUS SE AFASTOU.\n\nNOVO PROJETO DEUS CRIOU \nPOR SEU AMOR,\nPRA RESGATAR O HOMEM, \nPOBRE PECADOR:\n\n“PORQUE DEUS AMOU \nO MUNDO DE TAL MANEIRAQUE DEU O SEU FILHO UNIGÊNITO,PARA QUE TODO AQUELE \nQUE NELE CRÊ NÃO PEREÇA, \nMAS TENHA A VIDA ETERNA.”\n\nCREIO EM JESUS, \nETERNAMENTE VIVEREI;SEGUINDO A JESUS \nPARA O CÉU EU SUBIREIE ADORAREI O REI, \nADORAREI O REI,ADORAREI O REI JESUS.', '73 - DE ETERNIDADE A ETERNIDADE DE ETERNIDADE A ETERNIDADEJESUS É O NOSSO DEUS. TODAS AS COISASPOR ELE FORAM FEITAS E SEM ELE NADA DO QUE FOI FEITO SE FEZ. O HOMEM DEUS CRIOU,IGUAL A ELE O FORMOU,PODENDO ASSIMVIVER ETERNAMENTE COM JESUS. MAS O HOMEM PECOU E DE DEUS SE AFASTOU. NOVO PROJETO DEUS CRIOU POR SEU AMOR, PRA RESGATAR O HOMEM, POBRE PECADOR: PORQUE DEUS AMOU O MUNDO DE TAL MANEIRAQUE DEU O SEU FILHO UNIGÊNITO,PARA QUE TODO AQUELE QUE NELE CRÊ NÃO PEREÇA, MAS TENHA A VIDA ETERNA. CREIO EM JESUS, ETERNAMENTE VIVEREI;SEGUINDO A JESUS PARA O CÉU EU SUBIREIE ADORAREI O REI, ADORAREI O REI,ADORAREI O REI JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('74', 'AQUILO QUE MELHOR EXISTE', 'AQUILO QUE MELHOR EXISTE\nÉ FALAR DE JESUS.\nELE É O CAMINHO E A VIDA,\nA VERDADE E A LUZ.\nBIS\n\nJESUS, AO APROXIMAR-SE, \nJOÃO BATISTA APONTOU:\n“EIS O CORDEIRO DE DEUS, \n QUE VEIO AO MUNDO\n NOS DAR SALVAÇÃO”.\n\nOS DISCÍPULOS, DESANIMADOS\nPOR PESCAREM EM VÃO,\nJESUS OS MANDA \nDE VOLTA AO MAR\nE MUITOS PEIXES PESCAR.\n\nALEGRES DESCOBRIRAM:\n“O CORDEIRO DE DEUS\nESTÁ VIVO ENTRE NÓS!”\nREINA PRA SEMPRE \nO MEU SALVADOR.', 'AQUILO QUE MELHOR EXISTE É FALAR DE JESUS. ELE É O CAMINHO E A VIDA, A VERDADE E A LUZ. JESUS, AO APROXIMAR-SE, JOÃO BATISTA APONTOU: EIS O CORDEIRO DE DEUS, QUE VEIO AO MUNDO NOS DAR SALVAÇÃO. OS DISCÍPULOS, DESANIMADOS POR PESCAREM EM VÃO, JESUS OS MANDA DE VOLTA AO MAR E MUITOS PEIXES PESCAR. ALEGRES DESCOBRIRAM: O CORDEIRO DE DEUS ESTÁ VIVO ENTRE NÓS! REINA PRA SEMPRE O MEU SALVADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('75', 'VOCÊ SABE QUEM FOI JOÃO  BATISTA?', 'VOCÊ SABE QUEM FOI JOÃO BATISTA? \nFOI UM PROFETA DE DEUS.ELE VEIO PARA TESTEMUNHARDE UMA VERDADEIRA LUZ.\n\nQUEM CRÊ EM JESUS TEM \nO PODER DE SER FEITO \nFILHO DE DEUS,\nCOM O DIREITO NA HERANÇADA VIDA ETERNA COM JESUS.\n\nVOCÊ SABE QUEM FOI O OUTRO JOÃO? \nUM APÓSTOLO DE JESUS.\nESCREVEU O EVANGELHO \nDE JOÃO, PRA MOSTRAR \nQUE JESUS É DEUS.\n\nESCREVEU TAMBÉM JOÃO 1, 2, 3\nE O LIVRO DE APOCALIPSE,\nQUE CONTA A HISTÓRIA  \nDO TEMPO DO FIM\nE DAS LINDAS PROMESSAS \nDE DEUS PARA A SUA IGREJA.', 'VOCÊ SABE QUEM FOI JOÃO BATISTA? FOI UM PROFETA DE DEUS.ELE VEIO PARA TESTEMUNHARDE UMA VERDADEIRA LUZ. QUEM CRÊ EM JESUS TEM O PODER DE SER FEITO FILHO DE DEUS, COM O DIREITO NA HERANÇADA VIDA ETERNA COM JESUS. VOCÊ SABE QUEM FOI O OUTRO JOÃO? UM APÓSTOLO DE JESUS. ESCREVEU O EVANGELHO DE JOÃO, PRA MOSTRAR QUE JESUS É DEUS. ESCREVEU TAMBÉM JOÃO 1, 2, 3 E O LIVRO DE APOCALIPSE, QUE CONTA A HISTÓRIA DO TEMPO DO FIM E DAS LINDAS PROMESSAS DE DEUS PARA A SUA IGREJA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('76', 'JESUS FALOU QUE O CÉU É PRA MIM', 'JESUS FALOU QUE  \nO CÉU É PRA MIM (3X)\nJESUS FALOU QUE  \nO CÉU É PRA MIM, \nO CÉU É PRA MIM, \nEU VOU COM ELE SIM.\n\nCORO  \nE SE VOCÊ QUISER O CÉU TAMBÉM PRECISA ACEITAR \nJESUS EM SEU CORAÇÃO,\nPARA PODER LHE TRANSFORMAR\nE O CÉU LHE DAR \nE LÁ VOCÊ MORAR.\n\nEU SOU FIEL E  \nJESUS ME QUER BEM, (3X)\nPOR ISSO EU SEI QUE \nO CÉU É PRA MIM,\nO CÉU É PRA MIM. \nEU VOU PRA GLÓRIA, SIM.\n\nCORO  \nE SE VOCÊ QUISER O CÉU TAMBÉM PRECISA ACEITAR \nJESUS EM SEU CORAÇÃO,\nPARA PODER LHE TRANSFORMAR\nE O CÉU LHE DAR \nE LÁ VOCÊ MORAR.', 'JESUS FALOU QUE O CÉU É PRA MIM JESUS FALOU QUE O CÉU É PRA MIM, O CÉU É PRA MIM, EU VOU COM ELE SIM. EU SOU FIEL E JESUS ME QUER BEM, POR ISSO EU SEI QUE O CÉU É PRA MIM, O CÉU É PRA MIM. EU VOU PRA GLÓRIA, SIM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('77', 'VOU CONTAR-VOS DE JESUS', 'VOU CONTAR-VOS DE JESUS\nO QUE JOÃO NOS ENSINOU:\nELE, POR AMOR, SE FEZ \nNOSSO SALVADOR.\n\nDE ALUNOS QUE CHAMOU:\nPEDRO, ANDRÉ, TIAGO E JOÃO,\nFILIPE, BARTOLOMEU E\nMATEUS, TIAGO, SIMÃO, TOMÉ,\nJUDAS, O BOM AMIGO,\nOUTRO JUDAS, O TRAIDOR.\n\nJESUS A TODOS CHAMOU: \n“EU SOU CAMINHO, \nA VERDADE E A LUZ”,\nA ELES ENSINOU.\n\nVOU CONTAR-VOS DE JESUS\nO QUE JOÃO NOS ENSINOU:\nELE, POR AMOR, SE FEZ \nNOSSO SALVADOR.\n\nDE ALUNOS QUE CHAMOU:\nPEDRO, ANDRÉ, TIAGO E JOÃO,\nFILIPE, BARTOLOMEU E\nMATEUS, TIAGO, SIMÃO, TOMÉ,\nJUDAS, O BOM AMIGO,\nOUTRO JUDAS, O TRAIDOR.\n\nJESUS A TODOS CHAMOU: \n“EU SOU CAMINHO, \nA VERDADE E A LUZ”,\nA ELES ENSINOU.', 'VOU CONTAR-VOS DE JESUS O QUE JOÃO NOS ENSINOU: ELE, POR AMOR, SE FEZ NOSSO SALVADOR. DE ALUNOS QUE CHAMOU: PEDRO, ANDRÉ, TIAGO E JOÃO, FILIPE, BARTOLOMEU E MATEUS, TIAGO, SIMÃO, TOMÉ, JUDAS, O BOM AMIGO, OUTRO JUDAS, O TRAIDOR. JESUS A TODOS CHAMOU: EU SOU CAMINHO, A VERDADE E A LUZ, A ELES ENSINOU. VOU CONTAR-VOS DE JESUS O QUE JOÃO NOS ENSINOU: ELE, POR AMOR, SE FEZ NOSSO SALVADOR. DE ALUNOS QUE CHAMOU: PEDRO, ANDRÉ, TIAGO E JOÃO, FILIPE, BARTOLOMEU E MATEUS, TIAGO, SIMÃO, TOMÉ, JUDAS, O BOM AMIGO, OUTRO JUDAS, O TRAIDOR. JESUS A TODOS CHAMOU: EU SOU CAMINHO, A VERDADE E A LUZ, A ELES ENSINOU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('78', 'O SENHOR É A MINHA LUZ', 'O SENHOR É A MINHA LUZ\nE A MINHA SALVAÇÃO.\nA QUEM EU TEMEREI?DE QUEM ME RECEAREI?\nBIS\n\nBOM E RETO É O SENHOR,POIS APONTA O CAMINHO AO PECADOR.NELE HÁ O PERDÃO,NELE ESPERO TODO DIA. (3X)', 'O SENHOR É A MINHA LUZ E A MINHA SALVAÇÃO. A QUEM EU TEMEREI?DE QUEM ME RECEAREI? BOM E RETO É O SENHOR,POIS APONTA O CAMINHO AO PECADOR.NELE HÁ O PERDÃO,NELE ESPERO TODO DIA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('79', 'DEUS AMA VOCÊ', 'DEUS AMA VOCÊ\nE ELE QUER TE SALVAR,\nELE VAI OPERAR \nEM SEU CORAÇÃO.\n\nA VIDA QUE UM DIAVOCÊ NÃO CONHECIA,\nGOZO, PAZ E ALEGRIAEM JESUS ENCONTROU.\n\nELE É O CAMINHO,			       \nA VERDADE E A VIDA\nE OFERECE A VOCÊ SALVAÇÃO.\nBASTA ABRIR	 A PORTA DO CORAÇÃO,\nPRA SENTIR A SUA PAZ E PERDÃO.\n\nELE É O CAMINHO,			       \nA VERDADE E A VIDA\nE OFERECE A VOCÊ SALVAÇÃO.\nBASTA ABRIR	 A PORTA DO CORAÇÃO,\nPRA SENTIR A SUA PAZ E PERDÃO. (2X)', 'DEUS AMA VOCÊ E ELE QUER TE SALVAR, ELE VAI OPERAR EM SEU CORAÇÃO. A VIDA QUE UM DIAVOCÊ NÃO CONHECIA, GOZO, PAZ E ALEGRIAEM JESUS ENCONTROU. ELE É O CAMINHO, A VERDADE E A VIDA E OFERECE A VOCÊ SALVAÇÃO. BASTA ABRIR A PORTA DO CORAÇÃO, PRA SENTIR A SUA PAZ E PERDÃO. ELE É O CAMINHO, A VERDADE E A VIDA E OFERECE A VOCÊ SALVAÇÃO. BASTA ABRIR A PORTA DO CORAÇÃO, PRA SENTIR A SUA PAZ E PERDÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('80', 'EXISTE UM LUGAR', 'EXISTE UM LUGAR\nQUE MEU JESUS FOI PREPARAR.\nSE VOCÊ QUISER CHEGAR LÁ,\nÉ SÓ A ELE SE ENTREGAR.\n\nESSE LUGAR É O CÉU DE LUZ,\nONDE HABITA O MEU JESUS.\nSE QUERES PAZ, ALEGRIA E PERDÃO\nENTREGA A ELE O TEU CORAÇÃO.', 'EXISTE UM LUGAR QUE MEU JESUS FOI PREPARAR. SE VOCÊ QUISER CHEGAR LÁ, É SÓ A ELE SE ENTREGAR. ESSE LUGAR É O CÉU DE LUZ, ONDE HABITA O MEU JESUS. SE QUERES PAZ, ALEGRIA E PERDÃO ENTREGA A ELE O TEU CORAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('81', 'QUANDO OUVI JESUS ME CHAMAR', 'QUANDO OUVI JESUS ME CHAMARPENSEI QUE ERA IRREAL,\nSUA VOZ DOCE E MEIGA \nA DIZER: “VINDE PEQUENINOS DO PAI”.\n\nENTÃO PUDE CRER QUE JESUS\nQUER USAR-ME TAMBÉM.\nAINDA PEQUENINO SOU,\nMAS POSSO LEVAR, DE DEUS, \nA MENSAGEM DE AMOR.\n\nCORO\nQUEM QUER SUBIR PARA O CÉU     \nPEQUENO SE FAÇA TAMBÉM,\nENTREGA TUA VIDA A JESUS,\nO PAI CELESTE QUE DESEJA \nA TI TODO BEM.\n\nSE QUERES TER DE CRISTO O PERDÃO\nABRE HOJE O TEU CORAÇÃO.\nDEIXE CRISTO ENTRAR E REINAR \nE A PAZ EM TUA VIDA NUNCA IRÁ FALTAR.\n\nCORO\nQUEM QUER SUBIR PARA O CÉU     \nPEQUENO SE FAÇA TAMBÉM,\nENTREGA TUA VIDA A JESUS,\nO PAI CELESTE QUE DESEJA \nA TI TODO BEM.\n\nCORO\nQUEM QUER SUBIR PARA O CÉU     \nPEQUENO SE FAÇA TAMBÉM,\nENTREGA TUA VIDA A JESUS,\nO PAI CELESTE QUE DESEJA \nA TI TODO BEM.\nO PAI CELESTE QUE DESEJA \nA TI TODO BEM.', 'QUANDO OUVI JESUS ME CHAMARPENSEI QUE ERA IRREAL, SUA VOZ DOCE E MEIGA A DIZER: VINDE PEQUENINOS DO PAI. ENTÃO PUDE CRER QUE JESUS QUER USAR-ME TAMBÉM. AINDA PEQUENINO SOU, MAS POSSO LEVAR, DE DEUS, A MENSAGEM DE AMOR. QUEM QUER SUBIR PARA O CÉU PEQUENO SE FAÇA TAMBÉM, ENTREGA TUA VIDA A JESUS, O PAI CELESTE QUE DESEJA A TI TODO BEM. SE QUERES TER DE CRISTO O PERDÃO ABRE HOJE O TEU CORAÇÃO. DEIXE CRISTO ENTRAR E REINAR E A PAZ EM TUA VIDA NUNCA IRÁ FALTAR. QUEM QUER SUBIR PARA O CÉU PEQUENO SE FAÇA TAMBÉM, ENTREGA TUA VIDA A JESUS, O PAI CELESTE QUE DESEJA A TI TODO BEM. QUEM QUER SUBIR PARA O CÉU PEQUENO SE FAÇA TAMBÉM, ENTREGA TUA VIDA A JESUS, O PAI CELESTE QUE DESEJA A TI TODO BEM. O PAI CELESTE QUE DESEJA A TI TODO BEM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('82', 'JESUS VEM NOS BUSCAR', 'JESUS VEM NOS BUSCAR,PROMETEU E NÃO FALHARÁ,PORÉM ELE NOS DISSE:DOIS CAMINHOS HAVERÁ.\n\nUM CAMINHO É CERTO,É ESTREITO E APERTADO,É O CAMINHO DE JESUS,FIRMADO NELE QUERO ESTAR.\n\nOUTRO CAMINHO TAMBÉM HÁ,É LARGO, ESPAÇOSO \nE CONDUZ  À PERDIÇÃO,POR ELE MUITOS VÃO, \nPOIS REJEITAM DE JESUS A SALVAÇÃO.\n\nJESUS A TODOS CONVIDA:“EU SOU O CAMINHOA VERDADE E A VIDA”.\nVEM DEPRESSA,VEM DEPRESSA, VEM,A PORTA ABERTAUM DIA FECHARÁ.\nBIS', 'JESUS VEM NOS BUSCAR,PROMETEU E NÃO FALHARÁ,PORÉM ELE NOS DISSE:DOIS CAMINHOS HAVERÁ. UM CAMINHO É CERTO,É ESTREITO E APERTADO,É O CAMINHO DE JESUS,FIRMADO NELE QUERO ESTAR. OUTRO CAMINHO TAMBÉM HÁ,É LARGO, ESPAÇOSO E CONDUZ À PERDIÇÃO,POR ELE MUITOS VÃO, POIS REJEITAM DE JESUS A SALVAÇÃO. JESUS A TODOS CONVIDA:EU SOU O CAMINHOA VERDADE E A VIDA. VEM DEPRESSA,VEM DEPRESSA, VEM,A PORTA ABERTAUM DIA FECHARÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('83', 'FOI NO CAMINHO PARA DAMASCO', 'FOI NO CAMINHO PARA DAMASCO \nQUE O GRANDE SAULO, PERSEGUIDOR,\nVIU GLORIOSA LUZ CELESTE,  \nQUE POR TERRA O DERRUBOU.\n\nDESSA LUZ SURGIU A VOZ:\nSAULO, SAULO,  \nQUE ME PERSEGUES.\nELE, CAÍDO, RESPONDEU:\nQUEM ÉS, SENHOR? \nQUEM ÉS, SENHOR?\n\nINSTRUMENTOS\n\nEU SOU JESUS, QUE TU PERSEGUES.\nQUE QUERES TU, SENHOR, QUE EU FAÇA?\nLEVANTA-TE E OBEDECE.\nNOVO CAMINHO JESUS TE DÁ.\n\nQUERO TAMBÉM SER DE JESUS,\nTER ESTA LUZ, ME ILUMINAR.\nE A CADA PASSO OUVIR SUA VOZ,    \nATÉ O DIA QUE AO CÉU CHEGAR.', 'FOI NO CAMINHO PARA DAMASCO QUE O GRANDE SAULO, PERSEGUIDOR, VIU GLORIOSA LUZ CELESTE, QUE POR TERRA O DERRUBOU. DESSA LUZ SURGIU A VOZ: SAULO, SAULO, QUE ME PERSEGUES. ELE, CAÍDO, RESPONDEU: QUEM ÉS, SENHOR? QUEM ÉS, SENHOR? EU SOU JESUS, QUE TU PERSEGUES. QUE QUERES TU, SENHOR, QUE EU FAÇA? LEVANTA-TE E OBEDECE. NOVO CAMINHO JESUS TE DÁ. QUERO TAMBÉM SER DE JESUS, TER ESTA LUZ, ME ILUMINAR. E A CADA PASSO OUVIR SUA VOZ, ATÉ O DIA QUE AO CÉU CHEGAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('84', 'QUERES SER FELIZ?', 'QUERES SER FELIZ, CONHECER JESUS?\nELE VAI TE DAR ALEGRIA, VIDA E PAZ.\n\nEU JÁ SOU FELIZ,  \nDEI MEU CORAÇÃO \nE JESUS EM MIM \nVEIO HABITAR.\n\nQUERES SER FELIZ, CONHECER JESUS?\nELE VAI TE DAR ALEGRIA, VIDA E PAZ.\n\nEU JÁ SOU FELIZ, DEI MEU CORAÇÃO \nE JESUS EM MIM VEIO HABITAR.', 'QUERES SER FELIZ, CONHECER JESUS? ELE VAI TE DAR ALEGRIA, VIDA E PAZ. EU JÁ SOU FELIZ, DEI MEU CORAÇÃO E JESUS EM MIM VEIO HABITAR. QUERES SER FELIZ, CONHECER JESUS? ELE VAI TE DAR ALEGRIA, VIDA E PAZ. EU JÁ SOU FELIZ, DEI MEU CORAÇÃO E JESUS EM MIM VEIO HABITAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('85', 'NESTE DIA ESPECIAL', 'Neste dia especial, \nVou lhe apresentar Jesus,\nQue dissipa todo o mal e faz\nRaiar em nós sua luz.\n\nCORO\nJESUS É BOM AMIGO, \nABRIGO NO TEMPORAL,\nQUE NOS LIVRA DO PERIGO \nE POR NÓS VENCEU O MAL.\n\nABRA o seu coração                         e venha conhecer jesus,\nCom amor e segurança À\nVida eterna O conduz\n\nCORO\nJESUS É BOM AMIGO, \nABRIGO NO TEMPORAL,\nQUE NOS LIVRA DO PERIGO \nE POR NÓS VENCEU O MAL. \n\nFINAL: SIM, POR NÓS VENCEU O MAL.', 'NESTE DIA ESPECIAL, VOU LHE APRESENTAR JESUS, QUE DISSIPA TODO O MAL E FAZ RAIAR EM NÓS SUA LUZ. JESUS É BOM AMIGO, ABRIGO NO TEMPORAL, QUE NOS LIVRA DO PERIGO E POR NÓS VENCEU O MAL. ABRA O SEU CORAÇÃO E VENHA CONHECER JESUS, COM AMOR E SEGURANÇA À VIDA ETERNA O CONDUZ JESUS É BOM AMIGO, ABRIGO NO TEMPORAL, QUE NOS LIVRA DO PERIGO E POR NÓS VENCEU O MAL. SIM, POR NÓS VENCEU O MAL.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('86', 'UM DIA MORREU O MEU JESUS', 'UM DIA MORREU O MEU JESUS\nNAQUELA CRUZ POR MIM,\nO SANGUE DERRAMADO \nLIMPOU OS MEUS PECADOS.\nEU VOU CANTAR, \nPORQUE JESUS ESTÁ AQUI.\n\nCORO\nAGORA MEU JESUS VOU                     ADORAR, EU VOU CANTAR. \nEU VOU LOUVAR COMO DAVI,\nAO DERROTAR \nOS QUE QUERIAM O ATINGIR.\n      \nINSTRUMENTOS\n\nJESUS, EU QUERO \nMINHA VIDA TE ENTREGAR \nE QUERO MAIS \nA TUA OBRA REALIZAR,\nSERVI-LO SEMPRE \nDE TODO O CORAÇÃO\nE SEMPRE EU CANTAREI \nESTA CANÇÃO.\n\nCORO (2X)\nAGORA MEU JESUS VOU                     ADORAR, EU VOU CANTAR. \nEU VOU LOUVAR COMO DAVI,\nAO DERROTAR OS QUE \nQUERIAM O ATINGIR.', 'UM DIA MORREU O MEU JESUS NAQUELA CRUZ POR MIM, O SANGUE DERRAMADO LIMPOU OS MEUS PECADOS. EU VOU CANTAR, PORQUE JESUS ESTÁ AQUI. AGORA MEU JESUS VOU ADORAR, EU VOU CANTAR. EU VOU LOUVAR COMO DAVI, AO DERROTAR OS QUE QUERIAM O ATINGIR. JESUS, EU QUERO MINHA VIDA TE ENTREGAR E QUERO MAIS A TUA OBRA REALIZAR, SERVI-LO SEMPRE DE TODO O CORAÇÃO E SEMPRE EU CANTAREI ESTA CANÇÃO. AGORA MEU JESUS VOU ADORAR, EU VOU CANTAR. EU VOU LOUVAR COMO DAVI, AO DERROTAR OS QUE QUERIAM O ATINGIR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('87', 'O SENHOR É O BOM PASTOR', 'O SENHOR É O BOM PASTOR,\nELE É O SALVADOR,\nO DEUS DE PAZ E DE ALEGRIA,\nO DEUS DE AMOR.\n\nCORO\nELE VEM ME BUSCAR \nE VAI ME LEVAR\nPARA A CIDADE CELESTIAL.\nVOCÊ TAMBÉM PODE IR,\nÉ SÓ ANDAR NO CAMINHO \nDE CRISTO JESUS.\n\nELE CURA E SALVA,\nFALA AOS CORAÇÕES,\nCUIDA DOS SEUS FILHOS\nCOM MUITO AMOR.\n\nCORO\nELE VEM ME BUSCAR \nE VAI ME LEVAR\nPARA A CIDADE CELESTIAL.\nVOCÊ TAMBÉM PODE IR,\nÉ SÓ ANDAR NO CAMINHO \nDE CRISTO JESUS.\n\nCORO\nELE VEM ME BUSCAR \nE VAI ME LEVAR\nPARA A CIDADE CELESTIAL.\nVOCÊ TAMBÉM PODE IR,\nÉ SÓ ANDAR NO CAMINHO \nDE CRISTO JESUS.\nNO CAMINHO DE CRISTO JESUS.', 'O SENHOR É O BOM PASTOR, ELE É O SALVADOR, O DEUS DE PAZ E DE ALEGRIA, O DEUS DE AMOR. ELE VEM ME BUSCAR E VAI ME LEVAR PARA A CIDADE CELESTIAL. VOCÊ TAMBÉM PODE IR, É SÓ ANDAR NO CAMINHO DE CRISTO JESUS. ELE CURA E SALVA, FALA AOS CORAÇÕES, CUIDA DOS SEUS FILHOS COM MUITO AMOR. ELE VEM ME BUSCAR E VAI ME LEVAR PARA A CIDADE CELESTIAL. VOCÊ TAMBÉM PODE IR, É SÓ ANDAR NO CAMINHO DE CRISTO JESUS. ELE VEM ME BUSCAR E VAI ME LEVAR PARA A CIDADE CELESTIAL. VOCÊ TAMBÉM PODE IR, É SÓ ANDAR NO CAMINHO DE CRISTO JESUS. NO CAMINHO DE CRISTO JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('88', 'VOU CONTAR PARA VOCÊ UMA HISTÓRIA ESPECIAL', 'VOU CONTAR PARA VOCÊ\nUMA HISTÓRIA ESPECIAL:\nÉ A HISTÓRIA DE JESUS,\nNOSSO AMIGO LEAL.\n\nELE VEIO COM A MISSÃO\nDE NOS DAR A SALVAÇÃO,\nPARA TANTO HOMEM SE FEZ,\nDEIXOU O CÉU DE ESPLENDOR,\nVEIO À TERRA DEMONSTRAR\nDE DEUS O INFINITO AMOR\n\nPADECEU EM UMA CRUZ\nE MORREU PARA NOS LIMPAR,\nNOSSO PECADO LAVAR\nCOM SEU SANGUE REMIDOR,\nE VIVO ELE ESTÁ!\n\nNO TERCEIRO DIA \nRESSUSCITOU,\nÀ DIREITA DE DEUS PAI\nROGA PELO PECADOR.\n\nBREVE, BREVE VOLTARÁ\nPARA A IGREJA ARREBATAR\nE JUNTOS VAMOS MORAR\nNO CELESTE LAR DE AMOR.\n\nSE VOCÊ TAMBÉM QUISER\nNESTE LAR DE AMOR MORAR\nBASTA ABRIR SEU CORAÇÃO\nE DEIXAR JESUS ENTRAR.\n\nFINAL:\nBASTA ABRIR SEU CORAÇÃO\nE DEIXAR JESUS ENTRAR.', 'VOU CONTAR PARA VOCÊ UMA HISTÓRIA ESPECIAL: É A HISTÓRIA DE JESUS, NOSSO AMIGO LEAL. ELE VEIO COM A MISSÃO DE NOS DAR A SALVAÇÃO, PARA TANTO HOMEM SE FEZ, DEIXOU O CÉU DE ESPLENDOR, VEIO À TERRA DEMONSTRAR DE DEUS O INFINITO AMOR PADECEU EM UMA CRUZ E MORREU PARA NOS LIMPAR, NOSSO PECADO LAVAR COM SEU SANGUE REMIDOR, E VIVO ELE ESTÁ! NO TERCEIRO DIA RESSUSCITOU, À DIREITA DE DEUS PAI ROGA PELO PECADOR. BREVE, BREVE VOLTARÁ PARA A IGREJA ARREBATAR E JUNTOS VAMOS MORAR NO CELESTE LAR DE AMOR. SE VOCÊ TAMBÉM QUISER NESTE LAR DE AMOR MORAR BASTA ABRIR SEU CORAÇÃO E DEIXAR JESUS ENTRAR. BASTA ABRIR SEU CORAÇÃO E DEIXAR JESUS ENTRAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('89', 'CERTO HOMEM, PRÍNCIPE  DOS JUDEUS (NICODEMOS)', 'CERTO HOMEM, \nPRÍNCIPE DOS JUDEUS,\nFOI AO MESTRE \nPERGUNTAR-LHE ASSIM:\n\nBEM SABEMOS QUE \nÉS MESTRE VINDO DE DEUS. \nCOMO PODE ALGUÉM \nNASCER DE NOVO?\n\nAQUELE QUE NÃO NASCER\nDA ÁGUA E DO ESPÍRITO \nNÃO PODE VER O REINO DE DEUS. \nMAS AQUELE QUE PERMANECER \nFIEL ATÉ O FIM, O VERÁ.', 'CERTO HOMEM, PRÍNCIPE DOS JUDEUS, FOI AO MESTRE PERGUNTAR-LHE ASSIM: BEM SABEMOS QUE ÉS MESTRE VINDO DE DEUS. COMO PODE ALGUÉM NASCER DE NOVO? AQUELE QUE NÃO NASCER DA ÁGUA E DO ESPÍRITO NÃO PODE VER O REINO DE DEUS. MAS AQUELE QUE PERMANECER FIEL ATÉ O FIM, O VERÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('90', 'ELE MORREU MAS RESSURGIU', 'ELE MORREU, MAS RESSURGIU; \nPLENA PAZ ENCHEU O MEU VIVER; \nJESUS É TUDO O QUE SEMPRE QUIS, \nJESUS ME TROUXE O SEU PERDÃO.\n\nQUERO FALAR DESTA SALVAÇÃO, \nPOR ONDE QUER QUE EU POSSA ANDAR, \nJESUS É TUDO, ELE É A PAZ. \nQUE VOCÊ PODE ENCONTRAR (2X)\n\nINSTRUMENTOS\n\nCRISTO, O SENHOR, É QUEM ME CONDUZ, \nLIVRA-ME DO MAL E DA TENTAÇÃO. \nE O SEU AMOR SEMPRE TRADUZ \nVIDA REAL E O CÉU PRA MIM!\n\nCRISTO JESUS É O MEU SENHOR\nSEMPRE PRESENTE NO MEU CORAÇÃO.\nBREVE VIRÁ DO CÉU ME BUSCAR. \nQUE ALEGRIA SERÁ! (2X)', 'ELE MORREU, MAS RESSURGIU; PLENA PAZ ENCHEU O MEU VIVER; JESUS É TUDO O QUE SEMPRE QUIS, JESUS ME TROUXE O SEU PERDÃO. QUERO FALAR DESTA SALVAÇÃO, POR ONDE QUER QUE EU POSSA ANDAR, JESUS É TUDO, ELE É A PAZ. QUE VOCÊ PODE ENCONTRAR CRISTO, O SENHOR, É QUEM ME CONDUZ, LIVRA-ME DO MAL E DA TENTAÇÃO. E O SEU AMOR SEMPRE TRADUZ VIDA REAL E O CÉU PRA MIM! CRISTO JESUS É O MEU SENHOR SEMPRE PRESENTE NO MEU CORAÇÃO. BREVE VIRÁ DO CÉU ME BUSCAR. QUE ALEGRIA SERÁ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('91', 'TENHO ALGO PRA VOCÊ', 'TENHO ALGO PRA VOCÊ NESTA CANÇÃO:\nTEM ALGUÉM QUE MORA EM MEU CORAÇÃO.\nESTE ALGUÉM DESEJA DAR A VOCÊ O PERDÃO.\n\nESTE ALGUÉM É MUITO \nIMPORTANTE!\nESTÁ BEM PERTO DE VOCÊ \nA TODO INSTANTE.\nELE SÓ POR NÓS MORREU \nNUMA CRUZ. ESTE ALGUÉM, \nLHE DIGO, É: JESUS', 'TENHO ALGO PRA VOCÊ NESTA CANÇÃO: TEM ALGUÉM QUE MORA EM MEU CORAÇÃO. ESTE ALGUÉM DESEJA DAR A VOCÊ O PERDÃO. ESTE ALGUÉM É MUITO IMPORTANTE! ESTÁ BEM PERTO DE VOCÊ A TODO INSTANTE. ELE SÓ POR NÓS MORREU NUMA CRUZ. ESTE ALGUÉM, LHE DIGO, É: JESUS', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('92', 'JESUS CURA E SALVA', 'JESUS CURA E SALVA,\nJESUS É O MEU SALVADOR;\nJESUS É MEU AMIGO,\nE ELE É O MEU REDENTOR.\n\nQUANDO ESTOU DOENTE,                  CURA ELE DÁ,                         \nQUANDO ESTOU TRISTE,                        A PAZ VEM REINAR!\n\nJESUS É FORÇA \nE ESPERANÇA! \nJESUS É O PRÍNCIPE\nDA PAZ!', 'JESUS CURA E SALVA, JESUS É O MEU SALVADOR; JESUS É MEU AMIGO, E ELE É O MEU REDENTOR. QUANDO ESTOU DOENTE, CURA ELE DÁ, QUANDO ESTOU TRISTE, A PAZ VEM REINAR! JESUS É FORÇA E ESPERANÇA! JESUS É O PRÍNCIPE DA PAZ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('93', 'JESUS TE AMA', 'JESUS TE AMA,\nELE QUER TE SALVAR,\nDEIXA A LUZ ENTRAR                   \nEM TEU CORAÇÃO.\n\nELE QUER TRANSFORMAR \nTEU CHORO EM ALEGRIA,\nELE QUER TE DAR PAZ, \nGOZO E ESPERANÇA.\n\nJESUS TE AMA \n(JESUS TE AMA),\nELE QUER TE SALVAR\n(ELE QUER TE SALVAR),\nDEIXA A LUZ \n(DEIXA A LUZ)\nENTRAR EM TEU CORAÇÃO.\n\nELE QUER TRANSFORMAR \nTEU CHORO EM ALEGRIA,\nELE QUER TE DAR PAZ, \nGOZO E ESPERANÇA.\n\nSE TU QUISERES\n(SE TU QUISERES)\nACEITAR A CRISTO\n(ACEITAR A CRISTO),\nABRE HOJE MESMO                \n(ABRE HOJE MESMO)\nO SEU CORAÇÃO!\n\nJESUS TE CHAMA!\nJESUS TE AMA!\nJESUS TE AMA!', 'JESUS TE AMA, ELE QUER TE SALVAR, DEIXA A LUZ ENTRAR EM TEU CORAÇÃO. ELE QUER TRANSFORMAR TEU CHORO EM ALEGRIA, ELE QUER TE DAR PAZ, GOZO E ESPERANÇA. JESUS TE AMA (JESUS TE AMA), ELE QUER TE SALVAR (ELE QUER TE SALVAR), DEIXA A LUZ (DEIXA A LUZ) ENTRAR EM TEU CORAÇÃO. ELE QUER TRANSFORMAR TEU CHORO EM ALEGRIA, ELE QUER TE DAR PAZ, GOZO E ESPERANÇA. SE TU QUISERES (SE TU QUISERES) ACEITAR A CRISTO (ACEITAR A CRISTO), ABRE HOJE MESMO (ABRE HOJE MESMO) O SEU CORAÇÃO! JESUS TE CHAMA! JESUS TE AMA! JESUS TE AMA!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('94', 'AQUELE QUE TEM SEDE', 'AQUELE QUE TEM SEDE \nVÁ À FONTE E BEBA,\nSUAS ÁGUAS DESSEDENTAM\nE TRAZEM VIDA.\n\nRIOS DE ÁGUAS CORRERÃO\nNO SEU INTERIOR, E A ALEGRIA QUE SALTA\nPARA A VIDA ETERNA.\n\nJESUS É ESSA FONTE DE VIDA,QUE SACIA A SEDE DA ALMA.\nVENHA A ELE E BEBA,\nE UMA VIDA ETERNA LHE DARÁ.\n\nAQUELE QUE TEM SEDE \nVÁ À FONTE E BEBA,\nSUAS ÁGUAS DESSEDENTAM\nE TRAZEM VIDA.\n\nRIOS DE ÁGUAS CORRERÃO\nNO SEU INTERIOR, E A ALEGRIA QUE SALTA\nPARA A VIDA ETERNA.', 'AQUELE QUE TEM SEDE VÁ À FONTE E BEBA, SUAS ÁGUAS DESSEDENTAM E TRAZEM VIDA. RIOS DE ÁGUAS CORRERÃO NO SEU INTERIOR, E A ALEGRIA QUE SALTA PARA A VIDA ETERNA. JESUS É ESSA FONTE DE VIDA,QUE SACIA A SEDE DA ALMA. VENHA A ELE E BEBA, E UMA VIDA ETERNA LHE DARÁ. AQUELE QUE TEM SEDE VÁ À FONTE E BEBA, SUAS ÁGUAS DESSEDENTAM E TRAZEM VIDA. RIOS DE ÁGUAS CORRERÃO NO SEU INTERIOR, E A ALEGRIA QUE SALTA PARA A VIDA ETERNA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('95', 'DO PÃO DO CÉU', 'DO PÃO DO CÉU ME NUTRIREI,\nDA FONTE ETERNA BEBEREI;\n“E QUEM BEBER”, \nNOS DIZ JESUS,\n“JAMAIS DE SEDE SOFRERÁ.”\n\nNÃO MAIS SEDE? \nQUE DIZEIS? \nNÃO MAIS SEDE \nASSIM SERÁS!\nBIS\n\n“E QUEM BEBER,” \nNOS DIZ JESUS\n“JAMAIS DE SEDE SOFRERÁ.”\nSEDE NÃO TERÁ!', 'DO PÃO DO CÉU ME NUTRIREI, DA FONTE ETERNA BEBEREI; E QUEM BEBER, NOS DIZ JESUS, JAMAIS DE SEDE SOFRERÁ. NÃO MAIS SEDE? QUE DIZEIS? NÃO MAIS SEDE ASSIM SERÁS! E QUEM BEBER, NOS DIZ JESUS JAMAIS DE SEDE SOFRERÁ. SEDE NÃO TERÁ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('96', 'SONHEI COM JESUS ESTA NOITE', 'SONHEI COM JESUS ESTA NOITEUM CONSELHO ELE ME DEU:“NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU”“NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU”\n\nEU IMPLOREI A JESUS:“SENHOR TEM DE MIM COMPAIXÃOEU VIVO VAGANDO NO MUNDO SEM PAZ SEM CONSOLAÇÃO”“EU VIVO VAGANDO NO MUNDO SEM PAZ SEM CONSOLAÇÃO”\n\nSONHEI COM JESUS ESTA NOITEUM CONSELHO ELE ME DEU:“NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU”“NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU”\n\nUMA VOZ ME FALOU BAIXINHONO FUNDO DO CORAÇÃO “OH PECADOR VEM DE PRESSA CRISTO TE DÁ SALVAÇÃO”“OH PECADOR VEM DE PRESSA CRISTO TE DÁ SALVAÇÃO”\n\nSONHEI COM JESUS ESTA NOITEUM CONSELHO ELE ME DEU:“NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU”“NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU”', 'SONHEI COM JESUS ESTA NOITEUM CONSELHO ELE ME DEU:NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EUNÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU EU IMPLOREI A JESUS:SENHOR TEM DE MIM COMPAIXÃOEU VIVO VAGANDO NO MUNDO SEM PAZ SEM CONSOLAÇÃOEU VIVO VAGANDO NO MUNDO SEM PAZ SEM CONSOLAÇÃO SONHEI COM JESUS ESTA NOITEUM CONSELHO ELE ME DEU:NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EUNÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU UMA VOZ ME FALOU BAIXINHONO FUNDO DO CORAÇÃO OH PECADOR VEM DE PRESSA CRISTO TE DÁ SALVAÇÃOOH PECADOR VEM DE PRESSA CRISTO TE DÁ SALVAÇÃO SONHEI COM JESUS ESTA NOITEUM CONSELHO ELE ME DEU:NÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EUNÃO SIGAS POR OUTRO CAMINHOQUE A PORTA DO CÉU SOU EU', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('97', 'JESUS É O CAMINHO', 'JESUS É O CAMINHO \nEU VOU AO CÉU COM ELE\n\nEU VOU, EU VOU \nEU VOU AO CÉU COM ELE.\n\nJESUS É A VERDADE \nEU VOU AO CÉU COM ELE\n\nEU VOU, EU VOU \nEU VOU AO CÉU COM ELE.\n\nJESUS É A MINHA VIDA \nEU VOU AO CÉU COM ELE\n\nEU VOU, EU VOU \nEU VOU AO CÉU COM ELE.', 'JESUS É O CAMINHO EU VOU AO CÉU COM ELE EU VOU, EU VOU EU VOU AO CÉU COM ELE. JESUS É A VERDADE EU VOU AO CÉU COM ELE EU VOU, EU VOU EU VOU AO CÉU COM ELE. JESUS É A MINHA VIDA EU VOU AO CÉU COM ELE EU VOU, EU VOU EU VOU AO CÉU COM ELE.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('98', 'EU ABRI MEU CORAÇÃO', 'EU ABRI MEU CORAÇÃO\nE JESUS VEIO HABITAR;\nDE MANSO BATEU\nLOGO A PORTA ABRI EU,\nE ELE VEIO EM MIM MORAR.\n\nEU ABRI MEU CORAÇÃO\nE JESUS VEIO HABITAR;\nDE MANSO BATEU\nLOGO A PORTA ABRI EU,\nE ELE VEIO EM MIM MORAR.', 'EU ABRI MEU CORAÇÃO E JESUS VEIO HABITAR; DE MANSO BATEU LOGO A PORTA ABRI EU, E ELE VEIO EM MIM MORAR. EU ABRI MEU CORAÇÃO E JESUS VEIO HABITAR; DE MANSO BATEU LOGO A PORTA ABRI EU, E ELE VEIO EM MIM MORAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('99', 'NO MEU CORAÇÃO', 'NO MEU CORAÇÃO\nNO MEU CORAÇÃO\nVEM HOJE ENTRAR, Ó CRISTO!\nVEM HOJE ENTRAR,                                SIM, VEM MORAR\nNO MEU CORAÇÃO, Ó CRISTO.', 'NO MEU CORAÇÃO NO MEU CORAÇÃO VEM HOJE ENTRAR, Ó CRISTO! VEM HOJE ENTRAR, SIM, VEM MORAR NO MEU CORAÇÃO, Ó CRISTO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('100', 'CRISTO SENTE AMOR POR MIM', 'CRISTO SENTE AMOR POR MIM,\nCOM CERTEZA EU CREIO ASSIM,\nPOR AMOR DE MIM MORREU,\nVIVO ESTÁ, POR MIM, NO CÉU.\n\nCORO\nCRISTO NOS AMA, \nCRISTO NOS CHAMA, \nCRISTO PROCLAMA\nTÃO GRANDE SALVAÇÃO.\n\nCRISTO TEM POR MIM AMOR\nE SE FEZ MEU SALVADOR,\nHOJE AINDA TEM PRAZER\nEM MENINOS RECEBER.\n\nCORO\nCRISTO NOS AMA, \nCRISTO NOS CHAMA, \nCRISTO PROCLAMA\nTÃO GRANDE SALVAÇÃO.\n\nPOR GOZAR SEU RICO AMOR\nHEI DE AMAR MEU SALVADOR,\nE DESEJO AQUI MOSTRAR\nSEU AMOR TÃO EXEMPLAR.\n\nCORO\nCRISTO NOS AMA, \nCRISTO NOS CHAMA, \nCRISTO PROCLAMA\nTÃO GRANDE SALVAÇÃO.', 'CRISTO SENTE AMOR POR MIM, COM CERTEZA EU CREIO ASSIM, POR AMOR DE MIM MORREU, VIVO ESTÁ, POR MIM, NO CÉU. CRISTO NOS AMA, CRISTO NOS CHAMA, CRISTO PROCLAMA TÃO GRANDE SALVAÇÃO. CRISTO TEM POR MIM AMOR E SE FEZ MEU SALVADOR, HOJE AINDA TEM PRAZER EM MENINOS RECEBER. CRISTO NOS AMA, CRISTO NOS CHAMA, CRISTO PROCLAMA TÃO GRANDE SALVAÇÃO. POR GOZAR SEU RICO AMOR HEI DE AMAR MEU SALVADOR, E DESEJO AQUI MOSTRAR SEU AMOR TÃO EXEMPLAR. CRISTO NOS AMA, CRISTO NOS CHAMA, CRISTO PROCLAMA TÃO GRANDE SALVAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('101', 'JESUS ME AMA', 'JESUS ME AMA E QUER SALVAR-ME,\nJESUS ME AMA E QUER-ME BEM.\n\nCORO\nPOR ISSO EU CANTO,\nSEMPRE ELE AMA,\nJESUS ME AMA, \nMEU SALVADOR.\n\nESTIVE PRESO NO VIL PECADO,\nESTIVE PRESO, MAS ME SALVOU.\n\nCORO\nPOR ISSO EU CANTO,\nSEMPRE ELE AMA,\nJESUS ME AMA, \nMEU SALVADOR.\n\nCASTIGO DURO QUE EU MEREÇO,\nJESUS SOFREU JÁ EM MEU LUGAR.\n\nCORO\nPOR ISSO EU CANTO,\nSEMPRE ELE AMA,\nJESUS ME AMA, \nMEU SALVADOR.\n\nAGORA, QUERONA MINHA VIDA,\nAO MEU AMIGO SEMPRE AGRADAR.\n\nCORO\nPOR ISSO EU CANTO,\nSEMPRE ELE AMA,\nJESUS ME AMA, \nMEU SALVADOR.', 'JESUS ME AMA E QUER SALVAR-ME, JESUS ME AMA E QUER-ME BEM. POR ISSO EU CANTO, SEMPRE ELE AMA, JESUS ME AMA, MEU SALVADOR. ESTIVE PRESO NO VIL PECADO, ESTIVE PRESO, MAS ME SALVOU. POR ISSO EU CANTO, SEMPRE ELE AMA, JESUS ME AMA, MEU SALVADOR. CASTIGO DURO QUE EU MEREÇO, JESUS SOFREU JÁ EM MEU LUGAR. POR ISSO EU CANTO, SEMPRE ELE AMA, JESUS ME AMA, MEU SALVADOR. AGORA, QUERONA MINHA VIDA, AO MEU AMIGO SEMPRE AGRADAR. POR ISSO EU CANTO, SEMPRE ELE AMA, JESUS ME AMA, MEU SALVADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('102', 'DAS MARAVILHAS QUE A BÍBLIA CONTÉM', 'DAS MARAVILHAS \nQUE A BÍBLIA CONTÉM,\nEIS A MAIS LINDA:\nJESUS ME QUER BEM;\n\nCHEGO-ME A ELE, \nNINGUÉM ME DETÉM,\nQUANDO ME LEMBRO \nDE QUE ME QUER BEM.\n\nOH! QUE PRAZER! \nJESUS ME QUER BEM,\nSIM, ME QUER BEM, \nA TI TAMBÉM;\nOH! QUE PRAZER! \nJESUS ME QUER BEM,\nSIM, ME QUER BEM, JESUS.', 'DAS MARAVILHAS QUE A BÍBLIA CONTÉM, EIS A MAIS LINDA: JESUS ME QUER BEM; CHEGO-ME A ELE, NINGUÉM ME DETÉM, QUANDO ME LEMBRO DE QUE ME QUER BEM. OH! QUE PRAZER! JESUS ME QUER BEM, SIM, ME QUER BEM, A TI TAMBÉM; OH! QUE PRAZER! JESUS ME QUER BEM, SIM, ME QUER BEM, JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('103', 'VINDE, MENINOS', 'VINDE, MENINOS, \nVINDE A JESUS!\nELE GANHOU-VOS \nBÊNÇÃOS NA CRUZ,\nOS PEQUENINOS ELE CONDUZ,\nÓ VINDE AO SALVADOR!\n\nCORO\nQUE ALEGRIA! \nSEM PECADO OU MAL\nREUNIR-NOS TODOS, AFINAL,\nNA SANTA PÁTRIA CELESTIAL\nCOM NOSSO SALVADOR.\n\nJÁ SEM DEMORA,\nHOJE CONVÉM\nIR CAMINHANDO À  \nGLÓRIA ALÉM;\nJESUS VOS CHAMA, \nQUER VOSSO BEM,\nÓ VINDE AO SALVADOR!\n\nCORO\nQUE ALEGRIA! \nSEM PECADO OU MAL\nREUNIR-NOS TODOS, AFINAL,\nNA SANTA PÁTRIA CELESTIAL\nCOM NOSSO SALVADOR.\n\nCRISTO VOS AMA, \nBEM ELE O DIZ,\nQUER RECEBER-VOS\nNO BOM PAÍS;\nQUER CONCEDER-VOS\nVIDA FELIZ,\nÓ VINDE AO SALVADOR!\n\nCORO\nQUE ALEGRIA! \nSEM PECADO OU MAL\nREUNIR-NOS TODOS, AFINAL,\nNA SANTA PÁTRIA CELESTIAL\nCOM NOSSO SALVADOR.', 'VINDE, MENINOS, VINDE A JESUS! ELE GANHOU-VOS BÊNÇÃOS NA CRUZ, OS PEQUENINOS ELE CONDUZ, Ó VINDE AO SALVADOR! QUE ALEGRIA! SEM PECADO OU MAL REUNIR-NOS TODOS, AFINAL, NA SANTA PÁTRIA CELESTIAL COM NOSSO SALVADOR. JÁ SEM DEMORA, HOJE CONVÉM IR CAMINHANDO À GLÓRIA ALÉM; JESUS VOS CHAMA, QUER VOSSO BEM, Ó VINDE AO SALVADOR! QUE ALEGRIA! SEM PECADO OU MAL REUNIR-NOS TODOS, AFINAL, NA SANTA PÁTRIA CELESTIAL COM NOSSO SALVADOR. CRISTO VOS AMA, BEM ELE O DIZ, QUER RECEBER-VOS NO BOM PAÍS; QUER CONCEDER-VOS VIDA FELIZ, Ó VINDE AO SALVADOR! QUE ALEGRIA! SEM PECADO OU MAL REUNIR-NOS TODOS, AFINAL, NA SANTA PÁTRIA CELESTIAL COM NOSSO SALVADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('104', 'NO CAMINHO ELE ME GUIARÁ', 'NO CAMINHO ELE ME GUIARÁ,\nELE QUER BEM\nA TODO PECADOR,\nO SEU AMOR POR MIM, \nVOCÊ OUVIU?\nDEUS GOSTA DE VOCÊ.\n\nCORO\nDEUS GOSTA DE VOCÊ, (BIS)\nO SEU AMOR VOCÊ VERÁ\nPOR TODA A PARTE QUE OLHAR;\nDEUS GOSTA DE VOCÊ.\n\nO SOL DOURADO\nELE FAZ NASCER,\nAS LINDAS FLORES\nELE FAZ ABRIR,\nQUANDO O DESERTO\nCHORA A CHUVA CAI,\nDEUS GOSTA DE VOCÊ.\n\nCORO\nDEUS GOSTA DE VOCÊ, (BIS)\nO SEU AMOR VOCÊ VERÁ\nPOR TODA A PARTE QUE OLHAR;\nDEUS GOSTA DE VOCÊ.', 'NO CAMINHO ELE ME GUIARÁ, ELE QUER BEM A TODO PECADOR, O SEU AMOR POR MIM, VOCÊ OUVIU? DEUS GOSTA DE VOCÊ. DEUS GOSTA DE VOCÊ, O SEU AMOR VOCÊ VERÁ POR TODA A PARTE QUE OLHAR; DEUS GOSTA DE VOCÊ. O SOL DOURADO ELE FAZ NASCER, AS LINDAS FLORES ELE FAZ ABRIR, QUANDO O DESERTO CHORA A CHUVA CAI, DEUS GOSTA DE VOCÊ. DEUS GOSTA DE VOCÊ, O SEU AMOR VOCÊ VERÁ POR TODA A PARTE QUE OLHAR; DEUS GOSTA DE VOCÊ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('105', 'HAVEREMOS DE CHEGAR', 'HAVEREMOS DE CHEGAR\nPELO PODER DO SENHOR EM JERUSALÉM;\nONDE A FELICIDADE PARA SEMPRE REINARÁ, EM JERUSALÉM.\n\nCORO\nALELUIA, CANTAREMOS,\nLOUVANDO AO SALVADOR\nEM JERUSALÉM,\nPOIS ALI JAMAIS OS MALES\nPODERÃO NOS ALCANÇAR,\nNA FELIZ JERUSALÉM.\n\nINSTRUMENTOS\n\nQUERES TU TAMBÉM ENTRAR \nCOM OS SALVOS POR JESUS EM JERUSALÉM?\nÉ PRECISO, HOJE MESMO, ACEITAR ESSA LUZ,\nCAMINHANDO A JERUSALÉM.\n\nCORO\nALELUIA, CANTAREMOS,\nLOUVANDO AO SALVADOR\nEM JERUSALÉM,\nPOIS ALI JAMAIS OS MALES\nPODERÃO NOS ALCANÇAR,\nNA FELIZ JERUSALÉM. \nNA FELIZ JERUSALÉM. \nNA FELIZ JERUSALÉM.', 'HAVEREMOS DE CHEGAR PELO PODER DO SENHOR EM JERUSALÉM; ONDE A FELICIDADE PARA SEMPRE REINARÁ, EM JERUSALÉM. ALELUIA, CANTAREMOS, LOUVANDO AO SALVADOR EM JERUSALÉM, POIS ALI JAMAIS OS MALES PODERÃO NOS ALCANÇAR, NA FELIZ JERUSALÉM. QUERES TU TAMBÉM ENTRAR COM OS SALVOS POR JESUS EM JERUSALÉM? É PRECISO, HOJE MESMO, ACEITAR ESSA LUZ, CAMINHANDO A JERUSALÉM. ALELUIA, CANTAREMOS, LOUVANDO AO SALVADOR EM JERUSALÉM, POIS ALI JAMAIS OS MALES PODERÃO NOS ALCANÇAR, NA FELIZ JERUSALÉM. NA FELIZ JERUSALÉM. NA FELIZ JERUSALÉM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('106', 'JESUS CRISTO É O CAMINHO', 'JESUS CRISTO É O CAMINHO\nE O GUIA DE VALOR;\nELE SALVA TODO AQUELE\nQUE CONFIA EM SEU AMOR.\n\nJESUS CRISTO É O CAMINHO,\nJESUS CRISTO ME SALVOU,\nEU FUI SALVO PELA GRAÇA \nQUE EM MIM DEPOSITOU. \nEU FUI SALVO PELA GRAÇA \nQUE EM MIM DEPOSITOU.', 'JESUS CRISTO É O CAMINHO E O GUIA DE VALOR; ELE SALVA TODO AQUELE QUE CONFIA EM SEU AMOR. JESUS CRISTO É O CAMINHO, JESUS CRISTO ME SALVOU, EU FUI SALVO PELA GRAÇA QUE EM MIM DEPOSITOU. EU FUI SALVO PELA GRAÇA QUE EM MIM DEPOSITOU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('107', 'EU QUERO CANTAR', 'EU QUERO CANTAR, \nEU QUERO FALAR\nQUE JESUS SALVA E CURA,\nQUE JESUS DEU-ME PAZ.\n\nREPETIR O HINO', 'EU QUERO CANTAR, EU QUERO FALAR QUE JESUS SALVA E CURA, QUE JESUS DEU-ME PAZ. REPETIR O HINO', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('108', 'HOJE É UM GRANDE DIA', 'HOJE É UM GRANDE DIA, É DIA DE LOUVAR;\nLOUVEMOS A JESUS QUE ESTÁ NESTE LUGAR;\nHOJE É DIA DE VITÓRIA E VITÓRIA \nELE NOS DÁ; RECEBA JESUS, \nELE QUER TE ABENÇOAR.\n\nCORO\nVENHAM TODOS JÁ,\nA JESUS VAMOS LOUVAR!\nACEITEM O SALVADOR \nQUE VIDA ETERNA \nQUER LHES DAR!\n\nHOJE AQUI ESTOU PARA TE LOUVAR\nPOR TANTAS MARAVILHAS, \nPOR SEMPRE ME AMAR.\nTUA OBRA EM MINHA VIDA, \nVOU ANUNCIAR, OBRA DE ALEGRIA \nE ALEGRIA QUE É SEM PAR!\n\nCORO\nVENHAM TODOS JÁ,\nA JESUS VAMOS LOUVAR!\nACEITEM O SALVADOR \nQUE VIDA ETERNA \nQUER LHES DAR!', 'HOJE É UM GRANDE DIA, É DIA DE LOUVAR; LOUVEMOS A JESUS QUE ESTÁ NESTE LUGAR; HOJE É DIA DE VITÓRIA E VITÓRIA ELE NOS DÁ; RECEBA JESUS, ELE QUER TE ABENÇOAR. VENHAM TODOS JÁ, A JESUS VAMOS LOUVAR! ACEITEM O SALVADOR QUE VIDA ETERNA QUER LHES DAR! HOJE AQUI ESTOU PARA TE LOUVAR POR TANTAS MARAVILHAS, POR SEMPRE ME AMAR. TUA OBRA EM MINHA VIDA, VOU ANUNCIAR, OBRA DE ALEGRIA E ALEGRIA QUE É SEM PAR! VENHAM TODOS JÁ, A JESUS VAMOS LOUVAR! ACEITEM O SALVADOR QUE VIDA ETERNA QUER LHES DAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('109', 'CANTA ALEGREMENTE, Ó FILHA DE SIÃO', 'CANTA ALEGREMENTE, \nÓ FILHA DE SIÃO;\nREJUBILA, Ó ISRAEL:\nREGOZIJA-TE E EXULTA \nDE TODO O CORAÇÃO,\nÓ FILHA DE JERUSALÉM.\n\nO SENHOR AFASTOU OS TEUS JUÍZOS,\nEXTERMINOU O TEU INIMIGO;\nO SENHOR, O REI DE ISRAEL,\nESTÁ NO MEIO DE TI;\nTU NÃO VERÁS MAIS MAL ALGUM.\n\nNAQUELE DIA SE DIRÁ \n A JERUSALÉM: NÃO TEMAS, \n Ó SIÃO, NÃO ENFRAQUEÇAM \n AS TUAS MÃOS.\n\nO SENHOR TEU DEUS \nESTÁ NO MEIO DE TI, \nPODEROSO PARA TE SALVAR; \nSE DELEITARÁ EM TI \nCOM ALEGRIA;\n\nCALAR-SE-Á POR SEU AMOR,\nREGOZIJAR-SE-Á  EM TI COM JÚBILO,\nÓ FILHA DE JERUSALÉM (2X)', 'CANTA ALEGREMENTE, Ó FILHA DE SIÃO; REJUBILA, Ó ISRAEL: REGOZIJA-TE E EXULTA DE TODO O CORAÇÃO, Ó FILHA DE JERUSALÉM. O SENHOR AFASTOU OS TEUS JUÍZOS, EXTERMINOU O TEU INIMIGO; O SENHOR, O REI DE ISRAEL, ESTÁ NO MEIO DE TI; TU NÃO VERÁS MAIS MAL ALGUM. NAQUELE DIA SE DIRÁ A JERUSALÉM: NÃO TEMAS, Ó SIÃO, NÃO ENFRAQUEÇAM AS TUAS MÃOS. O SENHOR TEU DEUS ESTÁ NO MEIO DE TI, PODEROSO PARA TE SALVAR; SE DELEITARÁ EM TI COM ALEGRIA; CALAR-SE-Á POR SEU AMOR, REGOZIJAR-SE-Á EM TI COM JÚBILO, Ó FILHA DE JERUSALÉM', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('110', 'EU TUDO POSSO', 'CORO\nEU TUDO POSSO  \nNAQUELE QUE  \nME FORTALECE.\n  \nEU VOO COMO UMA ÁGUIA,EU CRUZO MONTANHAS E VALES.\n\nCORO\nEU TUDO POSSO  \nNAQUELE  QUE  \nME  FORTALECE.\n\nEU VENÇO GIGANTES,\nEU VENÇO LEÕES,\nEU VENÇO OS LOBOS\nDO MUNDO.\n\nCORO\nEU TUDO POSSO  \nNAQUELE  QUE  \nME  FORTALECE.  \n\nEU CREIO NUM DEUS\nQUE VIVE E REINA,\nEU CREIO NUM DEUS\nQUE VENCE POR MIM.\n\nCORO\nEU TUDO POSSO  \nNAQUELE QUE  \nME  FORTALECE.', 'EU TUDO POSSO NAQUELE QUE ME FORTALECE. EU VOO COMO UMA ÁGUIA,EU CRUZO MONTANHAS E VALES. EU TUDO POSSO NAQUELE QUE ME FORTALECE. EU VENÇO GIGANTES, EU VENÇO LEÕES, EU VENÇO OS LOBOS DO MUNDO. EU TUDO POSSO NAQUELE QUE ME FORTALECE. EU CREIO NUM DEUS QUE VIVE E REINA, EU CREIO NUM DEUS QUE VENCE POR MIM. EU TUDO POSSO NAQUELE QUE ME FORTALECE.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('111', 'ENTREGA O TEU CAMINHO', 'ENTREGA O TEU CAMINHO \nAO SENHOR, CONFIA \nE O MAIS ELE FARÁ.\nALELUIA, ALELUIA, \nALELUIA, AMÉM.\nALELUIA, ALELUIA, \nALELUIA, AMÉM.', 'ENTREGA O TEU CAMINHO AO SENHOR, CONFIA E O MAIS ELE FARÁ. ALELUIA, ALELUIA, ALELUIA, AMÉM. ALELUIA, ALELUIA, ALELUIA, AMÉM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('112', 'CONSOLA-ME, ESPÍRITO SANTO', 'CONSOLA-ME, \nESPÍRITO SANTO,\nPARA QUE EU POSSA \nAGUARDAR COM FÉ\nA VINDA DO FILHO \nDO DEUS DE ABRAÃO;\n\nCONSOLA-ME, \nCONSOLA-ME,\nCONSOLA-ME, SENHOR.\n\nCONSOLA-ME, \nESPÍRITO SANTO,\nPARA QUE EU POSSA \nAGUARDAR COM FÉ\nA VINDA DO FILHO \nDO DEUS DE ABRAÃO;\nCONSOLA-ME, CONSOLA-ME,\nCONSOLA-ME, SENHOR.', 'CONSOLA-ME, ESPÍRITO SANTO, PARA QUE EU POSSA AGUARDAR COM FÉ A VINDA DO FILHO DO DEUS DE ABRAÃO; CONSOLA-ME, CONSOLA-ME, CONSOLA-ME, SENHOR. CONSOLA-ME, ESPÍRITO SANTO, PARA QUE EU POSSA AGUARDAR COM FÉ A VINDA DO FILHO DO DEUS DE ABRAÃO; CONSOLA-ME, CONSOLA-ME, CONSOLA-ME, SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('113', 'TUA MÃO É PODEROSA', 'TUA MÃO É PODEROSA\nE O TEU NOME DOCE AMOR,\nNÃO TE AFASTARÁS DE MIM,\nNEM CONTENDES CONTRA MIM,\nANTES CUIDARÁS, \nSENHOR, DE MIM.\n\nTUA MÃO É PODEROSA\nE O TEU NOME DOCE AMOR,\nNÃO TE AFASTARÁS DE MIM,\nNEM CONTENDES CONTRA MIM,\nANTES CUIDARÁS,\nSENHOR, DE MIM.', 'TUA MÃO É PODEROSA E O TEU NOME DOCE AMOR, NÃO TE AFASTARÁS DE MIM, NEM CONTENDES CONTRA MIM, ANTES CUIDARÁS, SENHOR, DE MIM. TUA MÃO É PODEROSA E O TEU NOME DOCE AMOR, NÃO TE AFASTARÁS DE MIM, NEM CONTENDES CONTRA MIM, ANTES CUIDARÁS, SENHOR, DE MIM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('114', 'O SENHOR É QUEM CUIDA DE MIM', 'O SENHOR É QUEM \nCUIDA DE MIM,O SENHOR É QUEM\nCUIDA DE MIM,\n\nNADA HEI DE TEMER, \nCOM JESUS VOU VENCER,POIS EU SEI QUE \nELE CUIDA DE MIM.\n\nA JESUS SERVIREI \nCOM AMOR, POIS EU SEI \nQUE ELE É MEU SALVADOR.\nA MEU LADO ESTÁ, \nNUNCA VAI ME DEIXAR,\nPOIS EU SEI QUE ELE \nCUIDA DE MIM.', 'O SENHOR É QUEM CUIDA DE MIM,O SENHOR É QUEM CUIDA DE MIM, NADA HEI DE TEMER, COM JESUS VOU VENCER,POIS EU SEI QUE ELE CUIDA DE MIM. A JESUS SERVIREI COM AMOR, POIS EU SEI QUE ELE É MEU SALVADOR. A MEU LADO ESTÁ, NUNCA VAI ME DEIXAR, POIS EU SEI QUE ELE CUIDA DE MIM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('115', 'JESUS, O BOM PASTOR', 'JESUS, O BOM PASTOR,\nCUIDA DE MIM \nCOM MUITO AMOR.\nA PASTOS VERDEJANTES\nSEMPRE LEVA-ME O SENHOR\n\nE A ÁGUAS TÃO TRANQUILAS MANSAMENTE ME CONDUZ.\nNAS VEREDAS DA JUSTIÇA,\nVIVEREI NA LUZ.\n\nSE MESMO O PERIGO \nTIVER QUE ENFRENTAR, \nSEI QUE MEU JESUS \nCOMIGO SEMPRE ESTARÁ.\nMEDO NÃO TEREI, \nPOIS SINTO SUA MÃO EM MIM.\nCOM O CAJADO DO SENHOR CONSOLO TENHO SIM!\n\nMESA ABUNDANTE HEI DE TER;\nÓLEO DO ESPÍRITO EM MEU VIVER;\nCÁLICE TRANSBORDANTE,\nVIDA ABUNDANTE,\nCOM A MISERICÓRDIA DO SENHOR.\n\nE POR LONGOS DIAS VIVEREI\nEM SUA CASA ETERNA HABITAREI.  \nEM SUA CASA ETERNA HABITAREI.', 'JESUS, O BOM PASTOR, CUIDA DE MIM COM MUITO AMOR. A PASTOS VERDEJANTES SEMPRE LEVA-ME O SENHOR E A ÁGUAS TÃO TRANQUILAS MANSAMENTE ME CONDUZ. NAS VEREDAS DA JUSTIÇA, VIVEREI NA LUZ. SE MESMO O PERIGO TIVER QUE ENFRENTAR, SEI QUE MEU JESUS COMIGO SEMPRE ESTARÁ. MEDO NÃO TEREI, POIS SINTO SUA MÃO EM MIM. COM O CAJADO DO SENHOR CONSOLO TENHO SIM! MESA ABUNDANTE HEI DE TER; ÓLEO DO ESPÍRITO EM MEU VIVER; CÁLICE TRANSBORDANTE, VIDA ABUNDANTE, COM A MISERICÓRDIA DO SENHOR. E POR LONGOS DIAS VIVEREI EM SUA CASA ETERNA HABITAREI. EM SUA CASA ETERNA HABITAREI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('116', 'SOBRE AS ONDAS', 'SOBRE AS ONDAS \nPODEREI ANDAR.\nJESUS ESTÁ COMIGO, \nNENHUM MAL ME ATINGIRÁ.\nSOPRA O VENTO, DEIXA SOPRAR\nJESUS ACALMA AS ONDAS\nE A PAZ VOLTA A REINAR.\n\nAS ONDAS VÃO SUBINDO,\nFORMANDO UM MONTÃO,\nESTE MUNDO MAU QUER\nNAUFRAGAR MEU CORAÇÃO.\nMAS NÃO TEMO, \nOLHO PARA JESUS.\nAO SOM DA SUA VOZ\nATÉ AS TREVAS VIRAM LUZ.', 'SOBRE AS ONDAS PODEREI ANDAR. JESUS ESTÁ COMIGO, NENHUM MAL ME ATINGIRÁ. SOPRA O VENTO, DEIXA SOPRAR JESUS ACALMA AS ONDAS E A PAZ VOLTA A REINAR. AS ONDAS VÃO SUBINDO, FORMANDO UM MONTÃO, ESTE MUNDO MAU QUER NAUFRAGAR MEU CORAÇÃO. MAS NÃO TEMO, OLHO PARA JESUS. AO SOM DA SUA VOZ ATÉ AS TREVAS VIRAM LUZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('117', 'DEITADA NA RELVA', 'DEITADA NA RELVA \nUMA FELIZ OVELHA\nJUNTO AO PASTOR \nESTÁ A DESCANSAR,\n\nNAS ÁGUAS TRANQUILAS\nSACIA SUA SEDE,\nDA RELVA BEM VERDE\nPODE SE ALIMENTAR.\n\nCORO\nOVELHA, JAMAIS \nDEIXE ESTE APRISCO. \nTENS O BOM PASTOR \nPARA DE TI CUIDAR.\nNO MUNDO LÁ FORA \nHÁ TRISTEZA E GUERRA, \nJESUS É A ALEGRIA, \nVERDADE E PAZ.\n\nE QUANDO AS TREVAS \nCAEM SOBRE O MUNDO\nO TENTADOR VEM \nDISPOSTO A TRAGAR.\nJESUS EM SEUS BRAÇOS, \nOVELHA, TE ACOLHE,\nPARA QUE TU POSSAS \nA VIDA HERDAR.\n\nCORO\nOVELHA, JAMAIS \nDEIXE ESTE APRISCO. \nTENS O BOM PASTOR \nPARA DE TI CUIDAR.\nNO MUNDO LÁ FORA \nHÁ TRISTEZA E GUERRA, \nJESUS É A ALEGRIA, \nVERDADE E PAZ.', 'DEITADA NA RELVA UMA FELIZ OVELHA JUNTO AO PASTOR ESTÁ A DESCANSAR, NAS ÁGUAS TRANQUILAS SACIA SUA SEDE, DA RELVA BEM VERDE PODE SE ALIMENTAR. OVELHA, JAMAIS DEIXE ESTE APRISCO. TENS O BOM PASTOR PARA DE TI CUIDAR. NO MUNDO LÁ FORA HÁ TRISTEZA E GUERRA, JESUS É A ALEGRIA, VERDADE E PAZ. E QUANDO AS TREVAS CAEM SOBRE O MUNDO O TENTADOR VEM DISPOSTO A TRAGAR. JESUS EM SEUS BRAÇOS, OVELHA, TE ACOLHE, PARA QUE TU POSSAS A VIDA HERDAR. OVELHA, JAMAIS DEIXE ESTE APRISCO. TENS O BOM PASTOR PARA DE TI CUIDAR. NO MUNDO LÁ FORA HÁ TRISTEZA E GUERRA, JESUS É A ALEGRIA, VERDADE E PAZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('118', 'ÂNCORA SEGURA', 'UMA ÂNCORA SEGURA \nTENHO NO SENHOR,\nQUEM NELE CONFIOU\nJAMAIS PERDIDO SE ACHOU.\n\nEU CONFIO NO SENHOR,\nSEGURO NELE ESTOU,\nSEI DE FATOS GRANDIOSOS,\nRESPOSTAS DO SENHOR:\n\nELIAS PEDIU A DEUS,FOGO DO CÉU DESCEU,CONSUMINDO O HOLOCAUSTO,O POVO SE ALEGROU:                       SÓ O SENHOR É DEUS!                        SÓ O SENHOR É DEUS!\n\nPEDRO SUBIU AO TEMPLO,VIU UM COXO A ESMOLAR.MELHOR QUE PRATA E OURO\nÉ O NOME DE JESUS.\nGRAÇA SE DERRAMOU, \nO COXO SE LEVANTOU.\nO POVO SE ALEGROU: \nSÓ O SENHOR É DEUS!\n\nPAULO VIU A TORMENTADESTRUIR A NAU SEM RUMO.TODOS DESANIMADOS, \nPAULO ANUNCIOU:\nO ANJO DE DEUS FALOU:               NINGUÉM SE PERDERÁ.TODOS CHEGARAM VIVOS,\nSÓ O SENHOR É DEUS!', 'UMA ÂNCORA SEGURA TENHO NO SENHOR, QUEM NELE CONFIOU JAMAIS PERDIDO SE ACHOU. EU CONFIO NO SENHOR, SEGURO NELE ESTOU, SEI DE FATOS GRANDIOSOS, RESPOSTAS DO SENHOR: ELIAS PEDIU A DEUS,FOGO DO CÉU DESCEU,CONSUMINDO O HOLOCAUSTO,O POVO SE ALEGROU: SÓ O SENHOR É DEUS! SÓ O SENHOR É DEUS! PEDRO SUBIU AO TEMPLO,VIU UM COXO A ESMOLAR.MELHOR QUE PRATA E OURO É O NOME DE JESUS. GRAÇA SE DERRAMOU, O COXO SE LEVANTOU. O POVO SE ALEGROU: SÓ O SENHOR É DEUS! PAULO VIU A TORMENTADESTRUIR A NAU SEM RUMO.TODOS DESANIMADOS, PAULO ANUNCIOU: O ANJO DE DEUS FALOU: NINGUÉM SE PERDERÁ.TODOS CHEGARAM VIVOS, SÓ O SENHOR É DEUS!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('119', 'JESUS, O MELHOR AMIGO', 'JESUS, O MELHOR AMIGO,\nQUE SEMPRE ESTÁ PRESENTE.\nNELE HÁ PODER \nPARA MUDAR O CRENTE.\n\nCORO (2X)                                           \nMESMO EM LUTAS E AFLIÇÕES                                                  ELE RESPONDE ÀS NOSSAS ORAÇÕES.\n\nJESUS TEM PODER.\nMESMO EM GUERRAS E BATALHAS\nVOCÊ VAI VENCER, \nPORQUE JESUS NÃO FALHA.\n\nSE VOCÊ QUISER UMA BÊNÇÃO,\nBASTA SOMENTE CRER,\nÉ SÓ PEDIR A ELE,\nQUE VOCÊ VAI RECEBER.\n\nCORO (2X)     \nMESMO EM LUTAS E AFLIÇÕES                                                  ELE RESPONDE ÀS NOSSAS ORAÇÕES.', 'JESUS, O MELHOR AMIGO, QUE SEMPRE ESTÁ PRESENTE. NELE HÁ PODER PARA MUDAR O CRENTE. MESMO EM LUTAS E AFLIÇÕES ELE RESPONDE ÀS NOSSAS ORAÇÕES. JESUS TEM PODER. MESMO EM GUERRAS E BATALHAS VOCÊ VAI VENCER, PORQUE JESUS NÃO FALHA. SE VOCÊ QUISER UMA BÊNÇÃO, BASTA SOMENTE CRER, É SÓ PEDIR A ELE, QUE VOCÊ VAI RECEBER. MESMO EM LUTAS E AFLIÇÕES ELE RESPONDE ÀS NOSSAS ORAÇÕES.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('120', 'PODERÁ CANTAR', 'CORO\nPODERÁ CANTAR \nQUEM NA ROCHA ESTIVER,\nPODERÁ CANTAR, \nPOIS COM JESUS \nFIRMADO ESTARÁ.\n\nESPEREI PELO SENHOR COM PACIÊNCIA\nE ME FIRMOU OS PASSOS.\nDE ESCORREGAR LIVROU-ME,\nDEU-ME UM NOVO CANTO.\n\nCORO\nPODERÁ CANTAR \nQUEM NA ROCHA ESTIVER,\nPODERÁ CANTAR, \nPOIS COM JESUS \nFIRMADO ESTARÁ.\n\nO CORAÇÃO FIRME EM CRISTO\nPOR VENDAVAIS NÃO VACILARÁ.\nNÃO EM AREIA, MAS NA ROCHA,\nOUVI SUA VOZ, QUE SEGURANÇA!\n\nCORO\nPODERÁ CANTAR \nQUEM NA ROCHA ESTIVER,\nPODERÁ CANTAR, \nPOIS COM JESUS \nFIRMADO ESTARÁ.', 'PODERÁ CANTAR QUEM NA ROCHA ESTIVER, PODERÁ CANTAR, POIS COM JESUS FIRMADO ESTARÁ. ESPEREI PELO SENHOR COM PACIÊNCIA E ME FIRMOU OS PASSOS. DE ESCORREGAR LIVROU-ME, DEU-ME UM NOVO CANTO. PODERÁ CANTAR QUEM NA ROCHA ESTIVER, PODERÁ CANTAR, POIS COM JESUS FIRMADO ESTARÁ. O CORAÇÃO FIRME EM CRISTO POR VENDAVAIS NÃO VACILARÁ. NÃO EM AREIA, MAS NA ROCHA, OUVI SUA VOZ, QUE SEGURANÇA! PODERÁ CANTAR QUEM NA ROCHA ESTIVER, PODERÁ CANTAR, POIS COM JESUS FIRMADO ESTARÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('121', 'MEU BARQUINHO', 'MEU BARQUINHO \nNAVEGA NO MAR,\nMUI FELIZ VIVO \nSEMPRE A CANTAR,\n\nGRANDES ONDAS\nVÊM PARA O NAUFRAGAR,\nNÃO TENHO MEDO, \nVOU A ÂNCORA LANÇAR.\n\nCORO\nVOU A JESUS, VOU A ÂNCORA LANÇAR.\nVOU A JESUS, POR SEU SANGUE VOU CLAMAR\nE FELIZ VOU AO PORTO CHEGAR.\nALELUIA! ALELUIA É O MEU CANTAR!\n\nMEU JESUS É AMIGO FIEL,\nPOR SUA MÃO ME CONDUZ ATÉ AO CÉU\nE SE UM DIA VIER A AFLIÇÃO,\nNÃO TENHO MEDO, \nPOIS É ELE O CAPITÃO.\n\nCORO\nVOU A JESUS, VOU A ÂNCORA LANÇAR.\nVOU A JESUS, POR SEU SANGUE VOU CLAMAR\nE FELIZ VOU AO PORTO CHEGAR.\nALELUIA! ALELUIA É O MEU CANTAR!', 'MEU BARQUINHO NAVEGA NO MAR, MUI FELIZ VIVO SEMPRE A CANTAR, GRANDES ONDAS VÊM PARA O NAUFRAGAR, NÃO TENHO MEDO, VOU A ÂNCORA LANÇAR. VOU A JESUS, VOU A ÂNCORA LANÇAR. VOU A JESUS, POR SEU SANGUE VOU CLAMAR E FELIZ VOU AO PORTO CHEGAR. ALELUIA! ALELUIA É O MEU CANTAR! MEU JESUS É AMIGO FIEL, POR SUA MÃO ME CONDUZ ATÉ AO CÉU E SE UM DIA VIER A AFLIÇÃO, NÃO TENHO MEDO, POIS É ELE O CAPITÃO. VOU A JESUS, VOU A ÂNCORA LANÇAR. VOU A JESUS, POR SEU SANGUE VOU CLAMAR E FELIZ VOU AO PORTO CHEGAR. ALELUIA! ALELUIA É O MEU CANTAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('122', 'CRISTO É MEU AMIGO', 'CRISTO É MEU AMIGO,\nELE ESTÁ COMIGO.\nALELUIA, ALELUIA, \nALELUIA, ALELUIA,\nELE ESTÁ COMIGO.\n\nCRISTO É TEU AMIGO,\nELE ESTÁ CONTIGO.\nALELUIA, ALELUIA, \nALELUIA, ALELUIA,\nELE ESTÁ CONTIGO.', 'CRISTO É MEU AMIGO, ELE ESTÁ COMIGO. ALELUIA, ALELUIA, ALELUIA, ALELUIA, ELE ESTÁ COMIGO. CRISTO É TEU AMIGO, ELE ESTÁ CONTIGO. ALELUIA, ALELUIA, ALELUIA, ALELUIA, ELE ESTÁ CONTIGO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('123', 'NESTA BATALHA NÃO TEREIS QUE PELEJAR', 'NESTA BATALHA NÃO TEREIS QUE PELEJAR;\nAGUARDAI, FICAI PARADOS,\nE VEDE A SALVAÇÃO DO SENHOR \nPARA CONVOSCO, Ó JUDÁ E JERUSALÉM.\n\nNÃO TEMAIS, NEM VOS ASSUSTEIS;\nAMANHÃ SAÍ-LHES AO ENCONTRO,\nPORQUE O SENHOR SERÁ CONVOSCO.\nNESTA BATALHA NÃO TEREIS QUE PELEJAR.', 'NESTA BATALHA NÃO TEREIS QUE PELEJAR; AGUARDAI, FICAI PARADOS, E VEDE A SALVAÇÃO DO SENHOR PARA CONVOSCO, Ó JUDÁ E JERUSALÉM. NÃO TEMAIS, NEM VOS ASSUSTEIS; AMANHÃ SAÍ-LHES AO ENCONTRO, PORQUE O SENHOR SERÁ CONVOSCO. NESTA BATALHA NÃO TEREIS QUE PELEJAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('124', 'O CÉU E A TERRA PASSARÃO', 'O CÉU E A TERRA PASSARÃO\nMAS AS MINHAS PALAVRAS \nNÃO HÃO DE PASSAR.\n\nEU SOU DEUS, SOU FIEL,\nNÃO TEMAIS, NEM VOS ASSUSTEIS!\nPROCLAMAI A VITÓRIA,\nRENOVAI A VOSSA FÉ,\nE O VOSSO ÂNIMO PORQUE\nA TERRA PROMETIDA VOS DAREI. (BIS)\n\n125 - COM JESUS VENCEDOR SEREI\n\nCOM JESUS VENCEDOR SEREI! \nCOM JESUS VENCEDOR SEREI!  \nVENCEDOR, VENCEDOR,\nVENCEDOR SEREI!\nCOM JESUS VENCEDOR SEREI!\n\nNAS BATALHAS ELE ME ACOMPANHA. \nNAS BATALHAS ELE ME ACOMPANHA.\nMEU JESUS, MEU JESUS,\nSEMPRE ME ACOMPANHA.\nCOM JESUS VENCEDOR SEREI!\nCOM JESUS VENCEDOR SEREI!\n\nELE É O MEU SALVADOR.\nELE É O MEU SALVADOR. \nSALVADOR, SALVADOR                           \nÉ O MEU JESUS! \nCOM JESUS VENCEDOR SEREI!', 'O CÉU E A TERRA PASSARÃO MAS AS MINHAS PALAVRAS NÃO HÃO DE PASSAR. EU SOU DEUS, SOU FIEL, NÃO TEMAIS, NEM VOS ASSUSTEIS! PROCLAMAI A VITÓRIA, RENOVAI A VOSSA FÉ, E O VOSSO ÂNIMO PORQUE A TERRA PROMETIDA VOS DAREI. 125 - COM JESUS VENCEDOR SEREI COM JESUS VENCEDOR SEREI! COM JESUS VENCEDOR SEREI! VENCEDOR, VENCEDOR, VENCEDOR SEREI! COM JESUS VENCEDOR SEREI! NAS BATALHAS ELE ME ACOMPANHA. NAS BATALHAS ELE ME ACOMPANHA. MEU JESUS, MEU JESUS, SEMPRE ME ACOMPANHA. COM JESUS VENCEDOR SEREI! COM JESUS VENCEDOR SEREI! ELE É O MEU SALVADOR. ELE É O MEU SALVADOR. SALVADOR, SALVADOR É O MEU JESUS! COM JESUS VENCEDOR SEREI!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('126', 'DEUS FORTE COMO JEOVÁ', 'DEUS FORTE \nCOMO JEOVÁ\nNÃO HÁ OUTRO \nQUE EU CONHEÇA.\n\nDEUS DE VITÓRIA, \nVARÃO DE GUERRA,\nDEUS PODEROSO \nÉ O SENHOR. \n\nONDE, ONDE ESTÁ\nO TEU DEUS? \nONDE, ONDE ESTÁ\nO TEU DEUS?\n\nMEU DEUS ESTÁ NO CÉU,\nTAMBÉM NO MEU CORAÇÃO, \nO DO MUNDO ESTÁ MORTO\nMAS O MEU RESSUSCITOU.', 'DEUS FORTE COMO JEOVÁ NÃO HÁ OUTRO QUE EU CONHEÇA. DEUS DE VITÓRIA, VARÃO DE GUERRA, DEUS PODEROSO É O SENHOR. ONDE, ONDE ESTÁ O TEU DEUS? ONDE, ONDE ESTÁ O TEU DEUS? MEU DEUS ESTÁ NO CÉU, TAMBÉM NO MEU CORAÇÃO, O DO MUNDO ESTÁ MORTO MAS O MEU RESSUSCITOU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('127', 'CRISTO É VITÓRIA', 'CRISTO É VITÓRIA!\nPROCLAMAI COM REAL PRAZER; \nCRISTO É VITÓRIA!\nE COM ELE VAMOS NÓS VENCER!\n\nSE FALTAR PRAZER E LUZ,\nTUDO NOS DÁ JESUS,\nPOIS TEMOS VITÓRIA\nPOR QUEM JÁ VENCEU NA CRUZ.', 'CRISTO É VITÓRIA! PROCLAMAI COM REAL PRAZER; CRISTO É VITÓRIA! E COM ELE VAMOS NÓS VENCER! SE FALTAR PRAZER E LUZ, TUDO NOS DÁ JESUS, POIS TEMOS VITÓRIA POR QUEM JÁ VENCEU NA CRUZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('128', 'CRISTO É MEU AMIGO, É MEU AMIGO', 'CRISTO É MEU AMIGO,\nÉ MEU AMIGO, \nSEGURA FIRME \nA MINHA MÃO!\n\nQUANDO EU ANDO BEM,\nQUANDO ESTOU DOENTE,\nQUANDO ESTOU CONTENTE,\nOU TRISTE ESTOU: ALELUIA!\n\nCRISTO É MEU AMIGO, \nÉ MEU AMIGO,\nSEGURA FIRME A MINHA MÃO!\n\nREPETIR O HINO', 'CRISTO É MEU AMIGO, É MEU AMIGO, SEGURA FIRME A MINHA MÃO! QUANDO EU ANDO BEM, QUANDO ESTOU DOENTE, QUANDO ESTOU CONTENTE, OU TRISTE ESTOU: ALELUIA! CRISTO É MEU AMIGO, É MEU AMIGO, SEGURA FIRME A MINHA MÃO! REPETIR O HINO', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('129', 'ONTEM, HOJE E PARA SEMPRE', 'ONTEM, HOJE  E PARA SEMPRE\nO SALVADOR É IGUAL, TODOS MUDAM, \nMENOS CRISTO, ROCHA ETERNAL.\n\nROCHA ETERNAL, \nROCHA ETERNAL,\nTODOS MUDAM,\nMENOS CRISTO,\nROCHA ETERNAL.', 'ONTEM, HOJE E PARA SEMPRE O SALVADOR É IGUAL, TODOS MUDAM, MENOS CRISTO, ROCHA ETERNAL. ROCHA ETERNAL, ROCHA ETERNAL, TODOS MUDAM, MENOS CRISTO, ROCHA ETERNAL.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('130', 'MEU BOM PASTOR É CRISTO', 'MEU BOM PASTOR É CRISTO, \nCOM ELE ANDAREI;\nCONDUZ-ME ÀS CALMAS ÁGUAS,\nCOM ELE ANDAREI, \nSEMPRE, SEMPRE\nCOM ELE ANDAREI.', 'MEU BOM PASTOR É CRISTO, COM ELE ANDAREI; CONDUZ-ME ÀS CALMAS ÁGUAS, COM ELE ANDAREI, SEMPRE, SEMPRE COM ELE ANDAREI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('131', 'COM CRISTO NO BARCO', 'COM CRISTO NO BARCO\nTUDO VAI MUITO BEM,\nVAI MUITO BEM \nVAI MUITO BEM \nCOM CRISTO NO BARCO\nTUDO VAI MUITO BEM,\nE PASSA O TEMPORAL.\n\nPASSA O TEMPORAL, PASSA O TEMPORAL. COM CRISTO NO BARCO \nTUDO VAI MUITO BEM, E PASSA O TEMPORAL', 'COM CRISTO NO BARCO TUDO VAI MUITO BEM, VAI MUITO BEM VAI MUITO BEM COM CRISTO NO BARCO TUDO VAI MUITO BEM, E PASSA O TEMPORAL. PASSA O TEMPORAL, PASSA O TEMPORAL. COM CRISTO NO BARCO TUDO VAI MUITO BEM, E PASSA O TEMPORAL', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('132', 'MEU BARCO É PEQUENO', 'MEU BARCO É PEQUENO\nE GRANDE É O MAR,\nJESUS SEGURA MINHA MÃO;\nELE É MEU PILOTO\nE TUDO VAI BEM\nNA VIAGEM PRA JERUSALÉM.\n\nJESUS VÊ A SUA IGREJA \nCOMO UM FORTE EDIFÍCIO,\nFIRME E EDIFICADO \nPARA MORADA DE DEUS.\n\n133 - JESUS VÊ A SUA IGREJA\n\nCORO (2X)\nNÃO É FEITA DE TIJOLO \nE MADEIRA, NÃO!\nÉ JESUS BEM VIVO NO CORAÇÃO.\n\nEDIFÍCIO ESPECIAL\nDESENHADO POR JESUS,\nPARA SEMPRE ERGUIDO \nPELO SANTO ESPÍRITO.\n\nCORO (2X)\nNÃO É FEITA DE TIJOLO \nE MADEIRA, NÃO!\nÉ JESUS BEM VIVO NO CORAÇÃO.\n\nVENHA PARA A IGREJA,\nVAMOS JUNTOS TRABALHAR\nNESTA OBRA GLORIOSA             \nATÉ JESUS VOLTAR.\n\nCORO (2X)\nNÃO É FEITA DE TIJOLO \nE MADEIRA NÃO!\nÉ JESUS BEM VIVO NO CORAÇÃO.', 'MEU BARCO É PEQUENO E GRANDE É O MAR, JESUS SEGURA MINHA MÃO; ELE É MEU PILOTO E TUDO VAI BEM NA VIAGEM PRA JERUSALÉM. JESUS VÊ A SUA IGREJA COMO UM FORTE EDIFÍCIO, FIRME E EDIFICADO PARA MORADA DE DEUS. 133 - JESUS VÊ A SUA IGREJA NÃO É FEITA DE TIJOLO E MADEIRA, NÃO! É JESUS BEM VIVO NO CORAÇÃO. EDIFÍCIO ESPECIAL DESENHADO POR JESUS, PARA SEMPRE ERGUIDO PELO SANTO ESPÍRITO. NÃO É FEITA DE TIJOLO E MADEIRA, NÃO! É JESUS BEM VIVO NO CORAÇÃO. VENHA PARA A IGREJA, VAMOS JUNTOS TRABALHAR NESTA OBRA GLORIOSA ATÉ JESUS VOLTAR. NÃO É FEITA DE TIJOLO E MADEIRA NÃO! É JESUS BEM VIVO NO CORAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('134', 'VOU CAMINHANDO PRA JERUSALÉM', 'VOU CAMINHANDO \nPRA JERUSALÉM,\nA CADA DIA, \nCHEGO MAIS PERTO,\n\nQUEM ME CONDUZ  \nÉ O MEU JESUS\nPOIS NO CLAMOR \nSEU SANGUE LIMPA \nE ANDO NA LUZ;\n\nE TENHO AS ARMAS ESPIRITUAIS: \nA ORAÇÃO, O LOUVOR, O JEJUM \nE  MADRUGADA E A PALAVRA REVELADA\nQUE ALIMENTA A ALMA E NOS ENSINA \nA VONTADE DO SENHOR.\n\nVOU CAMINHANDO\nPRA JERUSALÉM,\nSE VOCÊ QUISER,  \nVENHA COMIGO TAMBÉM\nSE VOCÊ QUISER,  \nVENHA COMIGO TAMBÉM', 'VOU CAMINHANDO PRA JERUSALÉM, A CADA DIA, CHEGO MAIS PERTO, QUEM ME CONDUZ É O MEU JESUS POIS NO CLAMOR SEU SANGUE LIMPA E ANDO NA LUZ; E TENHO AS ARMAS ESPIRITUAIS: A ORAÇÃO, O LOUVOR, O JEJUM E MADRUGADA E A PALAVRA REVELADA QUE ALIMENTA A ALMA E NOS ENSINA A VONTADE DO SENHOR. VOU CAMINHANDO PRA JERUSALÉM, SE VOCÊ QUISER, VENHA COMIGO TAMBÉM SE VOCÊ QUISER, VENHA COMIGO TAMBÉM', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('135', 'FLUA EM MIM, SENHOR', 'FLUA EM MIM, SENHOR,\nDO TEU ESPÍRITO,\nEU VOU TESTEMUNHAR \nDE TEU AMOR SEM PAR,\nAO MUNDO ANUNCIAR\nQUE CRISTO SALVA O PECADOR.\n\nFLUA EM MIM, SENHOR, \nDO TEU ESPÍRITO,\nFLUA EM MIM, SENHOR,\nDO TEU ESPÍRITO,\nEU VOU TESTEMUNHAR\nDE TEU AMOR SEM PAR,\nAO MUNDO ANUNCIAR\nQUE CRISTO SALVA O PECADOR.', 'FLUA EM MIM, SENHOR, DO TEU ESPÍRITO, EU VOU TESTEMUNHAR DE TEU AMOR SEM PAR, AO MUNDO ANUNCIAR QUE CRISTO SALVA O PECADOR. FLUA EM MIM, SENHOR, DO TEU ESPÍRITO, FLUA EM MIM, SENHOR, DO TEU ESPÍRITO, EU VOU TESTEMUNHAR DE TEU AMOR SEM PAR, AO MUNDO ANUNCIAR QUE CRISTO SALVA O PECADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('136', 'LÂMPADA PARA OS MEUS PÉS', 'LÂMPADA PARA OS MEUS PÉS,\nO CAMINHO ILUMINA,\nREVELADA POR DEUS,\nGUIARÁ O MEU CORAÇÃO.\n\nCORO\nA BÍBLIA É UM TESOURO \nDESCOBERTO PARA AQUELES \nQUE DE JESUS ESTÃO PERTO;\nA MINHA BÍBLIA VOU SEMPRE LER, PARA MAIS DE JESUS CONHECER.\n\nQUERO AMAR TUA PALAVRA,\nGUARDÁ-LA SEMPRE \nEM MEU CORAÇÃO,\nENSINAR ÀS PESSOAS\nQUE SÓ JESUS É A SALVAÇÃO.\n\nCORO\nA BÍBLIA É UM TESOURO \nDESCOBERTO PARA AQUELES \nQUE DE JESUS ESTÃO PERTO;\nA MINHA BÍBLIA \nVOU SEMPRE LER, PARA MAIS \nDE JESUS CONHECER.', 'LÂMPADA PARA OS MEUS PÉS, O CAMINHO ILUMINA, REVELADA POR DEUS, GUIARÁ O MEU CORAÇÃO. A BÍBLIA É UM TESOURO DESCOBERTO PARA AQUELES QUE DE JESUS ESTÃO PERTO; A MINHA BÍBLIA VOU SEMPRE LER, PARA MAIS DE JESUS CONHECER. QUERO AMAR TUA PALAVRA, GUARDÁ-LA SEMPRE EM MEU CORAÇÃO, ENSINAR ÀS PESSOAS QUE SÓ JESUS É A SALVAÇÃO. A BÍBLIA É UM TESOURO DESCOBERTO PARA AQUELES QUE DE JESUS ESTÃO PERTO; A MINHA BÍBLIA VOU SEMPRE LER, PARA MAIS DE JESUS CONHECER.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('137', 'NÃO POR FORÇA', '“NÃO POR FORÇA NEM \nPOR VIOLÊNCIA,\nMAS PELO MEU ESPÍRITO”.\n“NÃO POR FORÇA NEM \nPOR VIOLÊNCIA,\nMAS PELO MEU ESPÍRITO”.\n\nDIZ O SENHOR DOS EXÉRCITOS,\nDIZ O SENHOR DOS EXÉRCITOS:\n“NÃO POR FORÇA \nNEM POR VIOLÊNCIA,\nMAS PELO MEU ESPÍRITO”.', 'NÃO POR FORÇA NEM POR VIOLÊNCIA, MAS PELO MEU ESPÍRITO. NÃO POR FORÇA NEM POR VIOLÊNCIA, MAS PELO MEU ESPÍRITO. DIZ O SENHOR DOS EXÉRCITOS, DIZ O SENHOR DOS EXÉRCITOS: NÃO POR FORÇA NEM POR VIOLÊNCIA, MAS PELO MEU ESPÍRITO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('138', 'SOU UM SOLDADO DO BOM SALVADOR', 'SOU UM SOLDADO \nDO BOM SALVADOR,\nPOR JESUS LUTANDO\nCOM FÉ E AMOR.\n\nESPADA SEGURANDO                    BEM FIRME EM MINHA MÃO,\nA JESUS SEGUINDO,                           O GRANDE CAPITÃO.\n\nAO CÉU EU VOU MARCHANDO, \nJESUS ME ESPERA LÁ,\nPRA FRENTE EU VOU ANDANDO, \nAO CÉU EU VOU CHEGAR.\nFALANDO: UM, DOIS, TRÊS, QUATRO.\n\nSOU UM SOLDADO \nDO BOM SALVADOR,\nPOR JESUS LUTANDO\nCOM FÉ E AMOR.', 'SOU UM SOLDADO DO BOM SALVADOR, POR JESUS LUTANDO COM FÉ E AMOR. ESPADA SEGURANDO BEM FIRME EM MINHA MÃO, A JESUS SEGUINDO, O GRANDE CAPITÃO. AO CÉU EU VOU MARCHANDO, JESUS ME ESPERA LÁ, PRA FRENTE EU VOU ANDANDO, AO CÉU EU VOU CHEGAR. FALANDO: UM, DOIS, TRÊS, QUATRO. SOU UM SOLDADO DO BOM SALVADOR, POR JESUS LUTANDO COM FÉ E AMOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('139', 'DONS DO ESPÍRITO SANTO', 'DONS DO ESPÍRITO SANTO,\nBÊNÇÃOS QUE ALMEJO TANTO,\nSÃO COMO PEDRAS PRECIOSAS,\nCOMO O PERFUME DAS ROSAS.\n\nSABEDORIA, CIÊNCIA, FÉ, \nDONS DE CURAR, E MARAVILHAS, PROFECIA, DISCERNIMENTO, \nLÍNGUAS ESTRANHAS, INTERPRETAÇÃO.\n\nDONS DO ESPÍRITO SANTO,\nBÊNÇÃOS QUE ALMEJO TANTO,\nSÃO COMO PEDRAS PRECIOSAS,\nCOMO O PERFUME DAS ROSAS.\n\nSABEDORIA, CIÊNCIA, FÉ, \nDONS DE CURAR, E MARAVILHAS, PROFECIA, DISCERNIMENTO, \nLÍNGUAS ESTRANHAS, INTERPRETAÇÃO.', 'DONS DO ESPÍRITO SANTO, BÊNÇÃOS QUE ALMEJO TANTO, SÃO COMO PEDRAS PRECIOSAS, COMO O PERFUME DAS ROSAS. SABEDORIA, CIÊNCIA, FÉ, DONS DE CURAR, E MARAVILHAS, PROFECIA, DISCERNIMENTO, LÍNGUAS ESTRANHAS, INTERPRETAÇÃO. DONS DO ESPÍRITO SANTO, BÊNÇÃOS QUE ALMEJO TANTO, SÃO COMO PEDRAS PRECIOSAS, COMO O PERFUME DAS ROSAS. SABEDORIA, CIÊNCIA, FÉ, DONS DE CURAR, E MARAVILHAS, PROFECIA, DISCERNIMENTO, LÍNGUAS ESTRANHAS, INTERPRETAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('140', 'UMA LUZ RESPLANDECENTE', 'UMA LUZ RESPLANDECENTE\nHÁ EM VOLTA DO TEU OLHAR,\nTUA FACE RELUZENTE\nVEM HOJE ME MOSTRAR.\n\nSEI QUE UM DIA TU VIRÁS\nE ENTÃO ME LEVARÁS\nANTES MESMO QUE EU PEÇA:\nSENHOR, VEM ME BUSCAR!\n\nSEGURA-ME PELA MÃO\nQUANDO A VIDA ATRAVESSAR,\nSEI QUE TU ESTARÁS COMIGO\nQUANDO O MAL ME ENCONTRAR.', 'UMA LUZ RESPLANDECENTE HÁ EM VOLTA DO TEU OLHAR, TUA FACE RELUZENTE VEM HOJE ME MOSTRAR. SEI QUE UM DIA TU VIRÁS E ENTÃO ME LEVARÁS ANTES MESMO QUE EU PEÇA: SENHOR, VEM ME BUSCAR! SEGURA-ME PELA MÃO QUANDO A VIDA ATRAVESSAR, SEI QUE TU ESTARÁS COMIGO QUANDO O MAL ME ENCONTRAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('141', 'QUEM IRÁ?', 'QUEM IRÁ, QUEM IRÁ \nLEVAR A PRECIOSA SEMENTE?\nBIS\n\nAQUELE QUE LEVA \nA PRECIOSA SEMENTE                ANDANDO  E CHORANDO\nVOLTARÁ, SIM, COM ALEGRIA,\nTRAZENDO CONSIGO\nOS SEU MOLHOS\n\nEU IREI, SIM IREI,\nLEVAR A PALAVRA DE DEUS.\nEU IREI, SIM IREI,\nLEVAR A PALAVRA DE DEUS.\n\nAQUELE QUE LEVA \nA PRECIOSA SEMENTE                ANDANDO  E CHORANDO\nVOLTARÁ, SIM, COM ALEGRIA,\nTRAZENDO CONSIGO\nOS SEU MOLHOS', 'QUEM IRÁ, QUEM IRÁ LEVAR A PRECIOSA SEMENTE? AQUELE QUE LEVA A PRECIOSA SEMENTE ANDANDO E CHORANDO VOLTARÁ, SIM, COM ALEGRIA, TRAZENDO CONSIGO OS SEU MOLHOS EU IREI, SIM IREI, LEVAR A PALAVRA DE DEUS. EU IREI, SIM IREI, LEVAR A PALAVRA DE DEUS. AQUELE QUE LEVA A PRECIOSA SEMENTE ANDANDO E CHORANDO VOLTARÁ, SIM, COM ALEGRIA, TRAZENDO CONSIGO OS SEU MOLHOS', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('142', 'COMO UMA FOLHA AO VENTO', 'COMO UMA FOLHA AO VENTO\nVOA PRA LÁ E PRA CÁ,\nEU TAMBÉM QUERO ESTAR\nAONDE O ESPÍRITO SANTO MANDAR.\n\nNÃO FAÇO MAIS O QUE EU QUERO,\nMAS O QUE DEUS REVELAR;\nCOMO UMA FOLHA AO VENTO,\nVOANDO, VAI SEMPRE ONDE \nO VENTO SOPRAR,\n\nEU TAMBÉM QUERO ESTAR\nAONDE O ESPÍRITO SANTO MANDAR.\nEU TAMBÉM QUERO ESTAR\nAONDE O ESPÍRITO SANTO MANDAR.', 'COMO UMA FOLHA AO VENTO VOA PRA LÁ E PRA CÁ, EU TAMBÉM QUERO ESTAR AONDE O ESPÍRITO SANTO MANDAR. NÃO FAÇO MAIS O QUE EU QUERO, MAS O QUE DEUS REVELAR; COMO UMA FOLHA AO VENTO, VOANDO, VAI SEMPRE ONDE O VENTO SOPRAR, EU TAMBÉM QUERO ESTAR AONDE O ESPÍRITO SANTO MANDAR. EU TAMBÉM QUERO ESTAR AONDE O ESPÍRITO SANTO MANDAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('143', 'TENHO UMA CANDEIA (CANDEIA ACESA)', 'CORO\nTENHO UMA CANDEIA,  \nDE ÓLEO ESTÁ CHEIA,                      \nELA ANUNCIA QUE \nJESUS VOLTARÁ;\n\nLUZ BRILHANTE, REFULGENTE,              \nÉ O GRITO DA IGREJA:\nJESUS VAI VOLTAR!\n\nACENDE TUA CANDEIA,    \nNÃO A DEIXES APAGAR,\nILUMINANDO O TEU  ROSTO \nJESUS TE VERÁ.\n\nCORO\nTENHO UMA CANDEIA,  \nDE ÓLEO ESTÁ CHEIA,                      \nELA ANUNCIA QUE JESUS VOLTARÁ;\nLUZ BRILHANTE, REFULGENTE,              \nÉ O GRITO DA IGREJA:\nJESUS VAI VOLTAR!\n\nCANDEIA VAZIA              \nEU NÃO QUERO, NÃO,\nCANDEIA CHEIA, \nEU QUERO, SIM,\nCANDEIA COM FOGO   \nPRONTA PARA SUBIR.\n\nCANDEIA  VAZIA              \nEU NÃO QUERO, NÃO,\nCANDEIA  CHEIA, \nEU QUERO, SIM,\nCANDEIA  COM  FOGO   \nPRONTA  PARA  SUBIR.\n\nCORO\nTENHO UMA CANDEIA,  \nDE ÓLEO ESTÁ CHEIA,                      \nELA ANUNCIA QUE JESUS VOLTARÁ;\nLUZ BRILHANTE, REFULGENTE,              \nÉ O GRITO DA IGREJA:\nJESUS VAI VOLTAR!', 'TENHO UMA CANDEIA, DE ÓLEO ESTÁ CHEIA, ELA ANUNCIA QUE JESUS VOLTARÁ; LUZ BRILHANTE, REFULGENTE, É O GRITO DA IGREJA: JESUS VAI VOLTAR! ACENDE TUA CANDEIA, NÃO A DEIXES APAGAR, ILUMINANDO O TEU ROSTO JESUS TE VERÁ. TENHO UMA CANDEIA, DE ÓLEO ESTÁ CHEIA, ELA ANUNCIA QUE JESUS VOLTARÁ; LUZ BRILHANTE, REFULGENTE, É O GRITO DA IGREJA: JESUS VAI VOLTAR! CANDEIA VAZIA EU NÃO QUERO, NÃO, CANDEIA CHEIA, EU QUERO, SIM, CANDEIA COM FOGO PRONTA PARA SUBIR. CANDEIA VAZIA EU NÃO QUERO, NÃO, CANDEIA CHEIA, EU QUERO, SIM, CANDEIA COM FOGO PRONTA PARA SUBIR. TENHO UMA CANDEIA, DE ÓLEO ESTÁ CHEIA, ELA ANUNCIA QUE JESUS VOLTARÁ; LUZ BRILHANTE, REFULGENTE, É O GRITO DA IGREJA: JESUS VAI VOLTAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('144', 'NOVA ALIANÇA', 'NOVA ALIANÇA \nFEZ O MEU SENHOR\nCOM O SEU POVO \nNUM ATO DE AMOR; \n“EIS QUE FAÇO NOVAS \nTODAS AS COISAS”,\nASSIM FALOU O SENHOR.\n\nPREPARO O MEU CORAÇÃO\nPARA O ARREBATAMENTO,\nNÃO SERÁ FÁCIL, LUTAS VIRÃO,\nMAS NA BUSCA AO SENHOR\nELE DARÁ A SOLUÇÃO;\n\nCOM O ESPÍRITO SANTO\nQUER BATIZAR E EXPERIÊNCIAS \nCOM OS DONS QUER DAR,\n\nEU NÃO TEMEREI, \nCOM CRISTO ANDAREI \nNA DIREÇÃO DO ESPÍRITO SANTO.\n\nQUANDO EU CAMINHAR\nCOM MEU JESUS\nVAI RAIAR A LUZ\nE VIDAS SE ENTREGARÃO,\nRECEBENDO A SALVAÇÃO;\n\nE JUNTOS NUM CORPO UNIDO\nVAMOS RUMO À\nTÃO ESPERADA SIÃO.\nTÃO ESPERADA SIÃO.', 'NOVA ALIANÇA FEZ O MEU SENHOR COM O SEU POVO NUM ATO DE AMOR; EIS QUE FAÇO NOVAS TODAS AS COISAS, ASSIM FALOU O SENHOR. PREPARO O MEU CORAÇÃO PARA O ARREBATAMENTO, NÃO SERÁ FÁCIL, LUTAS VIRÃO, MAS NA BUSCA AO SENHOR ELE DARÁ A SOLUÇÃO; COM O ESPÍRITO SANTO QUER BATIZAR E EXPERIÊNCIAS COM OS DONS QUER DAR, EU NÃO TEMEREI, COM CRISTO ANDAREI NA DIREÇÃO DO ESPÍRITO SANTO. QUANDO EU CAMINHAR COM MEU JESUS VAI RAIAR A LUZ E VIDAS SE ENTREGARÃO, RECEBENDO A SALVAÇÃO; E JUNTOS NUM CORPO UNIDO VAMOS RUMO À TÃO ESPERADA SIÃO. TÃO ESPERADA SIÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('145', 'REVELAÇÃO ABRE PRA VOCÊ', 'REVELAÇÃO ABRE PRA VOCÊCONHECIMENTO DE DEUS \nE SEU PODER; O ESPÍRITO SANTO \nMOSTRA AO QUE CRÊ\n\nCOISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ.\nCOISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ.\n\nREVELAÇÃO ABRE PRA VOCÊCONHECIMENTO DE DEUS E SEU PODER;\nO ESPÍRITO SANTO MOSTRA AO QUE CRÊ\n\nCOISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ.\nCOISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ.', 'REVELAÇÃO ABRE PRA VOCÊCONHECIMENTO DE DEUS E SEU PODER; O ESPÍRITO SANTO MOSTRA AO QUE CRÊ COISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ. COISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ. REVELAÇÃO ABRE PRA VOCÊCONHECIMENTO DE DEUS E SEU PODER; O ESPÍRITO SANTO MOSTRA AO QUE CRÊ COISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ. COISAS MARAVILHOSASQUE O HOMEM SEM DEUS NÃO VÊ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('146', 'A IGREJA QUE ORA É VITORIOSA', 'A IGREJA QUE ORA \nÉ VITORIOSA, SEMPRE ESTÁ NA \nDEPENDÊNCIA DO SENHOR;\n\nA IGREJA QUE ORA É VITORIOSA,\nMUITOS MILAGRES ACONTECEM.\nPORQUE É UM CORPO VIVO\nONDE O CABEÇA É JESUS.\nPORQUE É UM CORPO VIVO\nONDE O CABEÇA É JESUS.\n\nSE UMA BÊNÇÃO QUER\nDOBRA OS TEUS JOELHOS,\nCLAMA, ORA, BUSCA SUA FACE;\nORANDO, CANTANDO, VERÁS\nO FRUTO DO ESPÍRITO SANTO.', 'A IGREJA QUE ORA É VITORIOSA, SEMPRE ESTÁ NA DEPENDÊNCIA DO SENHOR; A IGREJA QUE ORA É VITORIOSA, MUITOS MILAGRES ACONTECEM. PORQUE É UM CORPO VIVO ONDE O CABEÇA É JESUS. PORQUE É UM CORPO VIVO ONDE O CABEÇA É JESUS. SE UMA BÊNÇÃO QUER DOBRA OS TEUS JOELHOS, CLAMA, ORA, BUSCA SUA FACE; ORANDO, CANTANDO, VERÁS O FRUTO DO ESPÍRITO SANTO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('147', 'EM TUAS PISADAS', 'EM TUAS PISADAS \nCOLOCO OS MEUS PÉS,  \nASSIM, BEM FIRMADO, \nNÃO VACILAREI;\n\nOS  TEUS  PRECEITOS, \nSENHOR, OS  GUARDEI,\nAS TUAS  PALAVRAS                 \nSÃO MEU ALIMENTO,\nVIVER NA TUA OBRA  \nÉ O MEU SUSTENTO.\nBIS\n\nEM TUAS PISADAS \nCOLOCO OS MEUS PÉS,  \nASSIM, BEM FIRMADO, \nNÃO VACILAREI;\n\nOS  TEUS  PRECEITOS, \nSENHOR, OS  GUARDEI,\nAS TUAS  PALAVRAS                      \nSÃO MEU ALIMENTO,\nVIVER NA TUA OBRA  \nÉ O MEU SUSTENTO.\nBIS', 'EM TUAS PISADAS COLOCO OS MEUS PÉS, ASSIM, BEM FIRMADO, NÃO VACILAREI; OS TEUS PRECEITOS, SENHOR, OS GUARDEI, AS TUAS PALAVRAS SÃO MEU ALIMENTO, VIVER NA TUA OBRA É O MEU SUSTENTO. EM TUAS PISADAS COLOCO OS MEUS PÉS, ASSIM, BEM FIRMADO, NÃO VACILAREI; OS TEUS PRECEITOS, SENHOR, OS GUARDEI, AS TUAS PALAVRAS SÃO MEU ALIMENTO, VIVER NA TUA OBRA É O MEU SUSTENTO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('148', 'ANDANDO EM ESPÍRITO', 'ANDANDO EM ESPÍRITO \nVENCEREI A TENTAÇÃO,AGRADAREI A DEUS \nEM PERFEITA COMUNHÃO,\n\n“POIS O FRUTO DO ESPÍRITO                             É: AMOR, GOZO, PAZ, LONGANIMIDADE, BENIGNIDADE, BONDADE, FÉ, MANSIDÃO, TEMPERANÇA”.\n\nVIVENDO EM ESPÍRITO,\nANDANDO EM ESPÍRITO,ASSIM SOMOS SERVOS\nFIÉIS DE CRISTO.\nBIS', 'ANDANDO EM ESPÍRITO VENCEREI A TENTAÇÃO,AGRADAREI A DEUS EM PERFEITA COMUNHÃO, POIS O FRUTO DO ESPÍRITO É: AMOR, GOZO, PAZ, LONGANIMIDADE, BENIGNIDADE, BONDADE, FÉ, MANSIDÃO, TEMPERANÇA. VIVENDO EM ESPÍRITO, ANDANDO EM ESPÍRITO,ASSIM SOMOS SERVOS FIÉIS DE CRISTO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('149', 'NÓS SOMOS UMA VOZ', 'NÓS SOMOS UMA VOZ\nQUE CLAMA NO DESERTO,\nNESTE MUNDO DE ILUSÕES\nPROCLAMAMOS A MENSAGEM  \nDE SALVAÇÃO.\n\nDEUS AMA O QUE SE APRESSA,\nELE AMA O EVANGELISTA,\nAMA AQUELE QUE SE APRESSA\nPRA ANUNCIAR A SALVAÇÃOEM NOME DE JESUS.\n\nNÓS SOMOS UMA VOZ\nQUE CLAMA NO DESERTO,\nNESTE MUNDO DE ILUSÕES\nPROCLAMAMOS A MENSAGEM  \nDE SALVAÇÃO.\n\nDEUS AMA O QUE SE APRESSA,\nELE AMA O EVANGELISTA,\nAMA AQUELE QUE SE APRESSA\nPRA ANUNCIAR A SALVAÇÃOEM NOME DE JESUS.', 'NÓS SOMOS UMA VOZ QUE CLAMA NO DESERTO, NESTE MUNDO DE ILUSÕES PROCLAMAMOS A MENSAGEM DE SALVAÇÃO. DEUS AMA O QUE SE APRESSA, ELE AMA O EVANGELISTA, AMA AQUELE QUE SE APRESSA PRA ANUNCIAR A SALVAÇÃOEM NOME DE JESUS. NÓS SOMOS UMA VOZ QUE CLAMA NO DESERTO, NESTE MUNDO DE ILUSÕES PROCLAMAMOS A MENSAGEM DE SALVAÇÃO. DEUS AMA O QUE SE APRESSA, ELE AMA O EVANGELISTA, AMA AQUELE QUE SE APRESSA PRA ANUNCIAR A SALVAÇÃOEM NOME DE JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('150', 'CINCO SEIXOS', 'CINCO SEIXOS DO RIBEIRO \nDAVI COLOCOU\nEM SEU ALFORJE DE PASTOR\nQUANDO GOLIAS \nFOI A ENFRENTAR.\nSEM MEDO DAVI FOI LUTAR.\n\nDAVI OROU, \nCONFIOU EM DEUS,\nPARA ASSIM \nVENCER O FILISTEU.\n\nEM SEU CORAÇÃO HAVIA O LOUVOR,\nA PALAVRA, O JEJUM E A ORAÇÃO\nE NA MADRUGADA, \nSEMPRE A DEUS BUSCAVA\nDEIXANDO O SENHOR \nSUA VIDA DIRIGIR.\n\nE QUANDO GOLIAS FOI ENCONTRAR\nSÓ UMA PEDRA EM SUA FUNDA COLOCOU.\nE MIROU, GIROU, LANÇOU\nNA TESTA DO GIGANTE A PEDRA CRAVOU\n(TRUMMMM)\n\nO GIGANTE CAIU, \nDAVI FOI VENCEDOR.\nNO NOME DO SENHOR, \nNO NOME DO SENHOR.', 'CINCO SEIXOS DO RIBEIRO DAVI COLOCOU EM SEU ALFORJE DE PASTOR QUANDO GOLIAS FOI A ENFRENTAR. SEM MEDO DAVI FOI LUTAR. DAVI OROU, CONFIOU EM DEUS, PARA ASSIM VENCER O FILISTEU. EM SEU CORAÇÃO HAVIA O LOUVOR, A PALAVRA, O JEJUM E A ORAÇÃO E NA MADRUGADA, SEMPRE A DEUS BUSCAVA DEIXANDO O SENHOR SUA VIDA DIRIGIR. E QUANDO GOLIAS FOI ENCONTRAR SÓ UMA PEDRA EM SUA FUNDA COLOCOU. E MIROU, GIROU, LANÇOU NA TESTA DO GIGANTE A PEDRA CRAVOU (TRUMMMM) O GIGANTE CAIU, DAVI FOI VENCEDOR. NO NOME DO SENHOR, NO NOME DO SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('151', 'NO PRINCÍPIO ERA O VERBO', '“NO PRINCÍPIO ERA O VERBOE O VERBO ESTAVA COM DEUSE O VERBO ERA DEUS”.\n\n“TODAS AS COISAS\n FORAM FEITAS POR ELE\n E SEM ELE NADA \n DO QUE FOI FEITO SE FEZ”.\n\nVEIO TOMAR AS NOSSAS DORES,\nCONHECER AS NOSSAS  FRAQUEZAS\nE, DIANTE DO PAI, O NOSSO PECADO JUSTIFICAR.\n\nESTE VERBO É A PALAVRA VIVA, \nPROCLAMADA NA ETERNIDADE POR DEUS,\nQUANDO PROMETEU O SEU FILHO PRA MORRER \nEM NOSSO LUGAR.\n\nPOR ISSO TE LOUVAMOS,\nTE ADORAMOS, Ó DEUS!\nPELO SACRIFÍCIO DE JESUS\nTE RENDEMOS GLÓRIA,\n\nTODOS OS DIAS VALORIZAMOS \nESSA IDENTIDADE:\nA MARCA DO SANGUE, \nO ESPÍRITO SANTO, QUE NOS DÁ PLENA COMUNHÃO COM DEUS.\n\nPOR ISSO TE LOUVAMOS,\nTE ADORAMOS, Ó DEUS!\nPELO SACRIFÍCIO DE JESUS\nTE RENDEMOS GLÓRIA,\n\nTODOS OS DIAS VALORIZAMOS \nESSA IDENTIDADE:\nA MARCA DO SANGUE, \nO ESPÍRITO SANTO, QUE NOS DÁ PLENA COMUNHÃO COM DEUS.', 'NO PRINCÍPIO ERA O VERBOE O VERBO ESTAVA COM DEUSE O VERBO ERA DEUS. TODAS AS COISAS FORAM FEITAS POR ELE E SEM ELE NADA DO QUE FOI FEITO SE FEZ. VEIO TOMAR AS NOSSAS DORES, CONHECER AS NOSSAS FRAQUEZAS E, DIANTE DO PAI, O NOSSO PECADO JUSTIFICAR. ESTE VERBO É A PALAVRA VIVA, PROCLAMADA NA ETERNIDADE POR DEUS, QUANDO PROMETEU O SEU FILHO PRA MORRER EM NOSSO LUGAR. POR ISSO TE LOUVAMOS, TE ADORAMOS, Ó DEUS! PELO SACRIFÍCIO DE JESUS TE RENDEMOS GLÓRIA, TODOS OS DIAS VALORIZAMOS ESSA IDENTIDADE: A MARCA DO SANGUE, O ESPÍRITO SANTO, QUE NOS DÁ PLENA COMUNHÃO COM DEUS. POR ISSO TE LOUVAMOS, TE ADORAMOS, Ó DEUS! PELO SACRIFÍCIO DE JESUS TE RENDEMOS GLÓRIA, TODOS OS DIAS VALORIZAMOS ESSA IDENTIDADE: A MARCA DO SANGUE, O ESPÍRITO SANTO, QUE NOS DÁ PLENA COMUNHÃO COM DEUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('152', 'NAS BATALHAS SOU UM VENCEDOR', 'NAS BATALHAS SOU UM VENCEDOR, \nUSO AS ARMAS ESPIRITUAIS.\nREVESTIDO DE TODAA ARMADURA DE DEUS,\nSEREI FORTALECIDO NO SENHOR.\n\nTENHO CINGIDOS OS LOMBOS \nCOM A VERDADE, E VESTIDA \nA COURAÇA DA JUSTIÇA,\nE CALÇADOS OS PÉS NA PREPARAÇÃO DO EVANGELHO DA PAZ.\n\nTENHO, SOBRETUDO O ESCUDO DA FÉ,\nE TAMBÉM O CAPACETE DA SALVAÇÃO,\nE A ESPADA DO ESPÍRITO,QUE É A PALAVRA DE DEUS.\n\nNAS BATALHAS SOU UM VENCEDOR, \nUSO AS ARMAS ESPIRITUAIS. REVESTIDO DE TODAA ARMADURA DE DEUS,\nSEREI FORTALECIDO NO SENHOR, \nE NA FORÇA DO SEU PODER.', 'NAS BATALHAS SOU UM VENCEDOR, USO AS ARMAS ESPIRITUAIS. REVESTIDO DE TODAA ARMADURA DE DEUS, SEREI FORTALECIDO NO SENHOR. TENHO CINGIDOS OS LOMBOS COM A VERDADE, E VESTIDA A COURAÇA DA JUSTIÇA, E CALÇADOS OS PÉS NA PREPARAÇÃO DO EVANGELHO DA PAZ. TENHO, SOBRETUDO O ESCUDO DA FÉ, E TAMBÉM O CAPACETE DA SALVAÇÃO, E A ESPADA DO ESPÍRITO,QUE É A PALAVRA DE DEUS. NAS BATALHAS SOU UM VENCEDOR, USO AS ARMAS ESPIRITUAIS. REVESTIDO DE TODAA ARMADURA DE DEUS, SEREI FORTALECIDO NO SENHOR, E NA FORÇA DO SEU PODER.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('153', 'COMO NOÉ', 'COMO NOÉ, \nQUERO OBEDECER\nÀ DOCE VOZ DE DEUS,\nA ARCA VOU FAZER;\nCOMO NOÉ NA ARCA VOU ENTRAR\nE SALVAÇÃO VOU ALCANÇAR.\n\nPELA FÉ NOÉ \nEM TUDO OBEDECEU, \nSEGUINDO O PROJETO,\nNADA ELE TEMEU. \nHERDEIRO COM JESUS\nDEUS ASSIM O FEZ, \nPOIS A SALVAÇÃO\nÉ PRA TODO O QUE CRÊ.\n\nHERDEIRO COM JESUS\nDEUS ASSIM O FEZ, \nPOIS A SALVAÇÃO\nÉ PRA TODO O QUE CRÊ.\n\nCOMO NOÉ, \nQUERO OBEDECER\nÀ DOCE VOZ DE DEUS,\nA ARCA VOU FAZER.\nCOMO NOÉ NA ARCA \nVOU ENTRAR E SALVAÇÃO\nVOU ALCANÇAR.', 'COMO NOÉ, QUERO OBEDECER À DOCE VOZ DE DEUS, A ARCA VOU FAZER; COMO NOÉ NA ARCA VOU ENTRAR E SALVAÇÃO VOU ALCANÇAR. PELA FÉ NOÉ EM TUDO OBEDECEU, SEGUINDO O PROJETO, NADA ELE TEMEU. HERDEIRO COM JESUS DEUS ASSIM O FEZ, POIS A SALVAÇÃO É PRA TODO O QUE CRÊ. HERDEIRO COM JESUS DEUS ASSIM O FEZ, POIS A SALVAÇÃO É PRA TODO O QUE CRÊ. COMO NOÉ, QUERO OBEDECER À DOCE VOZ DE DEUS, A ARCA VOU FAZER. COMO NOÉ NA ARCA VOU ENTRAR E SALVAÇÃO VOU ALCANÇAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('154', 'COM O ESPÍRITO DE DEUS', 'CORO\nCOM O ESPÍRITO DE DEUS \nEM MINHA VIDA,\nSOU FELIZ, SOU FELIZ!\nTENHO PAZ, CONSOLO, \nGRAÇA E ALEGRIA.\nSOU FELIZ, SIM, SOU FELIZ!\n\nCRISTO PROMETEU \nDEIXAR-NOS O CONSOLADOR\nPARA ESTAR CONOSCO \nSEMPRE ONDE QUER QUE FOR,\n\nO ESPÍRITO DE VERDADE, \nQUE ACONSELHARÁ\nMINHA VIDA, ENSINANDO \nCOMO DEVO ANDAR.\n\nCORO\nCOM O ESPÍRITO DE DEUS \nEM MINHA VIDA,\nSOU FELIZ, SOU FELIZ!\nTENHO PAZ, CONSOLO, \nGRAÇA E ALEGRIA.\nSOU FELIZ, SIM, SOU FELIZ!\n\nQUERO SER OBEDIENTE \nAO ESPÍRITO DE DEUS,\nSEGUIR SUA PALAVRA \nE OS ENSINOS SEUS,\nTETEMUNHAR QUE TENHO \nDEUS EM MEU VIVER,\nMINHA VIDA É TRANSFORMADA,\nVOU DIZER PORQUÊ:\n\nCORO\nCOM O ESPÍRITO DE DEUS \nEM MINHA VIDA,\nSOU FELIZ, SOU FELIZ!\nTENHO PAZ, CONSOLO, \nGRAÇA E ALEGRIA.\nSOU FELIZ, SIM, SOU FELIZ!', 'COM O ESPÍRITO DE DEUS EM MINHA VIDA, SOU FELIZ, SOU FELIZ! TENHO PAZ, CONSOLO, GRAÇA E ALEGRIA. SOU FELIZ, SIM, SOU FELIZ! CRISTO PROMETEU DEIXAR-NOS O CONSOLADOR PARA ESTAR CONOSCO SEMPRE ONDE QUER QUE FOR, O ESPÍRITO DE VERDADE, QUE ACONSELHARÁ MINHA VIDA, ENSINANDO COMO DEVO ANDAR. COM O ESPÍRITO DE DEUS EM MINHA VIDA, SOU FELIZ, SOU FELIZ! TENHO PAZ, CONSOLO, GRAÇA E ALEGRIA. SOU FELIZ, SIM, SOU FELIZ! QUERO SER OBEDIENTE AO ESPÍRITO DE DEUS, SEGUIR SUA PALAVRA E OS ENSINOS SEUS, TETEMUNHAR QUE TENHO DEUS EM MEU VIVER, MINHA VIDA É TRANSFORMADA, VOU DIZER PORQUÊ: COM O ESPÍRITO DE DEUS EM MINHA VIDA, SOU FELIZ, SOU FELIZ! TENHO PAZ, CONSOLO, GRAÇA E ALEGRIA. SOU FELIZ, SIM, SOU FELIZ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('155', 'QUERO ESTAR EM TUA PRESENÇA, Ó DEUS', 'QUERO ESTAR EM TUA \nPRESENÇA, Ó DEUS, \nEM TUA OBRA PROSSEGUIR ATÉ O FIM,\nSEM TEMER E SEMPRE                  CONFIAR QUE JESUS                                  AO MEU LADO ESTÁ.\n\nCORO\nFAZE DE MIM UM VENCEDOR, \nNÃO IMPORTA QUAL SEJA \nA MINHA DOR.\n\nFAZE DE MIM UM ENVIADO TEU,\nPARA A TUA OBRA REALIZAR\nE DO TEU PODER TESTEMUNHAR\nE POR FIM JERUSALÉM ALCANÇAR.\n\nQUERO SER UM SERVO DO SENHOR\nE ANDAR SOB A REVELAÇÃO,\nPARTILHAR DA SUA COMUNHÃO,\nDANDO A ELE SEMPRE \nO MEU CORAÇÃO.\n\nCORO\nFAZE DE MIM UM VENCEDOR, \nNÃO IMPORTA QUAL SEJA \nA MINHA DOR.\n\nFAZE DE MIM UM ENVIADO TEU, \nPARA A TUA OBRA REALIZAR\nE DO TEU PODER TESTEMUNHAR\nE POR FIM JERUSALÉM ALCANÇAR.', 'QUERO ESTAR EM TUA PRESENÇA, Ó DEUS, EM TUA OBRA PROSSEGUIR ATÉ O FIM, SEM TEMER E SEMPRE CONFIAR QUE JESUS AO MEU LADO ESTÁ. FAZE DE MIM UM VENCEDOR, NÃO IMPORTA QUAL SEJA A MINHA DOR. FAZE DE MIM UM ENVIADO TEU, PARA A TUA OBRA REALIZAR E DO TEU PODER TESTEMUNHAR E POR FIM JERUSALÉM ALCANÇAR. QUERO SER UM SERVO DO SENHOR E ANDAR SOB A REVELAÇÃO, PARTILHAR DA SUA COMUNHÃO, DANDO A ELE SEMPRE O MEU CORAÇÃO. FAZE DE MIM UM VENCEDOR, NÃO IMPORTA QUAL SEJA A MINHA DOR. FAZE DE MIM UM ENVIADO TEU, PARA A TUA OBRA REALIZAR E DO TEU PODER TESTEMUNHAR E POR FIM JERUSALÉM ALCANÇAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('156', 'SOMOS CIDADÃOS DO CÉU', 'SOMOS CIDADÃOS, \nCIDADÃOS DO CÉU.\nSOMOS CIDADÃOS, \nTEMOS SALVAÇÃO.\n\nIDENTIDADE TEMOS,VEIO LÁ DA CRUZ,\nCOM O SACRIFÍCIODO SENHOR JESUS.\nFALAMOS A VERDADE,\nSEGUIMOS A JUSTIÇA.\nSOMOS CIDADÃOS,\nCIDADÃOS DO CÉU.\n\nTEMOS AS MÃOS LIMPAS,\nUM PURO CORAÇÃO.\nSOMOS CIDADÃOS,\nCIDADÃOS DO CÉU.\nSOMOS CIDADÃOS, \nCIDADÃOS DO CÉU.\nSOMOS CIDADÃOS, \nTEMOS SALVAÇÃO.\nBIS', 'SOMOS CIDADÃOS, CIDADÃOS DO CÉU. SOMOS CIDADÃOS, TEMOS SALVAÇÃO. IDENTIDADE TEMOS,VEIO LÁ DA CRUZ, COM O SACRIFÍCIODO SENHOR JESUS. FALAMOS A VERDADE, SEGUIMOS A JUSTIÇA. SOMOS CIDADÃOS, CIDADÃOS DO CÉU. TEMOS AS MÃOS LIMPAS, UM PURO CORAÇÃO. SOMOS CIDADÃOS, CIDADÃOS DO CÉU. SOMOS CIDADÃOS, CIDADÃOS DO CÉU. SOMOS CIDADÃOS, TEMOS SALVAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('157', 'ESTE MUNDO NÃO É MEU LUGAR', 'ESTE MUNDO NÃO \nÉ MEU LUGAR, \nPEREGRINO, ESTOU\nA CAMINHAR.\n\nMAS PARA O CÉU IREIMORAR COM MEU BOM REI,\nJESUS JÁ PREPAROU \nMEU NOVO LAR.\n\nTORNOU-ME CIDADÃO DO CÉU POR SEU AMOR,COM O SEU SANGUE ME COMPROU,\nETERNAMENTE AO SENHOR DAREI LOUVOR,TODA GLÓRIA, HONRA, GRAÇAS E AMOR.\n\nSOU CIDADÃO DO CÉU, A PÁTRIA CELESTIAL,O GRANDE AMOR DE DEUS,\nSUA GRAÇA ETERNAL,\nME CONCEDEU PERDÃO,\nME DEU A SALVAÇÃO,\n\nPOR ISSO SOU CIDADÃO DO CÉU, ALELUIA!\nSOU CIDADÃO DO CÉU, \nALELUIA!\nSOU CIDADÃO DO CÉU!', 'ESTE MUNDO NÃO É MEU LUGAR, PEREGRINO, ESTOU A CAMINHAR. MAS PARA O CÉU IREIMORAR COM MEU BOM REI, JESUS JÁ PREPAROU MEU NOVO LAR. TORNOU-ME CIDADÃO DO CÉU POR SEU AMOR,COM O SEU SANGUE ME COMPROU, ETERNAMENTE AO SENHOR DAREI LOUVOR,TODA GLÓRIA, HONRA, GRAÇAS E AMOR. SOU CIDADÃO DO CÉU, A PÁTRIA CELESTIAL,O GRANDE AMOR DE DEUS, SUA GRAÇA ETERNAL, ME CONCEDEU PERDÃO, ME DEU A SALVAÇÃO, POR ISSO SOU CIDADÃO DO CÉU, ALELUIA! SOU CIDADÃO DO CÉU, ALELUIA! SOU CIDADÃO DO CÉU!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('158', 'NO CAMINHO EU QUERO ESTAR', 'NO CAMINHO EU QUERO ESTAR, \nAO SENHOR VOU OBEDECER.\nAONDE QUER QUE DEUS \nMANDAR ANUNCIAR O SEU AMOR. ESTOU PRONTO, SENHOR, EU VOU!\n\nTANTAS VIDAS NÃO \nCONHECEM O SENHOR, \nVIVEM TRISTES, TÃO VAZIAS, \nSEM AMOR, PRECISANDO RECEBER \nO SEU PERDÃO,  PARA ASSIM ALCANÇAREM A SALVAÇÃO,\n\nQUE JESUS LÁ NO CALVÁRIO REVELOU, \nQUANDO SEU PRECIOSO \nSANGUE DERRAMOU,\nCONCEDENDO VIDA ETERNA AO QUE CRER,\nTRANSFORMANDO SUAS VIDAS, \nQUE PRAZER!\n\nQUE ALEGRIA PODER SERVIR \nA JESUS, NOSSO SALVADOR!\nEM SUA OBRA TRABALHAR, \nATENDENDO AO SEU CHAMAR,\nESTOU PRONTO, \nSENHOR, EU VOU!', 'NO CAMINHO EU QUERO ESTAR, AO SENHOR VOU OBEDECER. AONDE QUER QUE DEUS MANDAR ANUNCIAR O SEU AMOR. ESTOU PRONTO, SENHOR, EU VOU! TANTAS VIDAS NÃO CONHECEM O SENHOR, VIVEM TRISTES, TÃO VAZIAS, SEM AMOR, PRECISANDO RECEBER O SEU PERDÃO, PARA ASSIM ALCANÇAREM A SALVAÇÃO, QUE JESUS LÁ NO CALVÁRIO REVELOU, QUANDO SEU PRECIOSO SANGUE DERRAMOU, CONCEDENDO VIDA ETERNA AO QUE CRER, TRANSFORMANDO SUAS VIDAS, QUE PRAZER! QUE ALEGRIA PODER SERVIR A JESUS, NOSSO SALVADOR! EM SUA OBRA TRABALHAR, ATENDENDO AO SEU CHAMAR, ESTOU PRONTO, SENHOR, EU VOU!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('159', 'SERVO DO SENHOR EU SOU', 'SERVO DO SENHOR EU SOU\nE POSSO OUVIR SUA VOZ.\nSERVO DO SENHOR EU SOU\nE QUERO SERVIR A JESUS.\n\nUMA SÓ VOZ FALA AO MEU CORAÇÃO,\nA VOZ DE JESUS, MEU SENHOR.\nOUÇO A VOZ DO PERFEITO AMOR, \nA VOZ DO MEU BOM SALVADOR.\n\nSE VOCÊ TAMBÉM QUISER,\nPODE OUVIR A JESUS.\nBASTA ABRIR SEU CORAÇÃO\nE DEIXAR ENTRAR SUA LUZ.\n\nE UMA VOZ FALARÁ AO SEU CORAÇÃO,\nA VOZ DE JESUS, O SENHOR.\nSÓ A DOCE VOZ ENCHERÁ SEU CORAÇÃO\nDE PAZ, ALEGRIA E AMOR. \nDE PAZ, ALEGRIA E AMOR.', 'SERVO DO SENHOR EU SOU E POSSO OUVIR SUA VOZ. SERVO DO SENHOR EU SOU E QUERO SERVIR A JESUS. UMA SÓ VOZ FALA AO MEU CORAÇÃO, A VOZ DE JESUS, MEU SENHOR. OUÇO A VOZ DO PERFEITO AMOR, A VOZ DO MEU BOM SALVADOR. SE VOCÊ TAMBÉM QUISER, PODE OUVIR A JESUS. BASTA ABRIR SEU CORAÇÃO E DEIXAR ENTRAR SUA LUZ. E UMA VOZ FALARÁ AO SEU CORAÇÃO, A VOZ DE JESUS, O SENHOR. SÓ A DOCE VOZ ENCHERÁ SEU CORAÇÃO DE PAZ, ALEGRIA E AMOR. DE PAZ, ALEGRIA E AMOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('160', 'EXISTEM SEGREDOS NA TUA PALAVRA', 'EXISTEM SEGREDOS \nNA TUA PALAVRA\nQUE SÓ TEU ESPÍRITO \nPODE REVELAR.\n\nENSINOS DE VIDA, \nDE FELICIDADE,\nCAMINHO DE LUZ \nQUE JESUS VEIO NOS DAR.\n\nÉ LIVRO SELADO, \nMISTÉRIO GUARDADO,\nQUE O HOMEM SEM DEUS  \nNÃO PODE ALCANÇAR.\n\nÉ LIVRO ABERTO, \nCLARO, DESCOBERTO,\nPARA OS SERVOS FIÉIS   \nQUE COM JESUS VÃO REINAR. \nPARA OS SERVOS FIÉIS   \nQUE COM JESUS VÃO REINAR.', 'EXISTEM SEGREDOS NA TUA PALAVRA QUE SÓ TEU ESPÍRITO PODE REVELAR. ENSINOS DE VIDA, DE FELICIDADE, CAMINHO DE LUZ QUE JESUS VEIO NOS DAR. É LIVRO SELADO, MISTÉRIO GUARDADO, QUE O HOMEM SEM DEUS NÃO PODE ALCANÇAR. É LIVRO ABERTO, CLARO, DESCOBERTO, PARA OS SERVOS FIÉIS QUE COM JESUS VÃO REINAR. PARA OS SERVOS FIÉIS QUE COM JESUS VÃO REINAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('161', 'TU ÉS PRA MIM UM VASO ESCOLHIDO', 'TU ÉS PRA MIM UM VASO ESCOLHIDO,\nTU ÉS PRA MIM UM VASO DE VALOR.\nEU TE CHAMEI PARA SALVAR TUA VIDA, EU SOU JESUS, O TEU SENHOR.\n\nTU ÉS PRA MIM UM VASO ESCOLHIDO,\nTU ÉS PRA MIM UM VASO DE VALOR.\nPARA LEVAR MEU NOME A TANTAS GENTES\nE TESTEMUNHAR DO MEU AMOR.\n\nCORO\nVAI, FALA E ANUNCIA\nJESUS QUER O HOMEM TRANSFORMAR. \nOS DIAS PASSAM, O TEMPO FINDA,\nJESUS TEM PRESSA E VAI VOLTAR!\n\nCORO\nVAI, FALA E ANUNCIA\nJESUS QUER O HOMEM TRANSFORMAR. \nOS DIAS PASSAM, O TEMPO FINDA,\nJESUS TEM PRESSA E VAI VOLTAR! (2X)', 'TU ÉS PRA MIM UM VASO ESCOLHIDO, TU ÉS PRA MIM UM VASO DE VALOR. EU TE CHAMEI PARA SALVAR TUA VIDA, EU SOU JESUS, O TEU SENHOR. TU ÉS PRA MIM UM VASO ESCOLHIDO, TU ÉS PRA MIM UM VASO DE VALOR. PARA LEVAR MEU NOME A TANTAS GENTES E TESTEMUNHAR DO MEU AMOR. VAI, FALA E ANUNCIA JESUS QUER O HOMEM TRANSFORMAR. OS DIAS PASSAM, O TEMPO FINDA, JESUS TEM PRESSA E VAI VOLTAR! VAI, FALA E ANUNCIA JESUS QUER O HOMEM TRANSFORMAR. OS DIAS PASSAM, O TEMPO FINDA, JESUS TEM PRESSA E VAI VOLTAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('162', 'ANDAI NA MINHA PRESENÇA', 'CORO (2X)\nANDAI NA MINHA PRESENÇA, \nANDAI NA MINHA PRESENÇA\nE VOS GUIAREI.\n\nE VOS LEVAREI A UM LUGAR\nCHEIO DE GOZO E DE PAZ.\nFOME E SEDE JAMAIS TEREIS,\nPOIS COMEREIS DO PÃO DA VIDA.\n\nCORO (2X)\nANDAI NA MINHA PRESENÇA, \nANDAI NA MINHA PRESENÇA\nE VOS GUIAREI.\n\nE O MEU ESPÍRITO VOS CONDUZIRÁ \nÀ PÁTRIA CELESTIAL.\nLUTAS E DORES NUNCA MAIS TEREIS, \nPOIS VIVEREIS COM O VOSSO REI.\n\nCORO (2X)\nANDAI NA MINHA PRESENÇA, \nANDAI NA MINHA PRESENÇA\nE VOS GUIAREI.', 'ANDAI NA MINHA PRESENÇA, ANDAI NA MINHA PRESENÇA E VOS GUIAREI. E VOS LEVAREI A UM LUGAR CHEIO DE GOZO E DE PAZ. FOME E SEDE JAMAIS TEREIS, POIS COMEREIS DO PÃO DA VIDA. ANDAI NA MINHA PRESENÇA, ANDAI NA MINHA PRESENÇA E VOS GUIAREI. E O MEU ESPÍRITO VOS CONDUZIRÁ À PÁTRIA CELESTIAL. LUTAS E DORES NUNCA MAIS TEREIS, POIS VIVEREIS COM O VOSSO REI. ANDAI NA MINHA PRESENÇA, ANDAI NA MINHA PRESENÇA E VOS GUIAREI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('163', 'DÁ-ME UM CORAÇÃO CHEIO DO TEU AMOR', 'DÁ-ME UM CORAÇÃO\nCHEIO DO TEU AMOR,\nQUE SEMPRE RECONHEÇA\nTUA BONDADE, Ó MEU SENHOR.\n\nUM CORAÇÃO QUE ESTREMEÇA\nAO OUVIR TUA VOZ ASSIM\nE QUE NUNCA SE ESQUEÇA\nO QUE TU FAZES POR MIM.\n\nUM CORAÇÃO OBEDIENTE\nÀ TUA REVELAÇÃO,                           \nPURO E RENOVADO\nPELA TUA SALVAÇÃO.\n\nÓ SENHOR, AMÉM!', 'DÁ-ME UM CORAÇÃO CHEIO DO TEU AMOR, QUE SEMPRE RECONHEÇA TUA BONDADE, Ó MEU SENHOR. UM CORAÇÃO QUE ESTREMEÇA AO OUVIR TUA VOZ ASSIM E QUE NUNCA SE ESQUEÇA O QUE TU FAZES POR MIM. UM CORAÇÃO OBEDIENTE À TUA REVELAÇÃO, PURO E RENOVADO PELA TUA SALVAÇÃO. Ó SENHOR, AMÉM!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('164', 'DÁ-ME UM CORAÇÃO HUMILDE E RETO', 'DÁ-ME UM CORAÇÃO HUMILDE E RETO,\nQUE ATENTE PARA TUA PALAVRA \nE SABEDORIA,PRA QUE EU POSSA \nANDAR EM TUA PRESENÇA.\n\nCORO \nQUERO SER OBEDIENTE À TUA VOZ,\nTRABALHAR NA TUA OBRA COM AMOR;\nQUERO IR MORAR PRA SEMPRE NO PALÁCIO \nDO REI DOS REIS, NAS MANSÕES CELESTIAIS.\n\nQUE MINHA CASA ESTEJA FIRMADA EM JESUS,\nROCHA ETERNA, ELE É MEU ABRIGO SEGURO,\nMINHA FORTALEZA, MEU AMIGO FIEL,                        \nO MEU SALVADOR.\n\nCORO \nQUERO SER OBEDIENTE À TUA VOZ,\nTRABALHAR NA TUA OBRA COM AMOR;\nQUERO IR MORAR PRA SEMPRE NO PALÁCIO \nDO REI DOS REIS, NAS MANSÕES CELESTIAIS.\n\nCORO \nQUERO SER OBEDIENTE À TUA VOZ,\nTRABALHAR NA TUA OBRA COM AMOR;\nQUERO IR MORAR PRA SEMPRE NO PALÁCIO \nDO REI DOS REIS, NAS MANSÕES CELESTIAIS. (BIS)', 'DÁ-ME UM CORAÇÃO HUMILDE E RETO, QUE ATENTE PARA TUA PALAVRA E SABEDORIA,PRA QUE EU POSSA ANDAR EM TUA PRESENÇA. QUE MINHA CASA ESTEJA FIRMADA EM JESUS, ROCHA ETERNA, ELE É MEU ABRIGO SEGURO, MINHA FORTALEZA, MEU AMIGO FIEL, O MEU SALVADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('165', 'QUERO SER SANTO PARA O SENHOR', 'QUERO SER SANTO PARA O SENHOR,\nQUERO SER PURO EM SEU AMOR,\nEM TODO O TEMPO TESTEMUNHAR DE SEU AMOR E GRAÇA SEM PAR.\n\nQUERO LEVAR A MENSAGEM DE SALVAÇÃO\nPARA ESTE MUNDO QUE ESTÁ NA ESCURIDÃO \nE QUANDO CRISTO VIER NOS BUSCAR\nPOSSAMOS TODOS NO CÉU IR MORAR.\n\nQUERO SER SANTO PARA O SENHOR,\nQUERO SER PURO EM SEU AMOR,\nEM TODO O TEMPO TESTEMUNHAR DE SEU AMOR E GRAÇA SEM PAR.\n\nQUERO LEVAR A MENSAGEM DE SALVAÇÃO\nPARA ESTE MUNDO QUE ESTÁ NA ESCURIDÃO \nE QUANDO CRISTO VIER NOS BUSCAR\nPOSSAMOS TODOS NO CÉU IR MORAR.\n\nQUERO SER SANTO,\nQUERO SER PURO\nPARA O SENHOR!', 'QUERO SER SANTO PARA O SENHOR, QUERO SER PURO EM SEU AMOR, EM TODO O TEMPO TESTEMUNHAR DE SEU AMOR E GRAÇA SEM PAR. QUERO LEVAR A MENSAGEM DE SALVAÇÃO PARA ESTE MUNDO QUE ESTÁ NA ESCURIDÃO  E QUANDO CRISTO VIER NOS BUSCAR POSSAMOS TODOS NO CÉU IR MORAR. QUERO SER SANTO PARA O SENHOR, QUERO SER PURO EM SEU AMOR, EM TODO O TEMPO TESTEMUNHAR DE SEU AMOR E GRAÇA SEM PAR. QUERO LEVAR A MENSAGEM DE SALVAÇÃO PARA ESTE MUNDO QUE ESTÁ NA ESCURIDÃO  E QUANDO CRISTO VIER NOS BUSCAR POSSAMOS TODOS NO CÉU IR MORAR. QUERO SER SANTO, QUERO SER PURO PARA O SENHOR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('166', 'BRILHANDO, BRILHANDO', 'BRILHANDO, BRILHANDO,\nMINHA CANDEIA SEMPRE \nESTÁ BRILHANDO.\nBRILHANDO, BRILHANDO,\nBRILHANDO ATÉ JESUS VOLTAR.\n\nNÃO FALTARÁ O ÓLEO DO ESPÍRITO,\nMINHA CANDEIA SEMPRE CHEIA FICARÁ,\nPORQUE JESUS NOS DEU SUA PROMESSA\nQUE SEU ESPÍRITO CONOSCO ESTARÁ.\n\nE SE VOCÊ QUISER TAMBÉM BRILHAR,\nÉ SÓ ABRIR SEU CORAÇÃO\nE DEIXAR CRISTO NELE ENTRAR\nE ASSIM VOCÊ SEMPRE ESTARÁ.\n\nBRILHANDO, BRILHANDO,\nMINHA CANDEIA SEMPRE \nESTÁ BRILHANDO.\nBRILHANDO, BRILHANDO,\nBRILHANDO ATÉ JESUS VOLTAR.', 'BRILHANDO, BRILHANDO, MINHA CANDEIA SEMPRE ESTÁ BRILHANDO. BRILHANDO, BRILHANDO, BRILHANDO ATÉ JESUS VOLTAR. NÃO FALTARÁ O ÓLEO DO ESPÍRITO, MINHA CANDEIA SEMPRE CHEIA FICARÁ, PORQUE JESUS NOS DEU SUA PROMESSA QUE SEU ESPÍRITO CONOSCO ESTARÁ. E SE VOCÊ QUISER TAMBÉM BRILHAR, É SÓ ABRIR SEU CORAÇÃO E DEIXAR CRISTO NELE ENTRAR E ASSIM VOCÊ SEMPRE ESTARÁ. BRILHANDO, BRILHANDO, MINHA CANDEIA SEMPRE ESTÁ BRILHANDO. BRILHANDO, BRILHANDO, BRILHANDO ATÉ JESUS VOLTAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('167', 'DANIEL NA COVA DOS LEÕES', 'DANIEL TRÊS VEZES AO DIA\nBUSCAVA  AO SENHOR,\nDE JOELHOS ELE ORAVA\nE GLORIFICAVA A DEUS.\n\nCERTO DIA O ENCONTRARAM ORANDO PROSTRADO AO SEU DEUS, \nSEUS INIMIGOS CONTARAM \nAO REI E PEDIRAM PARA \nQUE CUMPRISSE A LEI.\n\nCORO\nDANIEL NA COVA DOS LEÕES,\nUM ANJO APARECEU.\nDANIEL NA COVA DOS LEÕES,\nO SEU DEUS O PROTEGEU.\n\nINSTRUMENTOS\n\nDANIEL FOI SALVO POR SEU \nDEUS E O REI COMPREENDEU.\nSEUS INIMIGOS FORAM PUNIDOS\nE O REI LOGO DECRETOU\nQUE O DEUS DE DANIEL\nÉ DEUS VIVO E SALVADOR.\n\nCORO\nDANIEL NA COVA DOS LEÕES,\nUM ANJO APARECEU.\nDANIEL NA COVA DOS LEÕES,\nO SEU DEUS O PROTEGEU.', 'DANIEL TRÊS VEZES AO DIA BUSCAVA AO SENHOR, DE JOELHOS ELE ORAVA E GLORIFICAVA A DEUS. CERTO DIA O ENCONTRARAM ORANDO PROSTRADO AO SEU DEUS, SEUS INIMIGOS CONTARAM AO REI E PEDIRAM PARA QUE CUMPRISSE A LEI. DANIEL NA COVA DOS LEÕES, UM ANJO APARECEU. DANIEL NA COVA DOS LEÕES, O SEU DEUS O PROTEGEU. DANIEL FOI SALVO POR SEU DEUS E O REI COMPREENDEU. SEUS INIMIGOS FORAM PUNIDOS E O REI LOGO DECRETOU QUE O DEUS DE DANIEL É DEUS VIVO E SALVADOR. DANIEL NA COVA DOS LEÕES, UM ANJO APARECEU. DANIEL NA COVA DOS LEÕES, O SEU DEUS O PROTEGEU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('168', 'JESUS CHAMA OS SEUS MINISTROS', 'JESUS CHAMA OS SEUS \nMINISTROS PARA UMA \nGRANDE MISSÃO:                             GUIAR O SEU POVO\nRUMO À BELA SIÃO.\n\nO APÓSTOLO É AQUELE,\nQUE LEVA A PALAVRA DO SENHOR.\nTESTEMUNHA PRA MUITOS POVOS,\nAPRESENTA A OBRA COM AMOR.\n\nO PROFETA APONTA O CAMINHO,\nÉ UM PROCLAMADOR.\nFALA DO QUE ESTÁ POR VIR,\nÉ O INTÉRPRETE DO SENHOR.\n\nPARA O EVANGELISTA\nNÃO HÁ TEMPO RUIM,\nPREGA A PALAVRA \nEM TODOS OS LUGARES\nCOM A AUTORIDADE DE JESUS.\n\nO PASTOR CUIDA DA IGREJA\nGUIANDO O REBANHO À SALVAÇÃO.\nAPASCENTA COM CUIDADO,\nLEVANDO O POVO À ADORAÇÃO!\n\nE O MESTRE É AQUELE,\nO MENOR DOS IRMÃOS,\nENSINA A SÃ DOUTRINA,\nEDUCA COM A REVELAÇÃO.\n\nESTES SÃO OS CINCO MINISTÉRIOS, \nFORMA SIMPLES E PATERNA \nDE JESUS ORIENTAR A SUA IGREJA,\nLEVANDO-A À VIDA ETERNA!\nLEVANDO-A À VIDA ETERNA!', 'JESUS CHAMA OS SEUS MINISTROS PARA UMA GRANDE MISSÃO: GUIAR O SEU POVO RUMO À BELA SIÃO. O APÓSTOLO É AQUELE, QUE LEVA A PALAVRA DO SENHOR. TESTEMUNHA PRA MUITOS POVOS, APRESENTA A OBRA COM AMOR. O PROFETA APONTA O CAMINHO, É UM PROCLAMADOR. FALA DO QUE ESTÁ POR VIR, É O INTÉRPRETE DO SENHOR. PARA O EVANGELISTA NÃO HÁ TEMPO RUIM, PREGA A PALAVRA EM TODOS OS LUGARES COM A AUTORIDADE DE JESUS. O PASTOR CUIDA DA IGREJA GUIANDO O REBANHO À SALVAÇÃO. APASCENTA COM CUIDADO, LEVANDO O POVO À ADORAÇÃO! E O MESTRE É AQUELE, O MENOR DOS IRMÃOS, ENSINA A SÃ DOUTRINA, EDUCA COM A REVELAÇÃO. ESTES SÃO OS CINCO MINISTÉRIOS, FORMA SIMPLES E PATERNA DE JESUS ORIENTAR A SUA IGREJA, LEVANDO-A À VIDA ETERNA! LEVANDO-A À VIDA ETERNA!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('169', 'SETE CARTAS', 'SETE CARTAS JOÃO ESCREVEU, AO ANJO DAS IGREJAS DEUS MANDOU,\n“CONHEÇO AS TUAS OBRAS”, \nASSIM DIZ O SENHOR,\n“QUEM TEM OUVIDOS OUÇA \n A VOZ DO MEU ESPÍRITO”.\n\nÉFESO, ESMIRNA,\nPÉRGAMO, TIATIRA,\nSARDES, FILADÉLFIA \nE LAODICÉIA.\n\nSÃO SETE CARTAS, SETE IGREJAS,\nSETE ESPÍRITOS DE DEUS \nA FALAR NO MEIO DAS IGREJAS.\n\nSÃO SETE CARTAS, SETE IGREJAS,\nSETE ESPÍRITOS DE DEUS                   \nA FALAR NO MEIO DAS IGREJAS.\n\nINSTRUMENTOS\n\nSETE CARTAS JOÃO \nESCREVEU, AO ANJO DAS IGREJAS DEUS MANDOU,\n“CONHEÇO AS TUAS OBRAS”, \nASSIM DIZ O SENHOR,\n“QUEM TEM OUVIDOS OUÇA \n A VOZ DO MEU ESPÍRITO”.\n\nÉFESO, ESMIRNA,\nPÉRGAMO, TIATIRA,\nSARDES, FILADÉLFIA \nE LAODICÉIA.\n\nSÃO SETE CARTAS, SETE IGREJAS,\nSETE ESPÍRITOS DE DEUS                   \nA FALAR NO MEIO DAS IGREJAS.', 'SETE CARTAS JOÃO ESCREVEU, AO ANJO DAS IGREJAS DEUS MANDOU, CONHEÇO AS TUAS OBRAS, ASSIM DIZ O SENHOR, QUEM TEM OUVIDOS OUÇA A VOZ DO MEU ESPÍRITO. ÉFESO, ESMIRNA, PÉRGAMO, TIATIRA, SARDES, FILADÉLFIA E LAODICÉIA. SÃO SETE CARTAS, SETE IGREJAS, SETE ESPÍRITOS DE DEUS A FALAR NO MEIO DAS IGREJAS. SÃO SETE CARTAS, SETE IGREJAS, SETE ESPÍRITOS DE DEUS A FALAR NO MEIO DAS IGREJAS. SETE CARTAS JOÃO ESCREVEU, AO ANJO DAS IGREJAS DEUS MANDOU, CONHEÇO AS TUAS OBRAS, ASSIM DIZ O SENHOR, QUEM TEM OUVIDOS OUÇA A VOZ DO MEU ESPÍRITO. ÉFESO, ESMIRNA, PÉRGAMO, TIATIRA, SARDES, FILADÉLFIA E LAODICÉIA. SÃO SETE CARTAS, SETE IGREJAS, SETE ESPÍRITOS DE DEUS A FALAR NO MEIO DAS IGREJAS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('170', 'NÓS SOMOS A CARTA DE CRISTO', 'NÓS SOMOS A CARTA DE CRISTO,\nA CARTA VIVA DE DEUS,\nPARA SER LIDA POR TODOS,\nREVELAR OS PROPÓSITOS DE DEUS.\n\nO QUE COMUNICA ESSA CARTA?\nO AMOR, O PERDÃO DE JESUS,\nAS PROMESSAS DE VIDA ETERNA\nNO CAMINHO QUE ELE NOS CONDUZ.\n\nNÃO FOI ESCRITA NA PEDRA, MAS NAS TÁBUAS DO CORAÇÃO.E QUEM ESCREVEU ESSA CARTAFOI O ESPÍRITO SANTO DE DEUS.\n\nNÓS SOMOS A CARTA DE CRISTO,\nA CARTA VIVA DE DEUS\nTESTEMUNHANDO A TODOS\nPRA SALVAR-NOS JESUS MORREU.', 'NÓS SOMOS A CARTA DE CRISTO, A CARTA VIVA DE DEUS, PARA SER LIDA POR TODOS, REVELAR OS PROPÓSITOS DE DEUS. O QUE COMUNICA ESSA CARTA? O AMOR, O PERDÃO DE JESUS, AS PROMESSAS DE VIDA ETERNA NO CAMINHO QUE ELE NOS CONDUZ. NÃO FOI ESCRITA NA PEDRA, MAS NAS TÁBUAS DO CORAÇÃO.E QUEM ESCREVEU ESSA CARTAFOI O ESPÍRITO SANTO DE DEUS. NÓS SOMOS A CARTA DE CRISTO, A CARTA VIVA DE DEUS TESTEMUNHANDO A TODOS PRA SALVAR-NOS JESUS MORREU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('171', 'SOU O SANTO', 'SOU O SANTO O VERDADEIRO,                                  \nTENHO A CHAVE DE DAVI;                                        \nA PORTA ABERTA ESTÁ,      \nPRA QUE POSSAS ME ADORAR!\n\nGUARDASTE AS MINHAS PALAVRAS,\nNÃO NEGASTE O MEU NOME;\nTAMBÉM EU TE GUARDAREI,\nEIS QUE VENHO SEM DEMORA.\n\nENTÃO, GUARDA O QUE TENS,                  \nPARA QUE NINGUÉM\nTOME A TUA COROA.', 'SOU O SANTO O VERDADEIRO, TENHO A CHAVE DE DAVI; A PORTA ABERTA ESTÁ, PRA QUE POSSAS ME ADORAR! GUARDASTE AS MINHAS PALAVRAS, NÃO NEGASTE O MEU NOME; TAMBÉM EU TE GUARDAREI, EIS QUE VENHO SEM DEMORA. ENTÃO, GUARDA O QUE TENS, PARA QUE NINGUÉM TOME A TUA COROA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('172', 'QUATRO COISAS TÃO PEQUENINAS', 'QUATRO COISAS TÃO PEQUENINAS \nUMA GRANDE LIÇÃO NOS DÃO: \nEMBORA TÃO FRÁGEIS,\nMUITO SÁBIAS SÃO.\n\nAS FORMIGAS SÃO TRABALHADORAS, \nCADA UMA EXERCE A SUA FUNÇÃO;\nÉ COMO A IGREJA DE CRISTO, \nTRABALHANDO PRA \nMANTER A SALVAÇÃO.\n\nEM SEGURANÇA O COELHO CONSTRÓI \nSUA CASA SOBRE A ROCHA;\nE, PARA ESTARMOS BEM SEGUROS,\nCONSTRUÍMOS NA ROCHA QUE É JESUS.\n\nOS GAFANHOTOS TODOS SAEM, \nE EM GRUPOS SE REPARTEM,\nSAÍMOS PROCLAMANDO A PALAVRA, \nSEMPRE UNIDOS, EM UM SÓ CORAÇÃO.\n\nE, NO FINAL DA CAMINHADA,\nHERDEIROS DAS PROMESSAS DE DEUS,\nTAL QUAL A ARANHA MORA NO PALÁCIO, \nMORAREMOS NAS MANSÕES COM JESUS!', 'QUATRO COISAS TÃO PEQUENINAS UMA GRANDE LIÇÃO NOS DÃO: EMBORA TÃO FRÁGEIS, MUITO SÁBIAS SÃO. AS FORMIGAS SÃO TRABALHADORAS, CADA UMA EXERCE A SUA FUNÇÃO; É COMO A IGREJA DE CRISTO, TRABALHANDO PRA MANTER A SALVAÇÃO. EM SEGURANÇA O COELHO CONSTRÓI SUA CASA SOBRE A ROCHA; E, PARA ESTARMOS BEM SEGUROS, CONSTRUÍMOS NA ROCHA QUE É JESUS. OS GAFANHOTOS TODOS SAEM, E EM GRUPOS SE REPARTEM, SAÍMOS PROCLAMANDO A PALAVRA, SEMPRE UNIDOS, EM UM SÓ CORAÇÃO. E, NO FINAL DA CAMINHADA, HERDEIROS DAS PROMESSAS DE DEUS, TAL QUAL A ARANHA MORA NO PALÁCIO, MORAREMOS NAS MANSÕES COM JESUS!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('173', 'OUÇO O CLAMOR DO BOM PASTOR', 'OUÇO O CLAMOR DO BOM PASTOR\nPELO DESERTO ASSOLADOR,\nSEUS CORDEIRINHOS A CHAMAR,\nMUI DESEJOSO DE OS SALVAR.\n\nCORO\nVAI BUSCAR, VAI BUSCAR!\nVAI BUSCAR MEUS CORDEIRINHOS, VAI! VAI BUSCAR, VAI BUSCAR!\nTRAZE-OS PARA O MEU APRISCO.\n\nQUEM NÃO DESEJA TRABALHAR\nE OS CORDEIRINHOS SEUS BUSCAR\nE ENCAMINHÁ-LOS A JESUS,\nFONTE DE VIDA, AMOR E LUZ?\n\nCORO\nVAI BUSCAR, VAI BUSCAR!\nVAI BUSCAR MEUS CORDEIRINHOS, VAI! VAI BUSCAR, VAI BUSCAR!\nTRAZE-OS PARA O MEU APRISCO.\n\nPELOS DESERTOS A SOFRER,\nOUVE OS SEUS GRITOS                         AO MORRER E O MESTRE CLAMA:\n“VAI BUSCAR!” PRA QUE OS POSSA,                     ENTÃO, SALVAR.\n\nCORO\nVAI BUSCAR, VAI BUSCAR!\nVAI BUSCAR MEUS CORDEIRINHOS, VAI! VAI BUSCAR, VAI BUSCAR!\nTRAZE-OS PARA O MEU APRISCO.', 'OUÇO O CLAMOR DO BOM PASTOR PELO DESERTO ASSOLADOR, SEUS CORDEIRINHOS A CHAMAR, MUI DESEJOSO DE OS SALVAR. VAI BUSCAR, VAI BUSCAR! VAI BUSCAR MEUS CORDEIRINHOS, VAI! VAI BUSCAR, VAI BUSCAR! TRAZE-OS PARA O MEU APRISCO. QUEM NÃO DESEJA TRABALHAR E OS CORDEIRINHOS SEUS BUSCAR E ENCAMINHÁ-LOS A JESUS, FONTE DE VIDA, AMOR E LUZ? VAI BUSCAR, VAI BUSCAR! VAI BUSCAR MEUS CORDEIRINHOS, VAI! VAI BUSCAR, VAI BUSCAR! TRAZE-OS PARA O MEU APRISCO. PELOS DESERTOS A SOFRER, OUVE OS SEUS GRITOS AO MORRER E O MESTRE CLAMA: VAI BUSCAR! PRA QUE OS POSSA, ENTÃO, SALVAR. VAI BUSCAR, VAI BUSCAR! VAI BUSCAR MEUS CORDEIRINHOS, VAI! VAI BUSCAR, VAI BUSCAR! TRAZE-OS PARA O MEU APRISCO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('174', 'A TUA PALAVRA É SEMENTE', 'A TUA PALAVRA É SEMENTE\nE TU ÉS O SEMEADOR,\nO MEU CORAÇÃO É A TERRA\nQUE TU SEMEASTE, SENHOR.\n\nCORO\nA TUA PALAVRA, A TUA PALAVRA,\nA TUA PALAVRA, SENHOR;\nA TUA PALAVRA, A TUA PALAVRA,\nA TUA PALAVRA É AMOR.\n\nMEDITANDO EU CERTO DIA\nNA TUA PALAVRA, SENHOR,\nSENTI QUE DO ALTO DESCIA\nA GRAÇA DO CONSOLADOR.\n\nCORO\nA TUA PALAVRA, A TUA PALAVRA,\nA TUA PALAVRA, SENHOR;\nA TUA PALAVRA, A TUA PALAVRA,\nA TUA PALAVRA É AMOR.', 'A TUA PALAVRA É SEMENTE E TU ÉS O SEMEADOR, O MEU CORAÇÃO É A TERRA QUE TU SEMEASTE, SENHOR. A TUA PALAVRA, A TUA PALAVRA, A TUA PALAVRA, SENHOR; A TUA PALAVRA, A TUA PALAVRA, A TUA PALAVRA É AMOR. MEDITANDO EU CERTO DIA NA TUA PALAVRA, SENHOR, SENTI QUE DO ALTO DESCIA A GRAÇA DO CONSOLADOR. A TUA PALAVRA, A TUA PALAVRA, A TUA PALAVRA, SENHOR; A TUA PALAVRA, A TUA PALAVRA, A TUA PALAVRA É AMOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('175', 'UM CERTO PASTORZINHO', 'UM CERTO PASTORZINHO,\nQUE SE CHAMOU DAVI,\nERA MUI PEQUENO,                                NÃO CONFIAVA EM SI;\nELE, COM OUSADIA,                       ORANDO SEMPRE A DEUS,\nFOI ENFRENTAR, UM DIA,                           O HERÓI DOS FILISTEUS.\n\nNA FUNDA UMA PEDRA COLOCOU, \nE GIROU, GIROU, GIROU; \nNA FUNDA UMA PEDRA COLOCOU, \nE GIROU, GIROU, GIROU;\n\nMAIS UMA VEZ, MAIS OUTRA VEZ,\nMAIS UMA VEZ GIROU, \nE A PEDRA ATIROU, \nO ALVO ACERTOU, E O GIGANTE \nAO CHÃO TOMBOU!', 'UM CERTO PASTORZINHO, QUE SE CHAMOU DAVI, ERA MUI PEQUENO, NÃO CONFIAVA EM SI; ELE, COM OUSADIA, ORANDO SEMPRE A DEUS, FOI ENFRENTAR, UM DIA, O HERÓI DOS FILISTEUS. NA FUNDA UMA PEDRA COLOCOU, E GIROU, GIROU, GIROU; NA FUNDA UMA PEDRA COLOCOU, E GIROU, GIROU, GIROU; MAIS UMA VEZ, MAIS OUTRA VEZ, MAIS UMA VEZ GIROU, E A PEDRA ATIROU, O ALVO ACERTOU, E O GIGANTE AO CHÃO TOMBOU!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('176', 'CRIA EM MIM, Ó DEUS', 'CRIA EM MIM, Ó DEUS,\nUM CORAÇÃO PURO  \nE RENOVA DENTRO EM MIM \nUM ESPÍRITO RETO.\n\nE RENOVA DENTRO EM MIM\nUM ESPÍRITO RETO.', 'CRIA EM MIM, Ó DEUS, UM CORAÇÃO PURO E RENOVA DENTRO EM MIM UM ESPÍRITO RETO. E RENOVA DENTRO EM MIM UM ESPÍRITO RETO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('177', 'FALA AO MEU CORAÇÃO, JESUS', 'FALA AO MEU\nCORAÇÃO, JESUS! \nFALA AO MEU                            CORAÇÃO, JESUS!\n\nFALA, FALA, FALA,              \nFALA AO MEU CORAÇÃO.\n\nVIVE EM MEU \nCORAÇÃO, JESUS!\nVIVE EM MEU \nCORAÇÃO, JESUS! \n\nVIVE, VIVE, VIVE, \nVIVE EM MEU CORAÇÃO.\n\nREINA EM MEU                            CORAÇÃO, JESUS!\nREINA EM MEU                             CORAÇÃO, JESUS!\n\nFALA, VIVE, REINA, \nREINA EM MEU CORAÇÃO.', 'FALA AO MEU CORAÇÃO, JESUS! FALA AO MEU CORAÇÃO, JESUS! FALA, FALA, FALA, FALA AO MEU CORAÇÃO. VIVE EM MEU CORAÇÃO, JESUS! VIVE EM MEU CORAÇÃO, JESUS! VIVE, VIVE, VIVE, VIVE EM MEU CORAÇÃO. REINA EM MEU CORAÇÃO, JESUS! REINA EM MEU CORAÇÃO, JESUS! FALA, VIVE, REINA, REINA EM MEU CORAÇÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('178', 'DISSE JESUS AOS JUDEUS  (EU TRABALHO TAMBÉM)', 'DISSE JESUS AOS JUDEUS,\nASSIM JESUS LHES RESPONDEU:\n“O MEU PAI TRABALHA ATÉ AGORA,\nEU TRABALHO TAMBÉM!\n\nEU TRABALHO TAMBÉM,\nEU TRABALHO TAMBÉM,\nO MEU PAI TRABALHA ATÉ AGORA,\nE EU TRABALHO TAMBÉM!”\n\nCONVÉM QUE EU FAÇA AS MESMAS OBRAS\nDAQUELE QUE ME ENVIOU,\nENQUANTO É DIA, A NOITE VEM QUANDO NÃO SE PODE TRABALHAR.\nO MEU PAI TRABALHA ATÉ AGORA, \nEU TRABALHO TAMBÉM!\n\nQUERO TRABALHAR TAMBÉM,\nQUERO TRABALHAR TAMBÉM,\nCOM O ESPÍRITO SANTO EM MINHA VIDA,\nQUERO TRABALHAR TAMBÉM!', 'DISSE JESUS AOS JUDEUS, ASSIM JESUS LHES RESPONDEU: O MEU PAI TRABALHA ATÉ AGORA, EU TRABALHO TAMBÉM! EU TRABALHO TAMBÉM, EU TRABALHO TAMBÉM, O MEU PAI TRABALHA ATÉ AGORA, E EU TRABALHO TAMBÉM! CONVÉM QUE EU FAÇA AS MESMAS OBRAS DAQUELE QUE ME ENVIOU, ENQUANTO É DIA, A NOITE VEM QUANDO NÃO SE PODE TRABALHAR. O MEU PAI TRABALHA ATÉ AGORA, EU TRABALHO TAMBÉM! QUERO TRABALHAR TAMBÉM, QUERO TRABALHAR TAMBÉM, COM O ESPÍRITO SANTO EM MINHA VIDA, QUERO TRABALHAR TAMBÉM!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('179', 'ORAR FAZ BEM', 'ORAR FAZ BEM! \nORAR FAZ BEM!\nFAZ BEM À ALMA,\nFAZ BEM AO CORAÇÃO,\nALEGRA A ALMA,\nALEGRA O CORAÇÃO!\n\nORAR FAZ BEM! \nORAR FAZ BEM! \nO NOSSO DEUS RESPONDE,\nRETIRA A AFLIÇÃO!\nO NOSSO DEUS RESPONDE,\nCONFORTA O CORAÇÃO!', 'ORAR FAZ BEM! ORAR FAZ BEM! FAZ BEM À ALMA, FAZ BEM AO CORAÇÃO, ALEGRA A ALMA, ALEGRA O CORAÇÃO! ORAR FAZ BEM! ORAR FAZ BEM! O NOSSO DEUS RESPONDE, RETIRA A AFLIÇÃO! O NOSSO DEUS RESPONDE, CONFORTA O CORAÇÃO!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('180', 'QUERO SER FIEL (JESUS ESTÁ VIVO)', 'QUERO SER FIEL A TI, JESUS.\nFAZER SEMPRE A TUA VONTADE.\nGUARDAR A TUA PALAVRA,\nQUE É LUZ E VIDA \nPARA O MEU CAMINHO.\n\nCORO\nSER FIEL, SER FIEL, \nSER FIEL ATÉ O FIM.\nSER FIEL, SER FIEL \nATÉ MEU JESUS VOLTAR!\n\nQUERO ANDAR \nNA TUA LUZ, SENHOR,\nSÓ ASSIM ESTOU SEGURO;\nQUERO PROCLAMAR EM ALTA VOZ: “JESUS RESSUSCITOU AO TERCEIRO DIA,\nESTÁ VIVO E REINA EM MEU VIVER”.\n\nCORO\nSER FIEL, SER FIEL, \nSER FIEL ATÉ O FIM.\nSER FIEL, SER FIEL \nATÉ MEU JESUS VOLTAR!\n\nJESUS ESTÁ VIVO, \nREINA EM MEU VIVER,\nE EM BREVE VOLTARÁ!', 'QUERO SER FIEL A TI, JESUS. FAZER SEMPRE A TUA VONTADE. GUARDAR A TUA PALAVRA, QUE É LUZ E VIDA PARA O MEU CAMINHO. SER FIEL, SER FIEL, SER FIEL ATÉ O FIM. SER FIEL, SER FIEL ATÉ MEU JESUS VOLTAR! QUERO ANDAR NA TUA LUZ, SENHOR, SÓ ASSIM ESTOU SEGURO; QUERO PROCLAMAR EM ALTA VOZ: JESUS RESSUSCITOU AO TERCEIRO DIA, ESTÁ VIVO E REINA EM MEU VIVER. SER FIEL, SER FIEL, SER FIEL ATÉ O FIM. SER FIEL, SER FIEL ATÉ MEU JESUS VOLTAR! JESUS ESTÁ VIVO, REINA EM MEU VIVER, E EM BREVE VOLTARÁ!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('181', 'JERUSALÉM, CIDADE DO MEU REI', 'JERUSALÉM, CIDADE DO MEU REI,\nA CADA DIA ANSEIO ESTAR ALI; CONTEMPLAREI A FACE DO SENHOR,\nAQUELE QUE ENTREGOU\nSUA VIDA POR MIM.\n\nJAMAIS A MORTE VEREI\nPOIS VIDA ETERNA ALCANCEI\nQUANDO ENTREGUEI\nMEU CORAÇÃO PARA JESUS.', 'JERUSALÉM, CIDADE DO MEU REI, A CADA DIA ANSEIO ESTAR ALI; CONTEMPLAREI A FACE DO SENHOR, AQUELE QUE ENTREGOU SUA VIDA POR MIM. JAMAIS A MORTE VEREI POIS VIDA ETERNA ALCANCEI QUANDO ENTREGUEI MEU CORAÇÃO PARA JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('182', 'QUERO VIVER PARA SEMPRE COM JESUS', 'CORO\nQUERO VIVER                                           PARA SEMPRE COM JESUS,                                     QUERO BEBER DA ÁGUA DA VIDA,\n\nQUERO COMER                  \nDA ÁRVORE DA VIDA, \nCOM JESUS ETERNAMENTE  \nVOU VIVER!\n\nVOU VIVER, SIM, VOU VIVER,\nPASSEAR NO JARDIM DO MEU SENHOR;                               A ÁRVORE DA VIDA NO MEIO DO JARDIM\nÉ CERTEZA QUE JESUS ME PROMETEU.\n\nCORO\nQUERO VIVER    \nPARA SEMPRE COM JESUS,                                     QUERO BEBER DA ÁGUA DA VIDA, \nQUERO COMER DA ÁRVORE DA VIDA, \nCOM JESUS ETERNAMENTE  \nVOU VIVER!\n\nPARA TRÁS O PECADO FICARÁ,                 \nSEU DOMÍNIO NÃO ME ATINGIRÁ; \nESCOLHI MUITO BEM:                        VIVER ETERNAMENTE COM JESUS!\n\nCORO\nQUERO VIVER    \nPARA SEMPRE COM JESUS,                                     QUERO BEBER DA ÁGUA DA VIDA, \nQUERO COMER DA ÁRVORE DA VIDA, \nCOM JESUS ETERNAMENTE  \nVOU VIVER!', 'QUERO VIVER PARA SEMPRE COM JESUS, QUERO BEBER DA ÁGUA DA VIDA, QUERO COMER DA ÁRVORE DA VIDA, COM JESUS ETERNAMENTE VOU VIVER! VOU VIVER, SIM, VOU VIVER, PASSEAR NO JARDIM DO MEU SENHOR; A ÁRVORE DA VIDA NO MEIO DO JARDIM É CERTEZA QUE JESUS ME PROMETEU. QUERO VIVER PARA SEMPRE COM JESUS, QUERO BEBER DA ÁGUA DA VIDA, QUERO COMER DA ÁRVORE DA VIDA, COM JESUS ETERNAMENTE VOU VIVER! PARA TRÁS O PECADO FICARÁ, SEU DOMÍNIO NÃO ME ATINGIRÁ; ESCOLHI MUITO BEM: VIVER ETERNAMENTE COM JESUS! QUERO VIVER PARA SEMPRE COM JESUS, QUERO BEBER DA ÁGUA DA VIDA, QUERO COMER DA ÁRVORE DA VIDA, COM JESUS ETERNAMENTE VOU VIVER!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('183', 'UM NOVO CÉU, UMA NOVA TERRA SE FARÁ', 'UM NOVO CÉU, \nUMA NOVA TERRA SE FARÁ,\nNOVO NOME NUMA \nPEDRA BRANCA RECEBEREI,\n\nNA CIDADE DE LUZ ETERNA IREI MORAR PARA SEMPRE COM O SALVADOR;\nRUAS DE OURO ANDAREI,\nRIO DA VIDA CONTEMPLAREI\n\nE MUITO LOUVOR ALI ENTOAREI,\nNÃO HAVERÁ DOR, \nPRANTO OU CLAMOR,\nTODA LÁGRIMA JESUS \nVAI ENXUGAR.\n\nNÓS SEREMOS O SEU \nPOVO ETERNAMENTE\nE DEUS NOSSO TABERNÁCULO \nPARA SEMPRE;\n\nSE VOCÊ QUISER VIR A CRISTO,\nABRA AGORA O SEU CORAÇÃO\nE DEIXA JESUS FAZER DA SUA VIDA\nMORADA ETERNA DE DEUS.', 'UM NOVO CÉU, UMA NOVA TERRA SE FARÁ, NOVO NOME NUMA PEDRA BRANCA RECEBEREI, NA CIDADE DE LUZ ETERNA IREI MORAR PARA SEMPRE COM O SALVADOR; RUAS DE OURO ANDAREI, RIO DA VIDA CONTEMPLAREI E MUITO LOUVOR ALI ENTOAREI, NÃO HAVERÁ DOR, PRANTO OU CLAMOR, TODA LÁGRIMA JESUS VAI ENXUGAR. NÓS SEREMOS O SEU POVO ETERNAMENTE E DEUS NOSSO TABERNÁCULO PARA SEMPRE; SE VOCÊ QUISER VIR A CRISTO, ABRA AGORA O SEU CORAÇÃO E DEIXA JESUS FAZER DA SUA VIDA MORADA ETERNA DE DEUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('184', 'NO EXPRESSO VIAJAMOS', 'NO EXPRESSO VIAJAMOS            PARA O BOM PAÍS DA LUZ,\nÉ O NOSSO PASSAPORTE       \nO NOME DE JESUS;\n\nÉ HORA DA PARTIDA   \nE ENSEJO AINDA TÊM\nAQUELES QUE QUISEREM               TER PASSAGEM NESSE TREM.\n\nBEM-VINDOS SEJAM TODOS\nPARA O TREM QUE PARTE JÁ,\nENTRADA PARA A PÁTRIA \nJESUS A TODOS DÁ;  \nEIS O SINAL DE MARCHA, \nSE QUERES IR TAMBÉM,\nRECEBE O TEU BILHETE \nDE PASSAGEM NESSE TREM.', 'NO EXPRESSO VIAJAMOS PARA O BOM PAÍS DA LUZ, É O NOSSO PASSAPORTE O NOME DE JESUS; É HORA DA PARTIDA E ENSEJO AINDA TÊM AQUELES QUE QUISEREM TER PASSAGEM NESSE TREM. BEM-VINDOS SEJAM TODOS PARA O TREM QUE PARTE JÁ, ENTRADA PARA A PÁTRIA JESUS A TODOS DÁ; EIS O SINAL DE MARCHA, SE QUERES IR TAMBÉM, RECEBE O TEU BILHETE DE PASSAGEM NESSE TREM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('185', 'HÁ UMA LINDA MORADA', 'HÁ UMA LINDA MORADA \nPRA MIM NO CÉU\nQUE JESUS FOI ALI PREPARAR;\nUM LUGAR DE DELÍCIAS \nE AMOR SEM FIM,\nCOM JESUS VOU \nPRA SEMPRE MORAR.\n\nNA CIDADE DE DEUS, \nNOVA JERUSALÉM,\nONDE O SOL \nNÃO PRECISA BRILHAR;\nO CORDEIRO É A LUZ \nQUE ILUMINA A CIDADE\nONDE VOU PARA \nSEMPRE MORAR.', 'HÁ UMA LINDA MORADA PRA MIM NO CÉU QUE JESUS FOI ALI PREPARAR; UM LUGAR DE DELÍCIAS E AMOR SEM FIM, COM JESUS VOU PRA SEMPRE MORAR. NA CIDADE DE DEUS, NOVA JERUSALÉM, ONDE O SOL NÃO PRECISA BRILHAR; O CORDEIRO É A LUZ QUE ILUMINA A CIDADE ONDE VOU PARA SEMPRE MORAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('186', 'NOSSAS VIDAS SÃO MUDADAS', 'NOSSAS VIDAS SÃO MUDADAS\nPARA ANDARMOS MUI FELIZES,\nQUANDO OUVIMOS A PALAVRA,\nDO NOSSO AMIGO E JUIZ.\n\nELE JULGA A NOSSA CAUSA\nE APAGA A TRANSGRESSÃO,\nDE TODO MAL SOMOS GUARDADOS, \nCAMINHAMOS EM SUA LUZ.\n\nLUZ QUE BRILHA A CADA INSTANTE \nPARA SERMOS IDENTIFICADOS,\nNAQUELE GRANDE DIA,\nE POR JESUS ARREBATADOS.\n\nMARANATA! É O NOSSO GRITO,\nMARANATA! VEM, JESUS!\nEM BREVE A TROMBETA SOARÁ, \nNO CÉU COM ELE QUERO ESTAR.\n\nMARANATA! É O NOSSO GRITO,\nMARANATA! VEM, JESUS!\nEM BREVE A TROMBETA SOARÁ, \nNO CÉU COM ELE QUERO ESTAR.\nNO CÉU COM ELE QUERO ESTAR.', 'NOSSAS VIDAS SÃO MUDADAS PARA ANDARMOS MUI FELIZES, QUANDO OUVIMOS A PALAVRA, DO NOSSO AMIGO E JUIZ. ELE JULGA A NOSSA CAUSA E APAGA A TRANSGRESSÃO, DE TODO MAL SOMOS GUARDADOS, CAMINHAMOS EM SUA LUZ. LUZ QUE BRILHA A CADA INSTANTE PARA SERMOS IDENTIFICADOS, NAQUELE GRANDE DIA, E POR JESUS ARREBATADOS. MARANATA! É O NOSSO GRITO, MARANATA! VEM, JESUS! EM BREVE A TROMBETA SOARÁ, NO CÉU COM ELE QUERO ESTAR. MARANATA! É O NOSSO GRITO, MARANATA! VEM, JESUS! EM BREVE A TROMBETA SOARÁ, NO CÉU COM ELE QUERO ESTAR. NO CÉU COM ELE QUERO ESTAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('187', 'VARÕES GALILEUS', 'VARÕES GALILEUS\nNÃO VOS MARAVILHEIS,\nESTE MESMO JESUS\nQUE HOJE VISTES SUBIR\nVOLTARÁ OUTRA VEZ.\n\nVARÕES GALILEUS\nNÃO VOS MARAVILHEIS,\nESTE MESMO JESUS\nQUE HOJE VISTES SUBIR\nVOLTARÁ OUTRA VEZ.\n\nE VOS LEVARÁ\n(E VOS LEVARÁ)\nPARA UM LAR DE PAZ \n(UM LAR DE PAZ),\nA CIDADE DE LUZ \nONDE A DOR CESSARÁ;\n\nPRANTO NÃO TEREIS \n(PRANTO NÃO TEREIS),\nQUAIS OS ANJOS SEREIS \n(ANJOS SEREIS).\nESTE MESMO JESUS \nQUE HOJE VISTES SUBIR\nVOLTARÁ OUTRA VEZ.', 'VARÕES GALILEUS NÃO VOS MARAVILHEIS, ESTE MESMO JESUS QUE HOJE VISTES SUBIR VOLTARÁ OUTRA VEZ. VARÕES GALILEUS NÃO VOS MARAVILHEIS, ESTE MESMO JESUS QUE HOJE VISTES SUBIR VOLTARÁ OUTRA VEZ. E VOS LEVARÁ (E VOS LEVARÁ) PARA UM LAR DE PAZ (UM LAR DE PAZ), A CIDADE DE LUZ ONDE A DOR CESSARÁ; PRANTO NÃO TEREIS (PRANTO NÃO TEREIS), QUAIS OS ANJOS SEREIS (ANJOS SEREIS). ESTE MESMO JESUS QUE HOJE VISTES SUBIR VOLTARÁ OUTRA VEZ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('188', 'JERUSALÉM ANSEIO VER', 'JERUSALÉM ANSEIO VER,\nCIDADE SANTA CHEIA DE AMOR,\nOH! COMO É LINDO \nSEU ESPLENDOR;\nA LUZ QUE BRILHA,\nLUZ DO MEU SENHOR;\n\nRUAS DE OURO ANDAREI,\nJUNTO COM OS ANJOS TRILHAREI,\nVEREI A FACE DE JESUS \nE VIVEREI NA SUA LUZ.\n\nIREI MORAR, COM JESUS VOU HABITAR \nEM GRANDE GLÓRIA E ESPLENDOR \nCOM MEU SENHOR;\n\nLÁ NÃO HAVERÁ DOR, \nTRISTEZAS NEM DESILUSÕES,\nSEMPRE ESTAREI BEM PERTINHO \nDO MEU REI.\n\nINSTRUMENTOS\n\nJERUSALÉM ANSEIO VER,\nCIDADE SANTA CHEIA DE AMOR,\nOH! COMO É LINDO\nSEU ESPLENDOR; \nA LUZ QUE BRILHA,  \nLUZ DO MEU SENHOR;\n\nRUAS DE OURO ANDAREI,\nJUNTO COM OS ANJOS TRILHAREI,\nVEREI A FACE DE JESUS \nE VIVEREI NA SUA LUZ.\n\nIREI MORAR, COM JESUS VOU HABITAR \nEM GRANDE GLÓRIA E ESPLENDOR \nCOM MEU SENHOR;\n\nLÁ NÃO HAVERÁ DOR, \nTRISTEZAS NEM DESILUSÕES,\nSEMPRE ESTAREI BEM PERTINHO \nDO MEU REI.\n\nFINAL: SEMPRE ESTAREI BEM \n	PERTINHO DO MEU REI.', 'JERUSALÉM ANSEIO VER, CIDADE SANTA CHEIA DE AMOR, OH! COMO É LINDO SEU ESPLENDOR; A LUZ QUE BRILHA, LUZ DO MEU SENHOR; RUAS DE OURO ANDAREI, JUNTO COM OS ANJOS TRILHAREI, VEREI A FACE DE JESUS E VIVEREI NA SUA LUZ. IREI MORAR, COM JESUS VOU HABITAR EM GRANDE GLÓRIA E ESPLENDOR COM MEU SENHOR; LÁ NÃO HAVERÁ DOR, TRISTEZAS NEM DESILUSÕES, SEMPRE ESTAREI BEM PERTINHO DO MEU REI. JERUSALÉM ANSEIO VER, CIDADE SANTA CHEIA DE AMOR, OH! COMO É LINDO SEU ESPLENDOR; A LUZ QUE BRILHA, LUZ DO MEU SENHOR; RUAS DE OURO ANDAREI, JUNTO COM OS ANJOS TRILHAREI, VEREI A FACE DE JESUS E VIVEREI NA SUA LUZ. IREI MORAR, COM JESUS VOU HABITAR EM GRANDE GLÓRIA E ESPLENDOR COM MEU SENHOR; LÁ NÃO HAVERÁ DOR, TRISTEZAS NEM DESILUSÕES, SEMPRE ESTAREI BEM PERTINHO DO MEU REI. SEMPRE ESTAREI BEM PERTINHO DO MEU REI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('189', 'UM DIA A IGREJA SUBIRÁ', 'UM DIA A IGREJA SUBIRÁ,\nBEM MAIS PERTINHO \nDE JESUS VAMOS FICAR;\nBEM MAIS PERTINHO\nBEM MAIS PERTINHO\nBEM MAIS PERTINHO\nVAMOS JUNTOS CELEBRAR,\n\nBEM MAIS PERTINHO\nBEM MAIS PERTINHO\nBEM MAIS PERTINHO\nDE JESUS VAMOS FICAR.\n\nUM DIA A IGREJA SUBIRÁ,\nBEM MAIS PERTINHO \nDE JESUS VAMOS FICAR;\nBEM MAIS PERTINHO (3X)\nVAMOS JUNTOS CELEBRAR,\nBEM MAIS PERTINHO (3X)\nDE JESUS VAMOS FICAR.', 'UM DIA A IGREJA SUBIRÁ, BEM MAIS PERTINHO DE JESUS VAMOS FICAR; BEM MAIS PERTINHO BEM MAIS PERTINHO BEM MAIS PERTINHO VAMOS JUNTOS CELEBRAR, BEM MAIS PERTINHO BEM MAIS PERTINHO BEM MAIS PERTINHO DE JESUS VAMOS FICAR. UM DIA A IGREJA SUBIRÁ, BEM MAIS PERTINHO DE JESUS VAMOS FICAR; BEM MAIS PERTINHO VAMOS JUNTOS CELEBRAR, BEM MAIS PERTINHO DE JESUS VAMOS FICAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('190', 'IGREJA, CORPO DE CRISTO', 'IGREJA, CORPO DE CRISTO, \nFOSTE COMPRADA\nCOM O SEU SANGUE,\nA TI EU PERTENÇO,\nJESUS JÁ ME SALVOU.\n\nCORO\nMINHA IGREJA É GLORIOSA,  \nÉ A NOIVA DO SENHOR,\nJESUS VEM, SIM, BUSCÁ-LA,   \nEU VOU COM O SENHOR.\n\nQUERES TU SUBIR TAMBÉM? VEM DEPRESSA PARA JESUS,   \nELE TE ESPERA COM AMOR,   \nVEM, VEM, DEPRESSA VEM.\n\nCORO\nMINHA IGREJA É GLORIOSA,  \nÉ A NOIVA DO SENHOR,\nJESUS VEM, SIM, BUSCÁ-LA,   \nEU VOU COM O SENHOR.\nJESUS VEM, SIM, BUSCÁ-LA, \nORA VEM, SENHOR JESUS.', 'IGREJA, CORPO DE CRISTO, FOSTE COMPRADA COM O SEU SANGUE, A TI EU PERTENÇO, JESUS JÁ ME SALVOU. MINHA IGREJA É GLORIOSA, É A NOIVA DO SENHOR, JESUS VEM, SIM, BUSCÁ-LA, EU VOU COM O SENHOR. QUERES TU SUBIR TAMBÉM? VEM DEPRESSA PARA JESUS, ELE TE ESPERA COM AMOR, VEM, VEM, DEPRESSA VEM. MINHA IGREJA É GLORIOSA, É A NOIVA DO SENHOR, JESUS VEM, SIM, BUSCÁ-LA, EU VOU COM O SENHOR. JESUS VEM, SIM, BUSCÁ-LA, ORA VEM, SENHOR JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('191', 'A NOIVA AMADA DO CORDEIRO', 'A NOIVA AMADA DO CORDEIRO\nESTÁ SENDO PREPARADA\nPARA O ENCONTRO COM SEU NOIVO\nNA LINDA FESTA NO CÉU.\n\nCORO\nDIANTE DO TRONO DO CORDEIRO\nEXPRESSARÁ TODO AMOR; \nALELUIA! HONRA E GLÓRIA\nAO NOSSO SALVADOR!\n\nSEGUE O CORDEIRO\nPARA ONDE ELE VAI,\nLÁ ESTÁ ELA, TÃO FORMOSA!\nPREPARADA JÁ ESTÁ.\n\nCORO\nDIANTE DO TRONO DO CORDEIRO\nEXPRESSARÁ TODO AMOR; \nALELUIA! HONRA E GLÓRIA\nAO NOSSO SALVADOR!\n\nCANTARÁ UM CANTO NOVO\nE SÓ ELA SABERÁ  \nPOIS SOMENTE OS REMIDOS\nESTE CANTO ENTOARÃO.\n\nCORO\nDIANTE DO TRONO DO CORDEIRO\nEXPRESSARÁ TODO AMOR; \nALELUIA! HONRA E GLÓRIA\nAO NOSSO SALVADOR!', 'A NOIVA AMADA DO CORDEIRO ESTÁ SENDO PREPARADA PARA O ENCONTRO COM SEU NOIVO NA LINDA FESTA NO CÉU. DIANTE DO TRONO DO CORDEIRO EXPRESSARÁ TODO AMOR; ALELUIA! HONRA E GLÓRIA AO NOSSO SALVADOR! SEGUE O CORDEIRO PARA ONDE ELE VAI, LÁ ESTÁ ELA, TÃO FORMOSA! PREPARADA JÁ ESTÁ. DIANTE DO TRONO DO CORDEIRO EXPRESSARÁ TODO AMOR; ALELUIA! HONRA E GLÓRIA AO NOSSO SALVADOR! CANTARÁ UM CANTO NOVO E SÓ ELA SABERÁ POIS SOMENTE OS REMIDOS ESTE CANTO ENTOARÃO. DIANTE DO TRONO DO CORDEIRO EXPRESSARÁ TODO AMOR; ALELUIA! HONRA E GLÓRIA AO NOSSO SALVADOR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('192', 'VOU PRA JERUSALÉM', 'VOU PRA JERUSALÉM,      \nA CIDADE DO MEU REI.   \nALI VEREI JESUS,\nMEU SALVADOR,                \nO FILHO DE DEUS.\n\nVOU PRA JERUSALÉM.\nEM RUAS DE OURO SEI \nQUE ANDAREI,\nDA FONTE CRISTALINA,\nLÁ DESFRUTAREI\nE A GLÓRIA ETERNA \nDE DEUS ME ILUMINARÁ.\n\nPRA SEMPRE ESTAREI\nNA ETERNA MANSÃO,\nCOM OS ANJOS, \nADORANDO O SALVADOR\nQUE EM MEU LUGAR MORREU,\nMAS VIVO ELE É,\n\nSENTADO ESTÁ NO TRONO \nCOM PODER E GLÓRIA, \nHONRA E LOUVOR, POR ISSO \nVOU PRA JERUSALÉM.\nVOU PRA JERUSALÉM.\nVOU PRA JERUSALÉM.', 'VOU PRA JERUSALÉM, A CIDADE DO MEU REI. ALI VEREI JESUS, MEU SALVADOR, O FILHO DE DEUS. VOU PRA JERUSALÉM. EM RUAS DE OURO SEI QUE ANDAREI, DA FONTE CRISTALINA, LÁ DESFRUTAREI E A GLÓRIA ETERNA DE DEUS ME ILUMINARÁ. PRA SEMPRE ESTAREI NA ETERNA MANSÃO, COM OS ANJOS, ADORANDO O SALVADOR QUE EM MEU LUGAR MORREU, MAS VIVO ELE É, SENTADO ESTÁ NO TRONO COM PODER E GLÓRIA, HONRA E LOUVOR, POR ISSO VOU PRA JERUSALÉM. VOU PRA JERUSALÉM. VOU PRA JERUSALÉM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('193', 'HÁ UMA IGREJA', 'HÁ UMA IGREJA QUE AGUARDA O SENHOR,\nPOIS CONFIA NO SEU GRANDE AMOR \nQUE JESUS POR NÓS DEMONSTROU: \nPOR NOSSA VIDA UM PREÇO PAGOU!\n\nCORO\nVEM, SENHOR, TUA IGREJA TE ESPERA.VEM, SENHOR, TUA IGREJA TE ESPERA.\nAGUARDAMOS A TUA PROMESSA. \nVEM, SENHOR, TUA IGREJA TE ESPERA.\n\nQUANDO CRISTO NAS NUVENS \nVOLTAR E AOS CÉUS SUA IGREJA LEVAR, \nQUE ALEGRIA ENTÃO SENTIREMOSPOIS COM ELE PRA SEMPRE ESTAREMOS.\n\nCORO\nVEM, SENHOR, TUA IGREJA TE ESPERA.VEM, SENHOR, TUA IGREJA TE ESPERA.\nAGUARDAMOS A TUA PROMESSA. \nVEM, SENHOR, TUA IGREJA TE ESPERA.', 'HÁ UMA IGREJA QUE AGUARDA O SENHOR, POIS CONFIA NO SEU GRANDE AMOR QUE JESUS POR NÓS DEMONSTROU: POR NOSSA VIDA UM PREÇO PAGOU! VEM, SENHOR, TUA IGREJA TE ESPERA.VEM, SENHOR, TUA IGREJA TE ESPERA. AGUARDAMOS A TUA PROMESSA. VEM, SENHOR, TUA IGREJA TE ESPERA. QUANDO CRISTO NAS NUVENS VOLTAR E AOS CÉUS SUA IGREJA LEVAR, QUE ALEGRIA ENTÃO SENTIREMOSPOIS COM ELE PRA SEMPRE ESTAREMOS. VEM, SENHOR, TUA IGREJA TE ESPERA.VEM, SENHOR, TUA IGREJA TE ESPERA. AGUARDAMOS A TUA PROMESSA. VEM, SENHOR, TUA IGREJA TE ESPERA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('194', 'NA NOVA JERUSALÉM', 'NA NOVA JERUSALÉMCOM CRISTO IREI MORAR,\nPOIS ELE PROMETEUQUE UM DIA VIRÁ ME BUSCAR.\n\nCORO\nNA NOVA JERUSALÉMNA NOVA JERUSALÉMNA NOVA JERUSALÉM\nCOM CRISTO QUERO ESTAR.\n\nSE VOCÊ QUISER MORARNA NOVA JERUSALÉM,\nÉ SÓ A CRISTO ACEITARE CANTAR COMIGO TAMBÉM.\n\nNA NOVA JERUSALÉMCOM CRISTO IREI MORAR,\nPOIS ELE PROMETEUQUE UM DIA VIRÁ ME BUSCAR.\n\nCORO\nNA NOVA JERUSALÉMNA NOVA JERUSALÉMNA NOVA JERUSALÉM\nCOM CRISTO QUERO ESTAR.', 'NA NOVA JERUSALÉMCOM CRISTO IREI MORAR, POIS ELE PROMETEUQUE UM DIA VIRÁ ME BUSCAR. NA NOVA JERUSALÉMNA NOVA JERUSALÉMNA NOVA JERUSALÉM COM CRISTO QUERO ESTAR. SE VOCÊ QUISER MORARNA NOVA JERUSALÉM, É SÓ A CRISTO ACEITARE CANTAR COMIGO TAMBÉM. NA NOVA JERUSALÉMCOM CRISTO IREI MORAR, POIS ELE PROMETEUQUE UM DIA VIRÁ ME BUSCAR. NA NOVA JERUSALÉMNA NOVA JERUSALÉMNA NOVA JERUSALÉM COM CRISTO QUERO ESTAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('195', 'EM BREVE ESTAREMOS NA GLÓRIA', 'EM BREVE ESTAREMOS NA GLÓRIA, \nA CANTAR ALELUIA AO CORDEIRO,\nAGUARDAMOS DIA E NOITE\nOUVIR O TOQUE \nDA TROMBETA DE DEUS ECOAR.\n\nVAMOS TER UMA GRANDE REUNIÃO\nNO CÉU COM O SALVADOR.\nO MOMENTO SE APROXIMA\nE A NOIVA SE APRONTA, \nAGUARDA O CHAMADO DO SENHOR.\n\nFELIZES SERVOS CHAMADOS\nPARA A GRANDE FESTA \nQUE ACONTECERÁ BREVEMENTE: \nSERÃO AS BODAS DO CORDEIRO.\n\nFELIZES SERVOS CHAMADOS\nPARA A GRANDE FESTA \nQUE ACONTECERÁ BREVEMENTE: \nSERÃO AS BODAS DO CORDEIRO. (2X)', 'EM BREVE ESTAREMOS NA GLÓRIA, A CANTAR ALELUIA AO CORDEIRO, AGUARDAMOS DIA E NOITE OUVIR O TOQUE DA TROMBETA DE DEUS ECOAR. VAMOS TER UMA GRANDE REUNIÃO NO CÉU COM O SALVADOR. O MOMENTO SE APROXIMA E A NOIVA SE APRONTA, AGUARDA O CHAMADO DO SENHOR. FELIZES SERVOS CHAMADOS PARA A GRANDE FESTA QUE ACONTECERÁ BREVEMENTE: SERÃO AS BODAS DO CORDEIRO. FELIZES SERVOS CHAMADOS PARA A GRANDE FESTA QUE ACONTECERÁ BREVEMENTE: SERÃO AS BODAS DO CORDEIRO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('196', 'JESUS NOS PROMETEU', 'JESUS NOS PROMETEU\nQUE VIRÁ NOS BUSCAR.\nESTE MUNDO PASSARÁ,\nTODO MAL FINDARÁ.\n\nCORO\nO TOQUE DA TROMBETA OUVIREMOS,\nO ANJO DO SENHOR A TOCARÁ.\nNAS NUVENS CELESTIAIS\nIREMOS ENCONTRAR JESUS.\n\nQUE GOZO E ALEGRIA HAVERÁ.\nA NOIVA DO SENHOR \nARREBATADA IRÁ. \nCOM JESUS PARA SEMPRE ESTARÁ.\n\nCORO\nO TOQUE DA TROMBETA OUVIREMOS,\nO ANJO DO SENHOR A TOCARÁ.\nNAS NUVENS CELESTIAIS\nIREMOS ENCONTRAR JESUS.', 'JESUS NOS PROMETEU QUE VIRÁ NOS BUSCAR. ESTE MUNDO PASSARÁ, TODO MAL FINDARÁ. O TOQUE DA TROMBETA OUVIREMOS, O ANJO DO SENHOR A TOCARÁ. NAS NUVENS CELESTIAIS IREMOS ENCONTRAR JESUS. QUE GOZO E ALEGRIA HAVERÁ. A NOIVA DO SENHOR ARREBATADA IRÁ. COM JESUS PARA SEMPRE ESTARÁ. O TOQUE DA TROMBETA OUVIREMOS, O ANJO DO SENHOR A TOCARÁ. NAS NUVENS CELESTIAIS IREMOS ENCONTRAR JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('197', 'MARANATA! VEM SENHOR JESUS', 'MARANATA!                                          VEM, SENHOR JESUS,\nVEM BUSCAR TUA IGREJA.\nMARANATA! \nVEM, SENHOR JESUS,\nVEM BUSCAR TUA IGREJA FIEL.\n\nPOR TEU SANGUE ELA FOI COMPRADA,\nRESGATADA POR TEU GRANDE AMOR\nE PELO ESPÍRITO ESTÁ SENDO ATAVIADA,\nSE PREPARANDO PARA AS BODAS \nCOM O SENHOR.\n\nMARANATA!                                          VEM, SENHOR JESUS,\nVEM BUSCAR TUA IGREJA.\nMARANATA! \nVEM, SENHOR JESUS,\nVEM BUSCAR TUA IGREJA FIEL.\n\nPOR TEU SANGUE ELA FOI COMPRADA,\nRESGATADA POR TEU GRANDE AMOR\nE PELO ESPÍRITO ESTÁ SENDO ATAVIADA,\nSE PREPARANDO PARA AS BODAS \nCOM O SENHOR.\n\nMARANATA! \nVEM, SENHOR JESUS,\nVEM BUSCAR TUA IGREJA.\nMARANATA!\nVEM, SENHOR JESUS,\nVEM BUSCAR TUA IGREJA.\nVEM BUSCAR TUA IGREJA FIEL.', 'MARANATA! VEM, SENHOR JESUS, VEM BUSCAR TUA IGREJA. MARANATA! VEM, SENHOR JESUS, VEM BUSCAR TUA IGREJA FIEL. POR TEU SANGUE ELA FOI COMPRADA, RESGATADA POR TEU GRANDE AMOR E PELO ESPÍRITO ESTÁ SENDO ATAVIADA, SE PREPARANDO PARA AS BODAS COM O SENHOR. MARANATA! VEM, SENHOR JESUS, VEM BUSCAR TUA IGREJA. MARANATA! VEM, SENHOR JESUS, VEM BUSCAR TUA IGREJA FIEL. POR TEU SANGUE ELA FOI COMPRADA, RESGATADA POR TEU GRANDE AMOR E PELO ESPÍRITO ESTÁ SENDO ATAVIADA, SE PREPARANDO PARA AS BODAS COM O SENHOR. MARANATA! VEM, SENHOR JESUS, VEM BUSCAR TUA IGREJA. MARANATA! VEM, SENHOR JESUS, VEM BUSCAR TUA IGREJA. VEM BUSCAR TUA IGREJA FIEL.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('198', 'O DIA ESTÁ CHEGANDO', 'O DIA ESTÁ CHEGANDO, \nAS HORAS ESTÃO PASSANDO,\nO DIA JÁ VAI CHEGAR\nE JESUS VAI VOLTAR!\n\nO TEMPO SE APRESSA, \nO AMOR SE ESFRIANDO, \nPESSOAS NÃO SE FALANDO. \nMAS JESUS VAI VOLTAR!\n\nPOIS ASSIM SERÁ                      QUANDO JESUS VOLTAR.\nASSIM SERÁ QUANDO                    JESUS VOLTAR.\nVAI VOLTAR, VAI VOLTAR!\n\nINSTRUMENTOS\n\nMENSAGENS REVELADAS, \nESCRITAS POR JESUS,\nPARA NOS PREPARAR,\nPORQUE JESUS VAI VOLTAR.\nPREPARANDO OS CORAÇÕES \nPARA JESUS ENCONTRAR,\nJESUS, MEU BOM PASTOR, \nQUE ME FAZ VENCEDOR.\n\nESTAMOS PREPARANDO, \nESTAMOS PREPARANDO \nOS CORAÇÕES, \nESTAMOS PREPARANDO, \nPREPARANDO OS CORAÇÕES.\nPORQUE JESUS VAI VOLTAR, \nVAI VOLTAR, VAI VOLTAR!\nVAI VOLTAR!', 'O DIA ESTÁ CHEGANDO, AS HORAS ESTÃO PASSANDO, O DIA JÁ VAI CHEGAR E JESUS VAI VOLTAR! O TEMPO SE APRESSA, O AMOR SE ESFRIANDO, PESSOAS NÃO SE FALANDO. MAS JESUS VAI VOLTAR! POIS ASSIM SERÁ QUANDO JESUS VOLTAR. ASSIM SERÁ QUANDO JESUS VOLTAR. VAI VOLTAR, VAI VOLTAR! MENSAGENS REVELADAS, ESCRITAS POR JESUS, PARA NOS PREPARAR, PORQUE JESUS VAI VOLTAR. PREPARANDO OS CORAÇÕES PARA JESUS ENCONTRAR, JESUS, MEU BOM PASTOR, QUE ME FAZ VENCEDOR. ESTAMOS PREPARANDO, ESTAMOS PREPARANDO OS CORAÇÕES, ESTAMOS PREPARANDO, PREPARANDO OS CORAÇÕES. PORQUE JESUS VAI VOLTAR, VAI VOLTAR, VAI VOLTAR! VAI VOLTAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('199', 'AGUARDANDO A ORIENTAÇÃO DO SALVADOR', 'AGUARDANDO A ORIENTAÇÃO \nDO SALVADOR,\nCOM JESUS MARCHAMOS, \nSEGUINDO SEM PARAR.\n\nA BANDEIRA DA VITÓRIA \nCONOSCO ESTÁ.\nOH! GLÓRIA, HOSANA AO REI!\nJESUS VENCENDO VEM!\n\nPELA FÉ AVISTAMOS NOSSO LAR,\nANSIOSOS PARA O ENCONTRO \nCOM JESUS.\nTODA LÁGRIMA ELE ENXUGARÁ.\nOH! GLÓRIA, HOSANA AO REI!\nJESUS VENCENDO VEM!\n\nINSTRUMENTOS\n\nCOM OS ANJOS \nCANTAREMOS LÁ NO CÉU\nLOUVORES AO CORDEIRO \nQUE VENCEU.\nA COROA ELE NOS DARÁ.\n\nOH! GLÓRIA! \n(GLÓRIA, GLÓRIA, GLÓRIA)\nJESUS VENCENDO VEM! \nGLÓRIA, JESUS VENCENDO VEM!', 'AGUARDANDO A ORIENTAÇÃO DO SALVADOR, COM JESUS MARCHAMOS, SEGUINDO SEM PARAR. A BANDEIRA DA VITÓRIA CONOSCO ESTÁ. OH! GLÓRIA, HOSANA AO REI! JESUS VENCENDO VEM! PELA FÉ AVISTAMOS NOSSO LAR, ANSIOSOS PARA O ENCONTRO COM JESUS. TODA LÁGRIMA ELE ENXUGARÁ. OH! GLÓRIA, HOSANA AO REI! JESUS VENCENDO VEM! COM OS ANJOS CANTAREMOS LÁ NO CÉU LOUVORES AO CORDEIRO QUE VENCEU. A COROA ELE NOS DARÁ. OH! GLÓRIA! (GLÓRIA, GLÓRIA, GLÓRIA) JESUS VENCENDO VEM! GLÓRIA, JESUS VENCENDO VEM!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('200', 'VOU PARA O MEU LAR', 'CORO\nVOU PARA O MEU LAR, \nJESUS JÁ PREPAROU \nO MEU LUGAR.\nVOU PARA O MEU LAR, \nJESUS JÁ PREPAROU \nO MEU LUGAR.\n\nESTÁ CHEGANDO \nA HORA DA PARTIDA,\nJESUS JÁ VEM ME BUSCAR.\nA TROMBETA VAI ECOAR\nE VOU PARA O MEU LAR.\n\nCORO\nVOU PARA O MEU LAR, \nJESUS JÁ PREPAROU \nO MEU LUGAR.\nVOU PARA O MEU LAR, \nJESUS JÁ PREPAROU \nO MEU LUGAR.\n\nMINHA CANDEIA ESTÁ BEM ACESA\nE ÓLEO NA BOTIJA TAMBÉM HÁ.\nA TROMBETA VAI ECOAR\nE VOU PARA O MEU LAR.\n\nCORO\nVOU PARA O MEU LAR, \nJESUS JÁ PREPAROU \nO MEU LUGAR.\nVOU PARA O MEU LAR, \nJESUS JÁ PREPAROU \nO MEU LUGAR.', 'VOU PARA O MEU LAR, JESUS JÁ PREPAROU O MEU LUGAR. VOU PARA O MEU LAR, JESUS JÁ PREPAROU O MEU LUGAR. ESTÁ CHEGANDO A HORA DA PARTIDA, JESUS JÁ VEM ME BUSCAR. A TROMBETA VAI ECOAR E VOU PARA O MEU LAR. VOU PARA O MEU LAR, JESUS JÁ PREPAROU O MEU LUGAR. VOU PARA O MEU LAR, JESUS JÁ PREPAROU O MEU LUGAR. MINHA CANDEIA ESTÁ BEM ACESA E ÓLEO NA BOTIJA TAMBÉM HÁ. A TROMBETA VAI ECOAR E VOU PARA O MEU LAR. VOU PARA O MEU LAR, JESUS JÁ PREPAROU O MEU LUGAR. VOU PARA O MEU LAR, JESUS JÁ PREPAROU O MEU LUGAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('201', 'SOBRE AS NUVENS JESUS VEM', 'SOBRE AS NUVENS JESUS VEM \nCOMO REI E VENCEDOR,\nSUA IGREJA VEM BUSCAR\nCUMPRINDO SUA PROMESSA \nAO SEU POVO.\n\nQUE ALEGRIA VER NOSSO REI.\nMARANATA, CANTAREMOS COM FERVOR,\nPOIS SEU BRADO É DE VITÓRIA,                    \nALELUIA, HONRA E GLÓRIA\nLHE DAREMOS COM AMOR.\n\nCOMO IGREJA FIEL,\nTODOS UNIDOS A UMA VOZ,\nCANTAREMOS JESUS \nVEM VENCEDOR!\nJESUS VEM VENCEDOR!\nJESUS VEM VENCEDOR!', 'SOBRE AS NUVENS JESUS VEM COMO REI E VENCEDOR, SUA IGREJA VEM BUSCAR CUMPRINDO SUA PROMESSA AO SEU POVO. QUE ALEGRIA VER NOSSO REI. MARANATA, CANTAREMOS COM FERVOR, POIS SEU BRADO É DE VITÓRIA, ALELUIA, HONRA E GLÓRIA LHE DAREMOS COM AMOR. COMO IGREJA FIEL, TODOS UNIDOS A UMA VOZ, CANTAREMOS JESUS VEM VENCEDOR! JESUS VEM VENCEDOR! JESUS VEM VENCEDOR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('202', 'A RAABE VEIO A ORDEM', 'A RAABE VEIO A ORDEM:\nNA JANELA DE SUA CASA \nCOLOCAR, UM CORDÃO \nDE FIO DE ESCARLATA \nPRA DA MORTE SE LIVRAR.\n\nELA CREU E OBEDECEU.VIU MUROS, CASAS ROLAREM,MAS SUA CASA NÃO CAIUFIO DE ESCARLATA A DEFENDEU.\n\nESTE MUNDO UM DIA PASSARÁ,\nA TERRA TREMERÁ,\nCASAS, PEDRAS VÃO ROLAR,\nMAS COM JESUS FIRME ESTAREI.\n\nSEU SANGUE É ESTE FIO \nE NELE VOU CONFIAR.\nESTAMOS PRONTOS, \nMARANATA! ORA VEM, SENHOR JESUS!\nORA VEM, SENHOR JESUS!\n\nESTAMOS PRONTOS, \nMARANATA! ORA VEM, SENHOR JESUS!', 'A RAABE VEIO A ORDEM: NA JANELA DE SUA CASA COLOCAR, UM CORDÃO DE FIO DE ESCARLATA PRA DA MORTE SE LIVRAR. ELA CREU E OBEDECEU.VIU MUROS, CASAS ROLAREM,MAS SUA CASA NÃO CAIUFIO DE ESCARLATA A DEFENDEU. ESTE MUNDO UM DIA PASSARÁ, A TERRA TREMERÁ, CASAS, PEDRAS VÃO ROLAR, MAS COM JESUS FIRME ESTAREI. SEU SANGUE É ESTE FIO E NELE VOU CONFIAR. ESTAMOS PRONTOS, MARANATA! ORA VEM, SENHOR JESUS! ORA VEM, SENHOR JESUS! ESTAMOS PRONTOS, MARANATA! ORA VEM, SENHOR JESUS!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('203', 'O FIO DE ESCARLATA O MISTÉRIO', 'O FIO DE ESCARLATA É O MISTÉRIO, DA FÉ E DA GRAÇA DO SENHOR.\nFOI REVELADO A NÓS E NOS LIGA \nÀ PRESENÇA DE DEUS, O SENHOR.\n\nCORO\nSEGUINDO O FIO DE ESCARLATA       \nVEREMOS MARANATA.\nORA VEM, SENHOR JESUS!\n\nA IGREJA TRIUNFANTE, \nENTOANDO UM NOVO CANTO, \nSUBIRÁ PRA MORAR COM JESUS.\n\nESTE FIO DE ESCARLATA REPRESENTA\nO SANGUE DE JESUS: \nNOVA ALIANÇA, VÉU RASGADO, \nNOVO CAMINHO PARA O CÉU.\n\nCORO\nSEGUINDO O FIO DE ESCARLATA       \nVEREMOS MARANATA.\nORA VEM, SENHOR JESUS!\n\nFINAL:\nA IGREJA TRIUNFANTE, \nENTOANDO UM NOVO CANTO, \nSUBIRÁ PRA MORAR COM JESUS.', 'O FIO DE ESCARLATA É O MISTÉRIO, DA FÉ E DA GRAÇA DO SENHOR. FOI REVELADO A NÓS E NOS LIGA À PRESENÇA DE DEUS, O SENHOR. SEGUINDO O FIO DE ESCARLATA VEREMOS MARANATA. ORA VEM, SENHOR JESUS! A IGREJA TRIUNFANTE, ENTOANDO UM NOVO CANTO, SUBIRÁ PRA MORAR COM JESUS. ESTE FIO DE ESCARLATA REPRESENTA O SANGUE DE JESUS: NOVA ALIANÇA, VÉU RASGADO, NOVO CAMINHO PARA O CÉU. SEGUINDO O FIO DE ESCARLATA VEREMOS MARANATA. ORA VEM, SENHOR JESUS! A IGREJA TRIUNFANTE, ENTOANDO UM NOVO CANTO, SUBIRÁ PRA MORAR COM JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('204', '“MARCHAI! MARCHAI!”', 'CORO\n“MARCHAI!  MARCHAI!”\nFIRME, SEGURA, \nCONFIANTE VAI,\nA IGREJA ADORNADA, \nPREPARADA, AO ENCONTRO \nDE SEU NOIVO VAI.\n\nEIS O MOMENTO! ESTAMOS ATENTOS!\nVIGILANTES, EM CONSTANTE ADORAÇÃO.\nJESUS NAS NUVENS DESCERÁ, \nSUA IGREJA LEVARÁ\nPARA A NOVA JERUSALÉM, ETERNO LAR.\n\nCORO\n“MARCHAI!  MARCHAI!”\nFIRME, SEGURA, \nCONFIANTE VAI,\nA IGREJA ADORNADA, \nPREPARADA, AO ENCONTRO \nDE SEU NOIVO VAI.\n\nO FIO DE ESCARLATA NOS GARANTE\nAS MORADAS PREPARADAS POR JESUS.\nTUDO ESTÁ PRONTO! CANDEIA ACESA! \nSOMOS O POVO QUE O ESPÍRITO CONDUZ.\n\nINSTRUMENTOS\n\nCORO\n“MARCHAI!  MARCHAI!”\nFIRME, SEGURA, \nCONFIANTE VAI,\nA IGREJA ADORNADA, \nPREPARADA, AO ENCONTRO \nDE SEU NOIVO VAI.', 'MARCHAI! MARCHAI! FIRME, SEGURA, CONFIANTE VAI, A IGREJA ADORNADA, PREPARADA, AO ENCONTRO DE SEU NOIVO VAI. EIS O MOMENTO! ESTAMOS ATENTOS! VIGILANTES, EM CONSTANTE ADORAÇÃO. JESUS NAS NUVENS DESCERÁ, SUA IGREJA LEVARÁ PARA A NOVA JERUSALÉM, ETERNO LAR. MARCHAI! MARCHAI! FIRME, SEGURA, CONFIANTE VAI, A IGREJA ADORNADA, PREPARADA, AO ENCONTRO DE SEU NOIVO VAI. O FIO DE ESCARLATA NOS GARANTE AS MORADAS PREPARADAS POR JESUS. TUDO ESTÁ PRONTO! CANDEIA ACESA! SOMOS O POVO QUE O ESPÍRITO CONDUZ. MARCHAI! MARCHAI! FIRME, SEGURA, CONFIANTE VAI, A IGREJA ADORNADA, PREPARADA, AO ENCONTRO DE SEU NOIVO VAI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('205', 'A MINHA ALMA ESPERA', 'A MINHA ALMA ESPERA,\nNO SENHOR ESPERA \nE JUNTOS VAMOS ADORAR,\nO GRANDE REI SENHOR,\nO NOSSO EMANUEL.\nE JUNTOS VAMOS ADORAR.\n\nVEM SENHOR! A TUA IGREJA \nESPERA E NÃO VAI TARDAR.\nA NOIVA PREPARADA ESTÁ \nE A IGREJA SUBIRÁ.\n\nA NOIVA PREPARADA ESTÁ\nE A IGREJA SUBIRÁ.\n\nINSTRUMENTOS\n\nA MINHA ALMA ESPERA,\nNO SENHOR ESPERA \nE JUNTOS VAMOS ADORAR,\nO GRANDE REI SENHOR,\nO NOSSO EMANUEL.\nE JUNTOS VAMOS ADORAR.\n\nVEM SENHOR! A TUA IGREJA \nESPERA E NÃO VAI TARDAR.\nA NOIVA PREPARADA ESTÁ \nE A IGREJA SUBIRÁ.\n\nA NOIVA PREPARADA ESTÁ\nE A IGREJA SUBIRÁ.', 'A MINHA ALMA ESPERA, NO SENHOR ESPERA E JUNTOS VAMOS ADORAR, O GRANDE REI SENHOR, O NOSSO EMANUEL. E JUNTOS VAMOS ADORAR. VEM SENHOR! A TUA IGREJA ESPERA E NÃO VAI TARDAR. A NOIVA PREPARADA ESTÁ E A IGREJA SUBIRÁ. A NOIVA PREPARADA ESTÁ E A IGREJA SUBIRÁ. A MINHA ALMA ESPERA, NO SENHOR ESPERA E JUNTOS VAMOS ADORAR, O GRANDE REI SENHOR, O NOSSO EMANUEL. E JUNTOS VAMOS ADORAR. VEM SENHOR! A TUA IGREJA ESPERA E NÃO VAI TARDAR. A NOIVA PREPARADA ESTÁ E A IGREJA SUBIRÁ. A NOIVA PREPARADA ESTÁ E A IGREJA SUBIRÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('206', 'NO CÉU UM DIA NÓS VAMOS MORAR', 'NO CÉU UM DIA NÓS VAMOS MORAR\nCOM JESUS, O BOM PASTOR, \nFELIZES SEREMOS.\n\nQUANTA ALEGRIA, \nMUITOS LOUVORES.\nCANTAREMOS AO SENHOR,\nCANTAREMOS AO SENHOR, \nCANTAREMOS AO SENHOR,  \nNOSSO SALVADOR!\n\nNO CÉU UM DIA NÓS VAMOS MORAR\nCOM JESUS, O BOM PASTOR, \nFELIZES SEREMOS.\n\nQUANTA ALEGRIA, \nMUITOS LOUVORES.\nCANTAREMOS AO SENHOR,\nCANTAREMOS AO SENHOR, \nCANTAREMOS AO SENHOR,  \nNOSSO SALVADOR!\nNOSSO SALVADOR!', 'NO CÉU UM DIA NÓS VAMOS MORAR COM JESUS, O BOM PASTOR, FELIZES SEREMOS. QUANTA ALEGRIA, MUITOS LOUVORES. CANTAREMOS AO SENHOR, CANTAREMOS AO SENHOR, CANTAREMOS AO SENHOR, NOSSO SALVADOR! NO CÉU UM DIA NÓS VAMOS MORAR COM JESUS, O BOM PASTOR, FELIZES SEREMOS. QUANTA ALEGRIA, MUITOS LOUVORES. CANTAREMOS AO SENHOR, CANTAREMOS AO SENHOR, CANTAREMOS AO SENHOR, NOSSO SALVADOR! NOSSO SALVADOR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('207', 'JESUS PROMETEU NOS BUSCAR', 'JESUS PROMETEU NOS BUSCAR\nARREBATAR SUA IGREJA FIEL\nCOM ELE IREMOS MORAR\nHABITAR LÁ NO CÉU\nNAS RUAS DE OURO \nIREMOS ANDAR.\n\nCORO\nOH! QUANTO ANSEIO ESTAR ALI\nVER FACE A FACE O MEU REI\nENFIM, VOU ADORAR JESUS.\n\nNÃO HÁ ALI TRISTEZA OU DOR, NEM MORTE, NEM PRANTO OU CLAMOR \nSÓ HAVERÁ SEU AMOR\nPOIS CONOSCO ESTARÁ \nCOM O CORDEIRO IREMOS AO LAR.\n\nCORO\nOH! QUANTO ANSEIO ESTAR ALI\nVER FACE A FACE O MEU REI\nENFIM, VOU ADORAR JESUS.\n\nESSE DIA ESTÁ PRA CHEGAR \nA TROMBETA ESTÁ PRA SOAR \nQUEM VENCER TUDO HERDARÁ \nCOM JESUS REINARÁ AO CORDEIRO\nIREMOS LOUVAR.\n\nCORO\nOH! QUANTO ANSEIO ESTAR ALI \nVER FACE A FACE  O MEU REI\nENFIM, VOU ADORAR JESUS.\nENFIM, VOU CONTEMPLAR JESUS. \nENFIM, VOU ABRAÇAR JESUS.', 'JESUS PROMETEU NOS BUSCAR ARREBATAR SUA IGREJA FIEL COM ELE IREMOS MORAR HABITAR LÁ NO CÉU NAS RUAS DE OURO IREMOS ANDAR. OH! QUANTO ANSEIO ESTAR ALI VER FACE A FACE O MEU REI ENFIM, VOU ADORAR JESUS. NÃO HÁ ALI TRISTEZA OU DOR, NEM MORTE, NEM PRANTO OU CLAMOR SÓ HAVERÁ SEU AMOR POIS CONOSCO ESTARÁ COM O CORDEIRO IREMOS AO LAR. OH! QUANTO ANSEIO ESTAR ALI VER FACE A FACE O MEU REI ENFIM, VOU ADORAR JESUS. ESSE DIA ESTÁ PRA CHEGAR A TROMBETA ESTÁ PRA SOAR QUEM VENCER TUDO HERDARÁ COM JESUS REINARÁ AO CORDEIRO IREMOS LOUVAR. OH! QUANTO ANSEIO ESTAR ALI VER FACE A FACE O MEU REI ENFIM, VOU ADORAR JESUS. ENFIM, VOU CONTEMPLAR JESUS. ENFIM, VOU ABRAÇAR JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('208', 'EU QUERO IR PARA O CÉU', 'EU QUERO IR PARA O CÉU\nVER O MEU SALVADOR.\nQUE ME RESGATOU,  \nSEU SANGUE ME COMPROU\n\nEU QUERO IR PARA O CÉU\nVIVER COM MEU JESUS \nANDAR NA SUA LUZ, \nPASSEAR NO SEU JARDIM.\n\nEU QUERO IR PARA O CÉU\nNAS RUAS DE OURO ANDAR\nVER AS BELAS MANSÕES,\nSUA GLÓRIA CONTEMPLAR\n\nINSTRUMENTOS\n\nEU QUERO IR PARA O CÉU\nMORAR COM MEU SENHOR \nDA ÁRVORE DA VIDA\nEU QUERO DESFRUTAR,\n\nADORAR O MEU JESUS, \nCOM OS ANJOS VOU CANTAR \nADORAR O MEU JESUS, \nCOM OS ANJOS VOU CANTAR', 'EU QUERO IR PARA O CÉU VER O MEU SALVADOR. QUE ME RESGATOU, SEU SANGUE ME COMPROU EU QUERO IR PARA O CÉU VIVER COM MEU JESUS ANDAR NA SUA LUZ, PASSEAR NO SEU JARDIM. EU QUERO IR PARA O CÉU NAS RUAS DE OURO ANDAR VER AS BELAS MANSÕES, SUA GLÓRIA CONTEMPLAR EU QUERO IR PARA O CÉU MORAR COM MEU SENHOR DA ÁRVORE DA VIDA EU QUERO DESFRUTAR, ADORAR O MEU JESUS, COM OS ANJOS VOU CANTAR ADORAR O MEU JESUS, COM OS ANJOS VOU CANTAR', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('209', 'SE EU FALO', 'SE EU FALO DO GRANDE\nAMOR DO PAI\nGRANDES BÊNÇÃOS \nPODEREI CONTAR.\nSE EU CANTO AS \nMARAVILHAS QUE ELE FAZ,\nO LOUVAREI ETERNAMENTE.\n\nGRANDE É O AMOR DO PAI, MARAVILHAS ELE FAZ\nQUANDO A IGREJA CANTA \nE ORA SEM CESSAR.\nSANTO, JUSTO E FIEL, \nSUA PROMESSA CUMPRIRÁ\nBREVE VEM NOS BUSCAR!\n\nMARANATA, JESUS VEM! \nMARANATA, JESUS VEM! \nBREVE VEM NOS BUSCAR! \nMARANATA, JESUS VEM! \nMARANATA, JESUS VEM! \nBREVE VEM NOS BUSCAR!\nBREVE VEM NOS BUSCAR!\nBREVE VEM NOS BUSCAR!', 'SE EU FALO DO GRANDE AMOR DO PAI GRANDES BÊNÇÃOS PODEREI CONTAR. SE EU CANTO AS MARAVILHAS QUE ELE FAZ, O LOUVAREI ETERNAMENTE. GRANDE É O AMOR DO PAI, MARAVILHAS ELE FAZ QUANDO A IGREJA CANTA E ORA SEM CESSAR. SANTO, JUSTO E FIEL, SUA PROMESSA CUMPRIRÁ BREVE VEM NOS BUSCAR! MARANATA, JESUS VEM! MARANATA, JESUS VEM! BREVE VEM NOS BUSCAR! MARANATA, JESUS VEM! MARANATA, JESUS VEM! BREVE VEM NOS BUSCAR! BREVE VEM NOS BUSCAR! BREVE VEM NOS BUSCAR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('210', 'JESUS VOLTARÁ PRA ME BUSCAR! (MARANATA)', 'JESUS VOLTARÁ PRA ME BUSCAR!\nO MEU CORAÇÃO ANSEIA\nPOR ESSSE ENCONTRO TÃO ESPECIAL, \nONDE TODA LÁGRIMA\nELE VAI ENXUGAR.\n\nA MINHA CANDEIA ESTÁ ACESA\nE O ÓLEO NA BOTIJA TAMBÉM HÁ.\nPOR ISSO EU CLAMO.\nPOR ISSO EU CLAMO.\n\nMARANATA! VEM, SENHOR JESUS! \nMARANATA! VEM, SENHOR JESUS!     \nA TUA IGREJA TE ESPERA, \nA TUA IGREJA PROCLAMA:\nVEM, SIM, VEM JESUS.\n\nCORO \nMARANATA É O GRITO DA IGREJA,\nMARANATA É UMA FORMA DE VIDA,\nMARANATA É O DESPERTAR DO SONO,\nÉ A ESPERANÇA DA ALMA REMIDA.\n\nINSTRUMENTOS\n\nPOR ISSO EU CLAMO.\nPOR ISSO EU CLAMO.\nBIS\n\nCORO \nMARANATA É O GRITO DA IGREJA,\nMARANATA É UMA FORMA DE VIDA,\nMARANATA É O DESPERTAR DO SONO,\nÉ A ESPERANÇA DA ALMA REMIDA.\n\nELE VEM! MARANATA! \nJESUS VEM! MARANATA!\nELE VEM! MARANATA! \nJESUS VEM! MARANATA!', 'JESUS VOLTARÁ PRA ME BUSCAR! O MEU CORAÇÃO ANSEIA POR ESSSE ENCONTRO TÃO ESPECIAL, ONDE TODA LÁGRIMA ELE VAI ENXUGAR. A MINHA CANDEIA ESTÁ ACESA E O ÓLEO NA BOTIJA TAMBÉM HÁ. POR ISSO EU CLAMO. POR ISSO EU CLAMO. MARANATA! VEM, SENHOR JESUS! MARANATA! VEM, SENHOR JESUS! A TUA IGREJA TE ESPERA, A TUA IGREJA PROCLAMA: VEM, SIM, VEM JESUS. ELE VEM! MARANATA! JESUS VEM! MARANATA! ELE VEM! MARANATA! JESUS VEM! MARANATA!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('211', 'OS DIAS ESTÃO PASSANDO', 'OS DIAS ESTÃO PASSANDO,\nO MOMENTO SE APROXIMA\nDO ENCONTRO TRIUNFAL.\nA TROMBETA VAI TOCAR.\n\nA PALAVRA ME DIRIGE,\nAPONTA O CAMINHO,\nOLHO PARA O ALTO                        \nE VEJO A REDENÇÃO.\n\nCORO \nEU IREI CONTEMPLAR \nOS CÉUS ABERTOS,\nOUVIREI JESUS CHAMAR \nPELO MEU NOME,\nEU TEREI O MEU CORPO TRANSFORMADO, \nPARA ENCONTRAR O SALVADOR.\n\nEU IREI ANDAR NAS RUAS DE OURO,\nEU IREI CANTAR NO LINDO CORAL,\nEU IREI VER A ÁRVORE DA VIDA,\nESTAREI EM MEU NOVO LAR \n(ESTAREI EM JERUSALÉM).\n\nINSTRUMENTOS\n\nQUERO ESTAR CONTIGO, MEU SENHOR,                                     (VEM, MEU SENHOR)\nVEM ME BUSCAR!\nTIRA TODA DOR E O MEU SOFRER,\nTRANSFORMA O MEU \nCHORO EM ALEGRIA.\n\nCORO \nEU IREI CONTEMPLAR \nOS CÉUS ABERTOS,\nOUVIREI JESUS CHAMAR \nPELO MEU NOME,\nEU TEREI O MEU CORPO TRANSFORMADO, \nPARA ENCONTRAR O SALVADOR.\n\nEU IREI ANDAR NAS RUAS DE OURO,\nEU IREI CANTAR NO LINDO CORAL,\nEU IREI VER A ÁRVORE DA VIDA,\nESTAREI EM MEU NOVO LAR \n(ESTAREI EM JERUSALÉM).\n\nCORO \nEU IREI CONTEMPLAR \nOS CÉUS ABERTOS,\nOUVIREI JESUS CHAMAR \nPELO MEU NOME,\nEU TEREI O MEU CORPO TRANSFORMADO, \nPARA ENCONTRAR O SALVADOR.\n\nEU IREI ANDAR NAS RUAS DE OURO,\nEU IREI CANTAR NO LINDO CORAL,\nEU IREI VER A ÁRVORE DA VIDA,\nESTAREI EM MEU NOVO LAR \n(ESTAREI EM JERUSALÉM).', 'OS DIAS ESTÃO PASSANDO, O MOMENTO SE APROXIMA DO ENCONTRO TRIUNFAL. A TROMBETA VAI TOCAR. A PALAVRA ME DIRIGE, APONTA O CAMINHO, OLHO PARA O ALTO E VEJO A REDENÇÃO. EU IREI ANDAR NAS RUAS DE OURO, EU IREI CANTAR NO LINDO CORAL, EU IREI VER A ÁRVORE DA VIDA, ESTAREI EM MEU NOVO LAR (ESTAREI EM JERUSALÉM). QUERO ESTAR CONTIGO, MEU SENHOR, (VEM, MEU SENHOR) VEM ME BUSCAR! TIRA TODA DOR E O MEU SOFRER, TRANSFORMA O MEU CHORO EM ALEGRIA. EU IREI ANDAR NAS RUAS DE OURO, EU IREI CANTAR NO LINDO CORAL, EU IREI VER A ÁRVORE DA VIDA, ESTAREI EM MEU NOVO LAR (ESTAREI EM JERUSALÉM). EU IREI ANDAR NAS RUAS DE OURO, EU IREI CANTAR NO LINDO CORAL, EU IREI VER A ÁRVORE DA VIDA, ESTAREI EM MEU NOVO LAR (ESTAREI EM JERUSALÉM).', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('212', 'SEI QUE CRISTO VOLTARÁ', 'SEI QUE CRISTO VOLTARÁ,\nPOIS NA BÍBLIA ESCRITO ESTÁ,\nJOÃO CATORZE, UM, DOIS, TRÊS,\nLEDE, POIS, E SABEREIS.\n\nSEI QUE ELE VOLTA, \nSEI QUE ELE VOLTA, \nSEI QUE ELE VOLTA, \nNA BÍBLIA ESCRITO ESTÁ.', 'SEI QUE CRISTO VOLTARÁ, POIS NA BÍBLIA ESCRITO ESTÁ, JOÃO CATORZE, UM, DOIS, TRÊS, LEDE, POIS, E SABEREIS. SEI QUE ELE VOLTA, SEI QUE ELE VOLTA, SEI QUE ELE VOLTA, NA BÍBLIA ESCRITO ESTÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('213', 'LÁ NO DOCE PORVIR', 'LÁ NO DOCE PORVIR, \nLÁ NO DOCE PORVIR, \nLÁ NO DOCE PORVIR, \nMANSÃO DE LUZ IREI TER COM JESUS,\nAH! QUE PRAZER ME ENCONTRAR ALI!\n\nSIM, NO DOCE PORVIR,\nSIM, NO DOCE PORVIR,  \nQUANDO A LUTA FINDAR\nE A VITÓRIA ALCANÇAR,\nSIM, NO DOCE PORVIR.', 'LÁ NO DOCE PORVIR, LÁ NO DOCE PORVIR, LÁ NO DOCE PORVIR, MANSÃO DE LUZ IREI TER COM JESUS, AH! QUE PRAZER ME ENCONTRAR ALI! SIM, NO DOCE PORVIR, SIM, NO DOCE PORVIR, QUANDO A LUTA FINDAR E A VITÓRIA ALCANÇAR, SIM, NO DOCE PORVIR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('214', 'NÓS RECEBEREMOS LÁ NO CÉU', 'NÓS RECEBEREMOS \nLÁ NO CÉU, LÁ NO CÉU,\nO LINDO, LINDO CÉU,\nOUTRO NOME NOVO\nALÉM DO VÉU, NESSE LINDO CÉU.\n\nUM NOME NOVO, \nUM NOME NOVO,\nNÓS TEREMOS JÁ;\nUM NOME NOVO,\nUM NOME NOVO,\nQUANDO ENTRARMOS LÁ.\n\nCORO\nSIM, RECEBEREMOS \nLÁ NO CÉU, LÁ NO CÉU, \nO LINDO, LINDO CÉU,\nOUTRO NOME NOVO\nALÉM DO VÉU, NESSE LINDO CÉU.\n\nNA PEDRINHA BRANCA, EU SÓ LEREI\nESSE NOME NOVO DE JESUS;\nBRANCA MAIS QUE A NEVE\nA GUARDAREI NO REINO DE LUZ.\n\nPEDRINHA BRANCA,\nPEDRINHA BRANCA\nNÓS TEREMOS JÁ;\nPEDRINHA BRANCA,\nPEDRINHA BRANCA\nQUANDO ENTRARMOS LÁ.\n\nCORO\nSIM, RECEBEREMOS \nLÁ NO CÉU, LÁ NO CÉU, \nO LINDO, LINDO CÉU,\nOUTRO NOME NOVO\nALÉM DO VÉU, NESSE LINDO CÉU.\n\nLARGA O MUNDO, \nCRÊ EM CRISTO E VEM!\nO MANÁ ESCONDIDO É PARA TI;\nSERVE, POIS, A DEUS,\nTENS TODO O BEM!\nCRISTO É TUDO ALI.\n\nMANÁ ESCONDIDO,\nMANÁ ESCONDIDO\nNÓS TEREMOS JÁ;\nMANÁ ESCONDIDO, \nMANÁ ESCONDIDO,\nQUANDO ENTRARMOS LÁ.\n\nCORO\nSIM, RECEBEREMOS \nLÁ NO CÉU, LÁ NO CÉU, \nO LINDO, LINDO CÉU,\nOUTRO NOME NOVO\nALÉM DO VÉU, NESSE LINDO CÉU.', 'NÓS RECEBEREMOS LÁ NO CÉU, LÁ NO CÉU, O LINDO, LINDO CÉU, OUTRO NOME NOVO ALÉM DO VÉU, NESSE LINDO CÉU. UM NOME NOVO, UM NOME NOVO, NÓS TEREMOS JÁ; UM NOME NOVO, UM NOME NOVO, QUANDO ENTRARMOS LÁ. SIM, RECEBEREMOS LÁ NO CÉU, LÁ NO CÉU, O LINDO, LINDO CÉU, OUTRO NOME NOVO ALÉM DO VÉU, NESSE LINDO CÉU. NA PEDRINHA BRANCA, EU SÓ LEREI ESSE NOME NOVO DE JESUS; BRANCA MAIS QUE A NEVE A GUARDAREI NO REINO DE LUZ. PEDRINHA BRANCA, PEDRINHA BRANCA NÓS TEREMOS JÁ; PEDRINHA BRANCA, PEDRINHA BRANCA QUANDO ENTRARMOS LÁ. SIM, RECEBEREMOS LÁ NO CÉU, LÁ NO CÉU, O LINDO, LINDO CÉU, OUTRO NOME NOVO ALÉM DO VÉU, NESSE LINDO CÉU. LARGA O MUNDO, CRÊ EM CRISTO E VEM! O MANÁ ESCONDIDO É PARA TI; SERVE, POIS, A DEUS, TENS TODO O BEM! CRISTO É TUDO ALI. MANÁ ESCONDIDO, MANÁ ESCONDIDO NÓS TEREMOS JÁ; MANÁ ESCONDIDO, MANÁ ESCONDIDO, QUANDO ENTRARMOS LÁ. SIM, RECEBEREMOS LÁ NO CÉU, LÁ NO CÉU, O LINDO, LINDO CÉU, OUTRO NOME NOVO ALÉM DO VÉU, NESSE LINDO CÉU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('215', 'EIS QUE JESUS VEM NAS NUVENS', 'EIS QUE JESUS VEM NAS NUVENS\nBUSCAR SUAS JOIAS,\nSUAS JOIAS PRECIOSAS\nDE MUITO VALOR.\n\nCORO\nCOMO ESTRELAS DA AURORA\nBRILHANDO NA FRONTE\nDE JESUS, LÁ NA GLÓRIA,\nADORNO SERÃO.\n\nVEM BUSCÁ-LAS, VAI LEVÁ-LAS\nAO REINO CELESTE, \nSUAS JOIAS RESPLENDENTES \nDE MUITO VALOR.\n\nCORO\nCOMO ESTRELAS DA AURORA\nBRILHANDO NA FRONTE\nDE JESUS, LÁ NA GLÓRIA,\nADORNO SERÃO.\n\nOS MENINOS E AS MENINAS\nQUE SERVEM A JESUS,\nSÃO-LHES JOIAS, RICAS\nJOIAS DE MUITO VALOR.\n\nCORO\nCOMO ESTRELAS DA AURORA\nBRILHANDO NA FRONTE\nDE JESUS, LÁ NA GLÓRIA,\nADORNO SERÃO.', 'EIS QUE JESUS VEM NAS NUVENS BUSCAR SUAS JOIAS, SUAS JOIAS PRECIOSAS DE MUITO VALOR. COMO ESTRELAS DA AURORA BRILHANDO NA FRONTE DE JESUS, LÁ NA GLÓRIA, ADORNO SERÃO. VEM BUSCÁ-LAS, VAI LEVÁ-LAS AO REINO CELESTE, SUAS JOIAS RESPLENDENTES DE MUITO VALOR. COMO ESTRELAS DA AURORA BRILHANDO NA FRONTE DE JESUS, LÁ NA GLÓRIA, ADORNO SERÃO. OS MENINOS E AS MENINAS QUE SERVEM A JESUS, SÃO-LHES JOIAS, RICAS JOIAS DE MUITO VALOR. COMO ESTRELAS DA AURORA BRILHANDO NA FRONTE DE JESUS, LÁ NA GLÓRIA, ADORNO SERÃO.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('216', 'SOBRE AS NUVENS DESCERÁ (ELE VIRÁ)', 'SOBRE AS NUVENS DESCERÁ\nNOSSO REI E SALVADOR;\nCOM PODER E GRANDE GLÓRIA\nAO SOAR DA TROMBETA ELE VIRÁ.\n\nCORO \nELE VIRÁ (ARREBATAR)\nELE VIRÁ (NÃO TARDARÁ)\nELE VIRÁ PARA BUSCAR \nA IGREJA FIEL.\n\nTUDO AQUI HÁ DE FINDAR,\nTUDO NOVO ELE FARÁ!\nQUEM VENCER TUDO HERDARÁ\nE NO CÉU COM JESUS \nVAMOS MORAR.\n\nCORO \nELE VIRÁ (ARREBATAR)\nELE VIRÁ (NÃO TARDARÁ)\nELE VIRÁ PARA BUSCAR \nA IGREJA FIEL.\n\nA NOVA JERUSALÉM\nO CORDEIRO ILUMINARÁ,\nRIO PURO HAVERÁ\nE A ÁRVORE DA VIDA\nALI ESTARÁ.\n\nCORO \nELE VIRÁ (ARREBATAR)\nELE VIRÁ (NÃO TARDARÁ)\nELE VIRÁ PARA BUSCAR \nA IGREJA FIEL.\n\nCORO \nELE VIRÁ (ARREBATAR)\nELE VIRÁ (NÃO TARDARÁ)\nELE VIRÁ PARA BUSCAR \nA IGREJA FIEL.\nELE VIRÁ PARA BUSCAR \nA IGREJA FIEL.', 'SOBRE AS NUVENS DESCERÁ NOSSO REI E SALVADOR; COM PODER E GRANDE GLÓRIA AO SOAR DA TROMBETA ELE VIRÁ. TUDO AQUI HÁ DE FINDAR, TUDO NOVO ELE FARÁ! QUEM VENCER TUDO HERDARÁ E NO CÉU COM JESUS VAMOS MORAR. A NOVA JERUSALÉM O CORDEIRO ILUMINARÁ, RIO PURO HAVERÁ E A ÁRVORE DA VIDA ALI ESTARÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('217', 'VEREI MEU GRANDE REI', 'VEREI MEU GRANDE REI,\nUM VENCEDOR SEREI,\nVEREI O MEU JESUS!\nNOVA JERUSALÉM,\nCIDADE DO MEU REI,\nESTAREI COM MEU JESUS!\n\nCORO\nOH! QUE GLÓRIA!\nSERÁ O ENCONTRO TRIUNFAL!\nALELUIA! VEREI OS CÉUS SE ABRIREM.\nE COM OS ANJOS A CANTAR,\nNA CIDADE VOU ENTRAR.\n“ORA VEM, VEM SENHOR JESUS!”\n\nELE MORREU NA CRUZ,\nPORÉM RESSUSCITOU \nE VIVO HOJE ESTÁ.\nQUANDO ENCONTRAR JESUS, \nVEREI A SUA LUZ,\nOH! QUE GLÓRIA ETERNAL!\n\nCORO\nOH! QUE GLÓRIA!\nSERÁ O ENCONTRO TRIUNFAL!\nALELUIA! VEREI OS CÉUS SE ABRIREM.\nE COM OS ANJOS A CANTAR,\nNA CIDADE VOU ENTRAR.\n“ORA VEM, VEM SENHOR JESUS!” VEM SENHOR JESUS.', 'VEREI MEU GRANDE REI, UM VENCEDOR SEREI, VEREI O MEU JESUS! NOVA JERUSALÉM, CIDADE DO MEU REI, ESTAREI COM MEU JESUS! OH! QUE GLÓRIA! SERÁ O ENCONTRO TRIUNFAL! ALELUIA! VEREI OS CÉUS SE ABRIREM. E COM OS ANJOS A CANTAR, NA CIDADE VOU ENTRAR. ORA VEM, VEM SENHOR JESUS! ELE MORREU NA CRUZ, PORÉM RESSUSCITOU E VIVO HOJE ESTÁ. QUANDO ENCONTRAR JESUS, VEREI A SUA LUZ, OH! QUE GLÓRIA ETERNAL! OH! QUE GLÓRIA! SERÁ O ENCONTRO TRIUNFAL! ALELUIA! VEREI OS CÉUS SE ABRIREM. E COM OS ANJOS A CANTAR, NA CIDADE VOU ENTRAR. ORA VEM, VEM SENHOR JESUS! VEM SENHOR JESUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('218', 'MARANATA', 'CORO\nMARANATA, \nMARANATA, \nJESUS BREVE VIRÁ!\n\nEU VOU SUBIR, POIS A TROMBETA ESCUTAREI;\nE LÁ NAS NUVENS COM \nJESUS ME ENCONTRAREI.\nDESPERTA IGREJA, VAMOS SUBIR! \nO TEU LUGAR NÃO É AQUI, \nPORQUE EM BREVE JESUS VIRÁ.\n\nCORO\nMARANATA, \nMARANATA, \nJESUS BREVE VIRÁ!\n\nEU VOU SUBIR, POIS A TROMBETA ESCUTAREI;\nE LÁ NAS NUVENS COM \nJESUS ME ENCONTRAREI.\nDESPERTA IGREJA, VAMOS SUBIR! \nO TEU LUGAR NÃO É AQUI, \nPORQUE EM BREVE JESUS VIRÁ.', 'MARANATA, MARANATA, JESUS BREVE VIRÁ! EU VOU SUBIR, POIS A TROMBETA ESCUTAREI; E LÁ NAS NUVENS COM JESUS ME ENCONTRAREI. DESPERTA IGREJA, VAMOS SUBIR! O TEU LUGAR NÃO É AQUI, PORQUE EM BREVE JESUS VIRÁ. MARANATA, MARANATA, JESUS BREVE VIRÁ! EU VOU SUBIR, POIS A TROMBETA ESCUTAREI; E LÁ NAS NUVENS COM JESUS ME ENCONTRAREI. DESPERTA IGREJA, VAMOS SUBIR! O TEU LUGAR NÃO É AQUI, PORQUE EM BREVE JESUS VIRÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('219', 'ELE VIRÁ NO MEIO DA NOITE', 'ELE VIRÁ NO MEIO DA NOITE,\nO NOIVO VEM BUSCAR \nA NOIVA AMADA, ELE VEM!\nPRA IR À NOVA JERUSALÉM,\nRESGATARÁ O POVO \nQUE ANDA NA LUZ.\n\nOS DIAS SÃO DE TREVAS, \nEU SEI, MAS PARA A IGREJA \nBRILHA A GLÓRIA DE CRISTO JESUS!\nENCHE TUA CANDEIA, DEIXA BRILHAR, DEIXA O ESPÍRITO SANTO BRILHAR!\n\nCORO\nBRILHA EM NÓS \nO ESPÍRITO SANTO DE DEUS,\nNOS LEVANDO \nA ENCONTRAR COM JESUS!\n\nNAQUELE GRANDE DIA                SUBIRÁ QUEM ESTIVER \nNA LUZ, ENCHE A CANDEIA\nE BRILHA O FOGO DO SENHOR! \n\nINSTRUMENTOS\n\nELE VIRÁ NO MEIO DA NOITE,\nO NOIVO VEM BUSCAR \nA NOIVA AMADA, ELE VEM!\nPRA IR À NOVA JERUSALÉM,\nRESGATARÁ O POVO \nQUE ANDA NA LUZ.\n\nOS DIAS SÃO DE TREVAS, \nEU SEI, MAS PARA A IGREJA \nBRILHA A GLÓRIA DE CRISTO JESUS!\nENCHE TUA CANDEIA, DEIXA BRILHAR, DEIXA O ESPÍRITO SANTO BRILHAR!\n\nCORO\nBRILHA EM NÓS \nO ESPÍRITO SANTO DE DEUS,\nNOS LEVANDO \nA ENCONTRAR COM JESUS!\n\nNAQUELE GRANDE DIA\nSUBIRÁ QUEM ESTIVER \nNA LUZ, ENCHE A CANDEIA\nE BRILHA O FOGO DO SENHOR!\n\nCORO\nBRILHA EM NÓS \nO ESPÍRITO SANTO DE DEUS,\nNOS LEVANDO \nA ENCONTRAR COM JESUS!\n\nNAQUELE GRANDE DIA \nSUBIRÁ QUEM ESTIVER NA LUZ, ENCHE A CANDEIA E BRILHA \nO FOGO DO SENHOR! \n\nENCHE A CANDEIA E BRILHA \nO FOGO DO SENHOR!', 'ELE VIRÁ NO MEIO DA NOITE, O NOIVO VEM BUSCAR A NOIVA AMADA, ELE VEM! PRA IR À NOVA JERUSALÉM, RESGATARÁ O POVO QUE ANDA NA LUZ. OS DIAS SÃO DE TREVAS, EU SEI, MAS PARA A IGREJA BRILHA A GLÓRIA DE CRISTO JESUS! ENCHE TUA CANDEIA, DEIXA BRILHAR, DEIXA O ESPÍRITO SANTO BRILHAR! BRILHA EM NÓS O ESPÍRITO SANTO DE DEUS, NOS LEVANDO A ENCONTRAR COM JESUS! NAQUELE GRANDE DIA SUBIRÁ QUEM ESTIVER NA LUZ, ENCHE A CANDEIA E BRILHA O FOGO DO SENHOR! ELE VIRÁ NO MEIO DA NOITE, O NOIVO VEM BUSCAR A NOIVA AMADA, ELE VEM! PRA IR À NOVA JERUSALÉM, RESGATARÁ O POVO QUE ANDA NA LUZ. OS DIAS SÃO DE TREVAS, EU SEI, MAS PARA A IGREJA BRILHA A GLÓRIA DE CRISTO JESUS! ENCHE TUA CANDEIA, DEIXA BRILHAR, DEIXA O ESPÍRITO SANTO BRILHAR! BRILHA EM NÓS O ESPÍRITO SANTO DE DEUS, NOS LEVANDO A ENCONTRAR COM JESUS! NAQUELE GRANDE DIA SUBIRÁ QUEM ESTIVER NA LUZ, ENCHE A CANDEIA E BRILHA O FOGO DO SENHOR! BRILHA EM NÓS O ESPÍRITO SANTO DE DEUS, NOS LEVANDO A ENCONTRAR COM JESUS! NAQUELE GRANDE DIA SUBIRÁ QUEM ESTIVER NA LUZ, ENCHE A CANDEIA E BRILHA O FOGO DO SENHOR! ENCHE A CANDEIA E BRILHA O FOGO DO SENHOR!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('220', 'ONDE VIVE O REI DA GLÓRIA?', 'ONDE VIVE O REI DA GLÓRIA?\nVIVE EM MEU CORAÇÃO.\nONDE REINA O REI DA GLÓRIA?\nREINA EM MEU CORAÇÃO.\n\nELE FALA, ELE GUIA \nNOSSOS PASSOS A JERUSALÉM, \nPARA JUNTOS HABITARMOS\nCOM JESUS, NOSSO REI.\n\nO NOSSO REI DA GLÓRIA\nOPERA MARAVILHAS\nNO MEIO DA IGREJA,\nLIBERTA CORAÇÕES;\n\nE HOJE QUER TRANSFORMAR \nA SUA VIDA, VENHA AGORA E SINTA \nO PODER DO SALVADOR,\nALELUIA! OH, GLÓRIA!\nLOUVEMOS AO SENHOR.\n\nONDE VIVE E REINA O REI DA GLÓRIA?\nVIVE, REINA EM NOSSOS CORAÇÕES.', 'ONDE VIVE O REI DA GLÓRIA? VIVE EM MEU CORAÇÃO. ONDE REINA O REI DA GLÓRIA? REINA EM MEU CORAÇÃO. ELE FALA, ELE GUIA NOSSOS PASSOS A JERUSALÉM, PARA JUNTOS HABITARMOS COM JESUS, NOSSO REI. O NOSSO REI DA GLÓRIA OPERA MARAVILHAS NO MEIO DA IGREJA, LIBERTA CORAÇÕES; E HOJE QUER TRANSFORMAR A SUA VIDA, VENHA AGORA E SINTA O PODER DO SALVADOR, ALELUIA! OH, GLÓRIA! LOUVEMOS AO SENHOR. ONDE VIVE E REINA O REI DA GLÓRIA? VIVE, REINA EM NOSSOS CORAÇÕES.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('221', 'VAI RAIAR O DIA', 'CORO (2X)\nVAI RAIAR O DIA,                     \nDIA DA VITÓRIA,\nVAI RAIAR O DIA, DIA EM QUE \nA VITÓRIA ALCANÇAREMOS.\n\nGLÓRIA E MAJESTADE ESTÃO \nANTE A FACE DO SENHOR\nE FORMOSURA NO SEU SANTO LUGAR; \nANUNCIAI ENTRE AS NAÇÕES\nA SUA GLÓRIA, ENTRE OS POVOS AS SUAS MARAVILHAS.\n\nCORO\nVAI RAIAR O DIA,            \nDIA DA VITÓRIA,\nVAI RAIAR O DIA, DIA EM QUE \nA VITÓRIA ALCANÇAREMOS.\n\nDAI AO SENHOR DEVIDA GLÓRIA,\nTRAZEI OFERTAS E ENTRAI \nNOS SEUS ÁTRIOS; ADORAI AO SENHOR \nEM SANTIDADE, COM LOUVOR \nADORAI A SUA FACE.\n\nCORO\nVAI RAIAR O DIA,            \nDIA DA VITÓRIA,\nVAI RAIAR O DIA, DIA EM QUE \nA VITÓRIA ALCANÇAREMOS.\n\nDAI AO SENHOR GLÓRIA \nE FORÇA, BRAME O MAR                  \nE A SUA PLENITUDE;\nANUNCIAI A SALVAÇÃO                   \nDE DIA EM DIA PORQUE EM BREVE                           \nA VITÓRIA ALCANÇAREMOS.\n\nCORO (2X)\nVAI RAIAR O DIA,            \nDIA DA VITÓRIA,\nVAI RAIAR O DIA, DIA EM QUE \nA VITÓRIA ALCANÇAREMOS.', 'VAI RAIAR O DIA, DIA DA VITÓRIA, VAI RAIAR O DIA, DIA EM QUE A VITÓRIA ALCANÇAREMOS. GLÓRIA E MAJESTADE ESTÃO ANTE A FACE DO SENHOR E FORMOSURA NO SEU SANTO LUGAR; ANUNCIAI ENTRE AS NAÇÕES A SUA GLÓRIA, ENTRE OS POVOS AS SUAS MARAVILHAS. VAI RAIAR O DIA, DIA DA VITÓRIA, VAI RAIAR O DIA, DIA EM QUE A VITÓRIA ALCANÇAREMOS. DAI AO SENHOR DEVIDA GLÓRIA, TRAZEI OFERTAS E ENTRAI NOS SEUS ÁTRIOS; ADORAI AO SENHOR EM SANTIDADE, COM LOUVOR ADORAI A SUA FACE. VAI RAIAR O DIA, DIA DA VITÓRIA, VAI RAIAR O DIA, DIA EM QUE A VITÓRIA ALCANÇAREMOS. DAI AO SENHOR GLÓRIA E FORÇA, BRAME O MAR E A SUA PLENITUDE; ANUNCIAI A SALVAÇÃO DE DIA EM DIA PORQUE EM BREVE A VITÓRIA ALCANÇAREMOS. VAI RAIAR O DIA, DIA DA VITÓRIA, VAI RAIAR O DIA, DIA EM QUE A VITÓRIA ALCANÇAREMOS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('222', 'DEUS HABITA NO MEIO DOS LOUVORES', 'DEUS HABITA \nNO MEIO DOS LOUVORES,  \nÓ CANTAI, IGREJA, CANTAI,\nÓ CANTAI, DEUS HABITA \nNO LOUVOR.\n\nÓ CANTAI, \nCANTAI, CANTAI, \nÓ CANTAI LOUVORES AO SENHOR;\nDEUS HABITA NO MEIO DOS LOUVORES,\nÓ CANTAI AO SENHOR.\n\nDEUS HABITA \nNO MEIO DOS LOUVORES,  \nÓ CANTAI, IGREJA, CANTAI,\nÓ CANTAI, DEUS HABITA \nNO LOUVOR.\n\nÓ CANTAI, \nCANTAI, CANTAI, \nÓ CANTAI LOUVORES AO SENHOR;\nDEUS HABITA NO MEIO DOS LOUVORES,\nÓ CANTAI AO SENHOR.', 'DEUS HABITA NO MEIO DOS LOUVORES, Ó CANTAI, IGREJA, CANTAI, Ó CANTAI, DEUS HABITA NO LOUVOR. Ó CANTAI, CANTAI, CANTAI, Ó CANTAI LOUVORES AO SENHOR; DEUS HABITA NO MEIO DOS LOUVORES, Ó CANTAI AO SENHOR. DEUS HABITA NO MEIO DOS LOUVORES, Ó CANTAI, IGREJA, CANTAI, Ó CANTAI, DEUS HABITA NO LOUVOR. Ó CANTAI, CANTAI, CANTAI, Ó CANTAI LOUVORES AO SENHOR; DEUS HABITA NO MEIO DOS LOUVORES, Ó CANTAI AO SENHOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('223', 'PAI, TUA BELEZA ME ADMIRA', 'PAI, TUA BELEZA ME ADMIRA,\nNO UNIVERSO QUE CRIASTE\nEU POSSO VER COMO TU ÉS\nCOMO TU ÉS;\n\nPAI, ATÉ NAS MAIS \nPEQUENAS COISAS          \nEXISTE TANTA HARMONIA,\nPERFEITA É A OBRA \nDAS TUAS MÃOS.\n\nCORO\nCOM TEU PODER FUNDASTE A TERRA, \nLEVANTASTE MONTES, SEPARASTE MARES;\nNO CÉU PUSESTE O SOL E A LUA,\nSOMENTE AO TEU MANDAR \nA VIDA SE FORMOU.\n\nE DO BARRO TU FIZESTE O HOMEM\nÀ TUA IMAGEM E SEMELHANÇA\nPARA ESTAR PERANTE TI E TE LOUVAR;\n\nPAI, OUVE ESTA MINHA ADORAÇÃO,\nÉ A MAIS SINCERA EXPRESSÃO\nDO AMOR QUE HÁ DENTRO DE MIM.\n\nINSTRUMENTOS\n\nCORO\nCOM TEU PODER FUNDASTE A TERRA, \nLEVANTASTE MONTES, SEPARASTE MARES;\nNO CÉU PUSESTE O SOL E A LUA,\nSOMENTE AO TEU MANDAR \nA VIDA SE FORMOU.\n\nE DO BARRO TU FIZESTE O HOMEM\nÀ TUA IMAGEM E SEMELHANÇA\nPARA ESTAR PERANTE TI E TE LOUVAR;\n\nPAI, OUVE ESTA MINHA ADORAÇÃO,\nÉ A MAIS SINCERA EXPRESSÃO\nDO AMOR QUE HÁ DENTRO DE MIM.', 'PAI, TUA BELEZA ME ADMIRA, NO UNIVERSO QUE CRIASTE EU POSSO VER COMO TU ÉS COMO TU ÉS; PAI, ATÉ NAS MAIS PEQUENAS COISAS EXISTE TANTA HARMONIA, PERFEITA É A OBRA DAS TUAS MÃOS. COM TEU PODER FUNDASTE A TERRA, LEVANTASTE MONTES, SEPARASTE MARES; NO CÉU PUSESTE O SOL E A LUA, SOMENTE AO TEU MANDAR A VIDA SE FORMOU. E DO BARRO TU FIZESTE O HOMEM À TUA IMAGEM E SEMELHANÇA PARA ESTAR PERANTE TI E TE LOUVAR; PAI, OUVE ESTA MINHA ADORAÇÃO, É A MAIS SINCERA EXPRESSÃO DO AMOR QUE HÁ DENTRO DE MIM. COM TEU PODER FUNDASTE A TERRA, LEVANTASTE MONTES, SEPARASTE MARES; NO CÉU PUSESTE O SOL E A LUA, SOMENTE AO TEU MANDAR A VIDA SE FORMOU. E DO BARRO TU FIZESTE O HOMEM À TUA IMAGEM E SEMELHANÇA PARA ESTAR PERANTE TI E TE LOUVAR; PAI, OUVE ESTA MINHA ADORAÇÃO, É A MAIS SINCERA EXPRESSÃO DO AMOR QUE HÁ DENTRO DE MIM.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('224', 'DEUS CRIOU OS CÉUS E A TERRA', 'DEUS CRIOU OS CÉUS E A TERRA, \nO UNIVERSO, TUDO ELE FEZ; A TERRA ERA VAZIA, COBERTA DE TREVAS, SEMELHANTE AO CORAÇÃO DO HOMEM  SEM DEUS.\n\nELE TROUXE A LUZ, SEPAROU AS ÁGUAS,   \nCRIOU A TERRA FIRME, AS ERVAS FEZ BROTAR,\nILUMINOU OS CÉUS COM O BRILHO DO SOL, \nLUA E ESTRELAS,\n\nENCHEU O MAR DE VIDA,  \nCRIOU OS ANIMAIS,\nPREPAROU TUDO TÃO BELO PARA DEPOIS O HOMEM CRIAR.\n\nCORO\nDO NADA ELE FEZ TUDO,\nCOM SUA PALAVRA OS CRIOU, \nELE É O DEUS DA VIDA\nE TUDO ESTÁ EM SUAS MÃOS;\n\nÉ ELE QUEM MOVE OS CORAÇÕES \nPARA CONHECERMOS O SEU AMOR, \nNOS REVELANDO JESUS, \nNOSSO SALVADOR.\n\nESTA TERRA UM DIA PASSARÁ,  \nNÃO MAIS EXISTIRÁ, O NOVO CÉU \nE A NOVA TERRA JESUS NOS DARÁ.\n\nCORO\nDO NADA ELE FEZ TUDO,            \nCOM SUA PALAVRA OS CRIOU,  \nELE É O DEUS DA VIDA\nE TUDO ESTÁ EM SUAS MÃOS;\n\nÉ ELE QUEM MOVE OS CORAÇÕES \nPARA CONHECERMOS O SEU AMOR, \nNOS REVELANDO JESUS,              NOSSO SALVADOR.', 'DEUS CRIOU OS CÉUS E A TERRA, O UNIVERSO, TUDO ELE FEZ; A TERRA ERA VAZIA, COBERTA DE TREVAS, SEMELHANTE AO CORAÇÃO DO HOMEM SEM DEUS. ELE TROUXE A LUZ, SEPAROU AS ÁGUAS, CRIOU A TERRA FIRME, AS ERVAS FEZ BROTAR, ILUMINOU OS CÉUS COM O BRILHO DO SOL, LUA E ESTRELAS, ENCHEU O MAR DE VIDA, CRIOU OS ANIMAIS, PREPAROU TUDO TÃO BELO PARA DEPOIS O HOMEM CRIAR. DO NADA ELE FEZ TUDO, COM SUA PALAVRA OS CRIOU, ELE É O DEUS DA VIDA E TUDO ESTÁ EM SUAS MÃOS; É ELE QUEM MOVE OS CORAÇÕES PARA CONHECERMOS O SEU AMOR, NOS REVELANDO JESUS, NOSSO SALVADOR. ESTA TERRA UM DIA PASSARÁ, NÃO MAIS EXISTIRÁ, O NOVO CÉU E A NOVA TERRA JESUS NOS DARÁ. DO NADA ELE FEZ TUDO, COM SUA PALAVRA OS CRIOU, ELE É O DEUS DA VIDA E TUDO ESTÁ EM SUAS MÃOS; É ELE QUEM MOVE OS CORAÇÕES PARA CONHECERMOS O SEU AMOR, NOS REVELANDO JESUS, NOSSO SALVADOR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('225', 'EU VIM AQUI SENHOR', 'EU VIM AQUI SENHOR, PARA AGRADECER \nPOR TUDO QUE TENS FEITO POR MIM; \nALEGRE ESTOU POR MAIS UM DIA\nNA TUA PRESENÇA, Ó DEUS.\n\nCORO\nGLÓRIA A JESUS, \nMARAVILHOSO ÉS PRA MIM,\nÉS FORTE E PODEROSO\nE CUMPRE SUAS PROMESSAS.\n\nO MEU PRAZER É TE LOUVAR\nPORQUE O SENHOR É FIEL;\nEU SEI QUE APENAS PEQUENO SOU,\nMAS SIRVO A TI POR AMOR.\n\nCORO\nGLÓRIA A JESUS, \nMARAVILHOSO ÉS PRA MIM,\nÉS FORTE E PODEROSO\nE CUMPRE SUAS PROMESSAS.', 'EU VIM AQUI SENHOR, PARA AGRADECER POR TUDO QUE TENS FEITO POR MIM; ALEGRE ESTOU POR MAIS UM DIA NA TUA PRESENÇA, Ó DEUS. GLÓRIA A JESUS, MARAVILHOSO ÉS PRA MIM, ÉS FORTE E PODEROSO E CUMPRE SUAS PROMESSAS. O MEU PRAZER É TE LOUVAR PORQUE O SENHOR É FIEL; EU SEI QUE APENAS PEQUENO SOU, MAS SIRVO A TI POR AMOR. GLÓRIA A JESUS, MARAVILHOSO ÉS PRA MIM, ÉS FORTE E PODEROSO E CUMPRE SUAS PROMESSAS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('226', 'IREI CANTAR E ADORAR O REI JESUS', 'IREI CANTAR E ADORAR AO REI JESUS\nQUE POR AMOR MORREU \nNA CRUZ PRA ME SALVAR;\n\nALEGRE SOU POIS SALVO ESTOU\nE ETERNAMENTE COM O SENHOR\nNAS MANSÕES CELESTIAIS IREI MORAR.\n\nOH! ALELUIA, HONRA E GLÓRIA \nAO REI JESUS! LÁ NO CÉU \nETERNAMENTE IREI CANTAR!\n\nADORAREI AO MEU SENHOR,\nPROSTRADO AOS PÉS DO SALVADOR\nQUE ENTRONIZADO ESTÁ\nPOIS ELE É O REI DOS REIS.\n\nOH! ALELUIA, HONRA E GLÓRIA \nAO REI JESUS! LÁ NO CÉU \nETERNAMENTE IREI CANTAR!\n\nADORAREI AO MEU SENHOR,\nPROSTRADO AOS PÉS DO SALVADOR\nQUE ENTRONIZADO ESTÁ\nPOIS ELE É O REI DOS REIS.', 'IREI CANTAR E ADORAR AO REI JESUS QUE POR AMOR MORREU NA CRUZ PRA ME SALVAR; ALEGRE SOU POIS SALVO ESTOU E ETERNAMENTE COM O SENHOR NAS MANSÕES CELESTIAIS IREI MORAR. OH! ALELUIA, HONRA E GLÓRIA AO REI JESUS! LÁ NO CÉU ETERNAMENTE IREI CANTAR! ADORAREI AO MEU SENHOR, PROSTRADO AOS PÉS DO SALVADOR QUE ENTRONIZADO ESTÁ POIS ELE É O REI DOS REIS. OH! ALELUIA, HONRA E GLÓRIA AO REI JESUS! LÁ NO CÉU ETERNAMENTE IREI CANTAR! ADORAREI AO MEU SENHOR, PROSTRADO AOS PÉS DO SALVADOR QUE ENTRONIZADO ESTÁ POIS ELE É O REI DOS REIS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('227', 'A JESUS IREI LOUVAR', 'A JESUS IREI LOUVAR,\nPOIS NA CRUZ SE DEU POR MIM.\nO SEU SANGUE DERRAMOU,\nMEU PECADO CARREGOU;\nTODA DOR ELE LEVOU,\nFOI QUEM PRIMEIRO ME AMOU.\n\nCOM QUERUBINS E SERAFINS\nA JESUS IREI LOUVAR,\nALELUIA! GLÓRIA A DEUS!\nLÁ NO CÉU EU VOU MORAR.\n\nCOM QUERUBINS E SERAFINS\nA JESUS IREI LOUVAR,\nALELUIA! GLÓRIA A DEUS!\nLÁ NO CÉU EU VOU MORAR.', 'A JESUS IREI LOUVAR, POIS NA CRUZ SE DEU POR MIM. O SEU SANGUE DERRAMOU, MEU PECADO CARREGOU; TODA DOR ELE LEVOU, FOI QUEM PRIMEIRO ME AMOU. COM QUERUBINS E SERAFINS A JESUS IREI LOUVAR, ALELUIA! GLÓRIA A DEUS! LÁ NO CÉU EU VOU MORAR. COM QUERUBINS E SERAFINS A JESUS IREI LOUVAR, ALELUIA! GLÓRIA A DEUS! LÁ NO CÉU EU VOU MORAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('228', 'HOSANA AO FILHO DE DAVI', 'HOSANA AO FILHO DE DAVI,\nHOSANA AO REI DE ISRAEL;\nBENDITO O QUE VEM\nEM NOME DO SENHOR,\nHOSANA, HOSANA.\n\nHOSANA AO QUE VEM\nEM NOME DO SENHOR,\nHOSANA, HOSANA; \nHOSANA NAS MAIORES ALTURAS.', 'HOSANA AO FILHO DE DAVI, HOSANA AO REI DE ISRAEL; BENDITO O QUE VEM EM NOME DO SENHOR, HOSANA, HOSANA. HOSANA AO QUE VEM EM NOME DO SENHOR, HOSANA, HOSANA; HOSANA NAS MAIORES ALTURAS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('229', 'CANTAI ALEGREMENTE A DEUS', 'CANTAI ALEGREMENTE A DEUS,\nCANTAI ALEGREMENTE A DEUS,\nCANTAI ALEGREMENTE A DEUS, CANTAI, CANTAI ALEGREMENTE A DEUS.\n\nTOMAI O SALTÉRIO, O ADUFE,\nA HARPA E O ALAÚDE,\nTOCAI A TROMBETA,\nÉ HORA DE SOLENIDADE.\n\nCANTAI ALEGREMENTE A DEUS,\nCANTAI ALEGREMENTE A DEUS,\nCANTAI ALEGREMENTE A DEUS, CANTAI,\nCANTAI ALEGREMENTE A DEUS.', 'CANTAI ALEGREMENTE A DEUS, CANTAI ALEGREMENTE A DEUS, CANTAI ALEGREMENTE A DEUS, CANTAI, CANTAI ALEGREMENTE A DEUS. TOMAI O SALTÉRIO, O ADUFE, A HARPA E O ALAÚDE, TOCAI A TROMBETA, É HORA DE SOLENIDADE. CANTAI ALEGREMENTE A DEUS, CANTAI ALEGREMENTE A DEUS, CANTAI ALEGREMENTE A DEUS, CANTAI, CANTAI ALEGREMENTE A DEUS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('230', 'ESTA CANÇÃO', 'ESTA CANÇÃO É PARA TI, \nJESUS, DO MEU CORAÇÃO\nTIREI ESTE LOUVOR.\nMEU DEUS BENDITO, GLÓRIA, GLÓRIA;\nMEU DEUS BENDITO, GLÓRIA, GLÓRIA.\n\nO MEU LOUVOR PERTENCE SÓ A TI,\nTEUS ANJOS SEMPRE LOUVAM,\nA ELES VOU ME UNIR. \nPRA SEMPRE GLÓRIA, GLÓRIA, GLÓRIA.\nPRA SEMPRE GLÓRIA, GLÓRIA, GLÓRIA.', 'ESTA CANÇÃO É PARA TI, JESUS, DO MEU CORAÇÃO TIREI ESTE LOUVOR. MEU DEUS BENDITO, GLÓRIA, GLÓRIA; MEU DEUS BENDITO, GLÓRIA, GLÓRIA. O MEU LOUVOR PERTENCE SÓ A TI, TEUS ANJOS SEMPRE LOUVAM, A ELES VOU ME UNIR. PRA SEMPRE GLÓRIA, GLÓRIA, GLÓRIA. PRA SEMPRE GLÓRIA, GLÓRIA, GLÓRIA.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('231', 'TODO SER QUE TEM FÔLEGO', 'TODO SER QUE TEM FÔLEGO \nLOUVE, LOUVE AO PAI, \nO SENHOR DOS SENHORES;\nTODO SER QUE TEM FÔLEGO LOUVE, LOUVE A JESUS, NOSSO REDENTOR.\n\nTODO SER QUE TEM FÔLEGO \nLOUVE, LOUVE AO \nESPÍRITO SANTO DE DEUS;\nLOUVE, LOUVE, LOUVE \nCOM CÂNTICO NOVO\nE TODO SEU SER.', 'TODO SER QUE TEM FÔLEGO LOUVE, LOUVE AO PAI, O SENHOR DOS SENHORES; TODO SER QUE TEM FÔLEGO LOUVE, LOUVE A JESUS, NOSSO REDENTOR. TODO SER QUE TEM FÔLEGO LOUVE, LOUVE AO ESPÍRITO SANTO DE DEUS; LOUVE, LOUVE, LOUVE COM CÂNTICO NOVO E TODO SEU SER.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('232', 'HOJE EU NÃO QUERO PEDIR', 'HOJE EU NÃO QUERO PEDIR NADA A TI,\nEU SÓ QUERO LOUVAR, MEU SENHOR,\nPOIS GRANDES COISAS FIZESTES POR MIM, \nPOR ISSO ALEGRE ESTOU.\n\nA NOITE JÁ ACABOU, FOI-SE A DOR,\nA ALEGRIA VOLTOU EM LOUVOR;\nTUA PALAVRA É FIEL, CREIO ASSIM,\nPOR ISSO ALEGRE ESTOU.\n\nHOJE EU NÃO QUERO PEDIR NADA A TI,\nEU SÓ QUERO LOUVAR, MEU SENHOR,\nPOIS GRANDES COISAS FIZESTES POR MIM, \nPOR ISSO ALEGRE ESTOU.\n\nA NOITE JÁ ACABOU, FOI-SE A DOR,\nA ALEGRIA VOLTOU EM LOUVOR;\nTUA PALAVRA É FIEL, CREIO ASSIM,\nPOR ISSO ALEGRE ESTOU.', 'HOJE EU NÃO QUERO PEDIR NADA A TI, EU SÓ QUERO LOUVAR, MEU SENHOR, POIS GRANDES COISAS FIZESTES POR MIM, POR ISSO ALEGRE ESTOU. A NOITE JÁ ACABOU, FOI-SE A DOR, A ALEGRIA VOLTOU EM LOUVOR; TUA PALAVRA É FIEL, CREIO ASSIM, POR ISSO ALEGRE ESTOU. HOJE EU NÃO QUERO PEDIR NADA A TI, EU SÓ QUERO LOUVAR, MEU SENHOR, POIS GRANDES COISAS FIZESTES POR MIM, POR ISSO ALEGRE ESTOU. A NOITE JÁ ACABOU, FOI-SE A DOR, A ALEGRIA VOLTOU EM LOUVOR; TUA PALAVRA É FIEL, CREIO ASSIM, POR ISSO ALEGRE ESTOU.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('233', 'NA CIDADE DE DAVI NASCEU O SALVADOR', 'NA CIDADE DE DAVI \nNASCEU O SALVADOR,\nCRISTO, O SENHOR;\nMULTIDÕES DE ANJOS\nLOUVARAM A DEUS DIZENDO:\n\nCORO (2X)\nGLÓRIA A DEUS NAS ALTURAS, \nPAZ NA TERRA, BOA VONTADE \nPARA COM OS HOMENS.\n\nJESUS NASCEU\nNUM LUGAR TÃO SIMPLES,\nFOI NO MEU CORAÇÃO;\nACHOU LUGAR PRA NASCER EM MIM \nPOIS ABRI MEU CORAÇÃO \nE AGORA O SIRVO, SIRVO, SIM.\n\nCORO (2X)\nGLÓRIA A DEUS NAS ALTURAS, \nPAZ NA TERRA, BOA VONTADE \nPARA COM OS HOMENS.', 'NA CIDADE DE DAVI NASCEU O SALVADOR, CRISTO, O SENHOR; MULTIDÕES DE ANJOS LOUVARAM A DEUS DIZENDO: GLÓRIA A DEUS NAS ALTURAS, PAZ NA TERRA, BOA VONTADE PARA COM OS HOMENS. JESUS NASCEU NUM LUGAR TÃO SIMPLES, FOI NO MEU CORAÇÃO; ACHOU LUGAR PRA NASCER EM MIM POIS ABRI MEU CORAÇÃO E AGORA O SIRVO, SIRVO, SIM. GLÓRIA A DEUS NAS ALTURAS, PAZ NA TERRA, BOA VONTADE PARA COM OS HOMENS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('234', 'SEI QUE SOU AMADO DO MEU SALVADOR', 'SEI QUE SOU AMADO \nDO MEU SALVADOR,\nSEI QUE ESTOU GUARDADO \nPELO SEU AMOR;\n\nDIA A DIA CAMINHANDO                     ESTOU INDO A JERUSALÉM,\nSEGUINDO MEU JESUS,\nEU SEI QUE EM BREVE CHEGAREI.\n\nCORO\nSOU FELIZ COM MEU SENHOR, (2X)    \nDIA A DIA CAMINHANDO                     ESTOU INDO A JERUSALÉM,\nSEGUINDO MEU JESUS,\nEU SEI QUE EM BREVE CHEGAREI.\n\nNAS MANSÕES CELESTIAIS \nIREI MORAR, COM OS ANJOS DO SENHOR \nIREI CANTAR; SEU AMOR JESUS MOSTRU \nPOR MIM, UM POBRE PECADOR,\nEM MEU LUGAR MORREU \nNA CRUZ, AGORA SALVO ESTOU.\n\nCORO\nSOU FELIZ COM MEU SENHOR, (2X)    \nDIA A DIA CAMINHANDO                     ESTOU INDO A JERUSALÉM,\nSEGUINDO MEU JESUS,\nEU SEI QUE EM BREVE CHEGAREI.', 'SEI QUE SOU AMADO DO MEU SALVADOR, SEI QUE ESTOU GUARDADO PELO SEU AMOR; DIA A DIA CAMINHANDO ESTOU INDO A JERUSALÉM, SEGUINDO MEU JESUS, EU SEI QUE EM BREVE CHEGAREI. SOU FELIZ COM MEU SENHOR, DIA A DIA CAMINHANDO ESTOU INDO A JERUSALÉM, SEGUINDO MEU JESUS, EU SEI QUE EM BREVE CHEGAREI. NAS MANSÕES CELESTIAIS IREI MORAR, COM OS ANJOS DO SENHOR IREI CANTAR; SEU AMOR JESUS MOSTRU POR MIM, UM POBRE PECADOR, EM MEU LUGAR MORREU NA CRUZ, AGORA SALVO ESTOU. SOU FELIZ COM MEU SENHOR, DIA A DIA CAMINHANDO ESTOU INDO A JERUSALÉM, SEGUINDO MEU JESUS, EU SEI QUE EM BREVE CHEGAREI.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('235', 'SENHOR, EU TE LOUVAREI', 'SENHOR, EU TE LOUVAREI\nEM TI ME ALEGRAREI,\nDE TODO O MEU CORAÇÃO \nLOUVORES A TI DAREI.\n\nPOIS TU NOS TENS SUSTENTADO\nCOM TUA MÃO DE PODER,\nGOZO E ALEGRIA TENS DADO\nA TODO QUE EM TI CRER.', 'SENHOR, EU TE LOUVAREI EM TI ME ALEGRAREI, DE TODO O MEU CORAÇÃO LOUVORES A TI DAREI. POIS TU NOS TENS SUSTENTADO COM TUA MÃO DE PODER, GOZO E ALEGRIA TENS DADO A TODO QUE EM TI CRER.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('236', 'SENHOR, DEUS TU ÉS VARÃO DE GUERRA', 'SENHOR DEUS, TU ÉS VARÃO DE GUERRA \nE VENCE AS BATALHAS POR NÓS.\nO SOL DETÉNS SE NECESSIDADE IMPERA\nE TUDO OUVE A TUA VOZ.\n\nNÃO HÁ INIMIGO PODEROSO.\nMAJESTOSO TU ÉS,\nDEUS FORTE, VITORIOSO,\nE TUDO ESTÁ AOS TEUS PÉS.\n\nSENHOR DEUS, TU ÉS VARÃO DE GUERRA \nE VENCE AS BATALHAS POR NÓS.\nO SOL DETÉNS SE NECESSIDADE IMPERA\nE TUDO OUVE A TUA VOZ.\n\nNÃO HÁ INIMIGO PODEROSO.\nMAJESTOSO TU ÉS,\nDEUS FORTE, VITORIOSO,\nE TUDO ESTÁ AOS TEUS PÉS.', 'SENHOR DEUS, TU ÉS VARÃO DE GUERRA E VENCE AS BATALHAS POR NÓS. O SOL DETÉNS SE NECESSIDADE IMPERA E TUDO OUVE A TUA VOZ. NÃO HÁ INIMIGO PODEROSO. MAJESTOSO TU ÉS, DEUS FORTE, VITORIOSO, E TUDO ESTÁ AOS TEUS PÉS. SENHOR DEUS, TU ÉS VARÃO DE GUERRA E VENCE AS BATALHAS POR NÓS. O SOL DETÉNS SE NECESSIDADE IMPERA E TUDO OUVE A TUA VOZ. NÃO HÁ INIMIGO PODEROSO. MAJESTOSO TU ÉS, DEUS FORTE, VITORIOSO, E TUDO ESTÁ AOS TEUS PÉS.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('237', 'MUITOS MOTIVOS TENHO', 'MUITOS MOTIVOS TENHO\nPARA TE ADORAR, OH, DEUS!\nTU ÉS PARA MIM O MARAVILHOSO, \nO PRÍNCIPE DA PAZ.\n\nCORO\nJESUS, TU ÉS PARA MIM \nO DEUS FIEL, MARAVILHOSO,\nOUTRO DEUS COMO\nO SENHOR NÃO HÁ.\n\nINSTRUMENTOS\n\nHOJE AQUI ESTOU A TE GLORIFICAR\nPELAS BÊNÇÃOS RECEBIDAS,\nPOR TUDO O QUE ME FAZ.\n\nCORO\nJESUS, TU ÉS PARA MIM \nO DEUS FIEL, MARAVILHOSO,\nOUTRO DEUS COMO\nO SENHOR NÃO HÁ.\n\nCORO\nJESUS, TU ÉS PARA MIM \nO DEUS FIEL, MARAVILHOSO,\nOUTRO DEUS COMO O SENHOR NÃO HÁ.\nOUTRO DEUS COMO O SENHOR NÃO HÁ.', 'MUITOS MOTIVOS TENHO PARA TE ADORAR, OH, DEUS! TU ÉS PARA MIM O MARAVILHOSO, O PRÍNCIPE DA PAZ. JESUS, TU ÉS PARA MIM O DEUS FIEL, MARAVILHOSO, OUTRO DEUS COMO O SENHOR NÃO HÁ. HOJE AQUI ESTOU A TE GLORIFICAR PELAS BÊNÇÃOS RECEBIDAS, POR TUDO O QUE ME FAZ. JESUS, TU ÉS PARA MIM O DEUS FIEL, MARAVILHOSO, OUTRO DEUS COMO O SENHOR NÃO HÁ. JESUS, TU ÉS PARA MIM O DEUS FIEL, MARAVILHOSO, OUTRO DEUS COMO O SENHOR NÃO HÁ. OUTRO DEUS COMO O SENHOR NÃO HÁ.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('238', 'EU VOU CANTAR', 'EU VOU CANTAR, CANTAR, CANTAR. \nEU VOU LOUVAR, LOUVAR, LOUVAR.                        JESUS COM SEU SANGUE ME COMPROU, POR SUA GRAÇA SALVO ESTOU.\n\nEU VOU CANTAR, CANTAR, CANTAR. \nEU VOU LOUVAR, LOUVAR, LOUVAR.\nPERTO ESTÁ O SENHOR DE VOLTAR \nE ASSIM VOU PARA O MEU LAR.\n\nINSTRUMENTOS\n\nEU VOU CANTAR, CANTAR, CANTAR.        EU VOU LOUVAR, LOUVAR, LOUVAR.                        JESUS COM SEU SANGUE ME COMPROU, POR SUA GRAÇA SALVO ESTOU.\n\nEU VOU CANTAR, CANTAR, CANTAR. \nEU VOU LOUVAR, LOUVAR, LOUVAR.\nPERTO ESTÁ O SENHOR DE VOLTAR \nE ASSIM VOU PARA O MEU LAR.', 'EU VOU CANTAR, CANTAR, CANTAR. EU VOU LOUVAR, LOUVAR, LOUVAR. JESUS COM SEU SANGUE ME COMPROU, POR SUA GRAÇA SALVO ESTOU. EU VOU CANTAR, CANTAR, CANTAR. EU VOU LOUVAR, LOUVAR, LOUVAR. PERTO ESTÁ O SENHOR DE VOLTAR E ASSIM VOU PARA O MEU LAR. EU VOU CANTAR, CANTAR, CANTAR. EU VOU LOUVAR, LOUVAR, LOUVAR. JESUS COM SEU SANGUE ME COMPROU, POR SUA GRAÇA SALVO ESTOU. EU VOU CANTAR, CANTAR, CANTAR. EU VOU LOUVAR, LOUVAR, LOUVAR. PERTO ESTÁ O SENHOR DE VOLTAR E ASSIM VOU PARA O MEU LAR.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('239', 'JESUS É A NOSSA VITÓRIA', 'JESUS É A NOSSA VITÓRIA\nELE NOS LEVA PARA A SUA GLÓRIA\nNOS GUARDA DE TODO O PERIGO\nJESUS É NOSSO GRANDE AMIGO.\n\nEU SOU FELIZ, POIS CONHECI A JESUS\nE HOJE EU CAMINHO EM SUA LUZ\nNA ETERNIDADE COM JESUS VOU MORAR\nE COM OS ANJOS PARA SEMPRE O ADORAR:\n\nVIVA O REI, VIVA O REI\nVIVA O REI, VIVA O REI\nVIVA O REI, \nVIVA O REI JESUS!\nVIVA O REI JESUS!', 'JESUS É A NOSSA VITÓRIA ELE NOS LEVA PARA A SUA GLÓRIA NOS GUARDA DE TODO O PERIGO JESUS É NOSSO GRANDE AMIGO. EU SOU FELIZ, POIS CONHECI A JESUS E HOJE EU CAMINHO EM SUA LUZ NA ETERNIDADE COM JESUS VOU MORAR E COM OS ANJOS PARA SEMPRE O ADORAR: VIVA O REI, VIVA O REI VIVA O REI, VIVA O REI VIVA O REI, VIVA O REI JESUS! VIVA O REI JESUS!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('240', 'O SENHOR DOS EXÉRCITOS ESTÁ AQUI', 'O SENHOR DOS EXÉRCITOS ESTÁ AQUI, (BIS)\nELE É O REI DA GLÓRIA,\nDEUS FORTE E PODEROSO\nNAS BATALHAS.\n\nCORO (2X)\nA ELE SEJA O LOUVOR,\nTODA A GLÓRIA,\nHONRA E PODER.\n\nGLÓRIA E MAJESTADE AO SENHOR\nPOIS ÉS DIGNO DE LOUVOR. \nGLÓRIA E MAJESTADE AO SENHOR \nPOIS ÉS DIGNO DE LOUVOR.\n\nCORO (2X)\nA ELE SEJA O LOUVOR,\nTODA A GLÓRIA,\nHONRA E PODER.\n\nO SENHOR DOS EXÉRCITOS ESTÁ AQUI \nO SENHOR DOS EXÉRCITOS ESTÁ AQUI \nELE É MARAVILHOSO, CONSELHEIRO,\nPRÍNCIPE DA PAZ.\n\nCORO (2X)\nA ELE SEJA O LOUVOR,\nTODA A GLÓRIA,\nHONRA E PODER.', 'O SENHOR DOS EXÉRCITOS ESTÁ AQUI, ELE É O REI DA GLÓRIA, DEUS FORTE E PODEROSO NAS BATALHAS. A ELE SEJA O LOUVOR, TODA A GLÓRIA, HONRA E PODER. GLÓRIA E MAJESTADE AO SENHOR POIS ÉS DIGNO DE LOUVOR. GLÓRIA E MAJESTADE AO SENHOR POIS ÉS DIGNO DE LOUVOR. A ELE SEJA O LOUVOR, TODA A GLÓRIA, HONRA E PODER. O SENHOR DOS EXÉRCITOS ESTÁ AQUI O SENHOR DOS EXÉRCITOS ESTÁ AQUI ELE É MARAVILHOSO, CONSELHEIRO, PRÍNCIPE DA PAZ. A ELE SEJA O LOUVOR, TODA A GLÓRIA, HONRA E PODER.', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('241', 'EXALTAI, EXALTAI', 'EXALTAI, EXALTAI, \nAQUELE QUE MORREU \nNA CRUZ PARA NOS SALVAR \nE HOJE VIVO ESTÁ \nPARA A VITÓRIA NOS DAR.\n\nEXALTAI, EXALTAI, \nAQUELE QUE MORREU \nNA CRUZ PARA NOS SALVAR \nE HOJE VIVO ESTÁ \nPARA A VITÓRIA NOS DAR. \n\nINSTRUMENTOS\n\nACLAMAI, ACLAMAI, \nPOIS DIGNO DE ABRIR \nO LIVRO O CORDEIRO É; \nBREVE JESUS VIRÁ, \nSUA IGREJA FIEL LEVARÁ, \nBREVE JESUS VIRÁ.\n\nACLAMAI, ACLAMAI, \nPOIS DIGNO DE ABRIR \nO LIVRO O CORDEIRO É; \nBREVE JESUS VIRÁ, \nSUA IGREJA FIEL LEVARÁ, \nBREVE JESUS VIRÁ. \nMARANATA! ALELUIA!', 'EXALTAI, EXALTAI, AQUELE QUE MORREU NA CRUZ PARA NOS SALVAR E HOJE VIVO ESTÁ PARA A VITÓRIA NOS DAR. EXALTAI, EXALTAI, AQUELE QUE MORREU NA CRUZ PARA NOS SALVAR E HOJE VIVO ESTÁ PARA A VITÓRIA NOS DAR. ACLAMAI, ACLAMAI, POIS DIGNO DE ABRIR O LIVRO O CORDEIRO É; BREVE JESUS VIRÁ, SUA IGREJA FIEL LEVARÁ, BREVE JESUS VIRÁ. ACLAMAI, ACLAMAI, POIS DIGNO DE ABRIR O LIVRO O CORDEIRO É; BREVE JESUS VIRÁ, SUA IGREJA FIEL LEVARÁ, BREVE JESUS VIRÁ. MARANATA! ALELUIA!', 2, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
@@ -1,7 +0,0 @@
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('01', 'AV- MUITO EM BREVE  O REI VEM', 'MUITO EM BREVE O REI VEM,\n(SIM, JESUS VEM!)\nMUITO EM BREVE O REI VEM,\n(SIM, JESUS VEM!) \nMUITO EM BREVE O REI VEM,\nMEU SENHOR JESUS VEM.\n\nVEM DEPRESSA, \nPOIS ELE TE CHAMA. \nTE CONVIDA A PARTICIPAR \nDA FESTA, \nTUDO JÁ ESTÁ PREPARADO,                               \nMEU SENHOR JESUS VEM.\n\nVEM BUSCAR UM POVO      \nPREPARADO, O ESPÍRITO NOS TEM REVELADO, \nVIGIAI, O REI VEM,                  \nELE VEM.', 'MUITO EM BREVE O REI VEM, (SIM, JESUS VEM!) MUITO EM BREVE O REI VEM, (SIM, JESUS VEM!) MUITO EM BREVE O REI VEM, MEU SENHOR JESUS VEM. VEM DEPRESSA, POIS ELE TE CHAMA. TE CONVIDA A PARTICIPAR DA FESTA, TUDO JÁ ESTÁ PREPARADO, MEU SENHOR JESUS VEM. VEM BUSCAR UM POVO PREPARADO, O ESPÍRITO NOS TEM REVELADO, VIGIAI, O REI VEM, ELE VEM.', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('02', 'AV - PREPARAI-VOS,  Ó IGREJA AMADA', 'PREPARAI-VOS, \nÓ IGREJA AMADA, \nPOIS O NOIVO \nEM BREVE VIRÁ! \nÓ NOIVA AMADA, ATAVIADA, PREPARADA PARA \nO NOIVO ESTÁ!\n\nCOM ALEGRIA, A PROCLAMAR: \nOH! JESUS, MEU SENHOR,         \nVEM NOS BUSCAR! \nA NOIVA PRONTA \nE PREPARADA       \nANSEIA ESTAR LOGO \nEM SEU NOVO LAR!\n\nCANDEIA ACESA \nE REVESTIDA, \nAGUARDA PRONTA \nO NOIVO A VIR BUSCAR! \nCOM FÉ SABEMOS \nE VIGIAMOS, \nANSIANDO \nESTE DIA CHEGAR!\n\nCOM ALEGRIA A PROCLAMAR: \nOH! JESUS, MEU SENHOR,         \nVEM NOS BUSCAR! \nA NOIVA PRONTA \nE PREPARADA       \nANSEIA ESTAR LOGO \nEM SEU NOVO LAR!', 'PREPARAI-VOS, Ó IGREJA AMADA, POIS O NOIVO EM BREVE VIRÁ! Ó NOIVA AMADA, ATAVIADA, PREPARADA PARA O NOIVO ESTÁ! COM ALEGRIA, A PROCLAMAR: OH! JESUS, MEU SENHOR, VEM NOS BUSCAR! A NOIVA PRONTA E PREPARADA ANSEIA ESTAR LOGO EM SEU NOVO LAR! CANDEIA ACESA E REVESTIDA, AGUARDA PRONTA O NOIVO A VIR BUSCAR! COM FÉ SABEMOS E VIGIAMOS, ANSIANDO ESTE DIA CHEGAR! COM ALEGRIA A PROCLAMAR: OH! JESUS, MEU SENHOR, VEM NOS BUSCAR! A NOIVA PRONTA E PREPARADA ANSEIA ESTAR LOGO EM SEU NOVO LAR!', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('03', 'AV- JESUS VOLTARÁ', 'JESUS VOLTARÁ, \nVOU ME PREPARAR,\nQUE DIA GLORIOSO \nQUANDO ELE VOLTAR!\n\nJESUS VOLTARÁ, \nNA GLÓRIA ESTAREI,\nCOM OS ANJOS CANTANDO\nA JESUS LOUVAREI!\n\nJESUS REUNIDO \nCOM SUA IGREJA FIEL,\nSERÁ UMA FESTA \nCOM TODOS NO CÉU!\n\nJESUS VOLTARÁ, \nNA GLÓRIA ESTAREI,\nCOM OS ANJOS CANTANDO\nA JESUS LOUVAREI! (3x)', 'JESUS VOLTARÁ, VOU ME PREPARAR, QUE DIA GLORIOSO QUANDO ELE VOLTAR! JESUS VOLTARÁ, NA GLÓRIA ESTAREI, COM OS ANJOS CANTANDO A JESUS LOUVAREI! JESUS REUNIDO COM SUA IGREJA FIEL, SERÁ UMA FESTA COM TODOS NO CÉU! JESUS VOLTARÁ, NA GLÓRIA ESTAREI, COM OS ANJOS CANTANDO A JESUS LOUVAREI!', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'GRÃO DE MOSTARDA, FERMENTO,', 'SAINDO DE CASA \nNAQUELE DIA, \nASSENTADO JUNTO AO MAR, JESUS FOI EXPLICAR\n\n04AV- AS PARÁBOLAS                       DO REINO\n\nÀQUELA MULTIDĀO \nE A TODOS QUE O SEGUIAM,\nSOBRE AS PARÁBOLAS \nDE UM REINO QUE VIRIA.\n\nSETE SÃO \nAS PARÁBOLAS DO REINO:\nSEMEADOR, TRIGO E JOIO,\n\nTESOURO ESCONDIDO, PÉROLA E REDE.\n\nVAMOS VIGIAR E ORAR,\nJESUS BREVE VIRÁ; IREMOS TODOS COM \nELE MORAR. \nMARANATA, JESUS VEM!', 'SAINDO DE CASA NAQUELE DIA, ASSENTADO JUNTO AO MAR, JESUS FOI EXPLICAR 04AV- AS PARÁBOLAS DO REINO ÀQUELA MULTIDĀO E A TODOS QUE O SEGUIAM, SOBRE AS PARÁBOLAS DE UM REINO QUE VIRIA. SETE SÃO AS PARÁBOLAS DO REINO: SEMEADOR, TRIGO E JOIO, TESOURO ESCONDIDO, PÉROLA E REDE. VAMOS VIGIAR E ORAR, JESUS BREVE VIRÁ; IREMOS TODOS COM ELE MORAR. MARANATA, JESUS VEM!', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('05', 'AV- EU CLAMO, EU ORO', 'EU CLAMO, EU ORO \nPELO SANGUE LÁ DA CRUZ,\nEU CLAMO, EU ORO \nPELO ESPÍRITO QUE RELUZ.\n\nQUANDO EU OLHO \nPARA A CRUZ,\nSEI QUE A VITÓRIA CHEGARÁ,\nPOIS POR MIM \nMORREU JESUS\nQUE NÃO ME ABANDONA \nNEM ME ABANDONARÁ.\n\nEU CLAMO, EU ORO \nPELO SANGUE \nLÁ DA CRUZ,\nEU CLAMO, EU ORO \nPELO ESPÍRITO \nQUE RELUZ.', 'EU CLAMO, EU ORO PELO SANGUE LÁ DA CRUZ, EU CLAMO, EU ORO PELO ESPÍRITO QUE RELUZ. QUANDO EU OLHO PARA A CRUZ, SEI QUE A VITÓRIA CHEGARÁ, POIS POR MIM MORREU JESUS QUE NÃO ME ABANDONA NEM ME ABANDONARÁ. EU CLAMO, EU ORO PELO SANGUE LÁ DA CRUZ, EU CLAMO, EU ORO PELO ESPÍRITO QUE RELUZ.', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('06', 'AV- A VITÓRIA DA IGREJA', 'NA BATALHA EU ORO \nAO SENHOR,\nNA BATALHA EU SUPLICO \nSEU FAVOR\n\nE DE JOELHOS EU SOU \nMAIS QUE VENCEDOR,\nGLORIFICO A DEUS \nQUE ATENDE \nAO MEU CLAMOR.\n\nBATALHA, \nORAÇÃO, VITÓRIA, \nGLÓRIA A JESUS, \n\nGLORIFICO A DEUS \nQUE ATENDE \nAO MEU CLAMOR.\n\n3X\n\nNA BATALHA EU ORO \nAO SENHOR,\nNA BATALHA EU SUPLICO \nSEU FAVOR\n\nE DE JOELHOS EU SOU \nMAIS QUE VENCEDOR,\nGLORIFICO A DEUS \nQUE ATENDE \nAO MEU CLAMOR.\n\nBATALHA, \nORAÇÃO, VITÓRIA, \nGLÓRIA A JESUS, \n\nGLORIFICO A DEUS \nQUE ATENDE \nAO MEU CLAMOR.\n\n3X', 'NA BATALHA EU ORO AO SENHOR, NA BATALHA EU SUPLICO SEU FAVOR E DE JOELHOS EU SOU MAIS QUE VENCEDOR, GLORIFICO A DEUS QUE ATENDE AO MEU CLAMOR. BATALHA, ORAÇÃO, VITÓRIA, GLÓRIA A JESUS, GLORIFICO A DEUS QUE ATENDE AO MEU CLAMOR. NA BATALHA EU ORO AO SENHOR, NA BATALHA EU SUPLICO SEU FAVOR E DE JOELHOS EU SOU MAIS QUE VENCEDOR, GLORIFICO A DEUS QUE ATENDE AO MEU CLAMOR. BATALHA, ORAÇÃO, VITÓRIA, GLÓRIA A JESUS, GLORIFICO A DEUS QUE ATENDE AO MEU CLAMOR.', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('07', 'AV- ESTÁ CHEGANDO                        A HORA', 'ESTÁ CHEGANDO A HORA,\nO TREM JÁ VAI PARTIR\nLEVANDO OS \nCORDEIRINHOS\nQUE VÃO AO CÉU SUBIR.\n\nJESUS ESTÁ CHAMANDO,\nA TODOS CONVIDANDO:\n“VENHAM SEM DEMORA\nPRA NOVA JERUSALÉM”.\n\nVOCÊ, Ó PEQUENINO,\nPOR QUE NÃO \nVEM TAMBÉM?\nRECEBA O SEU BILHETE\nE ENTRE NESSE TREM.\n\nE ALI JUNTOS ESTAREMOS\nNA CELESTIAL CIDADE,\nCOM CRISTO ANDAREMOS,\nSERÁ SÓ FELICIDADE.', 'ESTÁ CHEGANDO A HORA, O TREM JÁ VAI PARTIR LEVANDO OS CORDEIRINHOS QUE VÃO AO CÉU SUBIR. JESUS ESTÁ CHAMANDO, A TODOS CONVIDANDO: VENHAM SEM DEMORA PRA NOVA JERUSALÉM. VOCÊ, Ó PEQUENINO, POR QUE NÃO VEM TAMBÉM? RECEBA O SEU BILHETE E ENTRE NESSE TREM. E ALI JUNTOS ESTAREMOS NA CELESTIAL CIDADE, COM CRISTO ANDAREMOS, SERÁ SÓ FELICIDADE.', 3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
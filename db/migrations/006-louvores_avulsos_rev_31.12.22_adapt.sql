@@ -1,85 +0,0 @@
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SHEKINAH', 'CORO\nÓ SENHOR, A TI CLAMO\nQUE NOS MOSTRES A TUA SHEKINAH;\nCOM TUA GLÓRIA ENCHE ESTE LUGAR,\nCOM TUA PRESENÇA, A TUA SHEKINAH.\n\nSENHOR, SEI QUE ME CONHECES,\nQUERO ANDAR EM TEU CAMINHO\nE ENCONTRAR O TEU FAVOR.\n\nSENHOR, SÓ TUA PRESENÇA \nPODE ME FAZER DESCANSAR, \nSE NÃO FORES COMIGO EU NÃO PROSSEGUIREI,\nSE ANDARES COMIGO O MUNDO SABERÁ QUE \nTE ENCONTREI, POIS DESTE MUNDO EU ME SEPAREI.\n\nCORO\nÓ SENHOR, A TI CLAMO\nQUE NOS MOSTRES A TUA SHEKINAH;\nCOM TUA GLÓRIA ENCHE ESTE LUGAR,\nCOM TUA PRESENÇA, A TUA SHEKINAH. \n\nINSTRUMENTOS\nBIS\n\nCORO\nÓ SENHOR, A TI CLAMO\nQUE NOS MOSTRES A TUA SHEKINAH;\nCOM TUA GLÓRIA ENCHE ESTE LUGAR,\nCOM TUA PRESENÇA, A TUA SHEKINAH.\n\nFINAL: SHEKINAH, SHEKINAH!', 'Ó SENHOR, A TI CLAMO QUE NOS MOSTRES A TUA SHEKINAH; COM TUA GLÓRIA ENCHE ESTE LUGAR, COM TUA PRESENÇA, A TUA SHEKINAH. SENHOR, SEI QUE ME CONHECES, QUERO ANDAR EM TEU CAMINHO E ENCONTRAR O TEU FAVOR. SENHOR, SÓ TUA PRESENÇA PODE ME FAZER DESCANSAR, SE NÃO FORES COMIGO EU NÃO PROSSEGUIREI, SE ANDARES COMIGO O MUNDO SABERÁ QUE TE ENCONTREI, POIS DESTE MUNDO EU ME SEPAREI. Ó SENHOR, A TI CLAMO QUE NOS MOSTRES A TUA SHEKINAH; COM TUA GLÓRIA ENCHE ESTE LUGAR, COM TUA PRESENÇA, A TUA SHEKINAH. Ó SENHOR, A TI CLAMO QUE NOS MOSTRES A TUA SHEKINAH; COM TUA GLÓRIA ENCHE ESTE LUGAR, COM TUA PRESENÇA, A TUA SHEKINAH. SHEKINAH, SHEKINAH!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'TORRE FORTE', 'ESSAS LÁGRIMAS QUE ESCORREM DOS TEUS OLHOS\nSÓ JESUS É QUE PODE ENXUGÁ-LAS,\nSE TU VIVES TÃO SOZINHO, SEM PAZ, SEM AMOR,\nCRISTO QUER SER SEU AMIGO;\n\nELE JÁ LEVOU SOBRE SI \nNOSSAS DORES E OS NOSSOS PECADOS,\nFOI COM SANGUE INOCENTE \nQUE NÓS FOMOS COMPRADOS,\nHOJE SOMOS PARTE DO REINO DE DEUS.\n\nCORO\nTORRE FORTE (TORRE FORTE),\nDEUS CONOSCO (DEUS CONOSCO),\nPODEROSO EM OBRAS, PRÍNCIPE DOS EXÉRCITOS;\nO SENHOR SEMPRE VENCEU,\nNELE NÃO HÁ DERROTAS, \nELE É REI SOBRE TODOS OS REIS\n\nINSTRUMENTOS\n\nVEJO CRISTO SOBRE AS NUVENS TRIUNFANTE,\nEIS O BRADO DE VITÓRIA, NÓS VENCEMOS!\nOUÇO O TOQUE DA TROMBETA, \nA IGREJA VAI SUBINDO,\nANJOS E ARCANJOS NOS ESPERAM NO CÉU;\n\nALELUIA, NÓS CHEGAMOS AO FIM, \nOS REMIDOS QUE EM DEUS CONFIARAM,\nHÁ NO CÉU ALEGRIA, ALTO SOM DE LOUVOR,\nTODOS BENDIZENDO AO FILHO DE DEUS.\n\nCORO\nTORRE FORTE (TORRE FORTE),\nDEUS CONOSCO (DEUS CONOSCO),\nPODEROSO EM OBRAS, PRÍNCIPE DOS EXÉRCITOS;\nO SENHOR SEMPRE VENCEU,\nNELE NÃO HÁ DERROTAS, \nELE É REI SOBRE TODOS OS REIS\n\nFINAL:\nO SENHOR SEMPRE VENCEU, \nNELE NÃO HÁ DERROTAS, \nELE É REI SOBRE TODOS OS REIS,\nREI SOBRE TODOS OS REIS.', 'ESSAS LÁGRIMAS QUE ESCORREM DOS TEUS OLHOS SÓ JESUS É QUE PODE ENXUGÁ-LAS, SE TU VIVES TÃO SOZINHO, SEM PAZ, SEM AMOR, CRISTO QUER SER SEU AMIGO; ELE JÁ LEVOU SOBRE SI NOSSAS DORES E OS NOSSOS PECADOS, FOI COM SANGUE INOCENTE QUE NÓS FOMOS COMPRADOS, HOJE SOMOS PARTE DO REINO DE DEUS. TORRE FORTE (TORRE FORTE), DEUS CONOSCO (DEUS CONOSCO), PODEROSO EM OBRAS, PRÍNCIPE DOS EXÉRCITOS; O SENHOR SEMPRE VENCEU, NELE NÃO HÁ DERROTAS, ELE É REI SOBRE TODOS OS REIS VEJO CRISTO SOBRE AS NUVENS TRIUNFANTE, EIS O BRADO DE VITÓRIA, NÓS VENCEMOS! OUÇO O TOQUE DA TROMBETA, A IGREJA VAI SUBINDO, ANJOS E ARCANJOS NOS ESPERAM NO CÉU; ALELUIA, NÓS CHEGAMOS AO FIM, OS REMIDOS QUE EM DEUS CONFIARAM, HÁ NO CÉU ALEGRIA, ALTO SOM DE LOUVOR, TODOS BENDIZENDO AO FILHO DE DEUS. TORRE FORTE (TORRE FORTE), DEUS CONOSCO (DEUS CONOSCO), PODEROSO EM OBRAS, PRÍNCIPE DOS EXÉRCITOS; O SENHOR SEMPRE VENCEU, NELE NÃO HÁ DERROTAS, ELE É REI SOBRE TODOS OS REIS O SENHOR SEMPRE VENCEU, NELE NÃO HÁ DERROTAS, ELE É REI SOBRE TODOS OS REIS, REI SOBRE TODOS OS REIS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'VARÃO DE GUERRA É O SENHOR', 'VARÃO DE GUERRA É O SENHOR \nQUE VAI À FRENTE DO SEU POVO\nNAS PELEJAS DA ALMA, NAS PROVAÇÕES\nNAS LUTAS CONTRA OS NOSSOS ADVERSÁRIOS.\n\nVARÃO DE GUERRA É O SENHOR \nQUE ERGUE A SUA ESPADA \nE COM LABAREDAS DE FOGO\nTOCA NOS SEUS MINISTROS \nE OS TORNA CAPAZES PARA AS PELEJAS.\n\nESTE É O MEU DEUS, \nSOBERANO EM FORÇA E PODER, \nO ÚNICO QUE SE ASSENTA \nNO TRONO DA GLÓRIA E QUE REINARÁ\nETERNAMENTE;\n\nESTE É O MEU DEUS, \nSOBERANO EM FORÇA E PODER, \nJUSTO E CUMPRIDOR DA SUA PALAVRA, \nQUE NOS PROMETEU UM REI, JESUS,\nPARA REINAR SOBRE NÓS NA CIDADE SANTA\n\nFINAL: ETERNAMENTE.', 'VARÃO DE GUERRA É O SENHOR QUE VAI À FRENTE DO SEU POVO NAS PELEJAS DA ALMA, NAS PROVAÇÕES NAS LUTAS CONTRA OS NOSSOS ADVERSÁRIOS. VARÃO DE GUERRA É O SENHOR QUE ERGUE A SUA ESPADA E COM LABAREDAS DE FOGO TOCA NOS SEUS MINISTROS E OS TORNA CAPAZES PARA AS PELEJAS. ESTE É O MEU DEUS, SOBERANO EM FORÇA E PODER, O ÚNICO QUE SE ASSENTA NO TRONO DA GLÓRIA E QUE REINARÁ ETERNAMENTE; ESTE É O MEU DEUS, SOBERANO EM FORÇA E PODER, JUSTO E CUMPRIDOR DA SUA PALAVRA, QUE NOS PROMETEU UM REI, JESUS, PARA REINAR SOBRE NÓS NA CIDADE SANTA ETERNAMENTE.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'AINDA HÁ TEMPO', 'COMO É FORTE OUVIR COMO SERÁ O FIM; \nO MOMENTO CHEGARÁ, \nO CLAMOR DA MEIA-NOITE SE OUVIRÁ.\n\nA IGREJA FIEL PREPARADA ESTÁ \nE A IGREJA INFIEL, \nSUA OPORTUNIDADE ACABARÁ.\n\nAINDA HÁ TEMPO, \nJESUS CRISTO NÃO VOLTOU, \nAINDA HÁ TEMPO \nDO SEU SONO DESPERTAR. \n\nAINDA HÁ TEMPO, \nTEMPO DE SE ARREPENDER, \nTEMPO DE BUSCAR A DEUS, \nDE BATER À PORTA E ELA SE ABRIRÁ\n\nAINDA HÁ TEMPO DO AZEITE IR COMPRAR, \nAINDA HÁ TEMPO, TEMPO DE SANTIFICAR; AINDA HÁ TEMPO DA CANDEIA SE ENCHER, DO ESPOSO ENCONTRAR E COM ELE, \nPARA AS BODAS DO CORDEIRO, ENTRAR.\n\nAINDA HÁ TEMPO, \nJESUS CRISTO NÃO VOLTOU, \nAINDA HÁ TEMPO \nDO SEU SONO DESPERTAR. \n\nAINDA HÁ TEMPO, \nTEMPO DE SE ARREPENDER, \nTEMPO DE BUSCAR A DEUS, \nDE BATER À PORTA E ELA SE ABRIRÁ\n\nAINDA HÁ TEMPO DO AZEITE IR COMPRAR, \nAINDA HÁ TEMPO, TEMPO DE SANTIFICAR; AINDA HÁ TEMPO DA CANDEIA SE ENCHER, DO ESPOSO ENCONTRAR E COM ELE, \nPARA AS BODAS DO CORDEIRO, ENTRAR.\n\nFINAL: AINDA HÁ TEMPO', 'COMO É FORTE OUVIR COMO SERÁ O FIM; O MOMENTO CHEGARÁ, O CLAMOR DA MEIA-NOITE SE OUVIRÁ. A IGREJA FIEL PREPARADA ESTÁ E A IGREJA INFIEL, SUA OPORTUNIDADE ACABARÁ. AINDA HÁ TEMPO, JESUS CRISTO NÃO VOLTOU, AINDA HÁ TEMPO DO SEU SONO DESPERTAR. AINDA HÁ TEMPO, TEMPO DE SE ARREPENDER, TEMPO DE BUSCAR A DEUS, DE BATER À PORTA E ELA SE ABRIRÁ AINDA HÁ TEMPO DO AZEITE IR COMPRAR, AINDA HÁ TEMPO, TEMPO DE SANTIFICAR; AINDA HÁ TEMPO DA CANDEIA SE ENCHER, DO ESPOSO ENCONTRAR E COM ELE, PARA AS BODAS DO CORDEIRO, ENTRAR. AINDA HÁ TEMPO, JESUS CRISTO NÃO VOLTOU, AINDA HÁ TEMPO DO SEU SONO DESPERTAR. AINDA HÁ TEMPO, TEMPO DE SE ARREPENDER, TEMPO DE BUSCAR A DEUS, DE BATER À PORTA E ELA SE ABRIRÁ AINDA HÁ TEMPO DO AZEITE IR COMPRAR, AINDA HÁ TEMPO, TEMPO DE SANTIFICAR; AINDA HÁ TEMPO DA CANDEIA SE ENCHER, DO ESPOSO ENCONTRAR E COM ELE, PARA AS BODAS DO CORDEIRO, ENTRAR. AINDA HÁ TEMPO', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'UMA VOZ MANSA E DELICADA SINTA AGORA', 'UMA VOZ MANSA E DELICADA\nSINTA AGORA A MINHA PAZ EM TEU CORAÇÃO \nSEI PORQUE ESTÁS AQUI\nPENSAS QUE EU NÃO TE VI\nSAI DA ESCURIDÃO EU VOU TIRAR \nO MEDO DO TEU CORAÇÃO\n\nPENSAS ESTAR SÓ E OLHAS AO TEU REDOR\nSEI QUE HÁ MUITOS QUE ME DEIXARAM \nDESTRUIRAM MEUS ALTARES\nDESPREZARAM A PROFECIA DO TEU DEUS\n\nEU QUERO TE DIZER QUE EU LIVREI SALVEI\nTODOS QUE NÃO ME NEGARAM\nJOELHOS QUE NÃO SE DOBRARAM\nBIS\n\nSEU FIM NÃO É AQUI\nVOCÊ VAI PROSSEGUIR\nPOIS GRANDES COISAS SIM \nTU VIVERÁS POR MIM\n\nUMA VOZ MANSA E DELICADA\nSINTA AGORA A MINHA PAZ EM TEU CORAÇÃO \nSEI PORQUE ESTÁS AQUI\nPENSAS QUE EU NÃO TE VI\nSAI DA ESCURIDÃO EU VOU TIRAR \nO MEDO DO TEU CORAÇÃO\n\nPENSAS ESTAR SÓ E OLHAS AO TEU REDOR\nSEI QUE HÁ MUITOS QUE ME DEIXARAM \nDESTRUIRAM MEUS ALTARES\nDESPREZARAM A PROFECIA DO TEU DEUS\n\nEU QUERO TE DIZER QUE EU LIVREI SALVEI\nTODOS QUE NÃO ME NEGARAM\nJOELHOS QUE NÃO SE DOBRARAM\nBIS\n\nSEU FIM NÃO É AQUI\nVOCÊ VAI PROSSEGUIR\nPOIS GRANDES COISAS SIM \nTU VIVERÁS POR MIM\nBIS', 'UMA VOZ MANSA E DELICADA SINTA AGORA A MINHA PAZ EM TEU CORAÇÃO SEI PORQUE ESTÁS AQUI PENSAS QUE EU NÃO TE VI SAI DA ESCURIDÃO EU VOU TIRAR O MEDO DO TEU CORAÇÃO PENSAS ESTAR SÓ E OLHAS AO TEU REDOR SEI QUE HÁ MUITOS QUE ME DEIXARAM DESTRUIRAM MEUS ALTARES DESPREZARAM A PROFECIA DO TEU DEUS EU QUERO TE DIZER QUE EU LIVREI SALVEI TODOS QUE NÃO ME NEGARAM JOELHOS QUE NÃO SE DOBRARAM SEU FIM NÃO É AQUI VOCÊ VAI PROSSEGUIR POIS GRANDES COISAS SIM TU VIVERÁS POR MIM UMA VOZ MANSA E DELICADA SINTA AGORA A MINHA PAZ EM TEU CORAÇÃO SEI PORQUE ESTÁS AQUI PENSAS QUE EU NÃO TE VI SAI DA ESCURIDÃO EU VOU TIRAR O MEDO DO TEU CORAÇÃO PENSAS ESTAR SÓ E OLHAS AO TEU REDOR SEI QUE HÁ MUITOS QUE ME DEIXARAM DESTRUIRAM MEUS ALTARES DESPREZARAM A PROFECIA DO TEU DEUS EU QUERO TE DIZER QUE EU LIVREI SALVEI TODOS QUE NÃO ME NEGARAM JOELHOS QUE NÃO SE DOBRARAM SEU FIM NÃO É AQUI VOCÊ VAI PROSSEGUIR POIS GRANDES COISAS SIM TU VIVERÁS POR MIM', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'EM CAMINHOS DE DOR', 'EM CAMINHOS DE DOR EU ANDAVA, \nEM DESOBEDIÊNCIA AO SENHOR; \nEU ME ASSENTAVA E CHORAVA, \nME LEMBRANDO COMO EU ERA FELIZ. \nQUEM JÁ FOI ESCRAVO UM DIA, \nSABE QUE NÃO HÁ ALEGRIA \nEM CANTAR LOUVORES DISTANTE, \nDISTANTE DA CASA DO PAI.\n\nCOMO EU PODERIA CANTAR ALI?\nPOIS TU ÉS MINHA MAIOR ALEGRIA;\nSE NÃO FOR PRA TI, PRA NINGUÉM MAIS SERÁ.\nTUA PRESENÇA, Ó DEUS, QUERO TODOS OS DIAS!\nMEU LOUVOR É SÓ PRA TI, \nSÓ PRA TI!\n\nHAVERÁ O DIA DA VITÓRIA, A VITÓRIA FINAL,\nQUANDO SERÁ DESTRUÍDO E ESQUECIDO O MAL,\nO INIMIGO DO SENHOR, AQUELE QUE AOS HOMENS TROUXE TANTA DOR, TANTA DOR.\nHOJE EU CANTO AO SENHOR, \nVOLTEI, NÃO ME ESQUECEREI \nQUE É, SENHOR, NA TUA PRESENÇA, \nO LUGAR DE ONDE EU NÃO MAIS SAIREI!\n\nCOMO EU PODERIA CANTAR ALI?\nPOIS TU ÉS MINHA MAIOR ALEGRIA;\nSE NÃO FOR PRA TI, PRA NINGUÉM MAIS SERÁ.\nTUA PRESENÇA, Ó DEUS, QUERO TODOS OS DIAS!\nMEU LOUVOR É SÓ PRA TI, \nSÓ PRA TI!\n\nHAVERÁ O DIA DA VITÓRIA, A VITÓRIA FINAL,\nQUANDO SERÁ DESTRUÍDO E ESQUECIDO O MAL,\nO INIMIGO DO SENHOR, AQUELE QUE AOS HOMENS TROUXE TANTA DOR, TANTA DOR.\nHOJE EU CANTO AO SENHOR, \nVOLTEI, NÃO ME ESQUECEREI \nQUE É, SENHOR, NA TUA PRESENÇA, \nO LUGAR DE ONDE EU NÃO MAIS SAIREI!\n\nFINAL: \nQUE É, SENHOR, NA TUA PRESENÇA, \nO LUGAR DE ONDE EU NÃO MAIS SAIREI!', 'EM CAMINHOS DE DOR EU ANDAVA, EM DESOBEDIÊNCIA AO SENHOR; EU ME ASSENTAVA E CHORAVA, ME LEMBRANDO COMO EU ERA FELIZ. QUEM JÁ FOI ESCRAVO UM DIA, SABE QUE NÃO HÁ ALEGRIA EM CANTAR LOUVORES DISTANTE, DISTANTE DA CASA DO PAI. COMO EU PODERIA CANTAR ALI? POIS TU ÉS MINHA MAIOR ALEGRIA; SE NÃO FOR PRA TI, PRA NINGUÉM MAIS SERÁ. TUA PRESENÇA, Ó DEUS, QUERO TODOS OS DIAS! MEU LOUVOR É SÓ PRA TI, SÓ PRA TI! HAVERÁ O DIA DA VITÓRIA, A VITÓRIA FINAL, QUANDO SERÁ DESTRUÍDO E ESQUECIDO O MAL, O INIMIGO DO SENHOR, AQUELE QUE AOS HOMENS TROUXE TANTA DOR, TANTA DOR. HOJE EU CANTO AO SENHOR, VOLTEI, NÃO ME ESQUECEREI QUE É, SENHOR, NA TUA PRESENÇA, O LUGAR DE ONDE EU NÃO MAIS SAIREI! COMO EU PODERIA CANTAR ALI? POIS TU ÉS MINHA MAIOR ALEGRIA; SE NÃO FOR PRA TI, PRA NINGUÉM MAIS SERÁ. TUA PRESENÇA, Ó DEUS, QUERO TODOS OS DIAS! MEU LOUVOR É SÓ PRA TI, SÓ PRA TI! HAVERÁ O DIA DA VITÓRIA, A VITÓRIA FINAL, QUANDO SERÁ DESTRUÍDO E ESQUECIDO O MAL, O INIMIGO DO SENHOR, AQUELE QUE AOS HOMENS TROUXE TANTA DOR, TANTA DOR. HOJE EU CANTO AO SENHOR, VOLTEI, NÃO ME ESQUECEREI QUE É, SENHOR, NA TUA PRESENÇA, O LUGAR DE ONDE EU NÃO MAIS SAIREI! QUE É, SENHOR, NA TUA PRESENÇA, O LUGAR DE ONDE EU NÃO MAIS SAIREI!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'A MELHOR COISA', 'DE TANTAS COISAS \nQUE ANDEI FAZENDO,\nDE QUASE TODAS ME ARREPENDI.\nMAS HOUVE UMA ESPECIAL,\nFOI A MAIS CERTA QUE ESCOLHI.\n\nCORO\nA MELHOR COISA QUE EU JÁ FIZ\nEM TODA A MINHA VIDA, \nPOR ISSO SOU FELIZ EM \nACEITAR JESUS, SINCERAMENTE FOI\nA MELHOR COISA QUE EU JÁ FIZ.\n\nCOISAS ERRADAS ANDEI FAZENDO\nNA CONDIÇÃO DE PECADOR,\nMAS QUANDO ACHEI-ME DESFALECENDO,\nTOMEI A DECISÃO QUE ME SALVOU.\n\nCORO (2X)\nA MELHOR COISA QUE EU JÁ FIZ\nEM TODA A MINHA VIDA, \nPOR ISSO SOU FELIZ EM \nACEITAR JESUS, SINCERAMENTE FOI\nA MELHOR COISA QUE EU JÁ FIZ.', 'DE TANTAS COISAS QUE ANDEI FAZENDO, DE QUASE TODAS ME ARREPENDI. MAS HOUVE UMA ESPECIAL, FOI A MAIS CERTA QUE ESCOLHI. A MELHOR COISA QUE EU JÁ FIZ EM TODA A MINHA VIDA, POR ISSO SOU FELIZ EM ACEITAR JESUS, SINCERAMENTE FOI A MELHOR COISA QUE EU JÁ FIZ. COISAS ERRADAS ANDEI FAZENDO NA CONDIÇÃO DE PECADOR, MAS QUANDO ACHEI-ME DESFALECENDO, TOMEI A DECISÃO QUE ME SALVOU. A MELHOR COISA QUE EU JÁ FIZ EM TODA A MINHA VIDA, POR ISSO SOU FELIZ EM ACEITAR JESUS, SINCERAMENTE FOI A MELHOR COISA QUE EU JÁ FIZ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'BARNABÉ, HOMEM DE DEUS', 'NÃO FICA BEM A GENTE PASSAR BEM E O OUTRO CARESTIA, AINDA MAIS QUANDO SE SABE O QUE FAZER E NÃO SE FAZ. COMO FRUTO DO AMOR DE CRISTO, FRUTO DO SEU COMPROMISSO, VENDEU UM HOMEM O QUE TINHA E REPARTIU.\n\nCORO\nERA SEU NOME BARNABÉ, NATURAL DE CHIPRE,\nTAMBÉM CHAMADO DE JOSÉ DA CONSOLAÇÃO,\nHOMEM BOM E PIEDOSO, CHEIO DE TEMOR E FÉ,\nHOMEM DE DEUS.\n\nE QUANDO SAULO CONVERTEU-SE A CRISTO LHE FALTOU AMIGO,ALGUÉM QUE FOSSE COMPANHEIRO,\nFONTE DE CONSOLO E ABRIGO. COMO FRUTO DO AMOR DE CRISTO, FRUTO DO SEU COMPROMISSO, FOI UM HOMEM PROCURÁ-LO, DANDO-LHE A MÃO.\n\nCORO\nERA SEU NOME BARNABÉ, NATURAL DE CHIPRE,\nTAMBÉM CHAMADO DE JOSÉ DA CONSOLAÇÃO,\nHOMEM BOM E PIEDOSO, CHEIO DE TEMOR E FÉ,\nHOMEM DE DEUS.\n\nE QUANDO A IGREJA SE ESPALHOU POR TODO CANTO QUE HAVIA, POR PROVIDÊNCIA, SIM,\nPOR MÃO DE DEUS CHEGOU A ANTIOQUIA.\nPRECISANDO DE UM PASTOR DE ALMAS, \nMESMO DE UM PASTOR DE HOMENS, FORAM PROCURAR AQUELE QUE DEUS PREPAROU.\n\nCORO\nERA SEU NOME BARNABÉ, NATURAL DE CHIPRE,\nTAMBÉM CHAMADO DE JOSÉ DA CONSOLAÇÃO,\nHOMEM BOM E PIEDOSO, CHEIO DE TEMOR E FÉ,\nHOMEM DE DEUS.', 'NÃO FICA BEM A GENTE PASSAR BEM E O OUTRO CARESTIA, AINDA MAIS QUANDO SE SABE O QUE FAZER E NÃO SE FAZ. COMO FRUTO DO AMOR DE CRISTO, FRUTO DO SEU COMPROMISSO, VENDEU UM HOMEM O QUE TINHA E REPARTIU. ERA SEU NOME BARNABÉ, NATURAL DE CHIPRE, TAMBÉM CHAMADO DE JOSÉ DA CONSOLAÇÃO, HOMEM BOM E PIEDOSO, CHEIO DE TEMOR E FÉ, HOMEM DE DEUS. E QUANDO SAULO CONVERTEU-SE A CRISTO LHE FALTOU AMIGO,ALGUÉM QUE FOSSE COMPANHEIRO, FONTE DE CONSOLO E ABRIGO. COMO FRUTO DO AMOR DE CRISTO, FRUTO DO SEU COMPROMISSO, FOI UM HOMEM PROCURÁ-LO, DANDO-LHE A MÃO. ERA SEU NOME BARNABÉ, NATURAL DE CHIPRE, TAMBÉM CHAMADO DE JOSÉ DA CONSOLAÇÃO, HOMEM BOM E PIEDOSO, CHEIO DE TEMOR E FÉ, HOMEM DE DEUS. E QUANDO A IGREJA SE ESPALHOU POR TODO CANTO QUE HAVIA, POR PROVIDÊNCIA, SIM, POR MÃO DE DEUS CHEGOU A ANTIOQUIA. PRECISANDO DE UM PASTOR DE ALMAS, MESMO DE UM PASTOR DE HOMENS, FORAM PROCURAR AQUELE QUE DEUS PREPAROU. ERA SEU NOME BARNABÉ, NATURAL DE CHIPRE, TAMBÉM CHAMADO DE JOSÉ DA CONSOLAÇÃO, HOMEM BOM E PIEDOSO, CHEIO DE TEMOR E FÉ, HOMEM DE DEUS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'COMO AGRADECER (MEU TRIBUTO)', 'COMO AGRADECER, PELO BEM \nQUE TENS FEITO A MIM? \nQUE VEM DEMONSTRAR QUANTO \nAMOR TU TENS, Ó DEUS, POR MIM;\n\nAS VOZES DE MILHÕES DE ANJOS, \nNÃO PODERIAM EXPRESSAR, \nA GRATIDÃO DO MEU PEQUENO\nSER, QUE SÓ PERTENCE A TI.\n\nA DEUS DEMOS GLÓRIA (3X)\nQUE POR NÓS TANTO FEZ;\nFOI NA CRUZ QUE SALVOU-ME,\nSEU PODER RESTAUROU-ME,\nA DEUS DEMOS GLÓRIA, \nQUE POR NÓS TANTO FEZ.\n\nFOI NA CRUZ QUE SALVOU-ME,\nSEU PODER RESTAUROU-ME,\nA DEUS DEMOS GLÓRIA, \nQUE POR NÓS TANTO FEZ.\n\nQUERO VIVER AQUI \nPARA ADORAR-TE, MEU SENHOR,\nE SE SURGIR UM LOUVOR\nAO CALVÁRIO SEJA, SIM, SEJA, SIM.\n\nFOI NA CRUZ QUE SALVOU-ME,\nSEU PODER RESTAUROU-ME,\nA DEUS DEMOS GLÓRIA, \nQUE POR NÓS TANTO FEZ.', 'COMO AGRADECER, PELO BEM QUE TENS FEITO A MIM? QUE VEM DEMONSTRAR QUANTO AMOR TU TENS, Ó DEUS, POR MIM; AS VOZES DE MILHÕES DE ANJOS, NÃO PODERIAM EXPRESSAR, A GRATIDÃO DO MEU PEQUENO SER, QUE SÓ PERTENCE A TI. A DEUS DEMOS GLÓRIA QUE POR NÓS TANTO FEZ; FOI NA CRUZ QUE SALVOU-ME, SEU PODER RESTAUROU-ME, A DEUS DEMOS GLÓRIA, QUE POR NÓS TANTO FEZ. FOI NA CRUZ QUE SALVOU-ME, SEU PODER RESTAUROU-ME, A DEUS DEMOS GLÓRIA, QUE POR NÓS TANTO FEZ. QUERO VIVER AQUI PARA ADORAR-TE, MEU SENHOR, E SE SURGIR UM LOUVOR AO CALVÁRIO SEJA, SIM, SEJA, SIM. FOI NA CRUZ QUE SALVOU-ME, SEU PODER RESTAUROU-ME, A DEUS DEMOS GLÓRIA, QUE POR NÓS TANTO FEZ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'CORDEIRO DE DEUS', 'TEU SANTO FILHO, SEM PECAR\nFOI ENVIADO PRA LEVAR\nUM PESO QUE ERA TODO MEU\nE SE TORNAR CORDEIRO DE DEUS.\n\nO SEU PRESENTE DE AMOR\nFOI REJEITADO PELOS SEUS,\nHUMILDE REI, NADA FALOU\nE ASSIM SE FEZ CORDEIRO DE DEUS.\n\nCORO\nCORDEIRO DE DEUS, TÃO PURO ÉS\nVOU TE ADORAR E TE EXALTAR\nCOM SANGUE VEM LAVAR MEU SER\nMEU CRISTO ÉS CORDEIRO DE DEUS.\n\nPERDIDO ESTAVA SEM SABER,\nMAS ME ATRAÍSTE A TEU SER\nE HOJE SOU UM SERVO TEU\nPRA TEU LOUVOR, \nCORDEIRO DE DEUS.\n\nCORO\nCORDEIRO DE DEUS, TÃO PURO ÉS\nVOU TE ADORAR E TE EXALTAR\nCOM SANGUE VEM LAVAR MEU SER\nMEU CRISTO ÉS CORDEIRO DE DEUS.\nBIS', 'TEU SANTO FILHO, SEM PECAR FOI ENVIADO PRA LEVAR UM PESO QUE ERA TODO MEU E SE TORNAR CORDEIRO DE DEUS. O SEU PRESENTE DE AMOR FOI REJEITADO PELOS SEUS, HUMILDE REI, NADA FALOU E ASSIM SE FEZ CORDEIRO DE DEUS. CORDEIRO DE DEUS, TÃO PURO ÉS VOU TE ADORAR E TE EXALTAR COM SANGUE VEM LAVAR MEU SER MEU CRISTO ÉS CORDEIRO DE DEUS. PERDIDO ESTAVA SEM SABER, MAS ME ATRAÍSTE A TEU SER E HOJE SOU UM SERVO TEU PRA TEU LOUVOR, CORDEIRO DE DEUS. CORDEIRO DE DEUS, TÃO PURO ÉS VOU TE ADORAR E TE EXALTAR COM SANGUE VEM LAVAR MEU SER MEU CRISTO ÉS CORDEIRO DE DEUS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'DESCANSA, Ó ALMA', 'DESCANSA, Ó ALMA, \nEIS O SENHOR AO LADO; \nPACIENTE LEVA, \nE SEM QUEIXAR-TE, A CRUZ;\n\nDEIXA O SENHOR TOMAR \nDE TI CUIDADO,\nÉ IMUTÁVEL TEU FIEL JESUS!\nPROSSEGUE, Ó ALMA, \nO AMIGO CELESTIAL PROTEGERÁ \nTEUS PASSOS NO ESPINHAL!\n\nPROSSEGUE, Ó ALMA, \nO TRILHO É ESTREITO E ESCURO,\nMAS, NO PASSADO DEUS \nGUIOU-TE ASSIM!\nCONFIA AGORA A DEUS O TEU FUTURO,\nE O QUE É MISTÉRIO HÁ DE \nACLARAR-SE ENFIM,\nCONFIA, Ó ALMA, A SUA MANSA \nVOZ AINDA ACALMA O VENTO \nE O MAR FEROZ!\n\nCONFIA, Ó ALMA, \nA HORA VEM CHEGANDO!\nIRÁS COM CRISTO, O TEU SENHOR, \nMORAR, SEM DOR, NEM MÁGOAS,\nGOZARÁS, CANTANDO \nAS ALEGRIAS DO CELESTE LAR!\nDESCANSA, Ó ALMA, \nAGORA HÁ PRANTO E DOR, \nDEPOIS O GOZO, A PAZ, \nO CÉU DE AMOR!', 'DESCANSA, Ó ALMA, EIS O SENHOR AO LADO; PACIENTE LEVA, E SEM QUEIXAR-TE, A CRUZ; DEIXA O SENHOR TOMAR DE TI CUIDADO, É IMUTÁVEL TEU FIEL JESUS! PROSSEGUE, Ó ALMA, O AMIGO CELESTIAL PROTEGERÁ TEUS PASSOS NO ESPINHAL! PROSSEGUE, Ó ALMA, O TRILHO É ESTREITO E ESCURO, MAS, NO PASSADO DEUS GUIOU-TE ASSIM! CONFIA AGORA A DEUS O TEU FUTURO, E O QUE É MISTÉRIO HÁ DE ACLARAR-SE ENFIM, CONFIA, Ó ALMA, A SUA MANSA VOZ AINDA ACALMA O VENTO E O MAR FEROZ! CONFIA, Ó ALMA, A HORA VEM CHEGANDO! IRÁS COM CRISTO, O TEU SENHOR, MORAR, SEM DOR, NEM MÁGOAS, GOZARÁS, CANTANDO AS ALEGRIAS DO CELESTE LAR! DESCANSA, Ó ALMA, AGORA HÁ PRANTO E DOR, DEPOIS O GOZO, A PAZ, O CÉU DE AMOR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'DEUS, DEUS, DEUS', 'DEUS, DEUS, DEUS\nSANTO É TEU NOME, SENHOR!\nÀ TUA IMAGEM FEITOS,\nA TI LOUVORES ENTOEMOS\nPOIS FILHOS NOS FIZESTE.\n\nO TEU PODER IMENSO, Ó DEUS,\nMOSTRAR-NOS VEM\nCOM GRANDE AMOR.\n\n\nGLÓRIA AO SENHOR CANTEMOS\nE SEU AMOR LOUVEMOS.\nGLÓRIA, GLÓRIA AO SENHOR!\nBIS\nBIS\n\nQUAL VIAJANTE \nEM NOITE ESCURA,\nVAI PROCURANDO A LUZ,\nASSIM MINH’ALMA\nA DEUS PROCURA,\nPOIS ELE ME CONDUZ.\n\nÉ CERTO QUE PROVADO SOU,\nPELO CAMINHO A PROSSEGUIR,\nPORÉM EU SEI QUE TU BEM PERTO ESTÁS.\nQUANDO HEI DE IR, SENHOR, NÃO SEI,\nPARA O TEU SANTO LAR,\nSINTO PORÉM TUA VOZ CHAMAR,\nEM BREVE PARTIREI.\n\nTUDO O QUE DEUS FIZER É BOM,\nA NOITE CLARA FICARÁ\nNO ETERNO LAR DE DEUS.\nAMÉM (5X)', 'DEUS, DEUS, DEUS SANTO É TEU NOME, SENHOR! À TUA IMAGEM FEITOS, A TI LOUVORES ENTOEMOS POIS FILHOS NOS FIZESTE. O TEU PODER IMENSO, Ó DEUS, MOSTRAR-NOS VEM COM GRANDE AMOR. GLÓRIA AO SENHOR CANTEMOS E SEU AMOR LOUVEMOS. GLÓRIA, GLÓRIA AO SENHOR! QUAL VIAJANTE EM NOITE ESCURA, VAI PROCURANDO A LUZ, ASSIM MINH’ALMA A DEUS PROCURA, POIS ELE ME CONDUZ. É CERTO QUE PROVADO SOU, PELO CAMINHO A PROSSEGUIR, PORÉM EU SEI QUE TU BEM PERTO ESTÁS. QUANDO HEI DE IR, SENHOR, NÃO SEI, PARA O TEU SANTO LAR, SINTO PORÉM TUA VOZ CHAMAR, EM BREVE PARTIREI. TUDO O QUE DEUS FIZER É BOM, A NOITE CLARA FICARÁ NO ETERNO LAR DE DEUS. AMÉM (5X)', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'DEUS PREPAROU', 'DEUS PREPAROU UMA CIDADE \nPARA SUA IGREJA FIEL.\nNESTA CIDADE NÃO HAVERÁ DOR,\nPOIS ELE NÃO PERMITIRÁ.\nSEREMOS TIRADOS DESTE \nMUNDO CRUEL, PARA \nMORARMOS COM ELE NO CÉU.\n\nCORO\nEU QUERO ENTRAR NO CÉU COM JESUS,\nE CONTEMPLAR AS MANSÕES \nQUE DEUS PREPAROU.\nQUERO ANDAR NAS RUAS DE OURO\nE OUVIR A VOZ DE DEUS \nO MEU NOME CHAMAR.\n\nOUVE A VOZ DO REDENTOR, \nELE QUER HOJE SALVAR, \nQUER LIBERTAR E PERDOAR, \nTUAS FERIDAS CURAR E NÃO TARDARÁ.\nCRISTO VEM NOS BUSCAR, \nENTREGA TUA VIDA E ELE TE LEVARÁ.\n\nCORO\nEU QUERO ENTRAR NO CÉU COM JESUS,\nE CONTEMPLAR AS MANSÕES \nQUE DEUS PREPAROU.\nQUERO ANDAR NAS RUAS DE OURO\nE OUVIR A VOZ DE DEUS \nO MEU NOME CHAMAR.', 'DEUS PREPAROU UMA CIDADE PARA SUA IGREJA FIEL. NESTA CIDADE NÃO HAVERÁ DOR, POIS ELE NÃO PERMITIRÁ. SEREMOS TIRADOS DESTE MUNDO CRUEL, PARA MORARMOS COM ELE NO CÉU. EU QUERO ENTRAR NO CÉU COM JESUS, E CONTEMPLAR AS MANSÕES QUE DEUS PREPAROU. QUERO ANDAR NAS RUAS DE OURO E OUVIR A VOZ DE DEUS O MEU NOME CHAMAR. OUVE A VOZ DO REDENTOR, ELE QUER HOJE SALVAR, QUER LIBERTAR E PERDOAR, TUAS FERIDAS CURAR E NÃO TARDARÁ. CRISTO VEM NOS BUSCAR, ENTREGA TUA VIDA E ELE TE LEVARÁ. EU QUERO ENTRAR NO CÉU COM JESUS, E CONTEMPLAR AS MANSÕES QUE DEUS PREPAROU. QUERO ANDAR NAS RUAS DE OURO E OUVIR A VOZ DE DEUS O MEU NOME CHAMAR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'EU NÃO POSSO FUGIR DO TEU ESPÍRITO', 'EU NÃO POSSO FUGIR DO TEU ESPÍRITO, (SERVAS) \nNEM FICAR DISTANTE DO TEU AMOR; (VARÕES)\nSE EU SUBIR ATÉ OS CÉUS, \nSE AO ABISMO EU DESCER, \nSEI QUE ALI TU ESTÁS.\n\nMESMO SE EU TOMAR \nAS ASAS DA ALVORADA, \nTUA  MÃO AINDA ASSIM MEGUIARÁ, \nMESMO VINDO A NOITE ESCURA\nTUA LUZ BRILHARÁ, \nE COMIGO ESTARÁS.\n\nEU NÃO POSSO FUGIR DO TEU ESPÍRITO, (SERVAS) \nNEM FICAR DISTANTE DO TEU AMOR; (VARÕES)\nSE EU SUBIR ATÉ OS CÉUS, \nSE AO ABISMO EU DESCER, \nSEI QUE ALI TU ESTÁS.\n\nMESMO SE EU TOMAR \nAS ASAS DA ALVORADA, \nTUA  MÃO AINDA ASSIM MEGUIARÁ, \nMESMO VINDO A NOITE ESCURA\nTUA LUZ BRILHARÁ, \nE COMIGO ESTARÁS.', 'EU NÃO POSSO FUGIR DO TEU ESPÍRITO, NEM FICAR DISTANTE DO TEU AMOR; SE EU SUBIR ATÉ OS CÉUS, SE AO ABISMO EU DESCER, SEI QUE ALI TU ESTÁS. MESMO SE EU TOMAR AS ASAS DA ALVORADA, TUA MÃO AINDA ASSIM MEGUIARÁ, MESMO VINDO A NOITE ESCURA TUA LUZ BRILHARÁ, E COMIGO ESTARÁS. EU NÃO POSSO FUGIR DO TEU ESPÍRITO, NEM FICAR DISTANTE DO TEU AMOR; SE EU SUBIR ATÉ OS CÉUS, SE AO ABISMO EU DESCER, SEI QUE ALI TU ESTÁS. MESMO SE EU TOMAR AS ASAS DA ALVORADA, TUA MÃO AINDA ASSIM MEGUIARÁ, MESMO VINDO A NOITE ESCURA TUA LUZ BRILHARÁ, E COMIGO ESTARÁS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'EXPIROU', 'EXPIROU! NÃO MAIS PADECE\nDE DEUS PAI O FILHO AMADO,\nMAS O SOLO SE ESTREMECE \nCOM SEU SANGUE DERRAMADO.\n\nFOI ENTÃO QUE A DEUS BENDITO\nIMPLOROU O SALVADOR.\nEIS O AMOR VASTO, INFINITO, \nPELO POVO TRANSGRESSOR.\nENTREGOU A SUA VIDA! \nGRANDE PROVA DE AMOR!\nMESMO ALI CRUCIFICADO \nAMA A QUEM O CONDENOU!\n\nAOS SEUS PÉS EU VOU, ENQUANTO\nSOFRE ASSIM O CRISTO AMADO,\nPARA AO MENOS DAR-LHE O PRANTO,\nPOIS POR MIM DEU O SEU SANGUE.\nPARA AO MENOS DAR-LHE O PRANTO,\nPOIS POR MIM DEU O SEU SANGUE.', 'EXPIROU! NÃO MAIS PADECE DE DEUS PAI O FILHO AMADO, MAS O SOLO SE ESTREMECE COM SEU SANGUE DERRAMADO. FOI ENTÃO QUE A DEUS BENDITO IMPLOROU O SALVADOR. EIS O AMOR VASTO, INFINITO, PELO POVO TRANSGRESSOR. ENTREGOU A SUA VIDA! GRANDE PROVA DE AMOR! MESMO ALI CRUCIFICADO AMA A QUEM O CONDENOU! AOS SEUS PÉS EU VOU, ENQUANTO SOFRE ASSIM O CRISTO AMADO, PARA AO MENOS DAR-LHE O PRANTO, POIS POR MIM DEU O SEU SANGUE. PARA AO MENOS DAR-LHE O PRANTO, POIS POR MIM DEU O SEU SANGUE.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'ÉS UM REMIDO DE DEUS', 'ÉS UM REMIDO DE DEUS.\nTU ÉS UM DOS MEUS,\nÉS AQUELE A QUEM ESCOLHI.\nUM DIA OUVIU MINHA VOZ,\nA VOZ DO FILHO DE DEUS,\nA FALAR: VEM AQUI ME SERVIR.\n\nSENHOR, NADA TENHO PRA TE OFERECER.\nSABES O QUE SOU, \nSABES QUEM SOU EU E O TEU \nQUERER EM MIM SERÁ O MEU PRAZER. \nTEUS MISTÉRIOS CONHECER, TUA OBRA\nREALIZAR, MINHA VIDA ENTREGAR.\n\nAS LUTAS VÊM, \nMAS AS VITÓRIAS TAMBÉM VÊM.\nE O TEU AMOR É MAIS FORTE,\nE SEM ELE NÃO ESTARIA AQUI.\nCOM TEU PODER, TUA GRAÇA, TUA LUZ\nSOU UM VENCEDOR, SOU UM SERVO,\nSOU VASO A SERVIÇO DO SENHOR.\nBIS\n\nFINAL: \nSOU VASO A SERVIÇO DO SENHOR.', 'ÉS UM REMIDO DE DEUS. TU ÉS UM DOS MEUS, ÉS AQUELE A QUEM ESCOLHI. UM DIA OUVIU MINHA VOZ, A VOZ DO FILHO DE DEUS, A FALAR: VEM AQUI ME SERVIR. SENHOR, NADA TENHO PRA TE OFERECER. SABES O QUE SOU, SABES QUEM SOU EU E O TEU QUERER EM MIM SERÁ O MEU PRAZER. TEUS MISTÉRIOS CONHECER, TUA OBRA REALIZAR, MINHA VIDA ENTREGAR. AS LUTAS VÊM, MAS AS VITÓRIAS TAMBÉM VÊM. E O TEU AMOR É MAIS FORTE, E SEM ELE NÃO ESTARIA AQUI. COM TEU PODER, TUA GRAÇA, TUA LUZ SOU UM VENCEDOR, SOU UM SERVO, SOU VASO A SERVIÇO DO SENHOR. SOU VASO A SERVIÇO DO SENHOR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'FINDA-SE ESTE DIA', 'FINDA-SE ESTE DIA, QUE MEU PAI ME DEU,\nSOMBRA VESPERTINAS COBREM JÁ OS CÉUS,\nÓ JESUS BENDITO, SE COMIGO ESTÁS,\nEU NÃO TEMO A NOITE, VOU DORMIR EM PAZ.\n\nCOM MEUS PECADOS EU TE ENTRISTECI,\nMAS PERDÃO TE PEÇO, POR AMOR DE TI.\nSOU HUMANO E FRACO, LIVRA-ME DO MAL\nE EM SOSSEGO TENHO SONO E PAZ REAL.\n\nGUARDA O MARINHEIRO NO VIOLENTO MAR\nE AO QUE SOFRE DORES, \nQUEIRAS CONFORTAR.\nAO TENTADO ESTENDE TUA MÃO SENHOR,\nMANDA AO TRISTE E AFLITO TEU CONSOLADOR.\n\nPELOS PAIS E AMIGOS, PELA SANTA LEI,\nPELO AMOR DIVINO GRAÇAS TE DAREI.\nÓ JESUS ACEITA MINHA PETIÇÃO,\nE SEGURO DURMO SEM PERTUBAÇÃO.', 'FINDA-SE ESTE DIA, QUE MEU PAI ME DEU, SOMBRA VESPERTINAS COBREM JÁ OS CÉUS, Ó JESUS BENDITO, SE COMIGO ESTÁS, EU NÃO TEMO A NOITE, VOU DORMIR EM PAZ. COM MEUS PECADOS EU TE ENTRISTECI, MAS PERDÃO TE PEÇO, POR AMOR DE TI. SOU HUMANO E FRACO, LIVRA-ME DO MAL E EM SOSSEGO TENHO SONO E PAZ REAL. GUARDA O MARINHEIRO NO VIOLENTO MAR E AO QUE SOFRE DORES, QUEIRAS CONFORTAR. AO TENTADO ESTENDE TUA MÃO SENHOR, MANDA AO TRISTE E AFLITO TEU CONSOLADOR. PELOS PAIS E AMIGOS, PELA SANTA LEI, PELO AMOR DIVINO GRAÇAS TE DAREI. Ó JESUS ACEITA MINHA PETIÇÃO, E SEGURO DURMO SEM PERTUBAÇÃO.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'GUIA-ME', 'GUIA-ME PELAS DUNAS DO DESERTO\nGUIA-ME SINTO O TEU AMOR BEM PERTO\nGUIA-ME PELAS RUAS DESTA VIDA\nGUIA-ME ATÉ A TERRA PROMETIDA\n\nCORO\nGUIA-ME, DÁ-ME FORÇAS \nDE TI PRECISO TANTO ASSIM, \nUSA-ME, COMO QUISERES \nPORQUE TU ÉS PARTE DE MIM.\n\nINSTRUMENTOS\n\nÓ SENHOR, TEU CAJADO ME CONSOLA\nONDE FOR O MEU CÁLICE TRANSBORDA.\nFAZ-ME SER UM MANANCIAL DE ÁGUAS\nFAZ CORRER ÁGUAS VIVAS DE MINH’ALMA.\n\nCORO\nGUIA-ME, DÁ-ME FORÇAS \nDE TI PRECISO TANTO ASSIM, \nUSA-ME, COMO QUISERES \nPORQUE TU ÉS PARTE DE MIM.\n\nUSA-ME, COMO QUISERES,\nPORQUE TU ÉS PARTE DE MIM\n\nFINAL: PARTE DE MIM.', 'GUIA-ME PELAS DUNAS DO DESERTO GUIA-ME SINTO O TEU AMOR BEM PERTO GUIA-ME PELAS RUAS DESTA VIDA GUIA-ME ATÉ A TERRA PROMETIDA GUIA-ME, DÁ-ME FORÇAS DE TI PRECISO TANTO ASSIM, USA-ME, COMO QUISERES PORQUE TU ÉS PARTE DE MIM. Ó SENHOR, TEU CAJADO ME CONSOLA ONDE FOR O MEU CÁLICE TRANSBORDA. FAZ-ME SER UM MANANCIAL DE ÁGUAS FAZ CORRER ÁGUAS VIVAS DE MINH’ALMA. GUIA-ME, DÁ-ME FORÇAS DE TI PRECISO TANTO ASSIM, USA-ME, COMO QUISERES PORQUE TU ÉS PARTE DE MIM. USA-ME, COMO QUISERES, PORQUE TU ÉS PARTE DE MIM PARTE DE MIM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'GRANDE É O SENHOR, INCLINAI-VOS', 'GRANDE É O SENHOR,\nINCLINAI-VOS TERRA HUMILDEMENTE.\nGRANDE É O SENHOR\nADORAÍ-O SEMPRE ALEGREMENTE.\nREGOZIJAI! DE CORAÇÃO!\nELE É O CRIADOR E NÓS A CRIAÇÃO.\n\nEIS QUE VEM DE SUA MÃO:\nO SOL, A LUA, ESTRELAS E PLANETAS\nJUSTO ÉS EM SUAS LEIS;\nTUFÕES ACALMAM, ONDAS OBEDECEM-NO\nSOSSEGA O MAR AO SEU MANDAR,\nMONTANHAS SE DESFARÃO,\nDESERTOS BROTARÃO BOAS COLHEITAS,\nA CRIAÇÃO LHE APRAZ, O SOL DIRIGE A\nLUA, ESCONDE A NOITE EM DIA FAZ.\n\nGRANDE É O SENHOR,\nO SOBERANO LÁ NOS CÉUS,\nE REI DOS REIS ONIPOTENTE E SANTO \nDEUS, GRANDE EM SEU PODER,\nE MASJESTOSO EM SEU SABER.\nSUA BONDADE É IMENSURAVÉL COMO \nO MAR, SEU AMPLO AMOR É \nINDISPENSÁVEL COMO O AR, \nSANTO É O SENHOR, \nVINDE ADORÁ-LO COM LOUVOR.\n\nHOSANA AO SALVADOR, \n(UNIDOS TODOS NÓS) VARÕES\nCANTEMOS EM LOUVOR,\n(CANTEMOS NUMA VOZ) VARÕES\nHOSANA AO NOSSO DEUS,\nHOSANA AO SALVADOR,\nHOSANA AO SENHOR,\nHOSANA AO SENHOR, AO SENHOR.', 'GRANDE É O SENHOR, INCLINAI-VOS TERRA HUMILDEMENTE. GRANDE É O SENHOR ADORAÍ-O SEMPRE ALEGREMENTE. REGOZIJAI! DE CORAÇÃO! ELE É O CRIADOR E NÓS A CRIAÇÃO. EIS QUE VEM DE SUA MÃO: O SOL, A LUA, ESTRELAS E PLANETAS JUSTO ÉS EM SUAS LEIS; TUFÕES ACALMAM, ONDAS OBEDECEM-NO SOSSEGA O MAR AO SEU MANDAR, MONTANHAS SE DESFARÃO, DESERTOS BROTARÃO BOAS COLHEITAS, A CRIAÇÃO LHE APRAZ, O SOL DIRIGE A LUA, ESCONDE A NOITE EM DIA FAZ. GRANDE É O SENHOR, O SOBERANO LÁ NOS CÉUS, E REI DOS REIS ONIPOTENTE E SANTO DEUS, GRANDE EM SEU PODER, E MASJESTOSO EM SEU SABER. SUA BONDADE É IMENSURAVÉL COMO O MAR, SEU AMPLO AMOR É INDISPENSÁVEL COMO O AR, SANTO É O SENHOR, VINDE ADORÁ-LO COM LOUVOR. HOSANA AO SALVADOR, (UNIDOS TODOS NÓS) VARÕES CANTEMOS EM LOUVOR, (CANTEMOS NUMA VOZ) VARÕES HOSANA AO NOSSO DEUS, HOSANA AO SALVADOR, HOSANA AO SENHOR, HOSANA AO SENHOR, AO SENHOR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'HOJE EU DESCOBRI', 'HOJE EU DESCOBRI A FORMA DE VIVER FELIZ, \nA CRISTO EU ENTREGUEI A MINHA VIDA E ESPEREI,\nA SOLUÇÃO DOS MEUS PROBLEMAS.\nE A RESPOSTA EM CRISTO EU ACHEI.\n\nHOJE EU VIVO BEM E A SUA PAZ EU ENCONTREI, \nO FARDO TÃO PESADO \nNO CAMINHO EU DEIXEI.\nELE O TOMOU EM SUA CRUZ E DISSE-ME: \n“FILHO MEU, TE ALIVIAREI”.\n\nCORO\nFICA SENHOR, EM MEU CORAÇÃO,\nMORA SENHOR, EM MEU CORAÇÃO.\n\nINSTRUMENTOS\n\nHOJE EU VIVO BEM E A SUA PAZ EU ENCONTREI, \nO FARDO TÃO PESADO \nNO CAMINHO EU DEIXEI.\nELE O TOMOU EM SUA CRUZ E DISSE-ME: \n“FILHO MEU, TE ALIVIAREI”.\n\nCORO\nFICA SENHOR, EM MEU CORAÇÃO,\nMORA SENHOR, EM MEU CORAÇÃO.', 'HOJE EU DESCOBRI A FORMA DE VIVER FELIZ, A CRISTO EU ENTREGUEI A MINHA VIDA E ESPEREI, A SOLUÇÃO DOS MEUS PROBLEMAS. E A RESPOSTA EM CRISTO EU ACHEI. HOJE EU VIVO BEM E A SUA PAZ EU ENCONTREI, O FARDO TÃO PESADO NO CAMINHO EU DEIXEI. ELE O TOMOU EM SUA CRUZ E DISSE-ME: FILHO MEU, TE ALIVIAREI. FICA SENHOR, EM MEU CORAÇÃO, MORA SENHOR, EM MEU CORAÇÃO. HOJE EU VIVO BEM E A SUA PAZ EU ENCONTREI, O FARDO TÃO PESADO NO CAMINHO EU DEIXEI. ELE O TOMOU EM SUA CRUZ E DISSE-ME: FILHO MEU, TE ALIVIAREI. FICA SENHOR, EM MEU CORAÇÃO, MORA SENHOR, EM MEU CORAÇÃO.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'JERUSALÉM DE OURO', 'JERUSALÉM, EM TUAS RUAS \nEU OUÇO A ECOAR\nO SOM DA HARPA DE DAVI,\nMINHA ALMA A ACALENTAR\nPOR ENTRE AS TUAS OLIVEIRAS, \nO VENTO VEM CONTAR\nHISTÓRIAS DA VELHA CIDADE \nQUE OS MUROS VÃO GUARDAR.\n\nCORO\nJERUSALÉM, JERUSALÉM,\nBELEZA E COR DE ISRAEL,\nTU ÉS O ORGULHO DO TEU DEUS,\nEMANUEL.\nBIS\n\nAINDA OUÇO EM TUAS RUAS \nO SOM DA MULTIDÃO,\nDE PEREGRINOS E AMANTES \nEM BUSCA DE OBLAÇÃO,\nNO SANTO TEMPLO E EM TUAS FONTES\nSE ENCONTRAVA A PAZ,\nJERUSALÉM, QUEM TE CONHECE \nNÃO TE ESQUECE MAIS.\n\nCORO\nJERUSALÉM, JERUSALÉM,\nBELEZA E COR DE ISRAEL,\nTU ÉS O ORGULHO DO TEU DEUS,\nEMANUEL.\nBIS\n\nJERUSALÉM, EM TUAS PRECES \nLEMBRA DOS FILHOS TEUS\nQUE AINDA NÃO TE CONHECERAM \nMAS AMAM O TEU DEUS,\nSÃO VELHOS, JOVENS E MENINOS \nDISTANTES DO SEU LAR,\nQUE NÃO PISARAM TUAS RUAS \nMAS VIVEM POR TE AMAR.\n\nCORO\nJERUSALÉM, JERUSALÉM,\nBELEZA E COR DE ISRAEL,\nTU ÉS O ORGULHO DO TEU DEUS,\nEMANUEL.\nBIS', 'JERUSALÉM, EM TUAS RUAS EU OUÇO A ECOAR O SOM DA HARPA DE DAVI, MINHA ALMA A ACALENTAR POR ENTRE AS TUAS OLIVEIRAS, O VENTO VEM CONTAR HISTÓRIAS DA VELHA CIDADE QUE OS MUROS VÃO GUARDAR. JERUSALÉM, JERUSALÉM, BELEZA E COR DE ISRAEL, TU ÉS O ORGULHO DO TEU DEUS, EMANUEL. AINDA OUÇO EM TUAS RUAS O SOM DA MULTIDÃO, DE PEREGRINOS E AMANTES EM BUSCA DE OBLAÇÃO, NO SANTO TEMPLO E EM TUAS FONTES SE ENCONTRAVA A PAZ, JERUSALÉM, QUEM TE CONHECE NÃO TE ESQUECE MAIS. JERUSALÉM, JERUSALÉM, BELEZA E COR DE ISRAEL, TU ÉS O ORGULHO DO TEU DEUS, EMANUEL. JERUSALÉM, EM TUAS PRECES LEMBRA DOS FILHOS TEUS QUE AINDA NÃO TE CONHECERAM MAS AMAM O TEU DEUS, SÃO VELHOS, JOVENS E MENINOS DISTANTES DO SEU LAR, QUE NÃO PISARAM TUAS RUAS MAS VIVEM POR TE AMAR. JERUSALÉM, JERUSALÉM, BELEZA E COR DE ISRAEL, TU ÉS O ORGULHO DO TEU DEUS, EMANUEL.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'JESUS, SEMPRE TE AMO', 'JESUS, SEMPRE TE AMO \nPORQUE SEI QUE ÉS MEU;\nFELIZ EU TE RENDO LOUVOR \nQUE É SÓ TEU.\n\nMEU MESTRE DIVINO, \nSENHOR E MEU DEUS, \nPRA SEMPRE HEI DE AMAR-TE \nMEU CRISTO, MEU REI.\n\nSERVAS\n\nVARÕES\n\nEU TE AMO PORQUE TU MORRESTE POR MIM; \nEU TE AMO PORQUE TEU AMOR NÃO TEM FIM.\nEM TI CONFIANÇA PRA SEMPRE TEREI; \nPRA SEMPRE HEI DE AMAR-TE MEU REI.\n\nEU TE AMO NA VIDA, NA MORTE TAMBÉM;\nSEMPRE HEI DE LOUVAR-TE NA GLÓRIA DE ALÉM;\nAGORA E PRA SEMPRE POR TI VIVEREI;\nSEMPRE HEI DE AMAR-TE, \nMEU CRISTO, MEU REI.\nSEMPRE HEI DE AMAR-TE, \nMEU CRISTO, MEU REI.', 'JESUS, SEMPRE TE AMO PORQUE SEI QUE ÉS MEU; FELIZ EU TE RENDO LOUVOR QUE É SÓ TEU. MEU MESTRE DIVINO, SENHOR E MEU DEUS, PRA SEMPRE HEI DE AMAR-TE MEU CRISTO, MEU REI. EU TE AMO PORQUE TU MORRESTE POR MIM; EU TE AMO PORQUE TEU AMOR NÃO TEM FIM. EM TI CONFIANÇA PRA SEMPRE TEREI; PRA SEMPRE HEI DE AMAR-TE MEU REI. EU TE AMO NA VIDA, NA MORTE TAMBÉM; SEMPRE HEI DE LOUVAR-TE NA GLÓRIA DE ALÉM; AGORA E PRA SEMPRE POR TI VIVEREI; SEMPRE HEI DE AMAR-TE, MEU CRISTO, MEU REI. SEMPRE HEI DE AMAR-TE, MEU CRISTO, MEU REI.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'JESUS, SOMENTE TU', 'JESUS, SOMENTE TU, \nA MINHA SEDE PODE SACIAR,\nNADA TEM MAIS VALOR, \nDO QUE BUSCAR TUA FACE E TE ADORAR.\n\nCORO\nSÓ TU ÉS A LUZ DA MINHA VIDA,\nSÓ TU DÁS SENTIDO AO MEU VIVER,\nSÓ TU VÊS A MINHA ALMA FERIDA,\nSÓ TU TENS PODER PRA EU VENCER.\n\nJESUS, EU TE AMO,\nVEM MINHA SEDE AGORA SACIAR;\nENCHE MINH’ALMA COM TEU AMOR \nATÉ EU TRANSBORDAR.\n\nCORO\nSÓ TU ÉS A LUZ DA MINHA VIDA,\nSÓ TU DÁS SENTIDO AO MEU VIVER,\nSÓ TU VÊS A MINHA ALMA FERIDA,\nSÓ TU TENS PODER PRA EU VENCER.\nBIS', 'JESUS, SOMENTE TU, A MINHA SEDE PODE SACIAR, NADA TEM MAIS VALOR, DO QUE BUSCAR TUA FACE E TE ADORAR. SÓ TU ÉS A LUZ DA MINHA VIDA, SÓ TU DÁS SENTIDO AO MEU VIVER, SÓ TU VÊS A MINHA ALMA FERIDA, SÓ TU TENS PODER PRA EU VENCER. JESUS, EU TE AMO, VEM MINHA SEDE AGORA SACIAR; ENCHE MINH’ALMA COM TEU AMOR ATÉ EU TRANSBORDAR. SÓ TU ÉS A LUZ DA MINHA VIDA, SÓ TU DÁS SENTIDO AO MEU VIVER, SÓ TU VÊS A MINHA ALMA FERIDA, SÓ TU TENS PODER PRA EU VENCER.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'JUNTO A TI', 'JUNTO A TI, QUERO ESTAR, \nEM TUA CASA HABITAR, \nTEU AMOR EM MIM SENTIR,\nTUA VOZ SUAVE OUVIR, JESUS!\n\nCORO\nTU ÉS TUDO QUE EU \nALMEJO MINHA VIDA E LUZ, \nCADA DIA TE DESEJO MAIS \nE MAIS, JESUS.\n\nPELO ALTAR JÁ PASSEI\nE NO SANGUE ME LAVEI,\nPOSSO AGORA TE ADORAR\nMINHA SEDE SACIAR, JESUS!\n\nCORO (2X)\nTU ÉS TUDO QUE EU \nALMEJO MINHA VIDA E LUZ, \nCADA DIA TE DESEJO MAIS \nE MAIS, JESUS.\n\nINSTRUMENTOS\n\nCORO\nTU ÉS TUDO QUE EU \nALMEJO MINHA VIDA E LUZ, \nCADA DIA TE DESEJO MAIS \nE MAIS, JESUS.', 'JUNTO A TI, QUERO ESTAR, EM TUA CASA HABITAR, TEU AMOR EM MIM SENTIR, TUA VOZ SUAVE OUVIR, JESUS! TU ÉS TUDO QUE EU ALMEJO MINHA VIDA E LUZ, CADA DIA TE DESEJO MAIS E MAIS, JESUS. PELO ALTAR JÁ PASSEI E NO SANGUE ME LAVEI, POSSO AGORA TE ADORAR MINHA SEDE SACIAR, JESUS! TU ÉS TUDO QUE EU ALMEJO MINHA VIDA E LUZ, CADA DIA TE DESEJO MAIS E MAIS, JESUS. TU ÉS TUDO QUE EU ALMEJO MINHA VIDA E LUZ, CADA DIA TE DESEJO MAIS E MAIS, JESUS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'LOUVAI A DEUS, SENHOR', 'LOUVAI A DEUS, SENHOR, VINDE ADORÁ-LO,\nEM SEUS ATRIOS ENTOAI HINOS DE LOUVOR.\nLOUVAI A DEUS, SENHOR, VINDE ADORÁ-LO,\nEM SEUS ATRIOS ENTOAI HINOS DE LOUVOR.\n\nCÉUS ALEGRAI-VOS, TERRA EXULTAI,\nPERANTE A FACE DO SENHOR QUE VEM, ALELUIA.\nCÉUS ALEGRAI-VOS, TERRA EXULTAI,\nPERANTE A FACE DO SENHOR QUE VEM, ALELUIA.\n\nALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, \nALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA.\n\nANJOS CANTAI, Ó NAÇÕES EXULTAI,\nPERANTE A FACE DO SENHOR QUE VEM, ALELUIA.\nANJOS CANTAI, Ó NAÇÕES EXULTAI,\nPERANTE A FACE DO SENHOR QUE VEM, ALELUIA.\n\nALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, \nALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA.\n\nANJOS CANTAI, Ó NAÇÕES EXULTAI,\nPERANTE A FACE DO SENHOR QUE VEM, ALELUIA.\nANJOS CANTAI, Ó NAÇÕES EXULTAI,\nPERANTE A FACE DO SENHOR QUE VEM, ALELUIA.', 'LOUVAI A DEUS, SENHOR, VINDE ADORÁ-LO, EM SEUS ATRIOS ENTOAI HINOS DE LOUVOR. LOUVAI A DEUS, SENHOR, VINDE ADORÁ-LO, EM SEUS ATRIOS ENTOAI HINOS DE LOUVOR. CÉUS ALEGRAI-VOS, TERRA EXULTAI, PERANTE A FACE DO SENHOR QUE VEM, ALELUIA. CÉUS ALEGRAI-VOS, TERRA EXULTAI, PERANTE A FACE DO SENHOR QUE VEM, ALELUIA. ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA. ANJOS CANTAI, Ó NAÇÕES EXULTAI, PERANTE A FACE DO SENHOR QUE VEM, ALELUIA. ANJOS CANTAI, Ó NAÇÕES EXULTAI, PERANTE A FACE DO SENHOR QUE VEM, ALELUIA. ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA, ALELUIA. ANJOS CANTAI, Ó NAÇÕES EXULTAI, PERANTE A FACE DO SENHOR QUE VEM, ALELUIA. ANJOS CANTAI, Ó NAÇÕES EXULTAI, PERANTE A FACE DO SENHOR QUE VEM, ALELUIA.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'LOUVAI AO SENHOR (SALMO 150)', 'ALELUIA (ALELUIA), ALELUIA (ALELUIA)\nALELUIA, ALELUIA, ALELUIA, ALELUIA.\n\nLOUVAI AO SENHOR NO SEU SANTUÁRIO,\nLOUVAI AO SENHOR NO FIRMAMENTO \nDO SEU PODER, LOUVAI AO NOSSO DEUS, \nPOR SEUS FEITOS PODEROSOS,\nLOUVAI-O CONFORME A SUA \nGRANDEZA.\n\nÓ LOUVAI AO SENHOR AO TOCAR DA TROMBETA,\nÓ LOUVAI AO SENHOR COM SALTÉRIO E COM HARPA,\nLOUVAI COM ADUFE, COM JÚBILO LOUVAI,\nLOUVAI-O COM ÓRGÃOS E CORDAS LOUVAI,\nLOUVAI AO SENHOR COM CÍMBALOS SONOROS,\nLOUVAI AO SENHOR COM CÍMBALOS RETUMBANTES,\nE TODO O SER QUE RESPIRA, E TODO O SER QUE \nRESPIRA LOUVE AO SENHOR, \nSIM LOUVE AO SENHOR.\n\nLOUVAI AO SENHOR NO SEU SANTUÁRIO,\nLOUVAI AO SENHOR NO FIRMAMENTO DO SEU PODER,\nLOUVAI AO NOSSO DEUS, POR SEUS FEITOS PODEROSOS,\nLOUVAI-O CONFORME A SUA GRANDEZA.\n\nÓ LOUVAI AO SENHOR AO TOCAR DA TROMBETA,\nO LOUVAI AO SENHOR COM SALTÉRIO E COM HARPA,\nLOUVAI COM ADUFE, COM JÚBILO LOUVAI,\nALELUIA, ALELUIA, ALELUIA, ALELUIA.', 'ALELUIA (ALELUIA), ALELUIA (ALELUIA) ALELUIA, ALELUIA, ALELUIA, ALELUIA. LOUVAI AO SENHOR NO SEU SANTUÁRIO, LOUVAI AO SENHOR NO FIRMAMENTO DO SEU PODER, LOUVAI AO NOSSO DEUS, POR SEUS FEITOS PODEROSOS, LOUVAI-O CONFORME A SUA GRANDEZA. Ó LOUVAI AO SENHOR AO TOCAR DA TROMBETA, Ó LOUVAI AO SENHOR COM SALTÉRIO E COM HARPA, LOUVAI COM ADUFE, COM JÚBILO LOUVAI, LOUVAI-O COM ÓRGÃOS E CORDAS LOUVAI, LOUVAI AO SENHOR COM CÍMBALOS SONOROS, LOUVAI AO SENHOR COM CÍMBALOS RETUMBANTES, E TODO O SER QUE RESPIRA, E TODO O SER QUE RESPIRA LOUVE AO SENHOR, SIM LOUVE AO SENHOR. LOUVAI AO SENHOR NO SEU SANTUÁRIO, LOUVAI AO SENHOR NO FIRMAMENTO DO SEU PODER, LOUVAI AO NOSSO DEUS, POR SEUS FEITOS PODEROSOS, LOUVAI-O CONFORME A SUA GRANDEZA. Ó LOUVAI AO SENHOR AO TOCAR DA TROMBETA, O LOUVAI AO SENHOR COM SALTÉRIO E COM HARPA, LOUVAI COM ADUFE, COM JÚBILO LOUVAI, ALELUIA, ALELUIA, ALELUIA, ALELUIA.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'MAIS PUREZA DÁ-ME', 'MAIS PUREZA DÁ-ME,                       \nREJEIÇÃO AO MAL,                            \nMAIS CALMA NAS LUTAS,                       \nMAIS ALTO IDEAL;                              \nMAIS FÉ NO MEU MESTRE,                      \nMAIS CONSAGRAÇÃO,                       \nMAIS GOZO EM SERVI-LO,                   \nMAIS GRATA ORAÇÃO.\n\nMAIS PRUDENTE FAZE-ME,                  \nMAIS SÁBIO, SENHOR;                        \nMAIS FIRME EM CRISTO,                      \nMAIS FORÇAS NA DOR;                      \nMAIS RETO NA VIDA,                          \nMAIS TRISTE AO PECAR;                      \nMAIS HUMILDE FILHO,                        \nMAIS PRONTO EM AMAR.\n\nMAIS PURO FAZE-ME,                             \nMAIS SANTO EM JESUS;                           \nMAIS DO TEU DOMÍNIO,                            \nMAIS GOZO NA CRUZ.                          \nMAIS RICA ESPERANÇA,                       \nMAIS FÉ E PODER.                                \nMAIS ÂNSIA DO CÉU,                            \nMAIS VIDA EM TI.', 'MAIS PUREZA DÁ-ME, REJEIÇÃO AO MAL, MAIS CALMA NAS LUTAS, MAIS ALTO IDEAL; MAIS FÉ NO MEU MESTRE, MAIS CONSAGRAÇÃO, MAIS GOZO EM SERVI-LO, MAIS GRATA ORAÇÃO. MAIS PRUDENTE FAZE-ME, MAIS SÁBIO, SENHOR; MAIS FIRME EM CRISTO, MAIS FORÇAS NA DOR; MAIS RETO NA VIDA, MAIS TRISTE AO PECAR; MAIS HUMILDE FILHO, MAIS PRONTO EM AMAR. MAIS PURO FAZE-ME, MAIS SANTO EM JESUS; MAIS DO TEU DOMÍNIO, MAIS GOZO NA CRUZ. MAIS RICA ESPERANÇA, MAIS FÉ E PODER. MAIS ÂNSIA DO CÉU, MAIS VIDA EM TI.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'MAIS QUE MARAVILHOSO', 'JESUS NOS PROMETEU UM\nCONSELHEIRO SER,\nO FORTE DEUS, PRÍNCIPE DA\nPAZ, E COMO UM PAI SERIA\nPARA DAR-NOS AMOR, TÃO\nGRANDE QUE NÃO CESSARÁ\nJAMAIS.\n\nSERVAS\n\nDESCOBRI QUE JESUS CRISTO\nÉ UM DEUS FIEL.\nO QUE NOS PROMETEU\nCUMPRIU ENFIM.\nENTÃO, A MEU JESUS DESEJO\nCONFESSAR O QUE ELE\nREPRESENTA PARA MIM.\n\nVARÕES\n\nCORO\nMARAVILHOSO DEUS,\nMUITO MAIS QUE MEU SER \nPOSSA IMAGINAR, MUITO MAIS DO QUE SEI.\nPOIS ELE É MAIS, BEM MUITO MAIS DO QUE SONHEI.\nNELE ENCONTREI TUDO QUE PROCURAVA\nO QUE PRECISAVA SÓ NELE ACHEI:\nMARAVILHOSO, MUITO MAIS PRA MIM;\nDEUS MILAGROSO É, SEMPRE SERÁ\nMARAVILHOSO DEUS,\nÉ O QUE CRISTO É PRA MIM.\n\nAO RELEMBRAR QUE UM DIA,\nO REI DA GLÓRIA EM FORMA\nDE UM HOMEM SE TORNOU,\nFELIZ ME FAZ POIS SEI\nQUANTO ME AMAS, AO\nPENSAR QUEM ELE É\nE QUEM EU SOU.\n\nVARÕES\n\nCORO\nMARAVILHOSO DEUS,\nMUITO MAIS QUE MEU SER POSSA\nIMAGINAR, MUITO MAIS DO QUE SEI.\nPOIS ELE É MAIS, BEM MUITO MAIS DO QUE SONHEI.\nNELE ENCONTREI TUDO QUE PROCURAVA \nO QUE PRECISAVA SÓ NELE ACHEI:\nMARAVILHOSO, MUITO MAIS PRA MIM;\nDEUS MILAGROSO É, SEMPRE SERÁ \nMARAVILHOSO DEUS,\nÉ O QUE CRISTO É PRA MIM.\n\nFINAL:\nNELE ENCONTREI TUDO QUE\nPROCURAVA, O QUE PRECISAVA SÓ\nNELE ACHEI: MARAVILOSO, MUITO MAIS, PRA MIM;\nDEUS MILAGROSO É, SEMPRE SERÁ\nMARAVILHOSO DEUS,\nPODEROSO DEUS É, SEMPRE SERÁ\nMARAVILHOSO DEUS, PODEROSO DEUS, \nÉ O QUE CRISTO É PRA MIM.\nMARAVILHOSO É PRA MIM, PRA MIM.', 'JESUS NOS PROMETEU UM CONSELHEIRO SER, O FORTE DEUS, PRÍNCIPE DA PAZ, E COMO UM PAI SERIA PARA DAR-NOS AMOR, TÃO GRANDE QUE NÃO CESSARÁ JAMAIS. DESCOBRI QUE JESUS CRISTO É UM DEUS FIEL. O QUE NOS PROMETEU CUMPRIU ENFIM. ENTÃO, A MEU JESUS DESEJO CONFESSAR O QUE ELE REPRESENTA PARA MIM. MARAVILHOSO DEUS, MUITO MAIS QUE MEU SER POSSA IMAGINAR, MUITO MAIS DO QUE SEI. POIS ELE É MAIS, BEM MUITO MAIS DO QUE SONHEI. NELE ENCONTREI TUDO QUE PROCURAVA O QUE PRECISAVA SÓ NELE ACHEI: MARAVILHOSO, MUITO MAIS PRA MIM; DEUS MILAGROSO É, SEMPRE SERÁ MARAVILHOSO DEUS, É O QUE CRISTO É PRA MIM. AO RELEMBRAR QUE UM DIA, O REI DA GLÓRIA EM FORMA DE UM HOMEM SE TORNOU, FELIZ ME FAZ POIS SEI QUANTO ME AMAS, AO PENSAR QUEM ELE É E QUEM EU SOU. MARAVILHOSO DEUS, MUITO MAIS QUE MEU SER POSSA IMAGINAR, MUITO MAIS DO QUE SEI. POIS ELE É MAIS, BEM MUITO MAIS DO QUE SONHEI. NELE ENCONTREI TUDO QUE PROCURAVA O QUE PRECISAVA SÓ NELE ACHEI: MARAVILHOSO, MUITO MAIS PRA MIM; DEUS MILAGROSO É, SEMPRE SERÁ MARAVILHOSO DEUS, É O QUE CRISTO É PRA MIM. NELE ENCONTREI TUDO QUE PROCURAVA, O QUE PRECISAVA SÓ NELE ACHEI: MARAVILOSO, MUITO MAIS, PRA MIM; DEUS MILAGROSO É, SEMPRE SERÁ MARAVILHOSO DEUS, PODEROSO DEUS É, SEMPRE SERÁ MARAVILHOSO DEUS, PODEROSO DEUS, É O QUE CRISTO É PRA MIM. MARAVILHOSO É PRA MIM, PRA MIM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'MIL GLÓRIAS', 'SENHOR JESUS EXALTADO SEJA\nSEMPRE O TEU SANTO NOME.\nNOME SANTO E BOM. (ÉS TU SENHOR)\nNOME SANTO E BOM. (É SALVADOR)\nEXALTADO SEJA SEMPRE \nO NOME DE JESUS.\n\nEXALTADO SEJA SEMPRE \nO TEU NOME, Ó JESUS.\nTU QUE HABITAS LÁ NA GLÓRIA,\nÓ AMADO JESUS.\n\nGLÓRIA A JESUS, GLÓRIA A JESUS\nJESUS CRISTO ESTÁ NA GLÓRIA\nREVESTIDO DE PODER.\nBIS\nBIS\n\nGLÓRIA A JESUS CRISTO, ELE É O SALVADOR.\nFOI QUEM POR NÓS COM PODE NOS RESGAROU.\nGLÓRIA AO PAI CELESTE, \nGLÓRIA A JESUS CRISTO, O FILHO,\nQUE SALVOU AS NOSSAS ALMAS,\nCOM PODER NOS RESGATOU.\nELE ESTÁ SENTADO, REVESTIDO \nDE PODER ESPERANDO PELO PAI \nPRA USA IGREJA RECEBER.\n\nE ESTA JORNADA VAMOS ENCERRAR.\nE NOSSA COROA LÁ NO CÉU VAMOS GANHAR.\nTE PREPARA, Ó CRENTE PRA ENCONTRAR O SALVADOR,\nPOIS EM BREVE ESTA IGREJA VAI SUBIR COM O SENHOR.\nELE VEM NAS NUVENS COM PODER E \nGRANDE GLÓRIA PRA BUSCAR A IGREJA\nSANTA QUE RECEBEU A VITÓRIA.\n\nGLÓRIA, GLÓRIA, JESUS,\nCRISTO ESTÁ NA GLÓRIA \nREVESTIDO DE PODER\n\nAO SENHOR DAÍ GLÓRIA,\nDAÍ GLÓRIA.\nPRA SEMPRE, AMÉM.\nBIS\n\nABENÇOA-NOS SENHOR,\nDERRAMA SOBRE NÓS TUA PAZ\nABENÇOA-NOS SENHOR,\nDERRAMA SOBRE NÓS TEU AMOR.', 'SENHOR JESUS EXALTADO SEJA SEMPRE O TEU SANTO NOME. NOME SANTO E BOM. (ÉS TU SENHOR) NOME SANTO E BOM. (É SALVADOR) EXALTADO SEJA SEMPRE O NOME DE JESUS. EXALTADO SEJA SEMPRE O TEU NOME, Ó JESUS. TU QUE HABITAS LÁ NA GLÓRIA, Ó AMADO JESUS. GLÓRIA A JESUS, GLÓRIA A JESUS JESUS CRISTO ESTÁ NA GLÓRIA REVESTIDO DE PODER. GLÓRIA A JESUS CRISTO, ELE É O SALVADOR. FOI QUEM POR NÓS COM PODE NOS RESGAROU. GLÓRIA AO PAI CELESTE, GLÓRIA A JESUS CRISTO, O FILHO, QUE SALVOU AS NOSSAS ALMAS, COM PODER NOS RESGATOU. ELE ESTÁ SENTADO, REVESTIDO DE PODER ESPERANDO PELO PAI PRA USA IGREJA RECEBER. E ESTA JORNADA VAMOS ENCERRAR. E NOSSA COROA LÁ NO CÉU VAMOS GANHAR. TE PREPARA, Ó CRENTE PRA ENCONTRAR O SALVADOR, POIS EM BREVE ESTA IGREJA VAI SUBIR COM O SENHOR. ELE VEM NAS NUVENS COM PODER E GRANDE GLÓRIA PRA BUSCAR A IGREJA SANTA QUE RECEBEU A VITÓRIA. GLÓRIA, GLÓRIA, JESUS, CRISTO ESTÁ NA GLÓRIA REVESTIDO DE PODER AO SENHOR DAÍ GLÓRIA, DAÍ GLÓRIA. PRA SEMPRE, AMÉM. ABENÇOA-NOS SENHOR, DERRAMA SOBRE NÓS TUA PAZ ABENÇOA-NOS SENHOR, DERRAMA SOBRE NÓS TEU AMOR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'NO EXÍLIO', 'NO EXÍLIO BEM DISTANTE,\nMINHA TERRA VOU CANTAR,\nÉ DE TODAS A MAIS BELA,\nCOM ELA VIVO A SONHAR,\nÉ MAIS SALUBRE O SEU CLIMA\nDO QUE DESTA SOLIDÃO.\n\nCORO\nEU TENHO SAUDADES DELA\nOH! QUANDO IREI PRA SIÃO?\nOH! BELA SIÃO, MINHA TERRA É SIÃO;\nEU TENHO SAUDADES DELA,\nOH! QUANDO IREI PRA SIÃO?\n\nLÁ NÃO HÁ CHORO E NEM GUERRA,\nE NEM MESMO REVOLUÇÃO,\nPASTA O LOBO COM O CORDEIRO\nE O NOVILHO COM O LEÃO,\nE O MENINO APASCENTA\nCOM O CAJADO NA MÃO.\n\nCORO\nEU TENHO SAUDADES DELA\nOH! QUANDO IREI PRA SIÃO?\nOH! BELA SIÃO, MINHA TERRA É SIÃO;\nEU TENHO SAUDADES DELA,\nOH! QUANDO IREI PRA SIÃO?\n\nCORO\nOH! BELA SIÃO, MINHA TERRA É SIÃO;\nEU TENHO SAUDADES DELA,\nOH! QUANDO IREI PRA SIÃO?\n\nFINAL: \nOH! QUANDO IREI PRA SIÃO?', 'NO EXÍLIO BEM DISTANTE, MINHA TERRA VOU CANTAR, É DE TODAS A MAIS BELA, COM ELA VIVO A SONHAR, É MAIS SALUBRE O SEU CLIMA DO QUE DESTA SOLIDÃO. EU TENHO SAUDADES DELA OH! QUANDO IREI PRA SIÃO? OH! BELA SIÃO, MINHA TERRA É SIÃO; EU TENHO SAUDADES DELA, OH! QUANDO IREI PRA SIÃO? LÁ NÃO HÁ CHORO E NEM GUERRA, E NEM MESMO REVOLUÇÃO, PASTA O LOBO COM O CORDEIRO E O NOVILHO COM O LEÃO, E O MENINO APASCENTA COM O CAJADO NA MÃO. EU TENHO SAUDADES DELA OH! QUANDO IREI PRA SIÃO? OH! BELA SIÃO, MINHA TERRA É SIÃO; EU TENHO SAUDADES DELA, OH! QUANDO IREI PRA SIÃO? OH! BELA SIÃO, MINHA TERRA É SIÃO; EU TENHO SAUDADES DELA, OH! QUANDO IREI PRA SIÃO? OH! QUANDO IREI PRA SIÃO?', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'O NOVO CÉU', 'DEUS MESMO REVELOU O NOVO CÉU;\nDEUS MESMO REVELOU O NOVO CÉU\nE A NOVA TERRA,\nESTA TERRA NÃO MAIS EXISTIRÁ;\nESTA TERRA NÃO MAIS EXISTIRÁ,\n\nNOVO É ESTE CÉU E O MAR TAMBÉM SE DESFEZ,\nO EVANGELISTA VIU A CIDADE DO SENHOR,\nCIDADE DO SENHOR, CIDADE DO SENHOR,\nQUE APRESENTAVA A GLÓRIA DO SENHOR.\n\nNO BRILHO DE DEUS E NOSSO ETERNO PAI;\nNO BRILHO DE DEUS E NOSSO ETERNO PAI;\nNO BRILHO DE NOSSO ETERNO \nPAI E REDENTOR DOS CÉUS,\nNOSSO PAI DOS CÉUS.\n\nE SOOU UMA VOZ MUI FORTE, \nDIZENDO: EIS DE DEUS A HABITAÇÃO \nENTRE OS HOMENS COM OS SEUS SERVOS,\nPOIS DEUS VAI HABITAR, VAI MORAR COM OS SEUS.\nENTÃO VEREIS, ENTÃO VEREIS, ENTÃO VEREIS, \nENTÃO VEREIS A GLÓRIA DIVINA,\nE DEUS VOS GUIARÁ E SERÁ \nO VOSSO PAI.\n\nTODA LÁGRIMA ELE LIMPARÁ;\nTODA LÁGRIMA ELE LIMPARÁ;\nTODA LÁGRIMA ELE LIMPARÁ;\nTODA LÁGRIMA ELE LIMPARÁ.\n\nSIM, DOS VOSSOS OLHOS TODA \nA LÁGRIMA LIMPARÁ, LIMPARÁ, \nLIMPARÁ, LIMPARÁ.\n\nLOUVAI A DEUS, LOUVAI A DEUS, \nLOUVAI A DEUS, LOUVAI A DEUS, \nALELUIA.\nBIS', 'DEUS MESMO REVELOU O NOVO CÉU; DEUS MESMO REVELOU O NOVO CÉU E A NOVA TERRA, ESTA TERRA NÃO MAIS EXISTIRÁ; ESTA TERRA NÃO MAIS EXISTIRÁ, NOVO É ESTE CÉU E O MAR TAMBÉM SE DESFEZ, O EVANGELISTA VIU A CIDADE DO SENHOR, CIDADE DO SENHOR, CIDADE DO SENHOR, QUE APRESENTAVA A GLÓRIA DO SENHOR. NO BRILHO DE DEUS E NOSSO ETERNO PAI; NO BRILHO DE DEUS E NOSSO ETERNO PAI; NO BRILHO DE NOSSO ETERNO PAI E REDENTOR DOS CÉUS, NOSSO PAI DOS CÉUS. E SOOU UMA VOZ MUI FORTE, DIZENDO: EIS DE DEUS A HABITAÇÃO ENTRE OS HOMENS COM OS SEUS SERVOS, POIS DEUS VAI HABITAR, VAI MORAR COM OS SEUS. ENTÃO VEREIS, ENTÃO VEREIS, ENTÃO VEREIS, ENTÃO VEREIS A GLÓRIA DIVINA, E DEUS VOS GUIARÁ E SERÁ O VOSSO PAI. TODA LÁGRIMA ELE LIMPARÁ; TODA LÁGRIMA ELE LIMPARÁ; TODA LÁGRIMA ELE LIMPARÁ; TODA LÁGRIMA ELE LIMPARÁ. SIM, DOS VOSSOS OLHOS TODA A LÁGRIMA LIMPARÁ, LIMPARÁ, LIMPARÁ, LIMPARÁ. LOUVAI A DEUS, LOUVAI A DEUS, LOUVAI A DEUS, LOUVAI A DEUS, ALELUIA.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'O SENHOR É MINHA ROCHA', 'QUANDO PARO PRA PENSAR\nEM TEU GRANDE AMOR\nPENSO: “PODE DEUS AMAR A MIM PECADOR?”\nAO SENTIR O TEU PODER MANIFESTO EM MIM, \nEU NÃO CONSIGO COMPREENDER\nPORQUE ME AMAS TANTO ASSIM.\n\nPOIS O SENHOR É MINHA ROCHA\nMEU REFÚGIO É O SENHOR.\nNÃO TEMEREI, MAS FORTE SEREI\nQUANDO O MAL SOBRE MIM VIER\nPOIS O SENHOR É MINHA FORTALEZA \nE MEU PROTETOR SE EM PROVAÇÃO, \nME AJUDAS GRANDE É O AMOR \nQUE TENS POR MIM.\n\nQUANDO OLHO PARA OS CÉUS, \nOBRA DE TUAS MÃOS,\nVEJO O QUANTO ÉS GRANDE, \nÓ DEUS POR TUA CRIAÇÃO\nÓ MEU PAI, SENHOR DA LUZ, \nSOU UM PECADOR MAS SEI QUE \nO SANGUE DE JESUS \nFAZ DE MIM UM VENCEDOR!\n\nPOIS O SENHOR É MINHA ROCHA\nMEU REFÚGIO É O SENHOR.\nNÃO TEMEREI, MAS FORTE SEREI\nQUANDO O MAL SOBRE MIM VIER\nPOIS O SENHOR É MINHA FORTALEZA \nE MEU PROTETOR, SE EM PROVAÇÃO ME\nAJUDAS, GRANDE É O AMOR QUE \nTENS POR MIM.\n\nPOR ISSO PEÇO, Ó PAI, \nCOMIGO SÊ NESTA LUTA AQUI.\nLOUVOR, ENTÃO, HEI DE RENDER\nEM GRATIDÃO A TI. \nA TI, Ó PAI DE AMOR!\nPAI DE AMOR!\n\nPOIS O SENHOR É MINHA ROCHA.\nMEU REFÚGIO É O SENHOR\nNÃO TEMEREI, MAS FORTE SEREI\nQUANDO O MAL SOBRE MIM VIER\nPOIS O SENHOR É MINHA FORTALEZA \nE MEU PROTETOR SE EM PROVAÇÃO \nME AJUDAS GRANDE É O AMOR \nQUE TENS POR MIM!\nFINAL: SENHOR, TU ÉS A MINHA ROCHA.', 'QUANDO PARO PRA PENSAR EM TEU GRANDE AMOR PENSO: PODE DEUS AMAR A MIM PECADOR? AO SENTIR O TEU PODER MANIFESTO EM MIM, EU NÃO CONSIGO COMPREENDER PORQUE ME AMAS TANTO ASSIM. POIS O SENHOR É MINHA ROCHA MEU REFÚGIO É O SENHOR. NÃO TEMEREI, MAS FORTE SEREI QUANDO O MAL SOBRE MIM VIER POIS O SENHOR É MINHA FORTALEZA E MEU PROTETOR SE EM PROVAÇÃO, ME AJUDAS GRANDE É O AMOR QUE TENS POR MIM. QUANDO OLHO PARA OS CÉUS, OBRA DE TUAS MÃOS, VEJO O QUANTO ÉS GRANDE, Ó DEUS POR TUA CRIAÇÃO Ó MEU PAI, SENHOR DA LUZ, SOU UM PECADOR MAS SEI QUE O SANGUE DE JESUS FAZ DE MIM UM VENCEDOR! POIS O SENHOR É MINHA ROCHA MEU REFÚGIO É O SENHOR. NÃO TEMEREI, MAS FORTE SEREI QUANDO O MAL SOBRE MIM VIER POIS O SENHOR É MINHA FORTALEZA E MEU PROTETOR, SE EM PROVAÇÃO ME AJUDAS, GRANDE É O AMOR QUE TENS POR MIM. POR ISSO PEÇO, Ó PAI, COMIGO SÊ NESTA LUTA AQUI. LOUVOR, ENTÃO, HEI DE RENDER EM GRATIDÃO A TI. A TI, Ó PAI DE AMOR! PAI DE AMOR! POIS O SENHOR É MINHA ROCHA. MEU REFÚGIO É O SENHOR NÃO TEMEREI, MAS FORTE SEREI QUANDO O MAL SOBRE MIM VIER POIS O SENHOR É MINHA FORTALEZA E MEU PROTETOR SE EM PROVAÇÃO ME AJUDAS GRANDE É O AMOR QUE TENS POR MIM! SENHOR, TU ÉS A MINHA ROCHA.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'ORAÇÃO PELA PÁTRIA', 'POR NOSSA PÁTRIA ORAMOS A TI, \nÓ SUPREMO DEUS!\nPOR NOSSO LAR CLAMAMOS A TI, \nÓ REI DO CÉUS.\nGOVERNA A PÁTRIA COM AMOR,\nSÊ NOSSO AMPARO, Ó SALVADOR. \nDERRAMA GRAÇA COM FAVOR,\nDEUS SALVE A PÁTRIA!\n\nÀ PÁTRIA QUE NOS DESTE,\nESTENDE TUA MÃO.\nCOM BÊNÇÃOS NOS REVESTE,\nDÁ-NOS PAZ,CONSOLAÇÃO.\nSUSTENTA A ORDEM NACIONAL, \nO BOM GOVERNO IMPARCIAL; \nE DÁ-NOS GRAÇA DIVINAL,\nDEUS SALVE A PÁTRIA!\n\nDÁ-NOS REAL CIVISMO,\nFIEL, CONSTANTE, AUDAZ;\nPROMOVE O CRISTIANISMO \nDO PRÍNCIPE DA PAZ;\nA PÁTRIA LIVRA DO MAL,\nSÊ NOSSO AUXÍLIO DIVINAL,\nDIRIGE COM PODER REAL\nDEUS SALVE A PÁTRIA!\n\nA TUA IGREJA INFLAMA COM \nZELO, E TERNO AMOR,\nE SEJA O SEU PROGRAMA, \nCUMPRIDO COM VIGOR.\nENTÃO, OS SALVOS DE JESUS,\nLUTANDO FIRMES PELA CRUZ,\nDIFUNDIRÃO DE CRISTO,\nA LUZ POR TODA A PÁTRIA! \nAMÉM.', 'POR NOSSA PÁTRIA ORAMOS A TI, Ó SUPREMO DEUS! POR NOSSO LAR CLAMAMOS A TI, Ó REI DO CÉUS. GOVERNA A PÁTRIA COM AMOR, SÊ NOSSO AMPARO, Ó SALVADOR. DERRAMA GRAÇA COM FAVOR, DEUS SALVE A PÁTRIA! À PÁTRIA QUE NOS DESTE, ESTENDE TUA MÃO. COM BÊNÇÃOS NOS REVESTE, DÁ-NOS PAZ,CONSOLAÇÃO. SUSTENTA A ORDEM NACIONAL, O BOM GOVERNO IMPARCIAL; E DÁ-NOS GRAÇA DIVINAL, DEUS SALVE A PÁTRIA! DÁ-NOS REAL CIVISMO, FIEL, CONSTANTE, AUDAZ; PROMOVE O CRISTIANISMO DO PRÍNCIPE DA PAZ; A PÁTRIA LIVRA DO MAL, SÊ NOSSO AUXÍLIO DIVINAL, DIRIGE COM PODER REAL DEUS SALVE A PÁTRIA! A TUA IGREJA INFLAMA COM ZELO, E TERNO AMOR, E SEJA O SEU PROGRAMA, CUMPRIDO COM VIGOR. ENTÃO, OS SALVOS DE JESUS, LUTANDO FIRMES PELA CRUZ, DIFUNDIRÃO DE CRISTO, A LUZ POR TODA A PÁTRIA! AMÉM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'OS CÉUS DECLARAM A GLÓRIA DE DEUS', 'OS CÉUS DECLARAM A GLÓRIA DE DEUS,\nPODER ETERNO DO SENHOR.\nOS CÉUS, A TERRA, O MAR, \nTODO O SER CANTA O TEU LOUVOR,\nO TEU LOUVOR! Ó DEUS! Ó DEUS!  	\nÉS GRANDE REI DO UNIVERSO, \nDA VIDA O GRANDE AUTOR, SENHOR!\n\nOS CÉUS DECLARAM A GLÓRIA DE DEUS,\nÓ DEUS, MEU REI E SALVADOR,\nÓ DEUS, MEU PAI E SALVADOR!\n\nINSTRUMENTOS\n\nOS CÉUS DECLARAM A GLÓRIA DE DEUS,\nPODER ETERNO DO SENHOR.\nOS CÉUS, A TERRA, O MAR, \nTODO O SER CANTA O TEU LOUVOR,\nO TEU LOUVOR! Ó DEUS! Ó DEUS!  	\nÉS GRANDE REI DO UNIVERSO, \nDA VIDA O GRANDE AUTOR, SENHOR!\n\nOS CÉUS DECLARAM A GLÓRIA DE DEUS,\nÓ DEUS, MEU REI E SALVADOR,\nÓ DEUS, MEU PAI E SALVADOR!', 'OS CÉUS DECLARAM A GLÓRIA DE DEUS, PODER ETERNO DO SENHOR. OS CÉUS, A TERRA, O MAR, TODO O SER CANTA O TEU LOUVOR, O TEU LOUVOR! Ó DEUS! Ó DEUS! ÉS GRANDE REI DO UNIVERSO, DA VIDA O GRANDE AUTOR, SENHOR! OS CÉUS DECLARAM A GLÓRIA DE DEUS, Ó DEUS, MEU REI E SALVADOR, Ó DEUS, MEU PAI E SALVADOR! OS CÉUS DECLARAM A GLÓRIA DE DEUS, PODER ETERNO DO SENHOR. OS CÉUS, A TERRA, O MAR, TODO O SER CANTA O TEU LOUVOR, O TEU LOUVOR! Ó DEUS! Ó DEUS! ÉS GRANDE REI DO UNIVERSO, DA VIDA O GRANDE AUTOR, SENHOR! OS CÉUS DECLARAM A GLÓRIA DE DEUS, Ó DEUS, MEU REI E SALVADOR, Ó DEUS, MEU PAI E SALVADOR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PAI NOSSO', 'PAI NOSSO QUE ESTÁS NO CÉUS,\nSANTIFICADO SEJA O TEU NOME\nVENHA O TEU REINO,\nSEJA FEITA A TUA VONTADE ASSIM \nNA TERRA COMO NOS CÉUS.\nO PÃO NOSSO DE CADA DIA NOS DÁ \nHOJE E PERDOA AS NOSSAS DÍVIDAS\nASSIM COMO NÓS PERDOAMOS\nAOS NOSSOS DEVEDORES.\n\nE NÃO NOS DEIXES CAIR EM TENTAÇÃO\nMAS LIVRA NOS DO MAL\nPORQUE TEU É O REINO E O PODER, \nE A GLÓRIA, PARA SEMPRE.\nAMÉM.', 'PAI NOSSO QUE ESTÁS NO CÉUS, SANTIFICADO SEJA O TEU NOME VENHA O TEU REINO, SEJA FEITA A TUA VONTADE ASSIM NA TERRA COMO NOS CÉUS. O PÃO NOSSO DE CADA DIA NOS DÁ HOJE E PERDOA AS NOSSAS DÍVIDAS ASSIM COMO NÓS PERDOAMOS AOS NOSSOS DEVEDORES. E NÃO NOS DEIXES CAIR EM TENTAÇÃO MAS LIVRA NOS DO MAL PORQUE TEU É O REINO E O PODER, E A GLÓRIA, PARA SEMPRE. AMÉM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PEGA A TUA PARTE', 'CORO\nPEGA A TUA PARTE, IRMÃO, A MESA ESTÁ BEM FARTA,\nPEGUE EM ABUNDÂNCIA POIS A TUA ESPERANÇA \nCRISTO NÃO DEIXOU MORRER;\nENCHA O TEU CELEIRO DE BÊNÇÃOS ESPIRITUAIS,\nDEIXA QUE TRANSBORDE, QUE DERRAME \nATÉ QUE SOBRE, BENÇÃOS \nNUNCA SÃO DE MAIS.\n\nA MESA PREPARADA EM NOSSA FRENTE, \nO ANJO COM A BANDEJA EM SUAS MÃOS, \nDOS CRENTES A CABEÇA É UNGIDA, \nBRASAS VIVAS QUEIMAM O CORAÇÃO;\nCRISTO A CADA UM VAI PERGUNTANDO: \n“QUE QUERES QUE TE FAÇA, MEU IRMÃO”? \nHOJE AS BÊNÇÃOS VÊM EM ABUNDÂNCIA,\nESTENDE A JESUS CRISTO A TUA MÃO.\n\nCORO\nPEGA A TUA PARTE, IRMÃO, A MESA ESTÁ BEM FARTA,\nPEGUE EM ABUNDÂNCIA POIS A TUA ESPERANÇA \nCRISTO NÃO DEIXOU MORRER;\nENCHA O TEU CELEIRO DE BÊNÇÃOS ESPIRITUAIS,\nDEIXA QUE TRANSBORDE, QUE DERRAME \nATÉ QUE SOBRE, BENÇÃOS \nNUNCA SÃO DE MAIS.\n\nO ALIMENTO DESTA FESTA É MUITO PURO, \nAS BÊNÇÃOS VÃO DE CURA À SALVAÇÃO, CEGOS, MUDOS, SURDOS E OPRIMIDOS RECEBEM NESTA FESTA PERFEIÇÃO; \nCRISTO A CADA UM VAI PERGUNTANDO:\n“QUE QUERES QUE TE FAÇA, MEU IRMÃO”? \nHOJE AS BÊNÇÃOS VÊM EM ABUNDÂNCIA, ESTENDE A JESUS CRISTO A TUA MÃO.\n\nCORO\nPEGA A TUA PARTE, IRMÃO, A MESA ESTÁ BEM FARTA,\nPEGUE EM ABUNDÂNCIA POIS A TUA ESPERANÇA \nCRISTO NÃO DEIXOU MORRER;\nENCHA O TEU CELEIRO DE BÊNÇÃOS ESPIRITUAIS,\nDEIXA QUE TRANSBORDE, QUE DERRAME \nATÉ QUE SOBRE, BENÇÃOS NUNCA SÃO DE MAIS.\nBIS', 'PEGA A TUA PARTE, IRMÃO, A MESA ESTÁ BEM FARTA, PEGUE EM ABUNDÂNCIA POIS A TUA ESPERANÇA CRISTO NÃO DEIXOU MORRER; ENCHA O TEU CELEIRO DE BÊNÇÃOS ESPIRITUAIS, DEIXA QUE TRANSBORDE, QUE DERRAME ATÉ QUE SOBRE, BENÇÃOS NUNCA SÃO DE MAIS. A MESA PREPARADA EM NOSSA FRENTE, O ANJO COM A BANDEJA EM SUAS MÃOS, DOS CRENTES A CABEÇA É UNGIDA, BRASAS VIVAS QUEIMAM O CORAÇÃO; CRISTO A CADA UM VAI PERGUNTANDO: QUE QUERES QUE TE FAÇA, MEU IRMÃO? HOJE AS BÊNÇÃOS VÊM EM ABUNDÂNCIA, ESTENDE A JESUS CRISTO A TUA MÃO. PEGA A TUA PARTE, IRMÃO, A MESA ESTÁ BEM FARTA, PEGUE EM ABUNDÂNCIA POIS A TUA ESPERANÇA CRISTO NÃO DEIXOU MORRER; ENCHA O TEU CELEIRO DE BÊNÇÃOS ESPIRITUAIS, DEIXA QUE TRANSBORDE, QUE DERRAME ATÉ QUE SOBRE, BENÇÃOS NUNCA SÃO DE MAIS. O ALIMENTO DESTA FESTA É MUITO PURO, AS BÊNÇÃOS VÃO DE CURA À SALVAÇÃO, CEGOS, MUDOS, SURDOS E OPRIMIDOS RECEBEM NESTA FESTA PERFEIÇÃO; CRISTO A CADA UM VAI PERGUNTANDO: QUE QUERES QUE TE FAÇA, MEU IRMÃO? HOJE AS BÊNÇÃOS VÊM EM ABUNDÂNCIA, ESTENDE A JESUS CRISTO A TUA MÃO. PEGA A TUA PARTE, IRMÃO, A MESA ESTÁ BEM FARTA, PEGUE EM ABUNDÂNCIA POIS A TUA ESPERANÇA CRISTO NÃO DEIXOU MORRER; ENCHA O TEU CELEIRO DE BÊNÇÃOS ESPIRITUAIS, DEIXA QUE TRANSBORDE, QUE DERRAME ATÉ QUE SOBRE, BENÇÃOS NUNCA SÃO DE MAIS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PELO VALE ESCURO', 'PELO VALE ESCURO, SEGUREI JESUS\nMAS POR TI SEGURO, VENDO A SUA LUZ.\nO MEU PASSO INCERTO, TU DIRIGIRÁS \nE AO SENTIR-TE PERTO, NUNCA PERCO A PAZ.\n\nOS ESPINHOS TANTOS, QUE NOS VEM SANGRAR\nSÃO REMÉDIOS SANTOS, PARA NOS CURAR\nONDE EXISTE A GRAÇA DO BONDOSO DEUS\nTUDO O QUE SE PASSA,NOS CONDUZ AO CÉU.\n\nNÃO HÁ DOR QUE SEJA, SEM DIVINO FIM\nFAZE Ó DEUS QUE A IGREJA, COMPREENDA ASSIM.\nE APESAR DAS TREVAS, POSSO VER SENHOR\nQUE TU MESMO A LEVAS COM IMENSO AMOR.\n\nBREVE A NOITE DESCE, NOITE DE EMAÚS\nE MEU SER CARECE DE TE VER JESUS\nCOMPANHEIRO AMIGO, AO MEU ALDO VEM\nFICA Ó DEUS COMIGO, INFINITO BEM.', 'PELO VALE ESCURO, SEGUREI JESUS MAS POR TI SEGURO, VENDO A SUA LUZ. O MEU PASSO INCERTO, TU DIRIGIRÁS E AO SENTIR-TE PERTO, NUNCA PERCO A PAZ. OS ESPINHOS TANTOS, QUE NOS VEM SANGRAR SÃO REMÉDIOS SANTOS, PARA NOS CURAR ONDE EXISTE A GRAÇA DO BONDOSO DEUS TUDO O QUE SE PASSA,NOS CONDUZ AO CÉU. NÃO HÁ DOR QUE SEJA, SEM DIVINO FIM FAZE Ó DEUS QUE A IGREJA, COMPREENDA ASSIM. E APESAR DAS TREVAS, POSSO VER SENHOR QUE TU MESMO A LEVAS COM IMENSO AMOR. BREVE A NOITE DESCE, NOITE DE EMAÚS E MEU SER CARECE DE TE VER JESUS COMPANHEIRO AMIGO, AO MEU ALDO VEM FICA Ó DEUS COMIGO, INFINITO BEM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PRIMEIRO QUERO VER MEU SALVADOR', 'NO CÉU HÁ MUITAS, MUITAS COISAS\nQUE EU ANSEIO VER,\nSUAS MIL BELEZAS, FAUSTO EXPLENDOR,\nMAS AO FRUIR DAS CELESTIAIS,\nMORADAS O PRAZER,\nPRIMEIRO QUERO VER MEU SALVADOR.\n\nCORO\nPRIMEIRO QUERO VER MEU SALVADOR,\nSIM, ANTES DOS REMIDOS AO REDOR,\nENTÃO POR LONGOS DIAS! \nQUE DOCES ALEGRIAS!\nEU QUERO VER PRIMEIRO O SALVADOR.\n\nAS RUAS DE OURO EU QUERO VER, E OS\nSEUS NÓVEIS PORTAIS, EU QUERO VER OS\nPASSOS CELESTIAIS, A ÁRVORE DA VIDA E \nO LINDO RIO DO SENHOR,\nPRIMEIRO QUERO VER MEU SALVADOR.\n\nCORO\nPRIMEIRO QUERO VER MEU SALVADOR,\nSIM, ANTES DOS REMIDOS AO REDOR,\nENTÃO POR LONGOS DIAS! \nQUE DOCES ALEGRIAS!\nEU QUERO VER PRIMEIRO O SALVADOR.\n\nEU QUERO VER OS IRMÃOS E ESTAR COM\nELES NOS JARDINS, E OS DIAS IDOS\nLEMBRAREI COM AMOR, QUERIDOS QUERO\nVER OS QUAIS PARTIRAM ANTES SIM,\nMAS QUERO VER PRIMEIRO O SALVADOR.\n\nCORO\nPRIMEIRO QUERO VER MEU SALVADOR,\nSIM, ANTES DOS REMIDOS AO REDOR,\nENTÃO POR LONGOS DIAS! \nQUE DOCES ALEGRIAS!\nEU QUERO VER PRIMEIRO O SALVADOR.', 'NO CÉU HÁ MUITAS, MUITAS COISAS QUE EU ANSEIO VER, SUAS MIL BELEZAS, FAUSTO EXPLENDOR, MAS AO FRUIR DAS CELESTIAIS, MORADAS O PRAZER, PRIMEIRO QUERO VER MEU SALVADOR. PRIMEIRO QUERO VER MEU SALVADOR, SIM, ANTES DOS REMIDOS AO REDOR, ENTÃO POR LONGOS DIAS! QUE DOCES ALEGRIAS! EU QUERO VER PRIMEIRO O SALVADOR. AS RUAS DE OURO EU QUERO VER, E OS SEUS NÓVEIS PORTAIS, EU QUERO VER OS PASSOS CELESTIAIS, A ÁRVORE DA VIDA E O LINDO RIO DO SENHOR, PRIMEIRO QUERO VER MEU SALVADOR. PRIMEIRO QUERO VER MEU SALVADOR, SIM, ANTES DOS REMIDOS AO REDOR, ENTÃO POR LONGOS DIAS! QUE DOCES ALEGRIAS! EU QUERO VER PRIMEIRO O SALVADOR. EU QUERO VER OS IRMÃOS E ESTAR COM ELES NOS JARDINS, E OS DIAS IDOS LEMBRAREI COM AMOR, QUERIDOS QUERO VER OS QUAIS PARTIRAM ANTES SIM, MAS QUERO VER PRIMEIRO O SALVADOR. PRIMEIRO QUERO VER MEU SALVADOR, SIM, ANTES DOS REMIDOS AO REDOR, ENTÃO POR LONGOS DIAS! QUE DOCES ALEGRIAS! EU QUERO VER PRIMEIRO O SALVADOR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'QUANDO CHEGO EM TUA CASA', 'QUANDO CHEGO EM TUA CASA\nDOBRO OS MEUS JOELHOS, \nCOMEÇO A ORAR, SINTO ALGO \nTÃO DIVINO, TÃO MARAVILHOSO, \nCOMEÇO A CHORAR, SINTO UM \nCALOR TÃO FORTE QUE VAI \nAQUECENDO O MEU CORAÇÃO, \nSEI QUE É O MEU JESUS E \nJÁ OUVIU MINHA ORAÇÃO.\n\nCORO \nJESUS, VEM TOCAR EM MINHA VIDA\nTRAZENDO UM POUCO DE ALEGRIA\nPARA ESTE POBRE, POBRE CORAÇÃO;\nJESUS, PELA FÉ AGORA EU VEJO\nO ANJO TRAZENDO A VITÓRIA E \nELE ENTREGA EM MINHAS MÃOS.\n\nSE ESTÁ AMARGURADO,\nSE ESTÁ CANSADO DE TANTO SOFRER,\nSUAS FORÇAS JÁ SE FORAM,\nVOCÊ ATÉ PENSA QUE NÃO VAI VENCER,\nLEVANTE SEUS OLHOS AGORA,\nVEJA A VITÓRIA PERTO DE VOCÊ, \nJESUS CRISTO ESTÁ AQUI E ESTÁ \nDIZENDO: VOCÊ VAI VENCER.\n\nCORO \nJESUS, VEM TOCAR EM MINHA VIDA\nTRAZENDO UM POUCO DE ALEGRIA\nPARA ESTE POBRE, POBRE CORAÇÃO;\nJESUS, PELA FÉ AGORA EU VEJO\nO ANJO TRAZENDO A VITÓRIA E \nELE ENTREGA EM MINHAS MÃOS.\nO ANJO TRAZENDO A VITÓRIA E \nELE ENTREGA EM MINHAS MÃOS.', 'QUANDO CHEGO EM TUA CASA DOBRO OS MEUS JOELHOS, COMEÇO A ORAR, SINTO ALGO TÃO DIVINO, TÃO MARAVILHOSO, COMEÇO A CHORAR, SINTO UM CALOR TÃO FORTE QUE VAI AQUECENDO O MEU CORAÇÃO, SEI QUE É O MEU JESUS E JÁ OUVIU MINHA ORAÇÃO. SE ESTÁ AMARGURADO, SE ESTÁ CANSADO DE TANTO SOFRER, SUAS FORÇAS JÁ SE FORAM, VOCÊ ATÉ PENSA QUE NÃO VAI VENCER, LEVANTE SEUS OLHOS AGORA, VEJA A VITÓRIA PERTO DE VOCÊ, JESUS CRISTO ESTÁ AQUI E ESTÁ DIZENDO: VOCÊ VAI VENCER.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'QUANDO ENTREI NESTE LUGAR', 'QUANDO ENTREI NESTE LUGAR, \nSENTI SUA PRESENÇA\nEU SABIA AQUI É O LUGAR, \nONDE HABITA O AMOR.\n\nPOIS ESTE É O TEMPLO DE DEUS, \nJEOVÁ AMADO.\nNÓS ESTAMOS EM SUA PRESENÇA \nEM SANTO LUGAR.\n\nNÓS ESTAMOS EM SANTO LUGAR,\nE POSSO SENTIR AQUI HÁ ANJOS AO REDOR.\nVAMOS ADORAR A JESUS AGORA,\nESTAMOS REUNIDOS EM SUA\nPRESENÇA EM SANTO LUGAR.\n\nNA PRESENÇA DO SENHOR HÁ GOZO IMENSO, \nE A SEUS PÉS A PAZ DA ALMA ENCONTRARÁS.\n\nSE ESTÁS EM DÚVIDA, EU SEI \nSÓ ELE É A RESPOSTA.\nNÓS ESTAMOS EM SUA PRESENÇA \nEM SANTO LUGAR.\n\nNÓS ESTAMOS EM SANTO LUGAR\nE POSSO SENTIR AQUI HÁ ANJOS AO REDOR,\nVAMOS ADORAR A JESUS AGORA, \nESTAMOS REUNIDOS EM SUA PRESENÇA, \nEM SANTO LUGAR.\n\nNÓS ESTAMOS EM SANTO LUGAR\nE POSSO SENTIR AQUI HÁ ANJOS AO REDOR\nVAMOS ADORAR A JESUS AGORA.\nESTAMOS REUNIDOS EM SUA\nPRESENÇA, EM SANTO LUGAR.\n\n3X', 'QUANDO ENTREI NESTE LUGAR, SENTI SUA PRESENÇA EU SABIA AQUI É O LUGAR, ONDE HABITA O AMOR. POIS ESTE É O TEMPLO DE DEUS, JEOVÁ AMADO. NÓS ESTAMOS EM SUA PRESENÇA EM SANTO LUGAR. NÓS ESTAMOS EM SANTO LUGAR, E POSSO SENTIR AQUI HÁ ANJOS AO REDOR. VAMOS ADORAR A JESUS AGORA, ESTAMOS REUNIDOS EM SUA PRESENÇA EM SANTO LUGAR. NA PRESENÇA DO SENHOR HÁ GOZO IMENSO, E A SEUS PÉS A PAZ DA ALMA ENCONTRARÁS. SE ESTÁS EM DÚVIDA, EU SEI SÓ ELE É A RESPOSTA. NÓS ESTAMOS EM SUA PRESENÇA EM SANTO LUGAR. NÓS ESTAMOS EM SANTO LUGAR E POSSO SENTIR AQUI HÁ ANJOS AO REDOR, VAMOS ADORAR A JESUS AGORA, ESTAMOS REUNIDOS EM SUA PRESENÇA, EM SANTO LUGAR. NÓS ESTAMOS EM SANTO LUGAR E POSSO SENTIR AQUI HÁ ANJOS AO REDOR VAMOS ADORAR A JESUS AGORA. ESTAMOS REUNIDOS EM SUA PRESENÇA, EM SANTO LUGAR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'QUEM SÃO ESTES DE BRANCOS VESTIDOS?', 'QUEM SÃO ESTES \nDE BRANCOS VESTIDOS?  \nESTES SÃO OS QUE LAVARAM \nNO SANGUE DE JESUS\nSEUS VESTIDOS, SEUS VESTIDOS.\nBIS\nBIS\n\nPOR ISSO ESTÃO PERANTE \nO TRONO DIZENDO:\nSEJAM DADOS GLÓRIA,\nFORÇA E PODER AO NOSSO\nDEUS PARA TODO O SEMPRE.\nBIS\n\nFOME E SEDE JAMAIS SUAS ALMAS TERÃO,\nA SOMBRA DO CORDEIRO OS COBRIRÁ;\nA MANSÃO DOS FIÉIS VOSSA CERTA SERÁ\nE TODA A LÁGRIMA DEUS LIMPARÁ,\nTODA A LÁGRIMA DEUS LIMPARÁ,\nTODA A LÁGRIMA DEUS LIMPARÁ.', 'QUEM SÃO ESTES DE BRANCOS VESTIDOS? ESTES SÃO OS QUE LAVARAM NO SANGUE DE JESUS SEUS VESTIDOS, SEUS VESTIDOS. POR ISSO ESTÃO PERANTE O TRONO DIZENDO: SEJAM DADOS GLÓRIA, FORÇA E PODER AO NOSSO DEUS PARA TODO O SEMPRE. FOME E SEDE JAMAIS SUAS ALMAS TERÃO, A SOMBRA DO CORDEIRO OS COBRIRÁ; A MANSÃO DOS FIÉIS VOSSA CERTA SERÁ E TODA A LÁGRIMA DEUS LIMPARÁ, TODA A LÁGRIMA DEUS LIMPARÁ, TODA A LÁGRIMA DEUS LIMPARÁ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'REFÚGIO VERDADEIRO', 'SEGURO ESTOU, \nNÃO TENHO TEMOR DO MAL, \nSIM GUARDADO PELA FÉ.\nEM MEU JESUS NÃO POSSO DUVIDAR\nDESSE AMOR LEAL, ELE EM SEU CAMINHO\nSEMPRE ME CONDUZ.\n\nNÃO ME DEIXARÁ, MAS ME ABRIGARÁ.\nDO PECADO VIL ME VEM LIVRAR.\nA SUA GRAÇA NÃO ME RECUSARÁ.\nSIM, JESUS É QUEM ME PODE SUSTENTAR\n\nNO PODER DE CRISTO, O MESTRE,\nMINHA VIDA SALVA ESTÁ!\nDO PERIGO QUE CERCÁ-LA, \nELE PODERÁ LIVRÁ-LA, SEU PODER ETERNO\nSEMPRE A SUSTERÁ.\n\nABRIGO ETERNO TENHO NO SALVADOR\nELE ESCONDE A MINHA VIDA \nEM SEU PODER EU RECEAR \nNÃO POSSO DO MALFEITOR \nQUE PROCURA PERTINAZ \nME ENFRAQUECER CONFIADO \nENTÃO NESSA PROTEÇÃO SIGO \nA CRISTO E QUERO SER FIEL \nNA MINHA VIDA CHEIO \nDE GRATIDÃO SIM, \nA MEU SENHOR E REI EMANUEL.\n\nNO PODER DE CRISTO, O MESTRE,\nMINHA VIDA SALVA ESTÁ!\nDO PERIGO QUE CERCÁ-LA, \nELE PODERÁ LIVRÁ-LA, SEU PODER ETERNO\nSEMPRE A SUSTERÁ.\n\nPERIGO ALGUM ME PODE CAUSAR TEMOR, \nPOIS MEU SALVADOR NÃO ME ABANDONARÁ \nCOM SUA PROTEÇÃO E COM SEU AMOR, \nDIRIGINDO MINHA VIDA ELE ESTARÁ \nNUNCA O DEIXAREI, MAS  FIEL SEREI, \nSEMPRE FIRME CHEIO DE FERVOR\nA CRISTO REDENTOR, MEU SENHOR E REI, \nEU ME ENTREGAREI, FIRMADO EM SEU AMOR.\n\nNO PODER DE CRISTO O MESTRE\nMINHA VIDA SALVA ESTÁ! \nDO PERIGO QUE CERCÁ-LA\nELE PODERÁ LIVRÁ-LA\nSEU PODER ETERNO\nSEMPRE A SUSTERÁ.', 'SEGURO ESTOU, NÃO TENHO TEMOR DO MAL, SIM GUARDADO PELA FÉ. EM MEU JESUS NÃO POSSO DUVIDAR DESSE AMOR LEAL, ELE EM SEU CAMINHO SEMPRE ME CONDUZ. NÃO ME DEIXARÁ, MAS ME ABRIGARÁ. DO PECADO VIL ME VEM LIVRAR. A SUA GRAÇA NÃO ME RECUSARÁ. SIM, JESUS É QUEM ME PODE SUSTENTAR NO PODER DE CRISTO, O MESTRE, MINHA VIDA SALVA ESTÁ! DO PERIGO QUE CERCÁ-LA, ELE PODERÁ LIVRÁ-LA, SEU PODER ETERNO SEMPRE A SUSTERÁ. ABRIGO ETERNO TENHO NO SALVADOR ELE ESCONDE A MINHA VIDA EM SEU PODER EU RECEAR NÃO POSSO DO MALFEITOR QUE PROCURA PERTINAZ ME ENFRAQUECER CONFIADO ENTÃO NESSA PROTEÇÃO SIGO A CRISTO E QUERO SER FIEL NA MINHA VIDA CHEIO DE GRATIDÃO SIM, A MEU SENHOR E REI EMANUEL. NO PODER DE CRISTO, O MESTRE, MINHA VIDA SALVA ESTÁ! DO PERIGO QUE CERCÁ-LA, ELE PODERÁ LIVRÁ-LA, SEU PODER ETERNO SEMPRE A SUSTERÁ. PERIGO ALGUM ME PODE CAUSAR TEMOR, POIS MEU SALVADOR NÃO ME ABANDONARÁ COM SUA PROTEÇÃO E COM SEU AMOR, DIRIGINDO MINHA VIDA ELE ESTARÁ NUNCA O DEIXAREI, MAS FIEL SEREI, SEMPRE FIRME CHEIO DE FERVOR A CRISTO REDENTOR, MEU SENHOR E REI, EU ME ENTREGAREI, FIRMADO EM SEU AMOR. NO PODER DE CRISTO O MESTRE MINHA VIDA SALVA ESTÁ! DO PERIGO QUE CERCÁ-LA ELE PODERÁ LIVRÁ-LA SEU PODER ETERNO SEMPRE A SUSTERÁ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SABE FILHO', 'SABE, FILHO, QUERO FALAR COM VOCÊ,\nTENHO VISTO TEU LAMENTO, TUA DOR,\nVOCÊ DIZ: SENHOR NÃO VOU SUPORTAR,\nPOIS A LUTA É TÃO GRANDE,\nESTOU QUASE A DESANIMAR.\n\nOLHA, FILHO, TU JÁ LESTE MINHA HISTÓRIA,\nQUE EU DEIXEI UM TRONO DE GLÓRIA,\nPRA MORRER POR TI,\nLÁ NA RUA CENTRAL DE JERUSALÉM,\nCADA PASSO QUE EU DAVA,\nA MARCA DO MEU SANGUE FICAVA TAMBÉM.\n\nUMA COROA DE ESPINHOS ME COLOCARAM,\nE COM CRAVOS PONTIAGUDOS\nNAQUELA CRUZ ME PREGARAM,\nUMA LANÇA AFIADA ME TRANSPASSOU,\nNESSA HORA DE AGONIA,\nATÉ O MEU PAI ME DESAMPAROU.\nBIS\n\nNESSA HORA, MEUS AMIGOS ME DESPREZARAM,\nATÉ PEDRO, POR TRÊS VEZES ME NEGOU,\nLÁZARO, O AMIGO QUE RESSUSCITEI,\nFUI POR ELE DESPREZADO E POR TODOS QUE AMEI;\nTUDO ISSO EU PASSEI POR TE AMAR,\nPRA QUE HOJE EU PUDESSE TE ENTENDER.\n\nTEUS PROBLEMAS TODOS POSSO RESOLVER,\nBASTA SOMENTE CRER,\nQUE A SOLUÇÃO JÁ CHEGOU PRA VOCÊ,\nSE ESTÁS DOENTE, EU SOU O TEU REMÉDIO,\nSE ESTÁS CANSADO, EU POSSO TE ALIVIAR.\n\nEU VENCI, VOCÊ TAMBÉM VENCERÁ,\nSOU JESUS CRISTO, \nO ÚNICO QUE PODE TE AJUDAR;\nEU VENCI, VOCÊ TAMBÉM VENCERÁ,\nSOU JESUS CRISTO, \nO VERDADEIRO FILHO DE DEUS.', 'SABE, FILHO, QUERO FALAR COM VOCÊ, TENHO VISTO TEU LAMENTO, TUA DOR, VOCÊ DIZ: SENHOR NÃO VOU SUPORTAR, POIS A LUTA É TÃO GRANDE, ESTOU QUASE A DESANIMAR. OLHA, FILHO, TU JÁ LESTE MINHA HISTÓRIA, QUE EU DEIXEI UM TRONO DE GLÓRIA, PRA MORRER POR TI, LÁ NA RUA CENTRAL DE JERUSALÉM, CADA PASSO QUE EU DAVA, A MARCA DO MEU SANGUE FICAVA TAMBÉM. UMA COROA DE ESPINHOS ME COLOCARAM, E COM CRAVOS PONTIAGUDOS NAQUELA CRUZ ME PREGARAM, UMA LANÇA AFIADA ME TRANSPASSOU, NESSA HORA DE AGONIA, ATÉ O MEU PAI ME DESAMPAROU. NESSA HORA, MEUS AMIGOS ME DESPREZARAM, ATÉ PEDRO, POR TRÊS VEZES ME NEGOU, LÁZARO, O AMIGO QUE RESSUSCITEI, FUI POR ELE DESPREZADO E POR TODOS QUE AMEI; TUDO ISSO EU PASSEI POR TE AMAR, PRA QUE HOJE EU PUDESSE TE ENTENDER. TEUS PROBLEMAS TODOS POSSO RESOLVER, BASTA SOMENTE CRER, QUE A SOLUÇÃO JÁ CHEGOU PRA VOCÊ, SE ESTÁS DOENTE, EU SOU O TEU REMÉDIO, SE ESTÁS CANSADO, EU POSSO TE ALIVIAR. EU VENCI, VOCÊ TAMBÉM VENCERÁ, SOU JESUS CRISTO, O ÚNICO QUE PODE TE AJUDAR; EU VENCI, VOCÊ TAMBÉM VENCERÁ, SOU JESUS CRISTO, O VERDADEIRO FILHO DE DEUS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SANSÃO', 'SANSÃO ERA UM MENINO NAZIREU\nPARA LIVRAR SEUS PAIS DAS MÃOS DOS FILISTEUS.\nO MENINO FICOU GRANDE E O SENHOR \nO ABENÇOOU.\nE VIVIA IMPELIDO PELO ESPÍRITO DO SENHOR.\n\nSANSÃO MATOU UM LEÃO À MÃO DESARMADA.\nE MATOU TAMBÉM MIL HOMENS COM\nUMA QUEIXADA.\nE COM TREZENTAS RAPOSAS FEZ UMA \nGRANDE QUEIMADA,\nMAS FICOU UMA RAPOSINHA NO SEU\nPEITO ENCERRADA.\n\nO NOME DA RAPOSINHA CHAMA-SE PAIXÃO.\nPOIS ELA TEM DERROTADO MUITOS IRMÃOS.\nSANSÃO ENXERGOU DALILA E LOGO\nFOI DERROTADO.\nBRINCOU DE SER AMARRADO E FICOU\nMESMO AMARRADO.\n\nSERVAS\n\nO SEGREDO DO PODER ESTAVA NO CABELO.\nE POR UMA PAIXÃO CARNAL ELE \nPERDEUO ZELO. E ACABOU \nREVELANDO O SEGREDO DO SENHOR. \nFOI LEVADO AO CATIVEIRO E \nOS OLHOS LHE CUSTOU.\n\nVARÕES\n\nSEM OS OLHOS E CABELOS E AINDA\nAMARRADO, TRABALHAVA COMO ESCRAVO\nE ERA TORTURADO.\nMAS UM DIA ELE SENTIU O CABELO A CRESCER, \nPERCEBEU QUE SUA FÉ ESTAVA A REVIVER.\n\nFOI LEVADO PRÁ BRINCAR DIANTE DOS FILISTEUS.\nMAS JÁ TINHA O CORAÇÃO VOLTADO PARA DEUS.\nLEVANTOU A SUA VOZ E DISSE: Ó GRANDE\nDEUS, ESFORÇA-TE SÓ ESTA VEZ, \nMORRA EU COM OS FILISTEUS.', 'SANSÃO ERA UM MENINO NAZIREU PARA LIVRAR SEUS PAIS DAS MÃOS DOS FILISTEUS. O MENINO FICOU GRANDE E O SENHOR O ABENÇOOU. E VIVIA IMPELIDO PELO ESPÍRITO DO SENHOR. SANSÃO MATOU UM LEÃO À MÃO DESARMADA. E MATOU TAMBÉM MIL HOMENS COM UMA QUEIXADA. E COM TREZENTAS RAPOSAS FEZ UMA GRANDE QUEIMADA, MAS FICOU UMA RAPOSINHA NO SEU PEITO ENCERRADA. O NOME DA RAPOSINHA CHAMA-SE PAIXÃO. POIS ELA TEM DERROTADO MUITOS IRMÃOS. SANSÃO ENXERGOU DALILA E LOGO FOI DERROTADO. BRINCOU DE SER AMARRADO E FICOU MESMO AMARRADO. O SEGREDO DO PODER ESTAVA NO CABELO. E POR UMA PAIXÃO CARNAL ELE PERDEUO ZELO. E ACABOU REVELANDO O SEGREDO DO SENHOR. FOI LEVADO AO CATIVEIRO E OS OLHOS LHE CUSTOU. SEM OS OLHOS E CABELOS E AINDA AMARRADO, TRABALHAVA COMO ESCRAVO E ERA TORTURADO. MAS UM DIA ELE SENTIU O CABELO A CRESCER, PERCEBEU QUE SUA FÉ ESTAVA A REVIVER. FOI LEVADO PRÁ BRINCAR DIANTE DOS FILISTEUS. MAS JÁ TINHA O CORAÇÃO VOLTADO PARA DEUS. LEVANTOU A SUA VOZ E DISSE: Ó GRANDE DEUS, ESFORÇA-TE SÓ ESTA VEZ, MORRA EU COM OS FILISTEUS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SANTO, DEUS DOS EXÉRCITOS', 'SANTO, SANTO, SANTO, \nDEUS DOS EXÉRCITOS\nOS CÉUS E A TERRA ESTÃO CHEIOS\nDA TUA GLÓRIA.\nBIS\n\nHOSANA, HOSANA, HOSANA \nNAS ALTURAS,\nBENDITO O QUE VEM EM NOME \nDO SENHOR BENDITO, \nBENDITO SENHOR.\n\nSERVAS\n\nHOSANA (VARÕES)\nHOSANA, HOSANA, NAS ALTURAS.', 'SANTO, SANTO, SANTO, DEUS DOS EXÉRCITOS OS CÉUS E A TERRA ESTÃO CHEIOS DA TUA GLÓRIA. HOSANA, HOSANA, HOSANA NAS ALTURAS, BENDITO O QUE VEM EM NOME DO SENHOR BENDITO, BENDITO SENHOR. HOSANA HOSANA, HOSANA, NAS ALTURAS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SEI QUE ÉS FIEL, JESUS', 'NUM ATO TEU SENHOR, \nVEJO A GRANDEZA DESTE TEU\nAMOR, QUE É PURO E SUAVE, \nME TORNANDO MAIS FELIZ.\nNUMA PALAVRA TUA, \nSINTO TUDO RESOLVER, \nTU FAZES O IMPOSSÍVEL PARA \nME FAZER VENCER.\n\nEU SEI QUE NÃO MEREÇO\nMAS SABES QUE CAREÇO\nDESTE TEU AMOR,\nQUE ME FAZ UM VENCEDOR!\nSEI QUE ÉS FIEL, JESUS\n\nINSTRUMENTOS\n\nVARÕES\n\nNUM ATO TEU SENHOR, \nVEJO A GRANDEZA DESTE TEU\nAMOR, QUE É PURO E SUAVE, \nME TORNANDO MAIS FELIZ.\nNUMA PALAVRA TUA, \nSINTO TUDO RESOLVER, \nTU FAZES O IMPOSSÍVEL PARA \nME FAZER VENCER.\n\nEU SEI QUE NÃO MEREÇO\nMAS SABES QUE CAREÇO\nDESTE TEU AMOR,\nQUE ME FAZ UM VENCEDOR!\nSEI QUE ÉS FIEL, JESUS\n\nVARÕES\n\nCORO (2X)\nSEI QUE ÉS FIEL, JESUS\n(E É GRANDE O TEU AMOR) VARÕES\nSEI QUE ÉS FIEL, JESUS\nSEI QUE ÉS FIEL!\n\nINSTRUMENTOS\n\nTODAS TUAS PROMESSAS FEITAS PARA MIM, \nEM BREVE TODAS ELAS EU VEREI CUMPRIR, POIS, \nO FUTURO É UM SEGREDO QUE \nTU GUARDAS E PERTENCE SÓ A TI.\n\nELEVO TOTALMENTE  MINHA GRATIDÃO, POIS, \nMEU LOUVOR É FRUTO TAMBÉM DESTE AMOR, \nE SEI QUE ESTOU GUARDADO \nEM TEU CORAÇÃO, \nNA TUA MEMÓRIA SENHOR.\n\nCORO (2X)\nSEI QUE ÉS FIEL, JESUS\n(E É GRANDE O TEU AMOR) VARÕES\nSEI QUE ÉS FIEL, JESUS\nSEI QUE ÉS FIEL!', 'NUM ATO TEU SENHOR, VEJO A GRANDEZA DESTE TEU AMOR, QUE É PURO E SUAVE, ME TORNANDO MAIS FELIZ. NUMA PALAVRA TUA, SINTO TUDO RESOLVER, TU FAZES O IMPOSSÍVEL PARA ME FAZER VENCER. EU SEI QUE NÃO MEREÇO MAS SABES QUE CAREÇO DESTE TEU AMOR, QUE ME FAZ UM VENCEDOR! SEI QUE ÉS FIEL, JESUS NUM ATO TEU SENHOR, VEJO A GRANDEZA DESTE TEU AMOR, QUE É PURO E SUAVE, ME TORNANDO MAIS FELIZ. NUMA PALAVRA TUA, SINTO TUDO RESOLVER, TU FAZES O IMPOSSÍVEL PARA ME FAZER VENCER. EU SEI QUE NÃO MEREÇO MAS SABES QUE CAREÇO DESTE TEU AMOR, QUE ME FAZ UM VENCEDOR! SEI QUE ÉS FIEL, JESUS SEI QUE ÉS FIEL, JESUS (E É GRANDE O TEU AMOR) VARÕES SEI QUE ÉS FIEL, JESUS SEI QUE ÉS FIEL! TODAS TUAS PROMESSAS FEITAS PARA MIM, EM BREVE TODAS ELAS EU VEREI CUMPRIR, POIS, O FUTURO É UM SEGREDO QUE TU GUARDAS E PERTENCE SÓ A TI. ELEVO TOTALMENTE MINHA GRATIDÃO, POIS, MEU LOUVOR É FRUTO TAMBÉM DESTE AMOR, E SEI QUE ESTOU GUARDADO EM TEU CORAÇÃO, NA TUA MEMÓRIA SENHOR. SEI QUE ÉS FIEL, JESUS (E É GRANDE O TEU AMOR) VARÕES SEI QUE ÉS FIEL, JESUS SEI QUE ÉS FIEL!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'VOZES LINDAS NUNCA OUVIDAS', 'VOZES LINDAS NUNCA OUVIDAS,\nVEM DESCENDO DAS ALTURAS,\nONDE OS ANJOS CANTAM GLÓRIA, \nAO NOSSO CRIADOR.\n\nHARMONIAS SANTAS VIBRAM NOS RENCANTOS,\nDAS CELESTIAIS MANSÕES,\nE NA TERRA ECÔA, COM DULÇOR IMENSO,\nESSE CORO CELESTIAL.\n\nVOZES LINDAS NUNCA OUVIDAS,\nVEM DESCENDO DAS ALTURAS,\nONDE OS ANJOS CANTAM GLÓRIA, \nAO NOSSO CRIADOR.\n\nHARMONIAS SANTAS VIBRAM NOS RENCANTOS,\nDAS CELESTIAIS MANSÕES,\nE NA TERRA ECÔA, COM DULÇOR IMENSO,\nESSE CORO CELESTIAL.\n\nDEUS OFERECE AO PECADOR,\nPOR MEIO DO SEU FILHO,\nSALVAÇÃO DE GRAÇA, NUNCA MERECIDA,\nCRISTO PELA CRUZ VIDA ETERNA TRAZ,\nGLÓRIA A DEUS PELA REDENÇÃO DO PECADOR,\nGLÓRIA A DEUS PORQUE REUNIU \nOS FILHOS SEUS.\n\nGRANDES FORAM AS TRANSGRESSÕES,\nCOMETIDAS PELO PECADOR,\nSÓ O AMOR DO BONDOSO DEUS,\nPODE AS CULPAS NOS RELEVAR,\nPERDOADOS E ARREPENDIDOS,\nLIBERTADOS, POIS, DE TODO MAL,\nPERTO DE JESUS, NOSSO SALVADOR,\nGOZAREMOS DOCE PAZ.\n\nPORTANTO A DEUS SEJAMOS GRATOS,\nO SEU AMADO FILHO HONREMOS,\nDANDO AO SANTO ESPÍRITO LOUVOR,\nETERNAMENTE AMÉM!\nGLÓRIA, GLÓRIA A DEUS,\nDANDO AO SANTO ESPÍRITO LOUVOR,\nETERNAMENTE AMÉM! GLÓRIA, \nGLÓRIA A DEUS! ETERNAMENTE AMÉM!\nGLÓRIA A DEUS! \nAMÉM! (4X)', 'VOZES LINDAS NUNCA OUVIDAS, VEM DESCENDO DAS ALTURAS, ONDE OS ANJOS CANTAM GLÓRIA, AO NOSSO CRIADOR. HARMONIAS SANTAS VIBRAM NOS RENCANTOS, DAS CELESTIAIS MANSÕES, E NA TERRA ECÔA, COM DULÇOR IMENSO, ESSE CORO CELESTIAL. VOZES LINDAS NUNCA OUVIDAS, VEM DESCENDO DAS ALTURAS, ONDE OS ANJOS CANTAM GLÓRIA, AO NOSSO CRIADOR. HARMONIAS SANTAS VIBRAM NOS RENCANTOS, DAS CELESTIAIS MANSÕES, E NA TERRA ECÔA, COM DULÇOR IMENSO, ESSE CORO CELESTIAL. DEUS OFERECE AO PECADOR, POR MEIO DO SEU FILHO, SALVAÇÃO DE GRAÇA, NUNCA MERECIDA, CRISTO PELA CRUZ VIDA ETERNA TRAZ, GLÓRIA A DEUS PELA REDENÇÃO DO PECADOR, GLÓRIA A DEUS PORQUE REUNIU OS FILHOS SEUS. GRANDES FORAM AS TRANSGRESSÕES, COMETIDAS PELO PECADOR, SÓ O AMOR DO BONDOSO DEUS, PODE AS CULPAS NOS RELEVAR, PERDOADOS E ARREPENDIDOS, LIBERTADOS, POIS, DE TODO MAL, PERTO DE JESUS, NOSSO SALVADOR, GOZAREMOS DOCE PAZ. PORTANTO A DEUS SEJAMOS GRATOS, O SEU AMADO FILHO HONREMOS, DANDO AO SANTO ESPÍRITO LOUVOR, ETERNAMENTE AMÉM! GLÓRIA, GLÓRIA A DEUS, DANDO AO SANTO ESPÍRITO LOUVOR, ETERNAMENTE AMÉM! GLÓRIA, GLÓRIA A DEUS! ETERNAMENTE AMÉM! GLÓRIA A DEUS! AMÉM!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SALVO DE GRAÇA', 'SALVOS DE GRAÇA POR JESUS, \nVIVO FELIZ  NA SUA LUZ.\nSEI QUE POR MINHA SALVAÇÃO, \nELE PAGOU A REMISSÃO.\n\nCORO\nQUERO COM CRISTO SEMPRE ANDAR, \nGRATO LOUVOR A DEUS CANTAR.\nCRISTO É O AMIGO SEM IGUAL, \nGUIA-ME AO LAR CELESTIAL.\n\nQUANTO ME AGRADA A DEUS SERVIR,\nHOJE NA LUTA OU NO PORVIR.\nSEU EVANGELHO VIDA TRAZ, \nGOZO PERFEITO E SANTA PAZ.\n\nCORO\nQUERO COM CRISTO SEMPRE ANDAR, \nGRATO LOUVOR A DEUS CANTAR.\nCRISTO É O AMIGO SEM IGUAL, \nGUIA-ME AO LAR CELESTIAL.\n\nQUERO SEGUIR MEU SALVADOR,\nSEMPRE LOUVAR O SEU AMOR.\nQUANDO O LABOR AQUI FINDAR,\nVOU COM JESUS NO CÉU MORAR.\n\nCORO\nQUERO COM CRISTO SEMPRE ANDAR, \nGRATO LOUVOR A DEUS CANTAR.\nCRISTO É O AMIGO SEM IGUAL, \nGUIA-ME AO LAR CELESTIAL.', 'SALVOS DE GRAÇA POR JESUS, VIVO FELIZ NA SUA LUZ. SEI QUE POR MINHA SALVAÇÃO, ELE PAGOU A REMISSÃO. QUERO COM CRISTO SEMPRE ANDAR, GRATO LOUVOR A DEUS CANTAR. CRISTO É O AMIGO SEM IGUAL, GUIA-ME AO LAR CELESTIAL. QUANTO ME AGRADA A DEUS SERVIR, HOJE NA LUTA OU NO PORVIR. SEU EVANGELHO VIDA TRAZ, GOZO PERFEITO E SANTA PAZ. QUERO COM CRISTO SEMPRE ANDAR, GRATO LOUVOR A DEUS CANTAR. CRISTO É O AMIGO SEM IGUAL, GUIA-ME AO LAR CELESTIAL. QUERO SEGUIR MEU SALVADOR, SEMPRE LOUVAR O SEU AMOR. QUANDO O LABOR AQUI FINDAR, VOU COM JESUS NO CÉU MORAR. QUERO COM CRISTO SEMPRE ANDAR, GRATO LOUVOR A DEUS CANTAR. CRISTO É O AMIGO SEM IGUAL, GUIA-ME AO LAR CELESTIAL.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SE CONFESSARMOS OS NOSSOS PECADOS', 'SE CONFESSARMOS OS NOSSOS PECADOS, \nELE É FIEL E JUSTO,\nPARA NOS PERDOAR OS PECADOS\nE NOS PURIFICAR DE TODA A INJUSTIÇA.\nREPETIR O LOUVOR', 'SE CONFESSARMOS OS NOSSOS PECADOS, ELE É FIEL E JUSTO, PARA NOS PERDOAR OS PECADOS E NOS PURIFICAR DE TODA A INJUSTIÇA.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PENDURADO NO MADEIRO', 'PENDURADO NO MADEIRO,\nÓ JESUS QUISESTE ASSIM.\nRESGATAR DO CATIVEIRO,\nE PROVAR-ME AMOR SEM FIM!\nO TEU SANGUE FOI VERTIDO,\nEXPIRAS-TE, Ó MEU JESUS,\nE FICOU POR TI CUMPRIDO\nMEU RESGATE SOBRE A CRUZ!\n\nNESSE SANGUE QUE VERTESTE,\nPURIFICA-ME SENHOR!\nFOI POR MIM QUE TU MORRESTE:\nSÊ PROPÍCIO AO PECADOR!\nSÊ PROPÍCIO AO DESPREZADO,\nSOB A DOR DA MALDIÇÃO,\nDO ABISMO DO PECADO\nA LUTAR NA ESCURIDÃO!\n\nQUERO A TI, JESUS BENDITO,\nMINHA FRONTE LEVANTAR:\nMAS NÃO POSSO, RÉU, AFLITO,\nTUA GLÓRIA CONTEMPLAR!\nPECADOR, NUNCA ESPERES\nDE JESUS NO REINO ENTRAR.\nEU BEM SEI, MAS, SE QUISERES, \nBEM ME PODES RESGATAR!\n\n“VINDE A MIM!” JESUS CONVIDA,\nJÁ TÃO MANSO O CORAÇÃO!\nJÁ, DA FÉ NA CHAMA BRILHA\nO PENHOR DA SALVAÇÃO!\nEI-LO ALI NA CRUZ PREGADO;\nCHAMA A TODO O PECADOR.\nA LIMPAR O SEU PECADO\nNESSE SANGUE EXPIADOR.', 'PENDURADO NO MADEIRO, Ó JESUS QUISESTE ASSIM. RESGATAR DO CATIVEIRO, E PROVAR-ME AMOR SEM FIM! O TEU SANGUE FOI VERTIDO, EXPIRAS-TE, Ó MEU JESUS, E FICOU POR TI CUMPRIDO MEU RESGATE SOBRE A CRUZ! NESSE SANGUE QUE VERTESTE, PURIFICA-ME SENHOR! FOI POR MIM QUE TU MORRESTE: SÊ PROPÍCIO AO PECADOR! SÊ PROPÍCIO AO DESPREZADO, SOB A DOR DA MALDIÇÃO, DO ABISMO DO PECADO A LUTAR NA ESCURIDÃO! QUERO A TI, JESUS BENDITO, MINHA FRONTE LEVANTAR: MAS NÃO POSSO, RÉU, AFLITO, TUA GLÓRIA CONTEMPLAR! PECADOR, NUNCA ESPERES DE JESUS NO REINO ENTRAR. EU BEM SEI, MAS, SE QUISERES, BEM ME PODES RESGATAR! VINDE A MIM! JESUS CONVIDA, JÁ TÃO MANSO O CORAÇÃO! JÁ, DA FÉ NA CHAMA BRILHA O PENHOR DA SALVAÇÃO! EI-LO ALI NA CRUZ PREGADO; CHAMA A TODO O PECADOR. A LIMPAR O SEU PECADO NESSE SANGUE EXPIADOR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'LOUVO-TE Ó DEUS', 'LOUVO-TE, Ó DEUS!\nLOUVO-TE,  SENHOR!\nSANTO É O TEU NOME!\nTEU CHAMADO SIM, LOGO\nCOMPREENDI O VALOR\nDA SALVAÇÃO. \nLOUVO-TE Ó DEUS!\n\nLOUVO-TE, SENHOR!\nSANTO É O TEU NOME.\nTEU CHAMADO SIM, LOGO\nCOMPREENDI O VALOR \nDA SALVAÇÃO.\nEM TI EU REVIVI, DESCANSO,\nPAZ EU ENCONTREI.\nA MINHA VIDA DEI A \nTI PARA O TEU LOUVOR.\n\nLOUVO-TE Ó DEUS!\nLOUVO-TE, SENHOR!\nSANTO É O TEU NOME.\nPROCLAMO PARA TODO \nO MUNDO OUVIR: \nMARANATA! JESUS VEM!\nMARANATA! JESUS VEM!\nORA VEM SENHOR JESUS!', 'LOUVO-TE, Ó DEUS! LOUVO-TE, SENHOR! SANTO É O TEU NOME! TEU CHAMADO SIM, LOGO COMPREENDI O VALOR DA SALVAÇÃO. LOUVO-TE Ó DEUS! LOUVO-TE, SENHOR! SANTO É O TEU NOME. TEU CHAMADO SIM, LOGO COMPREENDI O VALOR DA SALVAÇÃO. EM TI EU REVIVI, DESCANSO, PAZ EU ENCONTREI. A MINHA VIDA DEI A TI PARA O TEU LOUVOR. LOUVO-TE Ó DEUS! LOUVO-TE, SENHOR! SANTO É O TEU NOME. PROCLAMO PARA TODO O MUNDO OUVIR: MARANATA! JESUS VEM! MARANATA! JESUS VEM! ORA VEM SENHOR JESUS!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'QUANTO TEMPO FAZ', 'QUANTO TEMPO FAZ QUE VOCÊ NÃO ORA?\nQUANTO TEMPO FAZ QUE VOCÊ NÃO ENTRA \nNO SEU QUARTO E CHORA?\nQUANTO TEMPO FAZ QUE VOCÊ \nNÃO CANTA MAIS UM HINO DE VITÓRIA?\nQUANTO TEMPO FAZ? \nJÁ FAZ MUITO TEMPO, \nNEM SE LEMBRA MAIS.\n\nMAS HOJE CHEGOU PARA TI UM \nGRANDE RENOVO,\nDEUS VAI COLOCAR EM SUA BOCA \nUM CÂNTICO NOVO,\nCOMECE A GLORIFICAR \nO SEU SANTO NOME, POIS ELE ESTÁ\nPRESENTE E VAI TE ALEGRAR.\n\nQUANTO TEMPO FAZ, QUE NÃO TENS ALEGRIA?\nQUANTO TEMPO FAZ QUE VOCÊ PERDEU \nO DOM DE PROFECIA?\nQUANTO TEMPO FAZ QUE A SUA VIDA \nÉ TRISTE E VAZIA?\nQUANTO TEMPO FAZ? \nJÁ FAZ MUITO TEMPO, \nNEM SE LEMBRA MAIS.\n\nMAS HOJE CHEGOU PARA TI \nUM GRANDE RENOVO,\nDEUS VAI COLOCAR EM SUA BOCA \nUM CÂNTICO NOVO,\nCOMECE A GLORIFICAR \nO SEU SANTO NOME, POIS ELE ESTÁ\nPRESENTE E VAI TE ALEGRAR.\nBIS', 'QUANTO TEMPO FAZ QUE VOCÊ NÃO ORA? QUANTO TEMPO FAZ QUE VOCÊ NÃO ENTRA NO SEU QUARTO E CHORA? QUANTO TEMPO FAZ QUE VOCÊ NÃO CANTA MAIS UM HINO DE VITÓRIA? QUANTO TEMPO FAZ? JÁ FAZ MUITO TEMPO, NEM SE LEMBRA MAIS. MAS HOJE CHEGOU PARA TI UM GRANDE RENOVO, DEUS VAI COLOCAR EM SUA BOCA UM CÂNTICO NOVO, COMECE A GLORIFICAR O SEU SANTO NOME, POIS ELE ESTÁ PRESENTE E VAI TE ALEGRAR. QUANTO TEMPO FAZ, QUE NÃO TENS ALEGRIA? QUANTO TEMPO FAZ QUE VOCÊ PERDEU O DOM DE PROFECIA? QUANTO TEMPO FAZ QUE A SUA VIDA É TRISTE E VAZIA? QUANTO TEMPO FAZ? JÁ FAZ MUITO TEMPO, NEM SE LEMBRA MAIS. MAS HOJE CHEGOU PARA TI UM GRANDE RENOVO, DEUS VAI COLOCAR EM SUA BOCA UM CÂNTICO NOVO, COMECE A GLORIFICAR O SEU SANTO NOME, POIS ELE ESTÁ PRESENTE E VAI TE ALEGRAR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'DIGNO É O CORDEIRO', 'DIGNO É O CORDEIRO QUE FOI MORTO\nDIGNO É O CORDEIRO QUE FOI MORTO\nDIGNO É O CORDEIRO QUE FOI MORTO \nDE RECEBER HONRA E GLÓRIA RIQUEZA E PODER, \nFORÇA E SABEDORIA. \nDIGNO É O CORDEIRO, DIGNO É O CORDEIRO, \nDIGNO É O CORDEIRO QUE FOI MORTO\nDIGNO É O CORDEIRO.\nREPETIR O LOUVOR', 'DIGNO É O CORDEIRO QUE FOI MORTO DIGNO É O CORDEIRO QUE FOI MORTO DIGNO É O CORDEIRO QUE FOI MORTO DE RECEBER HONRA E GLÓRIA RIQUEZA E PODER, FORÇA E SABEDORIA. DIGNO É O CORDEIRO, DIGNO É O CORDEIRO, DIGNO É O CORDEIRO QUE FOI MORTO DIGNO É O CORDEIRO.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'OH! COMO É GRANDE E DOCE A PROMESSA', 'OH! COMO É GRANDE E DOCE A PROMESSA DO SALVADOR, JESUS, NOSSO REI! AO QUE CONFIA \nNA SUA GRAÇA ELE DIZ: “NUNCA TE DEIXAREI.”\n\nCORO\nOH! NÃO TEMAS, OH! NÃO TEMAS, \nPOIS EU CONTIGO SEMPRE SEREI!\nOH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI!\n\nEU SOU TEU DEUS, E PARA LIVRAR-TE, \nSEMPRE CONTIGO EU ESTAREI; \nNÃO TEMAS POIS, PORQUE, \nBEM SEGURO, EU PELA MÃO TE CONDUZIREI.\n\nCORO\nOH! NÃO TEMAS, OH! NÃO TEMAS, \nPOIS EU CONTIGO SEMPRE SEREI!\nOH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI!\n\nPARA REMIR-TE DEI O MEU SANGUE,\nPELO TEU NOME EU TE CHAMEI;\nMEU PARA SEMPRE TU ÉS AGORA,\nCRÊ POIS QUE NUNCA TE DEIXAREI.\n\nCORO\nOH! NÃO TEMAS, OH! NÃO TEMAS, \nPOIS EU CONTIGO SEMPRE SEREI!\nOH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI!\n\nERAS INDIGNO, MAS ESCOLHI-TE; NÃO TEMAS, \nPOIS EU MUITO TE AMEI; QUEM DOS MEUS BRAÇOS \nPODE ARRANCAR-TE: SEMPRE SEGURO TE GUARDAREI.\n\nCORO\nOH! NÃO TEMAS, OH! NÃO TEMAS, \nPOIS EU CONTIGO SEMPRE SEREI!\nOH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI!', 'OH! COMO É GRANDE E DOCE A PROMESSA DO SALVADOR, JESUS, NOSSO REI! AO QUE CONFIA NA SUA GRAÇA ELE DIZ: NUNCA TE DEIXAREI. OH! NÃO TEMAS, OH! NÃO TEMAS, POIS EU CONTIGO SEMPRE SEREI! OH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI! EU SOU TEU DEUS, E PARA LIVRAR-TE, SEMPRE CONTIGO EU ESTAREI; NÃO TEMAS POIS, PORQUE, BEM SEGURO, EU PELA MÃO TE CONDUZIREI. OH! NÃO TEMAS, OH! NÃO TEMAS, POIS EU CONTIGO SEMPRE SEREI! OH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI! PARA REMIR-TE DEI O MEU SANGUE, PELO TEU NOME EU TE CHAMEI; MEU PARA SEMPRE TU ÉS AGORA, CRÊ POIS QUE NUNCA TE DEIXAREI. OH! NÃO TEMAS, OH! NÃO TEMAS, POIS EU CONTIGO SEMPRE SEREI! OH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI! ERAS INDIGNO, MAS ESCOLHI-TE; NÃO TEMAS, POIS EU MUITO TE AMEI; QUEM DOS MEUS BRAÇOS PODE ARRANCAR-TE: SEMPRE SEGURO TE GUARDAREI. OH! NÃO TEMAS, OH! NÃO TEMAS, POIS EU CONTIGO SEMPRE SEREI! OH! NÃO TEMAS, OH! NÃO TEMAS,POIS EU NUNCA TE DEIXAREI!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SEMPRE IMAGINEI EM MINHA VIDA', 'SEMPRE IMAGINEI EM MINHA VIDA QUE EXISTIRIA UM LUGAR, ONDE EU NÃO PUDESSE MAIS SOFRER E A MINHA DOR EU PODERIA ESQUECER.\nNÃO MAIS LEMBRAR DE TUDO O QUE PASSOU \nE UMA NOVA VIDA COMEÇAR.\n\nO CÉU É O LUGAR ONDE EU VOU MORAR, \nNÃO HÁ TRISTEZA LÁ, TODA A ANGÚSTIA ACABARÁ. QUANDO JESUS VOLTAR E JUNTO ME LEVAR\nTODA A LÁGRIMA SECARÁ POIS O SENHOR ENXUGARÁ.\n\nSE NÃO HÁ ESPERANÇA EM TUA VIDA, QUE UM DIA PODERIA SER FELIZ, SAIBA QUE POR TI MORREU JESUS E TODO O SOFRIMENTO FOI VENCIDO LÁ NA CRUZ. PARA PODER MUDAR O TEU SOFRER E ALEGRIA ETERNA CONHECER.\n\nO CÉU É O LUGAR ONDE TU VAIS MORAR, \nNÃO HÁ TRISTEZA LÁ, TODA A ANGÚSTIA ACABARÁ. QUANDO JESUS VOLTAR E JUNTO TI LEVAR\nTODA A LÁGRIMA SECARÁ POIS O SENHOR ENXUGARÁ.\n\nO CÉU É O LUGAR ONDE VAMOS MORAR, \nNÃO HÁ TRISTEZA LÁ, TODA A ANGÚSTIA ACABARÁ. QUANDO JESUS VOLTAR E JUNTO NOS LEVAR\nTODA A LÁGRIMA SECARÁ POIS O SENHOR ENXUGARÁ.\n\nENXUGARÁ (ENXUGARÁ),\nENXUGARÁ (ENXUGARÁ),\nENXUGARÁ.', 'SEMPRE IMAGINEI EM MINHA VIDA QUE EXISTIRIA UM LUGAR, ONDE EU NÃO PUDESSE MAIS SOFRER E A MINHA DOR EU PODERIA ESQUECER. NÃO MAIS LEMBRAR DE TUDO O QUE PASSOU E UMA NOVA VIDA COMEÇAR. O CÉU É O LUGAR ONDE EU VOU MORAR, NÃO HÁ TRISTEZA LÁ, TODA A ANGÚSTIA ACABARÁ. QUANDO JESUS VOLTAR E JUNTO ME LEVAR TODA A LÁGRIMA SECARÁ POIS O SENHOR ENXUGARÁ. SE NÃO HÁ ESPERANÇA EM TUA VIDA, QUE UM DIA PODERIA SER FELIZ, SAIBA QUE POR TI MORREU JESUS E TODO O SOFRIMENTO FOI VENCIDO LÁ NA CRUZ. PARA PODER MUDAR O TEU SOFRER E ALEGRIA ETERNA CONHECER. O CÉU É O LUGAR ONDE TU VAIS MORAR, NÃO HÁ TRISTEZA LÁ, TODA A ANGÚSTIA ACABARÁ. QUANDO JESUS VOLTAR E JUNTO TI LEVAR TODA A LÁGRIMA SECARÁ POIS O SENHOR ENXUGARÁ. O CÉU É O LUGAR ONDE VAMOS MORAR, NÃO HÁ TRISTEZA LÁ, TODA A ANGÚSTIA ACABARÁ. QUANDO JESUS VOLTAR E JUNTO NOS LEVAR TODA A LÁGRIMA SECARÁ POIS O SENHOR ENXUGARÁ. ENXUGARÁ (ENXUGARÁ), ENXUGARÁ (ENXUGARÁ), ENXUGARÁ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'DEUS EL SHADAI', 'O QUE DEUS PODE FAZER É INDESCRITÍVEL\nNOSSO DEUS PODE AGIR ALÉM DO VISÍVEL\nÉ COMO ENCONTRAR ÁGUA NO DESERTO\nÉ MAIS QUE A RAZÃO DO HOMEM MORTAL.\n\nO QUE DEUS PODE FAZER É MARAVILHOSO\nNOSSO DEUS PODE AGIR ALÉM DO QUE EU MEREÇO.\nÉ COMO RENASCER, TRANSFORMAR O MEU VIVER.\nÉ MAIS QUE UM MILAGRE. É VIVER A SALVAÇÃO.\n\nCORO\nNOSSO DEUS EL SHADAI FOGO ABRASADOR.\nSANTO, SANTO, SANTO É ESSE DEUS, DEUS DE AMOR.\nOS CÉUS SE MOVEM QUANDO O JUSTO ORA, \nDOBRA OS JOELHOS. VITÓRIA VIRÁ AO QUE TEM FÉ.\n\nO QUE DEUS PODE FAZER É INDESCRITÍVEL\nNOSSO DEUS PODE AGIR ALÉM DO VISÍVEL\nÉ COMO ENCONTRAR ÁGUA NO DESERTO\nÉ MAIS QUE A RAZÃO DO HOMEM MORTAL.\n\nO QUE DEUS PODE FAZER É MARAVILHOSO\nNOSSO DEUS PODE AGIR ALÉM DO QUE EU MEREÇO.\nÉ COMO RENASCER, TRANSFORMAR O MEU VIVER.\nÉ MAIS QUE UM MILAGRE. É VIVER A SALVAÇÃO.\n\nCORO\nNOSSO DEUS EL SHADAI FOGO ABRASADOR.\nSANTO, SANTO, SANTO É ESSE DEUS, DEUS DE AMOR.\nOS CÉUS SE MOVEM QUANDO O JUSTO ORA, \nDOBRA OS JOELHOS. VITÓRIA VIRÁ AO QUE TEM FÉ.', 'O QUE DEUS PODE FAZER É INDESCRITÍVEL NOSSO DEUS PODE AGIR ALÉM DO VISÍVEL É COMO ENCONTRAR ÁGUA NO DESERTO É MAIS QUE A RAZÃO DO HOMEM MORTAL. O QUE DEUS PODE FAZER É MARAVILHOSO NOSSO DEUS PODE AGIR ALÉM DO QUE EU MEREÇO. É COMO RENASCER, TRANSFORMAR O MEU VIVER. É MAIS QUE UM MILAGRE. É VIVER A SALVAÇÃO. NOSSO DEUS EL SHADAI FOGO ABRASADOR. SANTO, SANTO, SANTO É ESSE DEUS, DEUS DE AMOR. OS CÉUS SE MOVEM QUANDO O JUSTO ORA, DOBRA OS JOELHOS. VITÓRIA VIRÁ AO QUE TEM FÉ. O QUE DEUS PODE FAZER É INDESCRITÍVEL NOSSO DEUS PODE AGIR ALÉM DO VISÍVEL É COMO ENCONTRAR ÁGUA NO DESERTO É MAIS QUE A RAZÃO DO HOMEM MORTAL. O QUE DEUS PODE FAZER É MARAVILHOSO NOSSO DEUS PODE AGIR ALÉM DO QUE EU MEREÇO. É COMO RENASCER, TRANSFORMAR O MEU VIVER. É MAIS QUE UM MILAGRE. É VIVER A SALVAÇÃO. NOSSO DEUS EL SHADAI FOGO ABRASADOR. SANTO, SANTO, SANTO É ESSE DEUS, DEUS DE AMOR. OS CÉUS SE MOVEM QUANDO O JUSTO ORA, DOBRA OS JOELHOS. VITÓRIA VIRÁ AO QUE TEM FÉ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'EU PRECISO DE TI', 'SENHOR, EU ME AJOELHO\nA TEUS PÉS, (SENHOR)\nTE PEÇO PERDÃO, COMUNHÃO.\n(TE PEÇO, SENHOR)\nEU QUERO A CADA DIA ESTAR,\n(CONTIGO MEU DEUS)\nPOR ONDE QUER QUE EU VÁ.\n\nEU PRECISO DE TI (DE TI)\nSENHOR, OUVE A MINHA ORAÇÃO.\n(MEU DEUS, MEU PAI)\nATENDE A MINHA SÚPLICA, (SENHOR)\nPORQUE PRECISO TANTO DE TI,\n(TANTO DE TI)\nTANTO DE TI, NA MINHA VIDA.\n\nEU PRECISO DE TI (DE TI)\nSENHOR, OUVE A MINHA ORAÇÃO.\n(MEU DEUS, MEU PAI)\nATENDE A MINHA SÚPLICA, (SENHOR)\nPORQUE PRECISO TANTO DE TI,\n(TANTO DE TI)\nTANTO DE TI, NA MINHA VIDA.\nBIS', 'SENHOR, EU ME AJOELHO A TEUS PÉS, (SENHOR) TE PEÇO PERDÃO, COMUNHÃO. (TE PEÇO, SENHOR) EU QUERO A CADA DIA ESTAR, (CONTIGO MEU DEUS) POR ONDE QUER QUE EU VÁ. EU PRECISO DE TI (DE TI) SENHOR, OUVE A MINHA ORAÇÃO. (MEU DEUS, MEU PAI) ATENDE A MINHA SÚPLICA, (SENHOR) PORQUE PRECISO TANTO DE TI, (TANTO DE TI) TANTO DE TI, NA MINHA VIDA. EU PRECISO DE TI (DE TI) SENHOR, OUVE A MINHA ORAÇÃO. (MEU DEUS, MEU PAI) ATENDE A MINHA SÚPLICA, (SENHOR) PORQUE PRECISO TANTO DE TI, (TANTO DE TI) TANTO DE TI, NA MINHA VIDA.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'FIRME ESTAREI', 'FIRME ESTAREI E CONFIAREI \nQUE PELO A VIVEREI\nDEUS É AMOR, E OS FRUTOS DO AMOR\nSÃO MAIS PRECIOSOS QUE OUTROS BENS.\n\nCORO:\nPACIENTE E BENIGNO É O AMOR (É O AMOR)\nTEM PODER PARA CURAR E TODO MAL ANIQUILAR\nÉ MAIS FORTE QUE O SOFRER, O ESPERAR SUPORTAR\nEGOÍSMO E O ORGULHO NELE NÃO ATINGIRÃO\nÉ O AMOR DE DEUS QUE ME ENCHE O CORAÇÃO.\n\nNO AMOR, O MEDO NÃO TEM LUGAR\nO AMOR DÁ AMOR OUSADIA PRA LUTAR \nE CONQUISTAR AQUILO QUE PERDIDO \nPARECE ESTAR TUDO É POSSIVEL RESGATAR\nPORQUE COMIGO O AMOR PERMANECER.\n\nCORO: (2X)\nPACIENTE E BENIGNO É O AMOR (É O AMOR)\nTEM PODER PARA CURAR E TODO MAL ANIQUILAR\nÉ MAIS FORTE QUE O SOFRER, O ESPERAR SUPORTAR\nEGOÍSMO E O ORGULHO NELE NÃO ATINGIRÃO\nÉ O AMOR DE DEUS QUE ME ENCHE O CORAÇÃO.', 'FIRME ESTAREI E CONFIAREI QUE PELO A VIVEREI DEUS É AMOR, E OS FRUTOS DO AMOR SÃO MAIS PRECIOSOS QUE OUTROS BENS. NO AMOR, O MEDO NÃO TEM LUGAR O AMOR DÁ AMOR OUSADIA PRA LUTAR E CONQUISTAR AQUILO QUE PERDIDO PARECE ESTAR TUDO É POSSIVEL RESGATAR PORQUE COMIGO O AMOR PERMANECER.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'O DIA DA VITÓRIA', 'ASSIM COMO A NOITE AGUARDA O SOL,\nCOMO A BRISA SONHA UM DIA SOPRAR\nCOMO A TERRA SECA ESPERA A CHUVA\nCOMO O RIO ANSEIA PELO MAR\nEU DESEJO TANTO VER O DIA CHEGAR!\n\nCORO:\nO DIA DA VITÓRIA EM QUE VIRÁ MEU SALVADOR\nSIM, JESUS CRISTO, O SENHOR, VIRÁ NAS NUVENS \nPARA ME LEVAR SE TORNARÁ VERDADE TUDO \nO QUE SEMPRE SONHEI, TRISTEZAS EU NÃO MAIS \nTEREI E TODA LÁGRIMA DO MEU OLHAR\nELE ENXUGARÁ!\n\nBRAÇOS LEVANTADOS, LIVRES DO MAL\nIGUALDADE E JUSTIÇA HAVERÁ\nJÁ NÃO MAIS TERÁ MORTE OU GUERRA\nNOVO CÉU E UMA NOVA TERRA\nEU DESEJO TANTO VER O DIA CHEGAR!\n\nCORO: (2X)\nO DIA DA VITÓRIA EM QUE VIRÁ MEU SALVADOR\nSIM, JESUS CRISTO, O SENHOR, VIRÁ NAS NUVENS \nPARA ME LEVAR SE TORNARÁ VERDADE TUDO \nO QUE SEMPRE SONHEI, TRISTEZAS EU NÃO MAIS \nTEREI E TODA LÁGRIMA DO MEU OLHAR\nELE ENXUGARÁ! (FINAL 3X)', 'ASSIM COMO A NOITE AGUARDA O SOL, COMO A BRISA SONHA UM DIA SOPRAR COMO A TERRA SECA ESPERA A CHUVA COMO O RIO ANSEIA PELO MAR EU DESEJO TANTO VER O DIA CHEGAR! BRAÇOS LEVANTADOS, LIVRES DO MAL IGUALDADE E JUSTIÇA HAVERÁ JÁ NÃO MAIS TERÁ MORTE OU GUERRA NOVO CÉU E UMA NOVA TERRA EU DESEJO TANTO VER O DIA CHEGAR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'CRISTO, CURA SIM', 'CONTRA OS MALES DESTE MUNDO, \nDEUS NOS VALE SÓ \nNÃO HÁ MAL QUE DEUS NÃO CURE \nPOIS DE NÓS TEM DÓ.\n\nCORO\nCRISTO CURA, SIM\nCRISTO CURA, SIM\nSEU AMOR POR NÓS É IMENSO \nCRISTO CURA, SIM.\n\nDERRAMOU SEU SANGUE PURO\nPRA REMIR A MIM\nQUANDO UNGIDO \nSOU DE AZEITE\nSOU CURADO, ENFIM.\n\nCORO\nCRISTO CURA, SIM\nCRISTO CURA, SIM\nSEU AMOR POR NÓS É IMENSO \nCRISTO CURA, SIM.\n\nSÓ NOSSA ALMA É BEM SEGURA\nOCULTA EM JESUS\nELE O BÁLSAMO DA VIDA \nDERRAMOU NA CRUZ.\n\nCORO\nCRISTO CURA, SIM\nCRISTO CURA, SIM\nSEU AMOR POR NÓS É IMENSO \nCRISTO CURA, SIM.\n\nGLÓRIA A DEUS, ETERNA GLÓRIA\nDEMOS-LHE LOUVOR\nGLÓRIA, CÂNTICOS E HOSANAS \nDAI AO REDENTOR.\n\nCORO\nCRISTO CURA, SIM\nCRISTO CURA, SIM\nSEU AMOR POR NÓS É IMENSO \nCRISTO CURA, SIM.', 'CONTRA OS MALES DESTE MUNDO, DEUS NOS VALE SÓ NÃO HÁ MAL QUE DEUS NÃO CURE POIS DE NÓS TEM DÓ. CRISTO CURA, SIM CRISTO CURA, SIM SEU AMOR POR NÓS É IMENSO CRISTO CURA, SIM. DERRAMOU SEU SANGUE PURO PRA REMIR A MIM QUANDO UNGIDO SOU DE AZEITE SOU CURADO, ENFIM. CRISTO CURA, SIM CRISTO CURA, SIM SEU AMOR POR NÓS É IMENSO CRISTO CURA, SIM. SÓ NOSSA ALMA É BEM SEGURA OCULTA EM JESUS ELE O BÁLSAMO DA VIDA DERRAMOU NA CRUZ. CRISTO CURA, SIM CRISTO CURA, SIM SEU AMOR POR NÓS É IMENSO CRISTO CURA, SIM. GLÓRIA A DEUS, ETERNA GLÓRIA DEMOS-LHE LOUVOR GLÓRIA, CÂNTICOS E HOSANAS DAI AO REDENTOR. CRISTO CURA, SIM CRISTO CURA, SIM SEU AMOR POR NÓS É IMENSO CRISTO CURA, SIM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'NÃO TOQUEIS EM NADA IMPURO', 'EU QUERO Ó DEUS A TI ME SANTIFICAR\nE DO MAL QUERO ME DESVIAR\nE APRENDER PERDOAR E AMAR\nE DO PECADO QUERO ME LIBERTAR.\n\nEU SEI QUE HÁ PROMESSAS\nPARA AQUELE QUE TE BUSCAR!\nDEIXAR O TEU SANTO ESPÍRITO MOLDAR. \nEU QUERO QUE SE CUMPRA EM MIM TODO O BEM\nDA PROMESSA QUE DIZ ASSIM:\n\nCORO\nNÃO TOQUEIS EM NADA IMPURO \nQUE EU TE RECEBEREI PARA MIM SERÁS MEU FILHO \nPARA TI PAI EU SEREI. \nSE GRITARES POR SOCORRO EIS-ME AQUI EU TE DIREI. \nENTÃO CLAMARÁS A MIM, E EU TE RESPONDEREI \nSÓ QUEM SE SANTIFICA A DEUS VERÁ!\n\nEU SOU PEQUENO, \nNO TEU CAMINHO ME ENSINA À ANDAR. \nQUANDO EU CRESCER NÃO VOU ME DESVIAR, \nE O PECADO APRENDEREI A NEGAR. \nEU QUERO Ó DEUS A TI ME SANTIFICAR.\n\nCORO\nNÃO TOQUEIS EM NADA IMPURO \nQUE EU TE RECEBEREI PARA MIM SERÁS MEU FILHO \nPARA TI PAI EU SEREI. \nSE GRITARES POR SOCORRO EIS-ME AQUI EU TE DIREI. \nENTÃO CLAMARÁS A MIM, E EU TE RESPONDEREI \nSÓ QUEM SE SANTIFICA A DEUS VERÁ!\n\nSE GRITARES POR SOCORRO \nEIS-ME AQUI EU TE DIREI. \nENTÃO CLAMARÁS A MIM, \nE EU TE RESPONDEREI \nSÓ QUEM SE SANTIFICA \nA DEUS VERÁ! \n\nFINAL: VERÁ!', 'EU QUERO Ó DEUS A TI ME SANTIFICAR E DO MAL QUERO ME DESVIAR E APRENDER PERDOAR E AMAR E DO PECADO QUERO ME LIBERTAR. EU SEI QUE HÁ PROMESSAS PARA AQUELE QUE TE BUSCAR! DEIXAR O TEU SANTO ESPÍRITO MOLDAR. EU QUERO QUE SE CUMPRA EM MIM TODO O BEM DA PROMESSA QUE DIZ ASSIM: NÃO TOQUEIS EM NADA IMPURO QUE EU TE RECEBEREI PARA MIM SERÁS MEU FILHO PARA TI PAI EU SEREI. SE GRITARES POR SOCORRO EIS-ME AQUI EU TE DIREI. ENTÃO CLAMARÁS A MIM, E EU TE RESPONDEREI SÓ QUEM SE SANTIFICA A DEUS VERÁ! EU SOU PEQUENO, NO TEU CAMINHO ME ENSINA À ANDAR. QUANDO EU CRESCER NÃO VOU ME DESVIAR, E O PECADO APRENDEREI A NEGAR. EU QUERO Ó DEUS A TI ME SANTIFICAR. NÃO TOQUEIS EM NADA IMPURO QUE EU TE RECEBEREI PARA MIM SERÁS MEU FILHO PARA TI PAI EU SEREI. SE GRITARES POR SOCORRO EIS-ME AQUI EU TE DIREI. ENTÃO CLAMARÁS A MIM, E EU TE RESPONDEREI SÓ QUEM SE SANTIFICA A DEUS VERÁ! SE GRITARES POR SOCORRO EIS-ME AQUI EU TE DIREI. ENTÃO CLAMARÁS A MIM, E EU TE RESPONDEREI SÓ QUEM SE SANTIFICA A DEUS VERÁ! VERÁ!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'QUÃO GRANDE AMOR (VIGIAI)', 'QUÃO GRANDE AMOR, ETERNO AMOR, \nCOM LAÇOS DE AMOR EU TE ATRAI. \nMEU AMOR É FORTE COMO A MORTE. \nMAIOR DO QUE A DOR É O MEU AMOR POR TI. \nEU SOU JESUS A VERDADE E A LUZ, \nEU SABIA QUE POR TI \nIRIA MORRER NUMA CRUZ.\n\nÀ AGONIA QUE ENVOLVIA O CÁLICE \nDA PROFECIA ELE IRIA TOMAR! \nA TRAIÇÃO, A HUMILHAÇÃO \nOS PROFETAS DO PASSADO VIERAM A PROFETIZAR.\nAO GETSEMANI FUI PRA ORAR \nE OS DISCÍPULOS COMIGO \nNÃO PUDERAM VELAR.\n\nCORO\nEU DISSE VIGIAI, VIGIAI\nFICAI COMIGO E ORAI. \nMEU SUOR EM SANGUE SE TORNOU, \nMEU SACRIFÍCIO, MINHA DOR. \nNÃO FOI EM VÃO, VIGIAI. \nFICAI COMIGO E ORAI. \n\nINSTRUMENTOS\n\nCOM OS MALFEITORES EU FUI CONTADO, \nFUI TORTURADO, CRUCIFICADO. \nATÉ POR DEUS FUI DESAMPARADO, \nPOIS SOBRE MIM ESTAVAS TEU PECADO.\n\nCORO\nEU CLAMO: VIGIAI, VIGIAI\nFICAI COMIGO E ORAI. \nMEU SUOR EM SANGUE SE TORNOU, \nMEU SACRIFÍCIO, MINHA DOR. \nNÃO FOI EM VÃO, VIGIAI. \nFICAI COMIGO E ORAI. \n\nFINAL: \nVIGIAI, VIGIAI. FICAI COMIGO E ORAI!', 'QUÃO GRANDE AMOR, ETERNO AMOR, COM LAÇOS DE AMOR EU TE ATRAI. MEU AMOR É FORTE COMO A MORTE. MAIOR DO QUE A DOR É O MEU AMOR POR TI. EU SOU JESUS A VERDADE E A LUZ, EU SABIA QUE POR TI IRIA MORRER NUMA CRUZ. À AGONIA QUE ENVOLVIA O CÁLICE DA PROFECIA ELE IRIA TOMAR! A TRAIÇÃO, A HUMILHAÇÃO OS PROFETAS DO PASSADO VIERAM A PROFETIZAR. AO GETSEMANI FUI PRA ORAR E OS DISCÍPULOS COMIGO NÃO PUDERAM VELAR. EU DISSE VIGIAI, VIGIAI FICAI COMIGO E ORAI. MEU SUOR EM SANGUE SE TORNOU, MEU SACRIFÍCIO, MINHA DOR. NÃO FOI EM VÃO, VIGIAI. FICAI COMIGO E ORAI. COM OS MALFEITORES EU FUI CONTADO, FUI TORTURADO, CRUCIFICADO. ATÉ POR DEUS FUI DESAMPARADO, POIS SOBRE MIM ESTAVAS TEU PECADO. EU CLAMO: VIGIAI, VIGIAI FICAI COMIGO E ORAI. MEU SUOR EM SANGUE SE TORNOU, MEU SACRIFÍCIO, MINHA DOR. NÃO FOI EM VÃO, VIGIAI. FICAI COMIGO E ORAI. VIGIAI, VIGIAI. FICAI COMIGO E ORAI!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'ONDE ESTÁ JESUS (OVELHA PERDIDA)', 'ONDE ESTÁ JESUS? EU NÃO O POSSO VEREU ME AFASTEI DEMAIS \nE ME PERDI SEM PERCEBERME PARECEU SER BOM \nO QUE MANDOU MEU CORAÇÃOVEJO QUE TROPECEI, CAÍ, \nESTOU NA ESCURIDÃO\n\nENTÃO EU ME LEMBREI DE QUANDO ESTAVA JUNTO \nA TI DAS VEZES QUE CHOREI DO BOM PASTOR EU \nRECEBI O SEU CUIDADO E AMOR NUNCA O SENHOR ME ABANDONOU AGORA VOU CLAMAR, CHORAR, SUPLICAR O SEU FAVOR\n\nVEM, SENHOR, A SUA OVELHA RESGATARE NO APRISCO HOJE, AINDA, \nEU QUERO ESTARME TOMA EM SEUS BRAÇOS \nE DE MIM VEM CUIDARÓ DEUS, MINHAS FERIDAS VEM CURARE AO SEU LADO, PARA SEMPREMEU BOM PASTOR QUERO FICAR\n\nEIS QUE UMA VOZ OUVI\nEXISTE ALGUÉM CLAMANDO A MIM\nO CHORO RECONHECI, \nÉ DE ALGUÉM QUE CONVIVI\nEU SEM DEMORA IREI, EU SIM, \nEU MESMO A BUSCAREI\nDO MAL A LIVRAREI E BEM SEGURA \nA GUARDARE.\n\nEIS QUE A VEJO MINHA OVELHA, FRACA ESTÁ\nE NO APRISCO, HOJE AINDA, ESTARÁ\nSOU TEU PASTOR E NOS MEUS BRAÇOS  A VOU LEVAR\nDE TODO MEDO E PERIGO LIBERTA FICARÁS\nE HOJE EU VENHO TE BUSCAR\nPRA NADA MAIS NOS SEPARAR', 'ONDE ESTÁ JESUS? EU NÃO O POSSO VEREU ME AFASTEI DEMAIS E ME PERDI SEM PERCEBERME PARECEU SER BOM O QUE MANDOU MEU CORAÇÃOVEJO QUE TROPECEI, CAÍ, ESTOU NA ESCURIDÃO ENTÃO EU ME LEMBREI DE QUANDO ESTAVA JUNTO A TI DAS VEZES QUE CHOREI DO BOM PASTOR EU RECEBI O SEU CUIDADO E AMOR NUNCA O SENHOR ME ABANDONOU AGORA VOU CLAMAR, CHORAR, SUPLICAR O SEU FAVOR VEM, SENHOR, A SUA OVELHA RESGATARE NO APRISCO HOJE, AINDA, EU QUERO ESTARME TOMA EM SEUS BRAÇOS E DE MIM VEM CUIDARÓ DEUS, MINHAS FERIDAS VEM CURARE AO SEU LADO, PARA SEMPREMEU BOM PASTOR QUERO FICAR EIS QUE UMA VOZ OUVI EXISTE ALGUÉM CLAMANDO A MIM O CHORO RECONHECI, É DE ALGUÉM QUE CONVIVI EU SEM DEMORA IREI, EU SIM, EU MESMO A BUSCAREI DO MAL A LIVRAREI E BEM SEGURA A GUARDARE. EIS QUE A VEJO MINHA OVELHA, FRACA ESTÁ E NO APRISCO, HOJE AINDA, ESTARÁ SOU TEU PASTOR E NOS MEUS BRAÇOS A VOU LEVAR DE TODO MEDO E PERIGO LIBERTA FICARÁS E HOJE EU VENHO TE BUSCAR PRA NADA MAIS NOS SEPARAR', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'SALMO 5', 'À MINHA VOZ, Ó DEUS ATENDE,POIS NOITE E DIA CLAMO A TI. TÃO FRÁGIL SOU, TÃO POBRE AQUI!MAGOADA E SÓ, MINHA ALMA ARQUEJAE TE DESEJA.\n\nDA VIDA E LUZ TU ÉS A FONTE.EM MIM DERRAMA O TEU PODER!MINHA ORAÇÃO VEM RECEBERPOIS, DE MEU LEITO, O SOL VIGIOE EM TI CONFIO.\n\nNÃO ÉS UM DEUS QUE TE COMPRAZASNO VAGUEAR DO PECADOR.BONDOSO E JUSTO ÉS TU, SENHOR!E TEU FAVOR JAMAIS CONSENTESAOS MALDIZENTES.\n\nMEUS PÉS, À LUZ DE TEUS CAMINHOS,HUMILDE E GRATO, INCLINAREI.TU ÉS MEU DEUS, TU ÉS MEU REI.PURO E SINCERO.\n\nTEUS FILHOS TÊM CONSTANTE GOZO,REJUBILANDO EM TUA PAZ.DE TODO OS GUARDARÁS,POIS TUA LEI, Ó DEUS CONHECEME TE OBEDECEM.', 'À MINHA VOZ, Ó DEUS ATENDE,POIS NOITE E DIA CLAMO A TI. TÃO FRÁGIL SOU, TÃO POBRE AQUI!MAGOADA E SÓ, MINHA ALMA ARQUEJAE TE DESEJA. DA VIDA E LUZ TU ÉS A FONTE.EM MIM DERRAMA O TEU PODER!MINHA ORAÇÃO VEM RECEBERPOIS, DE MEU LEITO, O SOL VIGIOE EM TI CONFIO. NÃO ÉS UM DEUS QUE TE COMPRAZASNO VAGUEAR DO PECADOR.BONDOSO E JUSTO ÉS TU, SENHOR!E TEU FAVOR JAMAIS CONSENTESAOS MALDIZENTES. MEUS PÉS, À LUZ DE TEUS CAMINHOS,HUMILDE E GRATO, INCLINAREI.TU ÉS MEU DEUS, TU ÉS MEU REI.PURO E SINCERO. TEUS FILHOS TÊM CONSTANTE GOZO,REJUBILANDO EM TUA PAZ.DE TODO OS GUARDARÁS,POIS TUA LEI, Ó DEUS CONHECEME TE OBEDECEM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PRECIOSA GRAÇA (AMAZING GRACE)', 'PRECIOSA GRAÇA DE JESUSQUE UM DIA ME SALVOU!EU CEGO ESTAVA, DEU-ME LUZ,PERDIDO ME BUSCOU!\n\nA GRAÇA ENTÃO MEU CORAÇÃODO MEDO LIBERTOU.OH! QUÃO PRECIOSA A SALVAÇÃOQUE A GRAÇA ME GANHOU!\n\nPERIGOS MIL ATRAVESSEIE A GRAÇA ME VALEU.EU SÃO E SALVO AGORA IREI AO LAR DO CÉU.\n\nPROMESSAS DEU-ME O SALVADORE NELE EU POSSO CRER.É MEU ESCUDO E PROTETOREM TODO O MEU VIVER!', 'PRECIOSA GRAÇA DE JESUSQUE UM DIA ME SALVOU!EU CEGO ESTAVA, DEU-ME LUZ,PERDIDO ME BUSCOU! A GRAÇA ENTÃO MEU CORAÇÃODO MEDO LIBERTOU.OH! QUÃO PRECIOSA A SALVAÇÃOQUE A GRAÇA ME GANHOU! PERIGOS MIL ATRAVESSEIE A GRAÇA ME VALEU.EU SÃO E SALVO AGORA IREI AO LAR DO CÉU. PROMESSAS DEU-ME O SALVADORE NELE EU POSSO CRER.É MEU ESCUDO E PROTETOREM TODO O MEU VIVER!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'DEIXA MEU POVO IR (VAI MOISÉS)', 'VAI, MOISÉS! VAI POIS À TERRA DO EGITO\nDIZE A FARAÓ: DEIXA MEU POVO IR!\n\nNO EGITO ESTAVA ISRAEL\n(DEIXA MEU POVO IR!)\nOPRESSO E SEM SUPORTAR\n(DEIXA MEU POVO IR!)\n\nCORO\nVAI, MOISÉS! VAI POIS À TERRA DO EGITO\nDIZE A FARAÓ: DEIXA MEU POVO IR!\n\nAO EGITO DESCEU POIS MOISÉS\n(DEIXA MEU POVO IR!)\nA  FARAÓ PERSUADIU\n(DEIXA MEU POVO IR!)\n\nCORO\nVAI, MOISÉS! VAI POIS À TERRA DO EGITO\nDIZE A FARAÓ: DEIXA MEU POVO IR!\n\nASSIM FALOU DEUS A MOISÉS\n(DEIXA MEU POVO IR!)\nOS PRIMOGÊNITOS MATAREI\n(DEIXA MEU POVO IR!)\n\nCORO\nVAI, MOISÉS! VAI POIS À TERRA DO EGITO\nDIZE A FARAÓ: DEIXA MEU POVO IR!\n\nINSTRUMENTAL\n\nFINAL:\nVAI, MOISÉS! VAI POIS À TERRA DO EGITO\nDIZE A FARAÓ: DEIXA MEU POVO IR!\nVAI, MOISÉS!\nDEIXA MEU POVO IR!', 'VAI, MOISÉS! VAI POIS À TERRA DO EGITO DIZE A FARAÓ: DEIXA MEU POVO IR! NO EGITO ESTAVA ISRAEL (DEIXA MEU POVO IR!) OPRESSO E SEM SUPORTAR (DEIXA MEU POVO IR!) VAI, MOISÉS! VAI POIS À TERRA DO EGITO DIZE A FARAÓ: DEIXA MEU POVO IR! AO EGITO DESCEU POIS MOISÉS (DEIXA MEU POVO IR!) A FARAÓ PERSUADIU (DEIXA MEU POVO IR!) VAI, MOISÉS! VAI POIS À TERRA DO EGITO DIZE A FARAÓ: DEIXA MEU POVO IR! ASSIM FALOU DEUS A MOISÉS (DEIXA MEU POVO IR!) OS PRIMOGÊNITOS MATAREI (DEIXA MEU POVO IR!) VAI, MOISÉS! VAI POIS À TERRA DO EGITO DIZE A FARAÓ: DEIXA MEU POVO IR! INSTRUMENTAL VAI, MOISÉS! VAI POIS À TERRA DO EGITO DIZE A FARAÓ: DEIXA MEU POVO IR! VAI, MOISÉS! DEIXA MEU POVO IR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'TUA ALMA ESTÁ FERIDA, MAGOADO O CORAÇÃO? (VINDE A MIM)', 'TUA ALMA ESTÁ FERIDA, MAGOADO O CORAÇÃO,\nA TRISTEZA JÁ SE APODEROU DE TI,\nESCUTA MEU AMIGO, JESUS VOS FALA ASSIM:\nÓ CANSADO E OPRIMIDO VINDE A MIM.\n\nCORO \nTOMAI SOBRE VÓS MEU JUGO, EU VOS ALIVIAREI, \nE DESCANSO VOSSAS ALMAS GOZARÃO, \nPOIS O MEU FARDO É LEVE, MEU JUGO É SUAVE, \nPAZ PERFEITA VÓS TEREIS NO CORAÇÃO.\n\nDESPERTA TU QUE DORMES, A FÉ TRAZ A ESPERANÇA,\nJÁ RAIOU O NOVO DIA EM TEU FAVOR,\nLEMBRA QUE DEUS É AMOR E JESUS VOS FALA ASSIM:\nÓ CANSADOS E OPRIMIDOS VINDE A MIM.\n\nCORO \nTOMAI SOBRE VÓS MEU JUGO, EU VOS ALIVIAREI, \nE DESCANSO VOSSAS ALMAS GOZARÃO, \nPOIS O MEU FARDO É LEVE, MEU JUGO É SUAVE, \nPAZ PERFEITA VÓS TEREIS NO CORAÇÃO.\n\nSE CRERES MEU AMIGO, TERÁS A SALVAÇÃO,\nPLENA PAZ INUNDARÁ TEU CORAÇÃO.\nESCUTA A VOZ DE CRISTO, JESUS TE FALA ASSIM:\nÓ CANSADOS E OPRIMIDOS VINDE A MIM.\n\nCORO \nTOMAI SOBRE VÓS MEU JUGO, \nEU VOS ALIVIAREI, \nE DESCANSO VOSSAS ALMAS GOZARÃO, \nPOIS O MEU FARDO É LEVE, \nMEU JUGO É SUAVE, \nPAZ PERFEITA VÓS TEREIS NO CORAÇÃO.', 'TUA ALMA ESTÁ FERIDA, MAGOADO O CORAÇÃO, A TRISTEZA JÁ SE APODEROU DE TI, ESCUTA MEU AMIGO, JESUS VOS FALA ASSIM: Ó CANSADO E OPRIMIDO VINDE A MIM. DESPERTA TU QUE DORMES, A FÉ TRAZ A ESPERANÇA, JÁ RAIOU O NOVO DIA EM TEU FAVOR, LEMBRA QUE DEUS É AMOR E JESUS VOS FALA ASSIM: Ó CANSADOS E OPRIMIDOS VINDE A MIM. SE CRERES MEU AMIGO, TERÁS A SALVAÇÃO, PLENA PAZ INUNDARÁ TEU CORAÇÃO. ESCUTA A VOZ DE CRISTO, JESUS TE FALA ASSIM: Ó CANSADOS E OPRIMIDOS VINDE A MIM.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'O CAMINHO DE SIÃO', 'PEREGRINO SOLITÁRIO \nPROCURANDO DESCANSAR, EI-LO ENCONTRA PELA ESTRADA \nOS REMIDOS DE SIÃO.\nBIS\n\nCOM JÚBILO OUVIU FALAR DO CÉUEM QUE JESUS DESCANSO DÁ. SERÁ QUE A MIM UM VIAJOR AO CÉU, LUGAR DARÃO NAQUELE ETERNO LAR. DESCANSO EM VÃO NO MUNDO AQUI BUSQUEI, DESILUSÕES EU SÓ  ACHEI; MAS A SIÃO JAMAIS IREI,  POIS SOU TÃO VIL, TÃO PECADOR.\n\nMAS DE ONDE VEM A LINDA HARMONIAQUE ENCHE MINHA ALMA DE PAZ E DE ALEGRIA?VEM DOS REMIDOS  QUE CANTAM JUNTO AO TRONO, CANTAM OS LOUVORES AO SEU REDENTOR. EIS QUE ELES ESPERAM OS POBRES PEREGRINOS,QUE HOJE AINDA LUTAM NO MUNDO TORMENTOSO EI-LOS QUE OS CHAMAM COM VOZES TRIUNFANTESPARA A CELESTE MANSÃO DO SENHOR.\n\nPARA SIÃO QUAL SERÁ POIS O CAMINHO?CRISTO! EIS O CAMINHO, A VERDADE E A VIDA!MAS COMO TER  DELE O PENHOR QUE ME ACEITA?PRONTO ELE ATENDE A QUEM BUSCA O SEU FAVOR.\n\nNÃO ME QUER, INDIGNO SOU, EU, PECADOR!VEM COM FÉ, POIS JESUS AMA AOS PECADORES.MINHA HUMILDE PRECE VOU JÁ LHE OFERTAR.A QUEM VAI COM FERVOR ELE ATENDERÁ.POVO DE DEUS JUBILAI! CRISTO NOS LEVA A SIÃO! DAI GLÓRIA A DEUS! DAI GLÓRIA A DEUS! \nALTO LOUVOR A JESUS. ALELUIA', 'PEREGRINO SOLITÁRIO PROCURANDO DESCANSAR, EI-LO ENCONTRA PELA ESTRADA OS REMIDOS DE SIÃO. COM JÚBILO OUVIU FALAR DO CÉUEM QUE JESUS DESCANSO DÁ. SERÁ QUE A MIM UM VIAJOR AO CÉU, LUGAR DARÃO NAQUELE ETERNO LAR. DESCANSO EM VÃO NO MUNDO AQUI BUSQUEI, DESILUSÕES EU SÓ ACHEI; MAS A SIÃO JAMAIS IREI, POIS SOU TÃO VIL, TÃO PECADOR. MAS DE ONDE VEM A LINDA HARMONIAQUE ENCHE MINHA ALMA DE PAZ E DE ALEGRIA?VEM DOS REMIDOS QUE CANTAM JUNTO AO TRONO, CANTAM OS LOUVORES AO SEU REDENTOR. EIS QUE ELES ESPERAM OS POBRES PEREGRINOS,QUE HOJE AINDA LUTAM NO MUNDO TORMENTOSO EI-LOS QUE OS CHAMAM COM VOZES TRIUNFANTESPARA A CELESTE MANSÃO DO SENHOR. PARA SIÃO QUAL SERÁ POIS O CAMINHO?CRISTO! EIS O CAMINHO, A VERDADE E A VIDA!MAS COMO TER DELE O PENHOR QUE ME ACEITA?PRONTO ELE ATENDE A QUEM BUSCA O SEU FAVOR. NÃO ME QUER, INDIGNO SOU, EU, PECADOR!VEM COM FÉ, POIS JESUS AMA AOS PECADORES.MINHA HUMILDE PRECE VOU JÁ LHE OFERTAR.A QUEM VAI COM FERVOR ELE ATENDERÁ.POVO DE DEUS JUBILAI! CRISTO NOS LEVA A SIÃO! DAI GLÓRIA A DEUS! DAI GLÓRIA A DEUS! ALTO LOUVOR A JESUS. ALELUIA', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'VIVEREMOS PELA FÉ', 'AQUELE QUE HÁ DE VIR VIRÁ, E NÃO TARDARÁ. \nO JUSTO VIVERÁ PELA FÉ E NÃO DEVE RECUAR.\nEM TUDO SOMOS ATRIBULADOS, \n\nPORÉM, NÃO ESTAMOS ANGUSTIADOS.\nO DEUS QUE ONTEM DE MIM CUIDOU,\nHOJE E SEMPRE COMIGO ESTARÁ.\n\nCORO\nVIVEREMOS PELA FÉ ,\nSABENDO QUE O NOSSO SENHOR VIVO ESTÁ\nE EM BREVE, MUITO EM BREVE\n(E EM BREVE, MUITO EM BREVE)\nAO CÉU NOS LEVARÁ.\n\nNÃO TEMAS OS TEMORES DA NOITE \nO SENHOR CONTIGO ESTÁ.\nO DEUS QUE ONTEM DE TI CUIDOU \nHOJE E SEMPRE CONTIGO ESTARÁ.\n\nVARÕES\n\nTODOS\n\nCORO \nVIVEREMOS PELA FÉ ,\nSABENDO QUE O NOSSO SENHOR VIVO ESTÁ\nE EM BREVE, MUITO EM BREVE\n(E EM BREVE, MUITO EM BREVE)\nAO CÉU NOS LEVARÁ.\nBIS', 'AQUELE QUE HÁ DE VIR VIRÁ, E NÃO TARDARÁ. O JUSTO VIVERÁ PELA FÉ E NÃO DEVE RECUAR. EM TUDO SOMOS ATRIBULADOS, PORÉM, NÃO ESTAMOS ANGUSTIADOS. O DEUS QUE ONTEM DE MIM CUIDOU, HOJE E SEMPRE COMIGO ESTARÁ. VIVEREMOS PELA FÉ , SABENDO QUE O NOSSO SENHOR VIVO ESTÁ E EM BREVE, MUITO EM BREVE (E EM BREVE, MUITO EM BREVE) AO CÉU NOS LEVARÁ. NÃO TEMAS OS TEMORES DA NOITE O SENHOR CONTIGO ESTÁ. O DEUS QUE ONTEM DE TI CUIDOU HOJE E SEMPRE CONTIGO ESTARÁ.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'CIDADE ETERNAL', 'CONSTRANGIDOS PELO AMOR DO NOSSO DEUS\nCAMINHAMOS PARA NOVA JERUSALÉM.\nPERSEGUIDOS, MAS NÃO DESAMPARADOS,\nSEGUIREMOS SEGUROS PARA A CIDADE ETERNAL.\n\nCORO\nEM RUAS DE OURO, SENHOR, ANDAREMOS,\nÀS MARGENS DO RIO DA VIDA TE BENDIREMOS,\nRIO CLARO COMO CRISTAL PROCEDENDO DO TRONO,\nDO TRONO DE DEUS E DO CORDEIRO.\nINIGUALÁVEL, INCOMPARÁVEL, INDESCRITÍVEL,\nO QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS\nINSTRUMENTOS\n\nDESTE MUNDO NÓS SEREMOS ARREBATADOS,\nCOM O CORDEIRO NAS NUVENS NOS ENCONTRAREMOS.\nNÃO HAVERÁ MAIS DOR E NÃO HAVERÁ PRANTO,\nSÃO PALAVRAS FIÉIS E VERDADEIRAS PROFERIDAS POR DEUS.\n\nCORO\nEM RUAS DE OURO, SENHOR, ANDAREMOS,\nÀS MARGENS DO RIO DA VIDA TE BENDIREMOS,\nRIO CLARO COMO CRISTAL PROCEDENDO DO TRONO\nDO TRONO DE DEUS E DO CORDEIRO.\nINIGUALÁVEL, INCOMPARÁVEL, INDESCRITÍVEL,\nO QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS.\n\nINIGUALÁVEL, INCOMPARÁVEL, INDESCRITÍVEL,\nO QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS\nBIS\n\nFINAL: \nO QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS', 'CONSTRANGIDOS PELO AMOR DO NOSSO DEUS CAMINHAMOS PARA NOVA JERUSALÉM. PERSEGUIDOS, MAS NÃO DESAMPARADOS, SEGUIREMOS SEGUROS PARA A CIDADE ETERNAL. EM RUAS DE OURO, SENHOR, ANDAREMOS, ÀS MARGENS DO RIO DA VIDA TE BENDIREMOS, RIO CLARO COMO CRISTAL PROCEDENDO DO TRONO, DO TRONO DE DEUS E DO CORDEIRO. INIGUALÁVEL, INCOMPARÁVEL, INDESCRITÍVEL, O QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS DESTE MUNDO NÓS SEREMOS ARREBATADOS, COM O CORDEIRO NAS NUVENS NOS ENCONTRAREMOS. NÃO HAVERÁ MAIS DOR E NÃO HAVERÁ PRANTO, SÃO PALAVRAS FIÉIS E VERDADEIRAS PROFERIDAS POR DEUS. EM RUAS DE OURO, SENHOR, ANDAREMOS, ÀS MARGENS DO RIO DA VIDA TE BENDIREMOS, RIO CLARO COMO CRISTAL PROCEDENDO DO TRONO DO TRONO DE DEUS E DO CORDEIRO. INIGUALÁVEL, INCOMPARÁVEL, INDESCRITÍVEL, O QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS. INIGUALÁVEL, INCOMPARÁVEL, INDESCRITÍVEL, O QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS O QUE DEUS PREPAROU PARA OS SEUS SALVOS E REMIDOS', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PILARES DE UM CRISTÃO', 'SAIBA MEU IRMÃO \nQUE HÁ PILARES QUE SUSTENTAM \nA VIDA DE UM CRISTÃO.\nNA ALEGRIA OU NA AFLIÇÃO \nO QUE IMPORTA É QUE TODOS\nESTÃO FIRMADOS NA ROCHA,\n\nA PEDRA DE ESQUINA\nQUE É NOSSO CRISTO, O SALVADOR.\nMESMO PREGADO NO MADEIRO,\nE PROVADO ATÉ A MORTE,\nRESSUSCITOU GLORIFICADO\nPARA NOS DAR A VIDA ETERNA.\n\nCORO\nOS PILARES DE UM CRISTÃO \nSÃO ERGUIDOS PELA FÉ \nNA ESPERANÇA DE QUE UM DIA\nAO CÉU DE GLÓRIA CHEGAREMOS.\nPOIS, NOSSO CRISTO VOLTARÁ\nE AO CÉU NOS LEVARÁ \nE COM ELE ESTAREMOS,\nNAS RUAS DE OURO ANDAREMOS.\n\nA ORAÇÃO DE UM CONTRITO\nÉ UM PILAR DA FÉ EM CRISTO,\nQUE NÃO REJEITA E NEM DEVOLVE\nA PETIÇÃO DE UM AFLITO.\nTENHA CERTEZA, MEU IRMÃO,\nQUE AS LÁGRIMAS NÃO SÃO EM VÃO.\n\nELAS MOVEM O CORAÇÃO DE DEUS\nQUE NOS DÁ A SALVAÇÃO \nPOR AQUELE QUE AO TERCEIRO DIA\nRESSURGIU VENCENDO A MORTE,\nE BREVE VOLTARÁ NAS NUVENS\nE NOS LEVARÁ À GLÓRIA.\n\nCORO\nOS PILARES DE UM CRISTÃO \nSÃO ERGUIDOS PELA FÉ \nNA ESPERANÇA DE QUE UM DIA\nAO CÉU DE GLÓRIA CHEGAREMOS.\nPOIS, NOSSO CRISTO VOLTARÁ\nE AO CÉU NOS LEVARÁ \nE COM ELE ESTAREMOS,\nNAS RUAS DE OURO ANDAREMOS.', 'SAIBA MEU IRMÃO QUE HÁ PILARES QUE SUSTENTAM A VIDA DE UM CRISTÃO. NA ALEGRIA OU NA AFLIÇÃO O QUE IMPORTA É QUE TODOS ESTÃO FIRMADOS NA ROCHA, A PEDRA DE ESQUINA QUE É NOSSO CRISTO, O SALVADOR. MESMO PREGADO NO MADEIRO, E PROVADO ATÉ A MORTE, RESSUSCITOU GLORIFICADO PARA NOS DAR A VIDA ETERNA. OS PILARES DE UM CRISTÃO SÃO ERGUIDOS PELA FÉ NA ESPERANÇA DE QUE UM DIA AO CÉU DE GLÓRIA CHEGAREMOS. POIS, NOSSO CRISTO VOLTARÁ E AO CÉU NOS LEVARÁ E COM ELE ESTAREMOS, NAS RUAS DE OURO ANDAREMOS. A ORAÇÃO DE UM CONTRITO É UM PILAR DA FÉ EM CRISTO, QUE NÃO REJEITA E NEM DEVOLVE A PETIÇÃO DE UM AFLITO. TENHA CERTEZA, MEU IRMÃO, QUE AS LÁGRIMAS NÃO SÃO EM VÃO. ELAS MOVEM O CORAÇÃO DE DEUS QUE NOS DÁ A SALVAÇÃO POR AQUELE QUE AO TERCEIRO DIA RESSURGIU VENCENDO A MORTE, E BREVE VOLTARÁ NAS NUVENS E NOS LEVARÁ À GLÓRIA. OS PILARES DE UM CRISTÃO SÃO ERGUIDOS PELA FÉ NA ESPERANÇA DE QUE UM DIA AO CÉU DE GLÓRIA CHEGAREMOS. POIS, NOSSO CRISTO VOLTARÁ E AO CÉU NOS LEVARÁ E COM ELE ESTAREMOS, NAS RUAS DE OURO ANDAREMOS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'IMUTÁVEL DEUS', 'É TEMPO DE RECONSTRUIR, \nREERGUER AS MURALHAS\nDISPONDO-SE A TRABALHAR, \nE NÃO OLHAR ATRÁS.\n\nCORO \nIMUTÁVEL DEUS! \nIGUAL A TI NÃO HÁ OUTRO.\nO TEU NOME É “EU SOU”, \nO GRANDE EL SHADAI.\n\nELE É O ALFA, (ELE É O ALFA)\nELE É O ÔMEGA, (ELE É O ÔMEGA)\nO PRIMEIRO E O ÚLTIMO, (O PRIMEIRO E O ÚLTIMO)\nIMUTÁVEL DEUS.\n\nONIPOTENTE, (ONIPOTENTE)\nONISCIENTE, (ONISCIENTE)\nONIPRESENTE, (ONIPRESENTE)\nIMUTÁVEL DEUS.\n\nDISPÕE-TE PARA PELEJAR \nDEFENDENDO ESTA OBRA.\nNÃO TEMAS, POIS, \nO TEU DEUS A VITÓRIA JÁ TE DEU.\n\nCORO \nIMUTÁVEL DEUS! \nIGUAL A TI NÃO HÁ OUTRO.\nO TEU NOME É “EU SOU”, \nO GRANDE EL SHADAI.\n\nELE É O ALFA, (ELE É O ALFA)\nELE É O ÔMEGA, (ELE É O ÔMEGA)\nO PRIMEIRO E O ÚLTIMO, (O PRIMEIRO E O ÚLTIMO)\nIMUTÁVEL DEUS.\n\nONIPOTENTE, (ONIPOTENTE)\nONISCIENTE, (ONISCIENTE)\nONIPRESENTE, (ONIPRESENTE)\nIMUTÁVEL DEUS.\n\nIMUTÁVEL DEUS! IGUAL A TI NÃO HÁ OUTRO.\nO TEU NOME É “EU SOU”, O GRANDE EL SHADAI.\n\nFINAL: O GRANDE EL SHADAI (2X)\nBIS', 'É TEMPO DE RECONSTRUIR, REERGUER AS MURALHAS DISPONDO-SE A TRABALHAR, E NÃO OLHAR ATRÁS. ELE É O ALFA, (ELE É O ALFA) ELE É O ÔMEGA, (ELE É O ÔMEGA) O PRIMEIRO E O ÚLTIMO, (O PRIMEIRO E O ÚLTIMO) IMUTÁVEL DEUS. ONIPOTENTE, (ONIPOTENTE) ONISCIENTE, (ONISCIENTE) ONIPRESENTE, (ONIPRESENTE) IMUTÁVEL DEUS. DISPÕE-TE PARA PELEJAR DEFENDENDO ESTA OBRA. NÃO TEMAS, POIS, O TEU DEUS A VITÓRIA JÁ TE DEU. ELE É O ALFA, (ELE É O ALFA) ELE É O ÔMEGA, (ELE É O ÔMEGA) O PRIMEIRO E O ÚLTIMO, (O PRIMEIRO E O ÚLTIMO) IMUTÁVEL DEUS. ONIPOTENTE, (ONIPOTENTE) ONISCIENTE, (ONISCIENTE) ONIPRESENTE, (ONIPRESENTE) IMUTÁVEL DEUS. IMUTÁVEL DEUS! IGUAL A TI NÃO HÁ OUTRO. O TEU NOME É EU SOU, O GRANDE EL SHADAI. O GRANDE EL SHADAI', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'NÃO HÁ O QUE TEMER (SEI QUE DEUS É POR MIM)', 'NÃO HÁ O QUE TEMER,\nO SENHOR, MEU PASTOR,\nLIVRA MINH’ALMA DA MORTE\nE OS MEUS PÉS CAMINHAM NA LUZ.\n\nAINDA QUE NO VALE EU ANDE,\nTU ME ESCONDES E TUA MÃO ME SUSTENTA.\nNÃO TEMEREI, CONFIAREI NO SENHOR.\n\nCORO \nSEI QUE DEUS É POR MIM, \nE O QUE ME RESTA É LOUVAR, ADORAR, \nBENDIZER PELAS SUAS MISERICÓRDIAS,\nNÃO HÁ O QUE TEMER.\n\nNÃO HÁ O QUE TEMER,\nTU ÉS MEU REI, SALVADOR.\nSE NO ALTO MAR PERDIDO ESTOU,\nTU ME CONDUZES, ÉS MINHA LUZ.\n\nAINDA QUE NO ÁRIDO DESERTO\nEU ME ENCONTRE,\nTU ALI ME SACIARÁS, CONFIAREI,\nDAS TUAS FONTES ME FARTAREI.\n\nCORO \nSEI QUE DEUS É POR MIM,\nE O QUE ME RESTA É LOUVAR, ADORAR, BENDIZER PELAS SUAS MISERICÓRDIAS,\nNÃO HÁ O QUE TEMER.\nBIS', 'NÃO HÁ O QUE TEMER, O SENHOR, MEU PASTOR, LIVRA MINH’ALMA DA MORTE E OS MEUS PÉS CAMINHAM NA LUZ. AINDA QUE NO VALE EU ANDE, TU ME ESCONDES E TUA MÃO ME SUSTENTA. NÃO TEMEREI, CONFIAREI NO SENHOR. NÃO HÁ O QUE TEMER, TU ÉS MEU REI, SALVADOR. SE NO ALTO MAR PERDIDO ESTOU, TU ME CONDUZES, ÉS MINHA LUZ. AINDA QUE NO ÁRIDO DESERTO EU ME ENCONTRE, TU ALI ME SACIARÁS, CONFIAREI, DAS TUAS FONTES ME FARTAREI.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'CANTA IGREJA, IGREJA FIEL!', 'CANTA IGREJA, IGREJA FIEL!\nPORQUE DEUS HABITA ENTRE NÓS.\nAQUELE QUE VEM NO SEU POVO TOCAR,\nNA MENINA DOS OLHOS DE DEUS TOCARÁ\n\nA SUA BONDADE O SENHOR MOSTRARÁ, \nA TODO AQUELE QUE O SEU REFÚGIO BUSCAR \nAO NOSSO CLAMOR ELE INCLINARÁ SEUS OUVIDOS, PARA NOS ESCUTAR.\n\nCORO\nO SENHOR DESPERTOU COMO UM VALENTE \nPARA NOS PROTEGER CALE-SE TODA A TERRA, \nPOIS DA SANTA MORADA DEUS SE LEVANTOU.\nDEUS SE LEVANTOU (3X)\n\nINSTRUMENTOS\nBIS\n\nA GLÓRIA DE DEUS EM NOSSO MEIO ESTÁ,\nEM NOSSOS LÁBIOS DEUS COLOCARÁ \nA SUA PALAVRA PARA GUERREAR \nE NA SOMBRA DE SUAS MÃOS NOS PROTEGERÁ\n\nDOS TESOUROS DO CÉU A IGREJA ENCHERÁ, \nDOS VALORES ETERNOS ELA VIVERÁ.\nUM MURO DE FOGO AO REDOR JÁ ESTÁ:\nÉ DEUS NOS GUARDANDO PRA COM ELE MORAR.\n\nCORO \nO SENHOR DESPERTOU COMO UM VALENTE \nPARA NOS PROTEGER CALE-SE TODA A TERRA, \nPOIS DA SANTA MORADA DEUS SE LEVANTOU. \nDEUS SE LEVANTOU (3X no final)\nBIS', 'CANTA IGREJA, IGREJA FIEL! PORQUE DEUS HABITA ENTRE NÓS. AQUELE QUE VEM NO SEU POVO TOCAR, NA MENINA DOS OLHOS DE DEUS TOCARÁ A SUA BONDADE O SENHOR MOSTRARÁ, A TODO AQUELE QUE O SEU REFÚGIO BUSCAR AO NOSSO CLAMOR ELE INCLINARÁ SEUS OUVIDOS, PARA NOS ESCUTAR. O SENHOR DESPERTOU COMO UM VALENTE PARA NOS PROTEGER CALE-SE TODA A TERRA, POIS DA SANTA MORADA DEUS SE LEVANTOU. DEUS SE LEVANTOU A GLÓRIA DE DEUS EM NOSSO MEIO ESTÁ, EM NOSSOS LÁBIOS DEUS COLOCARÁ A SUA PALAVRA PARA GUERREAR E NA SOMBRA DE SUAS MÃOS NOS PROTEGERÁ DOS TESOUROS DO CÉU A IGREJA ENCHERÁ, DOS VALORES ETERNOS ELA VIVERÁ. UM MURO DE FOGO AO REDOR JÁ ESTÁ: É DEUS NOS GUARDANDO PRA COM ELE MORAR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'O FIM VEM!', 'A TROMBETA ESTÁ PRA SOAR,\nANUNCIANDO QUE CRISTO VOLTARÁ.\nALERTA IGREJA AMADA, TUDO JÁ SE CUMPRIU.\n\nOS ANJOS JÁ ESTÃO PREPARADOS,\nESPERANDO O MOMENTO DE SOAR A TROMBETA, \nPORQUE O SENHOR JÁ VEM!\n\nCORO  \nIGREJA O FIM VEM! O FIM VEM!\nJESUS, SIM VEM! JESUS VEM! \nÉ O MOMENTO DE PREPARADOS JÁ ESTARMOS \nPORQUE O FIM VEM!\n\nNa estrada da vida (jesus companheiro)\n\nNA ESTRADA DA VIDA DE ESTRANHOS MISTÉRIOS\nFIEL COMPANHEIRO É CRISTO, O SENHOR\nPRESENTE CONSTANTE AO LONGO DA ESTRADA\nJESUS COMPANHEIRO ME ANIMA COM AMOR.\n\nNÃO ESTOU SOZINHO, EU TENHO UM AMIGO,\nEM MEIO AOS PERIGOS PRESENTE ELE ESTÁ!\nNÃO ME DESAMPARA EM MEIO À JORNADA\nJESUS COMPANHEIRO COMIGO ESTARÁ.\n\nO BOM COMANHEIRO É AQUELE QUE AJUDA\nNA ETERNA CONQUISTA DA VIDA REAL.\nJESUS É ESTE AMIGO DE DOCE BONDADE\nQUE DEU À MINHA ALMA O GOZO ETERNAL.', 'A TROMBETA ESTÁ PRA SOAR, ANUNCIANDO QUE CRISTO VOLTARÁ. ALERTA IGREJA AMADA, TUDO JÁ SE CUMPRIU. OS ANJOS JÁ ESTÃO PREPARADOS, ESPERANDO O MOMENTO DE SOAR A TROMBETA, PORQUE O SENHOR JÁ VEM! NA ESTRADA DA VIDA (JESUS COMPANHEIRO) NA ESTRADA DA VIDA DE ESTRANHOS MISTÉRIOS FIEL COMPANHEIRO É CRISTO, O SENHOR PRESENTE CONSTANTE AO LONGO DA ESTRADA JESUS COMPANHEIRO ME ANIMA COM AMOR. NÃO ESTOU SOZINHO, EU TENHO UM AMIGO, EM MEIO AOS PERIGOS PRESENTE ELE ESTÁ! NÃO ME DESAMPARA EM MEIO À JORNADA JESUS COMPANHEIRO COMIGO ESTARÁ. O BOM COMANHEIRO É AQUELE QUE AJUDA NA ETERNA CONQUISTA DA VIDA REAL. JESUS É ESTE AMIGO DE DOCE BONDADE QUE DEU À MINHA ALMA O GOZO ETERNAL.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PÕE-ME COMO SELO', 'CORO \nPÕE-ME COMO SELO SOBRE O TEU CORAÇÃO COMO SELO SOBRE O TEU BRAÇO, O AMOR É FORTE COMO A MORTE, SUAS BRASAS SÃO BRASAS DE FOGO,\n\nAS MUITAS ÁGUAS NÃO PODEM APAGAR ESTE AMOR NEM OS RIOS AFOGÁ-LO, \nAS MUITAS ÁGUAS NÃO PODEM APAGAR ESTE AMOR NEM OS RIOS AFOGA-LO!\n\nÓ TU QUE HABITA OS JARDINS, \nOS COMPANHEIROS ATENTOS \nPARA OUVIR A TUA VOZ \nFAZ-ME TAMBÉM OUVI-LA.\n\nCORO \nPÕE-ME COMO SELO SOBRE O TEU CORAÇÃO COMO SELO SOBRE O TEU BRAÇO, O AMOR É FORTE COMO A MORTE, SUAS BRASAS SÃO BRASAS DE FOGO,\n\nÓ TU QUE HABITA OS JARDINS, \nOS COMPANHEIROS ATENTOS \nPARA OUVIR A TUA VOZ \nFAZ-ME TAMBÉM OUVI-LA. \n\nFINAL: COMO O AMOR, \n           COMO O AMOR...', 'AS MUITAS ÁGUAS NÃO PODEM APAGAR ESTE AMOR NEM OS RIOS AFOGÁ-LO, AS MUITAS ÁGUAS NÃO PODEM APAGAR ESTE AMOR NEM OS RIOS AFOGA-LO! Ó TU QUE HABITA OS JARDINS, OS COMPANHEIROS ATENTOS PARA OUVIR A TUA VOZ FAZ-ME TAMBÉM OUVI-LA. Ó TU QUE HABITA OS JARDINS, OS COMPANHEIROS ATENTOS PARA OUVIR A TUA VOZ FAZ-ME TAMBÉM OUVI-LA. COMO O AMOR, COMO O AMOR...', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'EIS-ME, Ó SALVADOR, AQUI', 'EIS-ME, Ó SALVADOR, AQUI! \nCORPO E ALMA OFERTO A TI!\nSERVO INÚTIL SEM VALOR, \nMAS PERTENÇO A MEU SENHOR!\n\nFRACO EM OBRA E NO PENSAR; MUI PROPENSO A TROPEÇAR;\nSALVO ESTOU POR TEU AMOR \nE ME VOTO A TI, SENHOR!\n\nSUBJUGADO EM TODO O SER, \nME SUBMETO AO TEU PODER!\nGRANDE É O PREÇO DO PERDÃO, INTEIRA A CONSAGRAÇÃO!\n\nEU REMIDO PECADOR, \nME DEDICO AO REDENTOR.\nTEU É ESTE CORAÇÃO, \nTEU, EM PLENA SUJEIÇÃO!\n\nTOMA-ME, SENHOR JESUS! FAZ-ME ANDAR CONTIGO EM LUZ,\nSEM RESERVA, SEM TEMOR, \nTEU CATIVO, Ó SALVADOR.', 'EIS-ME, Ó SALVADOR, AQUI! CORPO E ALMA OFERTO A TI! SERVO INÚTIL SEM VALOR, MAS PERTENÇO A MEU SENHOR! FRACO EM OBRA E NO PENSAR; MUI PROPENSO A TROPEÇAR; SALVO ESTOU POR TEU AMOR E ME VOTO A TI, SENHOR! SUBJUGADO EM TODO O SER, ME SUBMETO AO TEU PODER! GRANDE É O PREÇO DO PERDÃO, INTEIRA A CONSAGRAÇÃO! EU REMIDO PECADOR, ME DEDICO AO REDENTOR. TEU É ESTE CORAÇÃO, TEU, EM PLENA SUJEIÇÃO! TOMA-ME, SENHOR JESUS! FAZ-ME ANDAR CONTIGO EM LUZ, SEM RESERVA, SEM TEMOR, TEU CATIVO, Ó SALVADOR.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'HONRA E GLÓRIA AO CORDEIRO', 'JESUS NO CÉU ME ENCONTRARÁ \nQUANDO EU A VIDA AQUI FINDAR,\nE OS REDIMIDOS DO SENHOR\nLIBERTOS DO VIL TENTADOR. (VARÕES)\nAO CHEGAR À GLÓRIA, CANTAREI VITÓRIAS;\n\nCANTAREI (CANTAREI) \nQUE SANTO É DEUS (QUE SANTO É DEUS)\nSANTO E SANTO (SANTO E SANTO) \nÉ DEUS SENHOR (SANTO É DEUS)\nGLÓRIA E HONRA (GLÓRIA E HONRA) \nAO GRANDE DEUS (GRANDE DEUS)\nAO QUE É E HÁ DE SER.\n\nSANTO, SANTO (SANTO É DEUS) \nÉ DEUS SENHOR (SIM DEUS SENHOR)\nALELUIA! (ALELUIA!) \nCANTAREI (CANTAREI) \nCOM OS ANJOS (COM OS ANJOS) \nLÁ NOS CÉUS (LÁ NOS CÉUS),\nGLÓRIA, HONRA AO NOSSO DEUS!\n\nOH QUE BELAS VOZES VEM DO TRONO DO SENHOR;\nGLÓRIA CANTAM AO CORDEIRO \nA QUEM É SEU SALVADOR (SEU SALVADOR).\nHARMONIA SANTA VEM-ME COMO AS ONDAS EMBALAR.\n\nAO CORDEIRO GLÓRIA E HONRA, \nSALVOS NÃO CESSEIS DE DAR.\nGLÓRIA, HONRA SEMPRE A DEUS ENTOAREI! \nAMÉM!', 'JESUS NO CÉU ME ENCONTRARÁ QUANDO EU A VIDA AQUI FINDAR, E OS REDIMIDOS DO SENHOR LIBERTOS DO VIL TENTADOR. AO CHEGAR À GLÓRIA, CANTAREI VITÓRIAS; CANTAREI (CANTAREI) QUE SANTO É DEUS (QUE SANTO É DEUS) SANTO E SANTO (SANTO E SANTO) É DEUS SENHOR (SANTO É DEUS) GLÓRIA E HONRA (GLÓRIA E HONRA) AO GRANDE DEUS (GRANDE DEUS) AO QUE É E HÁ DE SER. SANTO, SANTO (SANTO É DEUS) É DEUS SENHOR (SIM DEUS SENHOR) ALELUIA! (ALELUIA!) CANTAREI (CANTAREI) COM OS ANJOS (COM OS ANJOS) LÁ NOS CÉUS (LÁ NOS CÉUS), GLÓRIA, HONRA AO NOSSO DEUS! OH QUE BELAS VOZES VEM DO TRONO DO SENHOR; GLÓRIA CANTAM AO CORDEIRO A QUEM É SEU SALVADOR (SEU SALVADOR). HARMONIA SANTA VEM-ME COMO AS ONDAS EMBALAR. AO CORDEIRO GLÓRIA E HONRA, SALVOS NÃO CESSEIS DE DAR. GLÓRIA, HONRA SEMPRE A DEUS ENTOAREI! AMÉM!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'JARDIM DE ORAÇÃO', 'O JARDIM ONDE CRISTO ME ESPERA \nÉ LUGAR DE DELÍCIAS E PAZ.\nPOIS O BRILHO DE SUA PRESENÇA \nDÁ-ME VIDA REAL EFICAZ.\n\nCORO\nOH! QUE LINDO JARDIM, O JARDIM DE ORAÇÃO \nONDE AS FLORES EXALAM PODER.\nMEU JESUS PERTO ESTÁ E O PORTÃO ABRIRÁ DESTE LINDO JARDIM DE ORAÇÃO.\n\nNO JARDIM ONDE CRISTO ME ESPERA \nEU DISPONHO MEUS MALES E DOR.\nE POR BÊNÇÃOS DE DEUS CONFORTADO DOU LOUVORES AO MEU SALVADOR.\n\nCORO\nOH! QUE LINDO JARDIM, O JARDIM DE ORAÇÃO \nONDE AS FLORES EXALAM PODER.\nMEU JESUS PERTO ESTÁ E O PORTÃO ABRIRÁ DESTE LINDO JARDIM DE ORAÇÃO.\n\nNO JARDIM ONDE CRISTO ME ESPERA \nE QUER TAMBÉM TE ACOLHER MEU IRMÃO.\nVEM FRUIR A INCESSANTE BONDADE \nQUE EMANA DE SEU CORAÇÃO.\n\nCORO\nOH! QUE LINDO JARDIM, O JARDIM DE ORAÇÃO \nONDE AS FLORES EXALAM PODER.\nMEU JESUS PERTO ESTÁ E O PORTÃO ABRIRÁ DESTE LINDO JARDIM DE ORAÇÃO.', 'O JARDIM ONDE CRISTO ME ESPERA É LUGAR DE DELÍCIAS E PAZ. POIS O BRILHO DE SUA PRESENÇA DÁ-ME VIDA REAL EFICAZ. OH! QUE LINDO JARDIM, O JARDIM DE ORAÇÃO ONDE AS FLORES EXALAM PODER. MEU JESUS PERTO ESTÁ E O PORTÃO ABRIRÁ DESTE LINDO JARDIM DE ORAÇÃO. NO JARDIM ONDE CRISTO ME ESPERA EU DISPONHO MEUS MALES E DOR. E POR BÊNÇÃOS DE DEUS CONFORTADO DOU LOUVORES AO MEU SALVADOR. OH! QUE LINDO JARDIM, O JARDIM DE ORAÇÃO ONDE AS FLORES EXALAM PODER. MEU JESUS PERTO ESTÁ E O PORTÃO ABRIRÁ DESTE LINDO JARDIM DE ORAÇÃO. NO JARDIM ONDE CRISTO ME ESPERA E QUER TAMBÉM TE ACOLHER MEU IRMÃO. VEM FRUIR A INCESSANTE BONDADE QUE EMANA DE SEU CORAÇÃO. OH! QUE LINDO JARDIM, O JARDIM DE ORAÇÃO ONDE AS FLORES EXALAM PODER. MEU JESUS PERTO ESTÁ E O PORTÃO ABRIRÁ DESTE LINDO JARDIM DE ORAÇÃO.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'PELAS MARAVILHAS', 'PELAS MARAVILHAS E PELOS LIVRAMENTOS, SENHOR, DAMOS GRAÇAS E LOUVOR!\nÉS O DEUS ETERNO, FIEL, EMANUEL, \nDEUS DE AMOR. \nGLÓRIA AO CRIADOR!\n\nÉS JUSTO E RETO, TUA MAJESTADE MANIFESTARÁS, MANIFESTARÁS!\nEM MEIO AOS TEUS SERVOS, \nFIÉIS E REMIDOS, \nTUA LUZ BRILHARÁ PRA SEMPRE, \nDEUS TRIÚNO, EXCELSO SENHOR!\n\nREPETIR O LOUVOR\n\nPELAS MARAVILHAS E PELOS LIVRAMENTOS, SENHOR, DAMOS GRAÇAS E LOUVOR!\nÉS O DEUS ETERNO, FIEL, EMANUEL, \nDEUS DE AMOR. \nGLÓRIA AO CRIADOR!\n\nÉS JUSTO E RETO, TUA MAJESTADE MANIFESTARÁS, MANIFESTARÁS!\nEM MEIO AOS TEUS SERVOS, \nFIÉIS E REMIDOS, \nTUA LUZ BRILHARÁ PRA SEMPRE, \nDEUS TRIÚNO, EXCELSO SENHOR!\n\nFINAL: EXCELSO SENHOR!', 'PELAS MARAVILHAS E PELOS LIVRAMENTOS, SENHOR, DAMOS GRAÇAS E LOUVOR! ÉS O DEUS ETERNO, FIEL, EMANUEL, DEUS DE AMOR. GLÓRIA AO CRIADOR! ÉS JUSTO E RETO, TUA MAJESTADE MANIFESTARÁS, MANIFESTARÁS! EM MEIO AOS TEUS SERVOS, FIÉIS E REMIDOS, TUA LUZ BRILHARÁ PRA SEMPRE, DEUS TRIÚNO, EXCELSO SENHOR! PELAS MARAVILHAS E PELOS LIVRAMENTOS, SENHOR, DAMOS GRAÇAS E LOUVOR! ÉS O DEUS ETERNO, FIEL, EMANUEL, DEUS DE AMOR. GLÓRIA AO CRIADOR! ÉS JUSTO E RETO, TUA MAJESTADE MANIFESTARÁS, MANIFESTARÁS! EM MEIO AOS TEUS SERVOS, FIÉIS E REMIDOS, TUA LUZ BRILHARÁ PRA SEMPRE, DEUS TRIÚNO, EXCELSO SENHOR! EXCELSO SENHOR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'TODA TERRA EXALTAI', 'TODA TERRA EXALTAI NO SENHOR.\nVINDE, LHE RENDEI GLÓRIA \nE HONRA COM HINOS DE LOUVOR.\n\nSOLO MASCULINO\nE SABEI QUE O SENHOR, ELE É DEUS;\nPOIS FOI ELE QUE NOS FEZ O POVO SEU,\nO POVO SEU E OVELHAS DO SEU ETERNO, SEU ETERNO AMOR.\n\nPELAS ENTRADAS, VINDE ENTRAI A SUA GRAÇA CANTANDO COM LOUVOR.\nLOUVAI E BENDIZEI, \nLOUVAI E BENDIZEI AO BONDOSO DEUS, SENHOR\n\nMULHERES\nO SENHOR É BOM! A SUA VERDADE DURA,\nE A SUA FIDELIDADE DURA \nDE GERAÇÃO EM GERAÇÃO,\nDE GERAÇÃO EM GERAÇÃO.\n\nGLÓRIA SEJA DADA AO PAI \nE AO FILHO E AO ESPÍRITO SANTO,\nCOMO FOI NO PRINCÍPIO \nE AGORA E PARA SEMPRE:\nAMÉM, AMÉM, AMÉM!', 'TODA TERRA EXALTAI NO SENHOR. VINDE, LHE RENDEI GLÓRIA E HONRA COM HINOS DE LOUVOR. SOLO MASCULINO E SABEI QUE O SENHOR, ELE É DEUS; POIS FOI ELE QUE NOS FEZ O POVO SEU, O POVO SEU E OVELHAS DO SEU ETERNO, SEU ETERNO AMOR. PELAS ENTRADAS, VINDE ENTRAI A SUA GRAÇA CANTANDO COM LOUVOR. LOUVAI E BENDIZEI, LOUVAI E BENDIZEI AO BONDOSO DEUS, SENHOR MULHERES O SENHOR É BOM! A SUA VERDADE DURA, E A SUA FIDELIDADE DURA DE GERAÇÃO EM GERAÇÃO, DE GERAÇÃO EM GERAÇÃO. GLÓRIA SEJA DADA AO PAI E AO FILHO E AO ESPÍRITO SANTO, COMO FOI NO PRINCÍPIO E AGORA E PARA SEMPRE: AMÉM, AMÉM, AMÉM!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'EM OBEDIÊNCIA, SERVI AO SENHOR', 'EM OBEDIÊNCIA, SERVI AO SENHOR \nE EM HUMILDADE, BUSCAI AO SENHOR; \nDAS RIQUEZAS DO REINO DE DEUS, \nENCHEI O CORAÇÃO. \nE CHEIOS DO ESPÍRITO, \nNA BATALHA TEREIS VITÓRIA.\n\nCORO:\nO SENHOR SALVA, O SENHOR LIVRA, \nNÃO COM ESPADA, POIS DELE É A GUERRA; \nTOMA O CAJADO, DESCE AO RIBEIRO, \nDIANTE DA PELEJA O SENHOR É CONTIGO.\n\nPRUDENTEMENTE, ANDAI NO CAMINHO\nE TENDE ZELO COM A OBRA DO ESPÍRITO.\nCRIA EM MIM UM CORAÇÃO PURO\nE RENOVA-ME COM UM ESPÍRITO RETO.\n\nCORO (2X)\nO SENHOR SALVA, O SENHOR LIVRA, \nNÃO COM ESPADA, POIS DELE É A GUERRA; \nTOMA O CAJADO, DESCE AO RIBEIRO, \nDIANTE DA PELEJA O SENHOR É CONTIGO.\n\nFINAL: DIANTE DA PELEJA O SENHOR É CONTIGO.', 'EM OBEDIÊNCIA, SERVI AO SENHOR E EM HUMILDADE, BUSCAI AO SENHOR; DAS RIQUEZAS DO REINO DE DEUS, ENCHEI O CORAÇÃO. E CHEIOS DO ESPÍRITO, NA BATALHA TEREIS VITÓRIA. PRUDENTEMENTE, ANDAI NO CAMINHO E TENDE ZELO COM A OBRA DO ESPÍRITO. CRIA EM MIM UM CORAÇÃO PURO E RENOVA-ME COM UM ESPÍRITO RETO. O SENHOR SALVA, O SENHOR LIVRA, NÃO COM ESPADA, POIS DELE É A GUERRA; TOMA O CAJADO, DESCE AO RIBEIRO, DIANTE DA PELEJA O SENHOR É CONTIGO. DIANTE DA PELEJA O SENHOR É CONTIGO.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'CANTE ALELUIA', 'CANTE ALELUIA, CANTE ALELUIA \nCANTE ALELUIA, CANTE ALELUIA \nCANTE AO SENHOR.\n\nPORQUE ELE É O REI DA GLÓRIA\nELE É O REI DA GLÓRIA\nBIS\n\nCANTE ALELUIA, CANTE ALELUIA\nCANTE AO SENHOR.\n\nPORQUE ELE FAZ MARAVILHAS,\nELE FAZ MARAVILHAS\nBIS\n\nCANTE ALELUIA, CANTE ALELUIA\nCANTE AO SENHOR.\n\nPORQUE ELE É O DEUS QUE NOS OUVE,\nELE NOS OUVE.\nBIS\n\nCANTE ALELUIA, CANTE ALELUIA\nCANTE AO SENHOR.\n\nCANTE ALELUIA AO SENHOR,\nCANTE ALELUIA AO SENHOR!\nBIS', 'CANTE ALELUIA, CANTE ALELUIA CANTE ALELUIA, CANTE ALELUIA CANTE AO SENHOR. PORQUE ELE É O REI DA GLÓRIA ELE É O REI DA GLÓRIA CANTE ALELUIA, CANTE ALELUIA CANTE AO SENHOR. PORQUE ELE FAZ MARAVILHAS, ELE FAZ MARAVILHAS CANTE ALELUIA, CANTE ALELUIA CANTE AO SENHOR. PORQUE ELE É O DEUS QUE NOS OUVE, ELE NOS OUVE. CANTE ALELUIA, CANTE ALELUIA CANTE AO SENHOR. CANTE ALELUIA AO SENHOR, CANTE ALELUIA AO SENHOR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'ORAÇÃO DO PASTOR', 'ERA AINDA TÃO NOVO, \nTU ME DESTE UM CAJADO, \nRESISTI RECEBÊ-LO\nPOR TEMOR DOS TEUS LÁBIOS\nHOJE LOUVO AO SENHOR!\nPOR POSSUÍ-LO AINDA COMIGO\n\nA PESAR DOS DIAS PASSADOS,\nEU ME SINTO FORTALECIDO \nPELO TEU AMOR \nE, EMBEBECIDO PELO AGIR DO TEU ESPÍRITO SOBRE MIM.\n\nCORO\nEIS-ME AQUI, SENHOR! \nEIS-ME AQUI, SENHOR BENDITO, \nEIS-ME AQUI, SENHOR! \n\nFINAL: EIS-ME AQUI, SENHOR!', 'ERA AINDA TÃO NOVO, TU ME DESTE UM CAJADO, RESISTI RECEBÊ-LO POR TEMOR DOS TEUS LÁBIOS HOJE LOUVO AO SENHOR! POR POSSUÍ-LO AINDA COMIGO A PESAR DOS DIAS PASSADOS, EU ME SINTO FORTALECIDO PELO TEU AMOR E, EMBEBECIDO PELO AGIR DO TEU ESPÍRITO SOBRE MIM. EIS-ME AQUI, SENHOR! EIS-ME AQUI, SENHOR BENDITO, EIS-ME AQUI, SENHOR! EIS-ME AQUI, SENHOR!', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
-INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('null', 'FORTE DEUS', 'FORTE DEUS, TODO PODEROSO\nA TUA PAZ EXCEDE TODO ENTENDIMENTO\nE A TUA PAZ GUARDARÁ OS NOSSOS CORAÇÕES\nE OS NOSSOS PENSAMENTOS\nEM CRISTO JESUS\n\nTODO PODEROSO, DEUS,\nDEUS FORTE, MAGNIFICENTE, EMANUEL,\nTUA GLÓRIA ENCHERÁ TODA TERRA;\nINCOMPARÁVEIS SÃO AS TUAS OBRAS,\nÓ DEUS, GRANDIOSO ÉS!\nNOS ENSINASTE, ENTÃO,\nTUDO O QUE É VERDADEIRO, NISSO PENSAI.\nO QUE É PURO E JUSTO,\nSE HÁ ALGUM LOUVOR, NISSO PENSAI.\n\nÀ SOMBRA DA MORTE ANDÁVAMOS PERDIDOS,\nE EM MEIO ÀS TREVAS RESPLANDECEU A LUZ.\nE AGORA LIBERTOS EXULTAREMOS EM CRISTO,\nQUE VEIO AO MUNDO PARA SALVAÇÃO NOS DAR.\n\nUM MENINO NOS NASCEU; E SOBRE OS SEUS OMBROS\nO PRINCIPADO ESTÁ; E SE CHAMARÁ O SEU NOME:\nCONSELHEIRO, MARAVILHOSO, FORTE DEUS \nE PRÍNCIPE DA PAZ. DA ETERNIDADE É PAI, \nE O PRINCIPADO ETERNO SUBSISTIRÁ\nCOM JUÍZO E COM JUSTIÇA, \nFIRMADO AGORA E ETERNAMENTE,\nPELO ZELO DO SENHOR.\n\nTODO PODEROSO DEUS.\nDEUS FORTE, MAGNIFICENTE, EMANUEL,\nTUA GLÓRIA ENCHERÁ TODA TERRA;\nINCOMAPARÁVEIS SÃO TUAS OBRAS,\nGRANDIOSO ÉS.', 'FORTE DEUS, TODO PODEROSO A TUA PAZ EXCEDE TODO ENTENDIMENTO E A TUA PAZ GUARDARÁ OS NOSSOS CORAÇÕES E OS NOSSOS PENSAMENTOS EM CRISTO JESUS TODO PODEROSO, DEUS, DEUS FORTE, MAGNIFICENTE, EMANUEL, TUA GLÓRIA ENCHERÁ TODA TERRA; INCOMPARÁVEIS SÃO AS TUAS OBRAS, Ó DEUS, GRANDIOSO ÉS! NOS ENSINASTE, ENTÃO, TUDO O QUE É VERDADEIRO, NISSO PENSAI. O QUE É PURO E JUSTO, SE HÁ ALGUM LOUVOR, NISSO PENSAI. À SOMBRA DA MORTE ANDÁVAMOS PERDIDOS, E EM MEIO ÀS TREVAS RESPLANDECEU A LUZ. E AGORA LIBERTOS EXULTAREMOS EM CRISTO, QUE VEIO AO MUNDO PARA SALVAÇÃO NOS DAR. UM MENINO NOS NASCEU; E SOBRE OS SEUS OMBROS O PRINCIPADO ESTÁ; E SE CHAMARÁ O SEU NOME: CONSELHEIRO, MARAVILHOSO, FORTE DEUS E PRÍNCIPE DA PAZ. DA ETERNIDADE É PAI, E O PRINCIPADO ETERNO SUBSISTIRÁ COM JUÍZO E COM JUSTIÇA, FIRMADO AGORA E ETERNAMENTE, PELO ZELO DO SENHOR. TODO PODEROSO DEUS. DEUS FORTE, MAGNIFICENTE, EMANUEL, TUA GLÓRIA ENCHERÁ TODA TERRA; INCOMAPARÁVEIS SÃO TUAS OBRAS, GRANDIOSO ÉS.', 4, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);
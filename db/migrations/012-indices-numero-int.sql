@@ -0,0 +1,10 @@
+-- número do hino como inteiro, calculado do numero (TEXT); NULL para os
+-- avulsos sem número ('null')
+ALTER TABLE hino ADD COLUMN numero_int INTEGER GENERATED ALWAYS AS (
+  CASE WHEN numero GLOB '[0-9]*' THEN CAST(numero AS INTEGER) END
+) VIRTUAL;
+
+CREATE INDEX IF NOT EXISTS hino_coletanea_numero_idx ON hino (coletanea_id, numero_int);
+CREATE INDEX IF NOT EXISTS hino_categoria_idx ON hino (categoria_id);
+CREATE INDEX IF NOT EXISTS hino_autor_hino_idx ON hino_autor (hino_id);
+CREATE INDEX IF NOT EXISTS hino_autor_autor_idx ON hino_autor (autor_id);
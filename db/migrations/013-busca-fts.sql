@@ -0,0 +1,31 @@
+-- busca de texto completo nos títulos e letras, sem diferenciar acentos
+-- ("ORACAO" encontra "ORAÇÃO"); o conteúdo fica só no hino (tabela de
+-- conteúdo externo) e os índices de prefixo atendem a busca enquanto se digita
+CREATE VIRTUAL TABLE IF NOT EXISTS hino_fts USING fts5(
+  nome,
+  texto_limpo,
+  content = 'hino',
+  content_rowid = 'id',
+  tokenize = 'unicode61 remove_diacritics 2',
+  prefix = '2 3'
+);
+
+INSERT INTO hino_fts (hino_fts) VALUES ('rebuild');
+
+-- mantêm o índice em dia com o hino
+CREATE TRIGGER IF NOT EXISTS hino_fts_insert AFTER INSERT ON hino BEGIN
+  INSERT INTO hino_fts (rowid, nome, texto_limpo)
+  VALUES (new.id, new.nome, new.texto_limpo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS hino_fts_delete AFTER DELETE ON hino BEGIN
+  INSERT INTO hino_fts (hino_fts, rowid, nome, texto_limpo)
+  VALUES ('delete', old.id, old.nome, old.texto_limpo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS hino_fts_update AFTER UPDATE OF nome, texto_limpo ON hino BEGIN
+  INSERT INTO hino_fts (hino_fts, rowid, nome, texto_limpo)
+  VALUES ('delete', old.id, old.nome, old.texto_limpo);
+  INSERT INTO hino_fts (rowid, nome, texto_limpo)
+  VALUES (new.id, new.nome, new.texto_limpo);
+END;
@@ -1,19 +1,288 @@
-import subprocess
+import argparse
+import functools
 import glob
+import gzip
+import hashlib
 import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
 
+# migrações já aplicadas ao banco, com o checksum do conteúdo de cada uma
+SCHEMA_MIGRATIONS = """CREATE TABLE IF NOT EXISTS schema_migrations (
+  name TEXT NOT NULL PRIMARY KEY,
+  checksum TEXT NOT NULL,
+  applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)"""
 
-def run_migrations():
-    """Run SQLIte migrations using CMD."""
-    # remove old database file if it exists
-    if os.path.exists("database.db"):
-        os.remove("database.db")
+# bancos já montados, um por sequência de migrações (hash encadeado)
+BUILD_CACHE = ".build_cache"
+# bancos guardados no cache (os mais recentes)
+BUILD_CACHE_KEEP = 5
 
-    migration_files = glob.glob("migrations/*.sql")
-    for migration in migration_files:
-        print(f"Running migration: {migration}")
-        subprocess.run(f"sqlite3 database.db < {migration}", shell=True)
+# só na montagem do zero: se ela falha, o arquivo é descartado, então não há o
+# que proteger com o journal em disco nem com fsync
+BUILD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",  # 64 MiB
+)
+
+
+def migration_files():
+    """Migrações em ordem de nome, em texto (.sql) ou comprimidas (.sql.gz)."""
+    files = glob.glob("migrations/*.sql") + glob.glob("migrations/*.sql.gz")
+    return sorted(files, key=os.path.basename)
+
+
+def open_migration(migration):
+    # .sql.gz é descomprimido sob demanda, sem montar o texto inteiro em memória
+    if migration.endswith(".gz"):
+        return gzip.open(migration, "rt", encoding="utf-8")
+    return open(migration, "r", encoding="utf-8")
+
+
+class MigrationError(Exception):
+    pass
+
+
+def migration_name(migration):
+    # a mesma migração, comprimida ou não, tem o mesmo nome
+    name = os.path.basename(migration)
+    return name[: -len(".gz")] if name.endswith(".gz") else name
+
+
+@functools.lru_cache(maxsize=None)
+def migration_checksum(migration):
+    """sha256 do SQL da migração (descomprimido: comprimir um .sql já aplicado
+    não conta como edição); calculado uma vez por execução."""
+    checksum = hashlib.sha256()
+    with open_migration(migration) as f:
+        for line in f:
+            checksum.update(line.encode("utf-8"))
+    return checksum.hexdigest()
+
+
+def read_statements(migration):
+    """Comandos SQL da migração, um a um, lidos linha a linha.
+
+    Cada ";" do texto acumulado é testado com sqlite3.complete_statement: um
+    ";" dentro de uma string (como nas letras) não encerra o comando, e vários
+    comandos numa linha, ou um comentário depois do ";", também funcionam.
+    """
+    buffer = ""
+    with open_migration(migration) as f:
+        for line in f:
+            start = len(buffer)
+            buffer += line
+            end = buffer.find(";", start)
+            while end != -1:
+                if sqlite3.complete_statement(buffer[: end + 1]):
+                    yield buffer[: end + 1]
+                    buffer = buffer[end + 1 :]
+                    end = buffer.find(";")
+                else:
+                    end = buffer.find(";", end + 1)
+    if buffer.strip():
+        yield buffer
+
+
+def chain_hashes(files):
+    """Hash encadeado de cada prefixo das migrações: o i-ésimo identifica as
+    migrações até a i-ésima, pelos nomes e conteúdos, na ordem."""
+    chain = hashlib.sha256()
+    hashes = []
+    for migration in files:
+        chain.update(
+            f"{migration_name(migration)}\0{migration_checksum(migration)}\0".encode()
+        )
+        hashes.append(chain.hexdigest())
+    return hashes
+
+
+def restore_build(db, hashes, cache_dir=BUILD_CACHE):
+    """Copia para db o banco em cache do maior prefixo das migrações e retorna
+    quantas migrações ele já tem (0 se nenhum prefixo está em cache)."""
+    for count in range(len(hashes), 0, -1):
+        cached = os.path.join(cache_dir, f"{hashes[count - 1]}.db")
+        if os.path.exists(cached):
+            shutil.copyfile(cached, db)
+            return count
+    return 0
+
+
+def store_build(db, chain_hash, cache_dir=BUILD_CACHE):
+    """Guarda db no cache, descartando os bancos mais antigos."""
+    os.makedirs(cache_dir, exist_ok=True)
+    shutil.copyfile(db, os.path.join(cache_dir, f"{chain_hash}.db"))
+    cached = sorted(
+        glob.glob(os.path.join(cache_dir, "*.db")), key=os.path.getmtime, reverse=True
+    )
+    for old in cached[BUILD_CACHE_KEEP:]:
+        os.remove(old)
+
+
+def connect(db="database.db", build=False):
+    # isolation_level=None: as transações ficam por conta do BEGIN/COMMIT
+    # explícitos (o executescript faria COMMIT a cada chamada)
+    conn = sqlite3.connect(db, isolation_level=None)
+    if build:
+        for pragma in BUILD_PRAGMAS:
+            conn.execute(pragma)
+    return conn
+
+
+def apply_migration(conn, migration):
+    """Aplica a migração comando a comando, na transação aberta."""
+    for statement in read_statements(migration):
+        conn.execute(statement)
+
+
+def pending_migrations(conn, files):
+    """Migrações ainda não aplicadas ao banco.
+
+    Recusa continuar se uma migração aplicada foi editada ou removida, ou se
+    uma nova vem antes da última aplicada na ordem de nome (rodaria fora de
+    ordem).
+    """
+    applied = dict(conn.execute("SELECT name, checksum FROM schema_migrations"))
+    names = {migration_name(migration): migration for migration in files}
+    missing = sorted(set(applied) - set(names))
+    if missing:
+        raise MigrationError(
+            f"Applied migrations missing from migrations/: {', '.join(missing)}"
+        )
+
+    pending = []
+    for name, migration in names.items():
+        if name not in applied:
+            pending.append(migration)
+        elif migration_checksum(migration) != applied[name]:
+            raise MigrationError(
+                f"Migration {migration} was edited after being applied; "
+                "add a new migration instead (or rebuild with --rebuild)"
+            )
+    if pending and applied and migration_name(pending[0]) < max(applied):
+        raise MigrationError(
+            f"Migration {pending[0]} sorts before already applied "
+            f"{max(applied)}; rename it or rebuild with --rebuild"
+        )
+    return pending
+
+
+def run_migrations(db="database.db", rebuild=False, cache=True):
+    """Aplica as migrações pendentes numa única transação, montando o banco
+    do zero quando ele não existe (ou com rebuild).
+
+    A montagem parte do banco em cache do maior prefixo das migrações, quando
+    houver, e o resultado vai para o cache.
+    """
+    if rebuild and os.path.exists(db):
+        os.remove(db)
+    build = not os.path.exists(db)
+
+    start = time.perf_counter()
+    files = migration_files()
+    hashes = chain_hashes(files) if build and cache else None
+    if hashes:
+        cached = restore_build(db, hashes)
+        if cached:
+            print(f"Using cached build of {cached}/{len(files)} migrations")
+
+    conn = connect(db, build)
+    try:
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
+        if tables and "schema_migrations" not in tables:
+            raise MigrationError(
+                f"{db} has no schema_migrations table; rebuild it with --rebuild"
+            )
+        conn.execute(SCHEMA_MIGRATIONS)
+        pending = pending_migrations(conn, files)
+        if not pending:
+            conn.close()
+            print(f"No pending migrations ({time.perf_counter() - start:.3f}s)")
+            return
+
+        conn.execute("BEGIN")
+        for migration in pending:
+            began = time.perf_counter()
+            apply_migration(conn, migration)
+            conn.execute(
+                "INSERT INTO schema_migrations (name, checksum) VALUES (?, ?)",
+                (migration_name(migration), migration_checksum(migration)),
+            )
+            print(f"Ran migration: {migration} ({time.perf_counter() - began:.3f}s)")
+        conn.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        conn.close()
+        if build:
+            os.remove(db)
+        raise
+
+    began = time.perf_counter()
+    conn.execute("ANALYZE")
+    if build:
+        conn.execute("VACUUM")
+    conn.close()
+    print(f"ANALYZE{'/VACUUM' if build else ''}: {time.perf_counter() - began:.3f}s")
+    if hashes:
+        store_build(db, hashes[-1])
+    print(
+        f"{len(pending)} migrations applied in {time.perf_counter() - start:.3f}s"
+    )
+
+
+def check_migrations(db="database.db"):
+    """Confere as migrações da pasta com as já aplicadas ao banco, sem aplicar
+    nada: MigrationError se alguma aplicada foi editada ou removida (como ao
+    regravar uma migração com o ETL)."""
+    conn = sqlite3.connect(f"{Path(db).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        pending = pending_migrations(conn, migration_files())
+    finally:
+        conn.close()
+    print(f"Applied migrations unchanged; {len(pending)} pending")
+    for migration in pending:
+        print(f"  {migration}")
+    return pending
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Aplica ao banco as migrações ainda não aplicadas"
+    )
+    parser.add_argument("--db", default="database.db", help="arquivo do banco")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="apaga o banco e o monta de novo, a partir do banco em cache do "
+        "maior prefixo das migrações (do zero com --no-cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="monta sem usar nem guardar os bancos em cache",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="só confere se as migrações já aplicadas ao banco não mudaram, "
+        "sem aplicar as pendentes",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.check:
+        check_migrations(args.db)
+    else:
+        run_migrations(args.db, args.rebuild, not args.no_cache)
 
 
 if __name__ == "__main__":
-    run_migrations()
+    main()
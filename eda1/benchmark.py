@@ -0,0 +1,158 @@
+import argparse
+import multiprocessing
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.banco import DATABASE_PATH
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# compara o acesso do app ao banco antes e depois do src/banco.py
+
+# a consulta do load_data (src/pipeline.py)
+LOAD_DATA = """
+select
+    hino.id,
+    numero,
+    nome,
+    texto,
+    texto_limpo,
+    categoria_id,
+    c.descricao as categoria
+from
+    hino
+    left join categoria c on c.id = categoria_id
+where
+    coletanea_id = 1
+order by
+    hino.id
+"""
+# buscas: comum, rara e prefixo
+BUSCAS = ["senhor", "cordeiro", "oraç"]
+
+
+def peak_rss():
+    """Pico de memória residente do processo, em bytes (None onde o módulo
+    resource não existe)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def private_memory():
+    """Memória privada do processo em bytes (sem as páginas compartilhadas,
+    como as do mmap), onde existe /proc; None nos outros sistemas."""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None
+    return sum(
+        int(fields[field].split()[0]) * 1024
+        for field in ("Private_Clean", "Private_Dirty")
+        if field in fields
+    )
+
+
+def serving_run(mode, db, repeat=1):
+    """Num processo novo: o load_data e as buscas no modo de acesso dado, com
+    o tempo e a memória. "engine" é o acesso antigo do app (create_engine e
+    engine.connect() a cada chamada, sem nunca fechar a conexão; uma conexão
+    sqlite3 nova por busca); "pooled", o engine somente leitura compartilhado."""
+    import pandas as pd
+    from sqlalchemy import create_engine
+    from src import banco
+    from src.busca import search
+
+    banco.DATABASE_PATH = db
+    rss = peak_rss()
+    # as conexões do acesso antigo ficam abertas, como no app
+    abertas = []
+    load_best = search_best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if mode == "pooled":
+            with banco.shared_engine().connect() as connection:
+                hinos = pd.read_sql_query(LOAD_DATA, connection)
+        else:
+            engine = create_engine(f"sqlite:///{db}")
+            connection = engine.connect()
+            hinos = pd.read_sql_query(LOAD_DATA, connection)
+            abertas.append(connection)
+        elapsed = time.perf_counter() - start
+        load_best = elapsed if load_best is None else min(load_best, elapsed)
+
+        start = time.perf_counter()
+        if mode == "pooled":
+            found = [search(termos) for termos in BUSCAS]
+        else:
+            found = []
+            for termos in BUSCAS:
+                connection = sqlite3.connect(db)
+                found.append(search(termos, connection=connection))
+                connection.close()
+        elapsed = (time.perf_counter() - start) / len(BUSCAS)
+        search_best = elapsed if search_best is None else min(search_best, elapsed)
+    return (
+        load_best,
+        search_best,
+        peak_rss() - rss if rss else None,
+        private_memory(),
+        hinos.values.tolist(),
+        found,
+    )
+
+
+def bench_serving(db, repeat=1):
+    """Compara o acesso antigo do app (engine e conexão novos a cada consulta)
+    com o engine compartilhado somente leitura (immutable, mmap, pool), cada
+    um num processo novo."""
+    spawn = multiprocessing.get_context("spawn")
+    print(f"Benchmarking serving: {db}")
+    results = {}
+    for mode in ("engine", "pooled"):
+        with ProcessPoolExecutor(1, mp_context=spawn) as executor:
+            results[mode] = executor.submit(serving_run, mode, db, repeat).result()
+        load, search, rss, private, _, _ = results[mode]
+        print(
+            f"  {mode:>8}: load_data {load * 1e3:.2f} ms, "
+            f"search {search * 1e3:.2f} ms, RSS +"
+            + (f"{rss / 2**20:.1f} MiB" if rss is not None else "n/a")
+            + ", private "
+            + (f"{private / 2**20:.1f} MiB" if private is not None else "n/a")
+        )
+    if results["engine"][4:] != results["pooled"][4:]:
+        print("  results differ")
+        return False
+    return True
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compara o acesso antigo do app ao banco com o engine "
+        "compartilhado somente leitura (load_data e busca)"
+    )
+    parser.add_argument(
+        "db",
+        nargs="?",
+        default=DATABASE_PATH,
+        help="arquivo do banco",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not bench_serving(args.db, args.repeat):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
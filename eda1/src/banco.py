@@ -0,0 +1,69 @@
+import atexit
+import functools
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# acesso ao banco do app: o database.db nunca é escrito enquanto o app roda
+# (é remontado pelo db/run_migrations.py e copiado para assets), então é aberto
+# só para leitura e como imutável: sem locks nem verificação de alterações, e
+# com as páginas mapeadas em memória, compartilhadas pelos processos do app
+# pelo cache de páginas do sistema operacional. Depois de trocar o arquivo, é
+# preciso reiniciar o app.
+
+DATABASE_PATH = Path(__file__).parent.parent / "assets" / "database.db"
+# maior que o banco: o arquivo inteiro fica mapeado
+MMAP_SIZE = 256 * 1024 * 1024
+# conexões abertas por processo, qualquer que seja o número de sessões; quem
+# passa disso espera uma conexão ser devolvida
+POOL_SIZE = 4
+POOL_TIMEOUT = 30
+
+
+def connect(
+    database_path: Path = DATABASE_PATH, check_same_thread: bool = True
+) -> sqlite3.Connection:
+    """Conexão somente leitura (mode=ro, immutable=1) com mmap."""
+    connection = sqlite3.connect(
+        f"{Path(database_path).resolve().as_uri()}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=check_same_thread,
+    )
+    connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    return connection
+
+
+def readonly_engine(database_path: Path = DATABASE_PATH) -> Engine:
+    """Engine do SQLAlchemy sobre as conexões de connect, com um pool fixo de
+    POOL_SIZE conexões (cada uma usada por uma thread de cada vez)."""
+    return create_engine(
+        "sqlite://",
+        creator=lambda: connect(database_path, check_same_thread=False),
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=POOL_TIMEOUT,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def shared_engine() -> Engine:
+    """Engine único do processo, compartilhado por todas as sessões do app e
+    pelas consultas (load_data, busca); as conexões são fechadas na saída."""
+    engine = readonly_engine(DATABASE_PATH)
+    atexit.register(engine.dispose)
+    return engine
+
+
+@contextmanager
+def pooled_connection():
+    """Conexão sqlite3 do pool compartilhado, devolvida ao pool no fim do
+    bloco."""
+    connection = shared_engine().raw_connection()
+    try:
+        yield connection
+    finally:
+        connection.close()
@@ -0,0 +1,71 @@
+import re
+import sqlite3
+from src.banco import pooled_connection
+
+# busca nos títulos e letras pelo índice FTS5 do banco (tabela hino_fts,
+# migração 013); sem dependência do Streamlit, para uso também em scripts
+
+COLUNAS = ("nome", "texto_limpo")
+# peso do título e da letra no bm25: um termo no título vale mais
+PESOS = (10.0, 1.0)
+PALAVRA_REGEX = re.compile(r"\w+")
+
+
+def fts_query(termos: str, coluna: str | None = None) -> str | None:
+    """Consulta FTS5 a partir do texto digitado: todas as palavras, a última
+    como prefixo (a busca acompanha a digitação). None se não há palavras."""
+    palavras = PALAVRA_REGEX.findall(termos)
+    if not palavras:
+        return None
+    query = " ".join(f'"{palavra}"' for palavra in palavras) + "*"
+    if coluna is not None:
+        query = f"{coluna} : ({query})"
+    return query
+
+
+def search(
+    termos: str,
+    coluna: str | None = None,
+    coletanea_id: int | None = None,
+    limite: int | None = None,
+    marcas: tuple[str, str] = ("[", "]"),
+    connection: sqlite3.Connection | None = None,
+) -> list[tuple[int, str]]:
+    """Ids dos hinos que contêm os termos, do mais para o menos relevante,
+    com um trecho da letra (ou do título) com os termos entre as marcas.
+
+    A busca não diferencia maiúsculas nem acentos; coluna restringe a "nome" ou
+    "texto_limpo" e coletanea_id a uma coletânea.
+    """
+    if coluna is not None and coluna not in COLUNAS:
+        raise ValueError(f"coluna deve ser uma de {COLUNAS}")
+    query = fts_query(termos, coluna)
+    if query is None:
+        return []
+
+    sql = f"""
+    select
+        hino_fts.rowid,
+        snippet(hino_fts, -1, ?, ?, '...', 12)
+    from
+        hino_fts
+        join hino h on h.id = hino_fts.rowid
+    where
+        hino_fts match ?
+        and (? is null or h.coletanea_id = ?)
+    order by
+        bm25(hino_fts, {PESOS[0]}, {PESOS[1]})
+    limit ?
+    """
+    params = (
+        *marcas,
+        query,
+        coletanea_id,
+        coletanea_id,
+        -1 if limite is None else limite,
+    )
+
+    if connection is not None:
+        return connection.execute(sql, params).fetchall()
+    with pooled_connection() as connection:
+        return connection.execute(sql, params).fetchall()
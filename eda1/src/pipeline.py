@@ -1,7 +1,7 @@
 import streamlit as st
-from sqlalchemy import create_engine
 import pandas as pd
 from pathlib import Path
+from src.banco import shared_engine
 
 # import nltk
 
@@ -20,14 +20,9 @@ def hinos_processados() -> pd.DataFrame:
 
 @st.cache_data
 def load_data() -> pd.DataFrame:
-    database_path = Path(__file__).parent.parent / "assets" / "database.db"
-    engine = create_engine(f"sqlite:///{database_path}")
-
-    # Connect to the database
-    connection = engine.connect()
-
     sql_query = """
     select
+        hino.id,
         numero,
         nome,
         texto,
@@ -39,9 +34,13 @@ def load_data() -> pd.DataFrame:
         left join categoria c on c.id = categoria_id
     where
         coletanea_id = 1
+    order by
+        hino.id
     """
 
-    hinos_analise = pd.read_sql_query(sql_query, connection)
+    # conexão do pool compartilhado, devolvida ao fim da consulta
+    with shared_engine().connect() as connection:
+        hinos_analise = pd.read_sql_query(sql_query, connection)
     return hinos_analise
 
 
@@ -1,5 +1,6 @@
 import streamlit as st
 from src.pipeline import load_data
+from src.busca import search
 
 hinos = load_data()
 
@@ -25,10 +26,16 @@ if nome_filtro:
     ]
 
 
+colunas = ["numero", "nome", "categoria", "texto_limpo"]
 if texto_filtro:
-    hinos_filtrado = hinos_filtrado[
-        hinos_filtrado["texto_limpo"].str.contains(texto_filtro, case=False, na=False)
-    ]
+    # pelo índice de busca do banco (sem diferenciar acentos), os mais
+    # relevantes primeiro, com o trecho em que os termos aparecem
+    trechos = dict(search(texto_filtro, "texto_limpo", coletanea_id=1))
+    hinos_filtrado = hinos_filtrado[hinos_filtrado["id"].isin(trechos)].copy()
+    hinos_filtrado["trecho"] = hinos_filtrado["id"].map(trechos)
+    ordem = {id_hino: posicao for posicao, id_hino in enumerate(trechos)}
+    hinos_filtrado = hinos_filtrado.sort_values("id", key=lambda ids: ids.map(ordem))
+    colunas = ["numero", "nome", "categoria", "trecho", "texto_limpo"]
 
 # Filtro por categoria
 categorias_unicas = hinos["categoria"].unique()
@@ -50,18 +57,12 @@ pode ser usada para pesquisa de hinos específicos, utilizando os filtros dispon
 
 
 st.dataframe(
-    hinos_filtrado[
-        [
-            "numero",
-            "nome",
-            "categoria",
-            "texto_limpo",
-        ]
-    ].rename(
+    hinos_filtrado[colunas].rename(
         columns={
             "numero": "Nº",
             "nome": "Título",
             "categoria": "Categoria",
+            "trecho": "Trecho",
             "texto_limpo": "Texto",
         }
     ),
@@ -0,0 +1,801 @@
+import argparse
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import re
+import sqlite3
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pptx2txt import count_slides, extract_slides, _presentation
+from pptx2txt import iter_slides, slide2txt, pptx2txt_parallel
+from txt2json import AUTO_SHAPE_PATTERN, parse_txt, read_praises, write_praises
+from json2sql import HINO_COLUNAS, hino_values, hinos2sql, batches, load_sql
+from json2sql import iter_structure, process_structure, erros_conhecidos
+from json2sql import TAGS_CONTROLE, TAGS_LITERAIS
+from json2sql import return_possible_title, set_text_clean
+from synthetic import make_deck, make_frames_deck
+from duplicates import DuplicateIndex, shingles
+from metrics import peak_rss
+from records import Praise
+from structure import parse_texto
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+# por padrão, as apresentações que geram as migrações 003 e 004
+DECKS_PADRAO = [
+    "slides_adapt\\01.COLETANEA_IGREJAS_2022_TV-16.9_ADAPT.pptx",
+    "slides_adapt\\03.COLETÂNEA DE CIAS_2021 TV_ADAPT.pptx",
+]
+DUMPS_PADRAO = [
+    "slides_txt\\01.COLETANEA_IGREJAS_2022_TV-16.9_ADAPT.pptx.txt",
+    "slides_txt\\03.COLETÂNEA DE CIAS_2021 TV_ADAPT.pptx.txt",
+]
+MIGRACOES_ESQUEMA = [
+    "..\\db\\migrations\\001-create-main-tables.sql",
+    "..\\db\\migrations\\002-coletaneas.sql",
+]
+INTERMEDIARIOS_PADRAO = [
+    "slides_json\\01.COLETANEA_IGREJAS_2022_TV-16.9_ADAPT.pptx.txt.ndjson",
+    "slides_json\\03.COLETÂNEA DE CIAS_2021 TV_ADAPT.pptx.txt.ndjson",
+]
+
+
+def split_txt(file_txt):
+    """Parser antigo do txt2json (splits aninhados), mantido como referência."""
+    praises = []
+    with open(file_txt, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    for praise in text.split("__END__"):
+        praise_struc = {}
+        praise_struc["slides"] = []
+
+        for slide in praise.split("SLIDE_"):
+            slide_struc = {}
+            slide_num = slide.split("\n")[0].strip()
+            if not slide_num:
+                continue
+
+            slide_struc["slide"] = slide_num
+            slide_struc["shapes"] = []
+
+            for shape in slide.split("\nSHAPE_"):
+                record_line = False
+                text_inside = ""
+                shapes_struc = {}
+
+                for line in shape.split("\n"):
+                    if "SHAPE_" in line:
+                        match = re.search(AUTO_SHAPE_PATTERN, line)
+                        auto_shape = match.group(1)
+
+                        shapes_struc["auto_shape"] = auto_shape
+                        shapes_struc["shape"] = "AUTO_SHAPE"
+
+                    if "HEIGHT_" in line:
+                        height = line.split("_")[1]
+                        shapes_struc["height"] = int(height)
+                    if "TOP_" in line:
+                        top = line.split("_")[1]
+                        shapes_struc["top"] = int(top)
+
+                    if "END_TEXT" in line:
+                        record_line = False
+
+                    if record_line:
+                        text_inside += line + "\n"
+                    else:
+                        if text_inside:
+                            shapes_struc["text"] = text_inside.strip()
+
+                    if "START_TEXT" in line:
+                        text_inside = ""
+                        record_line = True
+
+                if shapes_struc:
+                    slide_struc["shapes"].append(shapes_struc)
+
+            praise_struc["slides"].append(slide_struc)
+
+        praises.append(praise_struc)
+    return praises
+
+
+def stream_txt(file_txt):
+    """Parser atual: uma passada, louvor a louvor (só conta, não acumula)."""
+    count = 0
+    with open(file_txt, "r", encoding="utf-8") as f:
+        for _ in parse_txt(f):
+            count += 1
+    return count
+
+
+def load_json(file_json):
+    """Leitura antiga do json2sql: o .json indentado inteiro de uma vez."""
+    with open(file_json, "r", encoding="utf-8") as f:
+        louvores = [Praise.from_dict(louvor) for louvor in json.load(f)]
+    return sum(1 for _ in iter_structure(louvores))
+
+
+def load_ndjson(file_ndjson):
+    """Leitura atual do json2sql: um louvor por linha, sob demanda."""
+    return sum(1 for _ in iter_structure(read_praises(file_ndjson)))
+
+
+def legacy_possible_title(texts):
+    """return_possible_title antigo (uma busca por tag), mantido como referência."""
+    possible_title = [
+        text
+        for text in texts
+        if all(opt not in text.upper() for opt in TAGS_CONTROLE)
+        and text.strip() != ""
+        and text.upper() not in TAGS_LITERAIS
+    ]
+    if possible_title:
+        min_string = min(possible_title, key=len)
+        title_index = texts.index(min_string)
+        title = min_string.upper().replace("\n", " ")
+        if title not in erros_conhecidos:
+            return title, title_index
+    return None, None
+
+
+def legacy_text_clean(texts_wo_title):
+    """set_text_clean antigo (um replace por tag), mantido como referência."""
+    texts_clean = [re.sub(r"[ \t]{2,}", " ", text) for text in texts_wo_title]
+    texts_clean = [line for line in texts_clean if line not in TAGS_LITERAIS]
+    new_texts_clean = []
+    for line in texts_clean:
+        for tag in TAGS_CONTROLE:
+            line = line.upper().replace(tag, "")
+        line = line.strip()
+        if line:
+            new_texts_clean.append(line)
+    texts_clean = new_texts_clean
+    coro_regex = re.compile(r"^CORO\s*")
+    texts_clean = [line for line in texts_clean if not coro_regex.match(line)]
+    texts_clean = " ".join(texts_clean)
+    texts_clean = texts_clean.replace("\n", " ")
+    texts_clean = re.sub(r"[ \t]{2,}", " ", texts_clean)
+    texts_clean = texts_clean.replace("“", "")
+    texts_clean = texts_clean.replace("”", "")
+    texts_clean = texts_clean.replace('"', "")
+    return texts_clean
+
+
+def clean_all(fragments, possible_title, text_clean):
+    # mesmo caminho do process_praise: título, depois o texto limpo sem ele
+    results = []
+    for texts in fragments:
+        title, title_index = possible_title(texts)
+        texts_wo_title = texts.copy()
+        if title_index is not None:
+            texts_wo_title.pop(title_index)
+        results.append((title, title_index, text_clean(texts_wo_title)))
+    return results
+
+
+def hino2sql(hino, coletanea_id):
+    """Formato antigo das migrações: um INSERT por hino."""
+    return (
+        "INSERT INTO hino ("
+        + HINO_COLUNAS
+        + ") VALUES "
+        + hino_values(hino, coletanea_id)
+        + ";\n"
+    )
+
+
+def schema_db(path):
+    """Cria em path um banco só com o esquema (migrações 001 e 002)."""
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    for migration in MIGRACOES_ESQUEMA:
+        with open(migration, "r", encoding="utf-8") as f:
+            conn.executescript(f.read())
+    conn.close()
+
+
+def replay_sql(db, migration):
+    # como no run_migrations: o arquivo inteiro pelo sqlite3 de linha de comando
+    with open(migration, "rb") as f:
+        subprocess.run(["sqlite3", db], stdin=f, check=True)
+
+
+def direct_load(db, hinos):
+    conn = sqlite3.connect(db)
+    load_sql(conn, hinos, 1)
+    conn.commit()
+    conn.close()
+
+
+def measure(func, *args, repeat=1, clock=time.perf_counter):
+    """Executa func e retorna (resultado, melhor tempo em s, pico de memória em bytes)."""
+    best = None
+    for _ in range(repeat):
+        _presentation.cache_clear()
+        start = clock()
+        result = func(*args)
+        elapsed = clock() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # memória medida numa execução separada, o tracemalloc distorce o tempo
+    _presentation.cache_clear()
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _presentation.cache_clear()
+
+    return result, best, peak
+
+
+def check_frames():
+    """Confere que os dois extratores classificam igual os graphicFrames de
+    tabela, gráfico e SmartArt, com e sem placeholder."""
+    tmp = tempfile.mkdtemp()
+    deck = make_frames_deck(os.path.join(tmp, "frames.pptx"))
+    try:
+        types = {
+            engine: [
+                shape.shape_type
+                for _, shapes in iter_slides(deck, engine=engine)
+                for shape in shapes
+            ]
+            for engine in ("pptx", "ooxml")
+        }
+    finally:
+        _presentation.cache_clear()
+        os.remove(deck)
+        os.rmdir(tmp)
+    if types["pptx"] != types["ooxml"]:
+        logging.error(
+            f"  graphicFrame types differ: pptx {types['pptx']}, "
+            f"ooxml {types['ooxml']}"
+        )
+        return False
+    logging.info(f"  graphicFrame types match ({len(types['pptx'])} shapes)")
+    return True
+
+
+def bench_extract(files, repeat=1):
+    """Compara a extração via python-pptx com a leitura direta do OOXML."""
+    ok = check_frames()
+    for file in files:
+        slides = count_slides(file)
+        logging.info(f"Benchmarking extraction: {file} ({slides} slides)")
+
+        results = {}
+        for engine in ("pptx", "ooxml"):
+            (_, _, text), elapsed, peak = measure(
+                extract_slides, file, 0, slides, engine, repeat=repeat
+            )
+            results[engine] = (text, elapsed, peak)
+            logging.info(
+                f"  {engine:>5}: {elapsed:.3f}s ({slides / elapsed:.0f} slides/s), "
+                f"peak {peak / 2**20:.1f} MiB"
+            )
+
+        pptx_text, pptx_time, pptx_peak = results["pptx"]
+        ooxml_text, ooxml_time, ooxml_peak = results["ooxml"]
+        if pptx_text != ooxml_text:
+            logging.error(f"  outputs differ for {file}")
+            ok = False
+        logging.info(
+            f"  speedup {pptx_time / ooxml_time:.1f}x, "
+            f"memory {pptx_peak / max(ooxml_peak, 1):.1f}x smaller"
+        )
+    return ok
+
+
+def bench_txt2json(files, repeat=1):
+    """Compara o parser de splits aninhados com o parser de uma passada."""
+    for file_txt in files:
+        logging.info(f"Benchmarking txt2json: {file_txt}")
+
+        praises, split_cpu, split_peak = measure(
+            split_txt, file_txt, repeat=repeat, clock=time.process_time
+        )
+        with open(file_txt, "r", encoding="utf-8") as f:
+            if [praise.to_dict() for praise in parse_txt(f)] != praises:
+                logging.error(f"  outputs differ for {file_txt}")
+
+        _, stream_cpu, stream_peak = measure(
+            stream_txt, file_txt, repeat=repeat, clock=time.process_time
+        )
+        for name, cpu, peak in (
+            ("split", split_cpu, split_peak),
+            ("stream", stream_cpu, stream_peak),
+        ):
+            logging.info(
+                f"  {name:>6}: {cpu:.3f}s CPU, peak {peak / 2**20:.1f} MiB"
+            )
+        logging.info(
+            f"  CPU {split_cpu / stream_cpu:.1f}x faster, "
+            f"memory {split_peak / max(stream_peak, 1):.1f}x smaller"
+        )
+
+
+def bench_json2sql(files, repeat=1):
+    """Compara o .json indentado (formato antigo) com o NDJSON na entrada do
+    json2sql: tamanho do arquivo, tempo de leitura e pico de memória."""
+    for file_ndjson in files:
+        logging.info(f"Benchmarking json2sql input: {file_ndjson}")
+
+        # o formato antigo é recriado a partir do NDJSON num arquivo temporário
+        praises = [praise.to_dict() for praise in read_praises(file_ndjson)]
+        fd, file_json = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(praises, f, ensure_ascii=False, indent=4)
+        del praises
+
+        try:
+            results = {}
+            for name, func, path in (
+                ("json", load_json, file_json),
+                ("ndjson", load_ndjson, file_ndjson),
+            ):
+                hinos, elapsed, peak = measure(func, path, repeat=repeat)
+                size = os.path.getsize(path)
+                results[name] = (hinos, elapsed, peak, size)
+                logging.info(
+                    f"  {name:>6}: {size / 2**20:.2f} MiB, {elapsed:.3f}s, "
+                    f"peak {peak / 2**20:.1f} MiB"
+                )
+        finally:
+            os.remove(file_json)
+
+        json_hinos, json_time, json_peak, json_size = results["json"]
+        nd_hinos, nd_time, nd_peak, nd_size = results["ndjson"]
+        if json_hinos != nd_hinos:
+            logging.error(f"  outputs differ for {file_ndjson}")
+        logging.info(
+            f"  file {json_size / nd_size:.1f}x smaller, "
+            f"speedup {json_time / nd_time:.1f}x, "
+            f"memory {json_peak / max(nd_peak, 1):.1f}x smaller"
+        )
+
+
+def bench_load(files, repeat=1):
+    """Compara a carga dos hinos no SQLite: migração com um INSERT por hino
+    (formato antigo), migração em lotes e executemany direto, numa transação."""
+    tmp = tempfile.mkdtemp()
+    db = os.path.join(tmp, "database.db")
+    try:
+        for file_ndjson in files:
+            hinos = list(iter_structure(read_praises(file_ndjson)))
+            logging.info(f"Benchmarking load: {file_ndjson} ({len(hinos)} hinos)")
+
+            legacy = os.path.join(tmp, "legacy.sql")
+            with open(legacy, "w", encoding="utf-8") as f:
+                f.writelines(hino2sql(hino, 1) for hino in hinos)
+            batched = os.path.join(tmp, "batched.sql")
+            with open(batched, "w", encoding="utf-8") as f:
+                f.writelines(hinos2sql(batch, 1) for batch in batches(hinos))
+
+            rows, times = {}, {}
+            for name, func, arg in (
+                ("replay", replay_sql, legacy),
+                ("batched", replay_sql, batched),
+                ("direct", direct_load, hinos),
+            ):
+                best = None
+                for _ in range(repeat):
+                    schema_db(db)
+                    start = time.perf_counter()
+                    func(db, arg)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+
+                conn = sqlite3.connect(db)
+                rows[name] = conn.execute(
+                    "SELECT numero, nome, texto, texto_limpo FROM hino ORDER BY id"
+                ).fetchall()
+                conn.close()
+                times[name] = best
+                logging.info(
+                    f"  {name:>7}: {best:.3f}s ({len(hinos) / best:.0f} hinos/s)"
+                )
+
+            if not rows["replay"] == rows["batched"] == rows["direct"]:
+                logging.error(f"  loaded rows differ for {file_ndjson}")
+            logging.info(
+                f"  speedup batched {times['replay'] / times['batched']:.1f}x, "
+                f"direct {times['replay'] / times['direct']:.1f}x"
+            )
+    finally:
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+# louvores em que a ordem da remoção das tags muda o texto limpo (o corpus
+# atual não tem nenhum): a saída tem de ser a das funções antigas
+LIMPEZA_REFERENCIA = [
+    ["TÍTULO", "A 2(H)X B"],
+    ["TÍTULO", "1(M)X"],
+    ["TÍTULO", "CANTEMOS (2(T)X)", "CORO (2X)"],
+    ["TÍTULO", "(BIS(H))", "REPETIR A 1ª (M)ESTROFE"],
+]
+
+
+def bench_clean(files, repeat=1):
+    """Saída de referência: confere o título e o texto limpo das funções atuais
+    com as antigas em todos os louvores, e compara os tempos."""
+    fragments = []
+    for file_ndjson in files:
+        for praise in read_praises(file_ndjson):
+            texts = [text.replace("–", "-") for text in praise.texts]
+            if texts:
+                fragments.append(texts)
+    fragments.extend(LIMPEZA_REFERENCIA)
+    lines = sum(len(texts) for texts in fragments)
+    logging.info(f"Benchmarking text cleaning: {len(fragments)} praises, {lines} fragments")
+
+    legacy, legacy_time, _ = measure(
+        clean_all, fragments, legacy_possible_title, legacy_text_clean, repeat=repeat
+    )
+    current, current_time, _ = measure(
+        clean_all, fragments, return_possible_title, set_text_clean, repeat=repeat
+    )
+    differ = [
+        (texts, old, new)
+        for texts, old, new in zip(fragments, legacy, current)
+        if old != new
+    ]
+    for texts, old, new in differ[:5]:
+        logging.error(f"  output differs: {texts[:3]}\n    old: {old}\n    new: {new}")
+    logging.info(f"  {len(fragments) - len(differ)}/{len(fragments)} praises identical")
+    logging.info(f"  legacy: {legacy_time:.3f}s, compiled: {current_time:.3f}s")
+    logging.info(f"  speedup {legacy_time / current_time:.1f}x")
+    return not differ
+
+
+# estrutura esperada de trechos com marcas de voz e repetição; TODOS no fim
+# de uma linha comum é letra, não voz
+ESTRUTURA_REFERENCIA = [
+    (
+        "BEM-VINDOS SEJAM TODOS\nO QUE IMPORTA É QUE TODOS",
+        [
+            {
+                "linhas": [
+                    {"texto": "BEM-VINDOS SEJAM TODOS"},
+                    {"texto": "O QUE IMPORTA É QUE TODOS"},
+                ]
+            }
+        ],
+    ),
+    ("(Ó DEUS) VARÕES", [{"linhas": [{"texto": "(Ó DEUS)", "voz": "VARÕES"}]}]),
+    ("(TODOS) CANTEMOS", [{"linhas": [{"texto": "CANTEMOS", "voz": "TODOS"}]}]),
+    ("TODOS\nCANTEMOS", [{"linhas": [{"texto": "CANTEMOS", "voz": "TODOS"}]}]),
+    (
+        "<b>CORO (2X)</b>\nA (M)\nB 3X\nBIS",
+        [
+            {
+                "tipo": "coro",
+                "vezes": 2,
+                "bis": True,
+                "linhas": [{"texto": "A", "voz": "M"}, {"texto": "B", "vezes": 3}],
+            }
+        ],
+    ),
+]
+
+
+def bench_structure(files, repeat=1):
+    """Saída de referência: confere a estrutura dos trechos de
+    ESTRUTURA_REFERENCIA e mede a estruturação dos textos dos louvores."""
+    differ = 0
+    for texto, esperado in ESTRUTURA_REFERENCIA:
+        estrofes = parse_texto(texto)
+        if estrofes != esperado:
+            differ += 1
+            logging.error(f"  structure differs: {texto!r}\n    got: {estrofes}")
+    logging.info(
+        f"  {len(ESTRUTURA_REFERENCIA) - differ}/{len(ESTRUTURA_REFERENCIA)} "
+        "reference texts identical"
+    )
+
+    textos = [
+        hino["texto"]
+        for file_ndjson in files
+        for hino in iter_structure(read_praises(file_ndjson))
+    ]
+    if textos:
+        _, elapsed, _ = measure(
+            lambda: [parse_texto(texto) for texto in textos], repeat=repeat
+        )
+        logging.info(f"  {len(textos)} hinos structured in {elapsed:.3f}s")
+    return not differ
+
+
+def brute_force_pairs(hinos, threshold):
+    # referência quadrática: Jaccard exato entre todos os pares de hinos
+    sets = [shingles(hino["texto_limpo"]) for hino in hinos]
+    pairs = set()
+    for i in range(len(sets)):
+        for j in range(i + 1, len(sets)):
+            if sets[i] and sets[j]:
+                jaccard = len(sets[i] & sets[j]) / len(sets[i] | sets[j])
+                if jaccard >= threshold:
+                    pairs.add((i, j))
+    return pairs
+
+
+def lsh_pairs(hinos):
+    index = DuplicateIndex()
+    for i, hino in enumerate(hinos):
+        index.add(i, hino["texto_limpo"])
+    return {(index.keys[i], index.keys[j]) for _, i, j in index.pairs()}
+
+
+def bench_duplicates(files, repeat=1):
+    """Saída de referência: confere os pares achados pelo MinHash/LSH com o
+    Jaccard exato entre todos os pares, e compara os tempos."""
+    hinos = [
+        hino
+        for file_ndjson in files
+        for hino in iter_structure(read_praises(file_ndjson))
+    ]
+    index = DuplicateIndex()
+    logging.info(f"Benchmarking near-duplicates: {len(hinos)} hinos")
+
+    exact, exact_time, _ = measure(
+        brute_force_pairs, hinos, index.threshold, repeat=repeat
+    )
+    found, lsh_time, _ = measure(lsh_pairs, hinos, repeat=repeat)
+    missed = exact - found
+    for i, j in sorted(exact | found):
+        status = "missed" if (i, j) in missed else "found"
+        logging.info(f"  {status}: {hinos[i]['nome']} x {hinos[j]['nome']}")
+    logging.info(f"  {len(exact) - len(missed)}/{len(exact)} exact pairs found")
+    logging.info(f"  brute force: {exact_time:.3f}s, MinHash/LSH: {lsh_time:.3f}s")
+    return not missed
+
+
+def stage_pptx2txt(src, dst, engine="pptx", workers=1, chunk_size=500):
+    if workers > 1:
+        # o mesmo caminho do pipeline.py -w N: blocos de chunk_size slides
+        pptx2txt_parallel([src], workers, chunk_size, engine, output=lambda _: dst)
+        return
+    with open(dst, "w", encoding="utf-8") as f:
+        for i, shapes in iter_slides(src, engine=engine):
+            f.write(slide2txt(i, shapes))
+
+
+def stage_txt2json(src, dst, workers=1):
+    with open(src, "r", encoding="utf-8") as f:
+        for _ in write_praises(parse_txt(f), dst):
+            pass
+
+
+def stage_json2sql(src, dst, workers=1):
+    with open(dst, "w", encoding="utf-8") as f:
+        for batch in batches(process_structure(read_praises(src), workers)):
+            f.write(hinos2sql(batch, 1))
+
+
+SUITE_STAGES = {
+    "pptx2txt": stage_pptx2txt,
+    "txt2json": stage_txt2json,
+    "json2sql": stage_json2sql,
+}
+
+
+def run_stage(stage, src, dst, options):
+    # roda num processo novo, para o pico de memória ser só o da etapa
+    wall, cpu = time.perf_counter(), time.process_time()
+    SUITE_STAGES[stage](src, dst, **options)
+    return time.perf_counter() - wall, time.process_time() - cpu, peak_rss()
+
+
+def suite_runs(workers):
+    """Etapas medidas em cada tamanho: (nome, etapa, entrada, saída, opções)."""
+    runs = [
+        ("pptx2txt", "pptx2txt", "deck.pptx", "deck.txt", {"engine": "pptx"}),
+        ("pptx2txt[ooxml]", "pptx2txt", "deck.pptx", "ooxml.txt", {"engine": "ooxml"}),
+        ("txt2json", "txt2json", "deck.txt", "deck.ndjson", {}),
+        ("json2sql", "json2sql", "deck.ndjson", "deck.sql", {}),
+    ]
+    if workers > 1:
+        runs.append(
+            (
+                f"pptx2txt[workers={workers}]",
+                "pptx2txt",
+                "deck.pptx",
+                "parallel.txt",
+                {"engine": "pptx", "workers": workers},
+            )
+        )
+        runs.append(
+            (
+                f"json2sql[workers={workers}]",
+                "json2sql",
+                "deck.ndjson",
+                "parallel.sql",
+                {"workers": workers},
+            )
+        )
+    return runs
+
+
+def same_file(a, b):
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        return fa.read() == fb.read()
+
+
+def bench_suite(sizes, repeat=1, workers=1, out="benchmark.json", decks=None):
+    """Mede cada etapa do ETL em apresentações sintéticas de vários tamanhos e
+    grava os resultados em out (JSON), para comparar execuções."""
+    tmp = tempfile.mkdtemp()
+    decks = decks or tmp
+    os.makedirs(decks, exist_ok=True)
+    spawn = multiprocessing.get_context("spawn")
+    results = []
+    try:
+        for size in sizes:
+            deck = os.path.join(decks, f"synthetic_{size}.pptx")
+            if not os.path.exists(deck):
+                make_deck(deck, size)
+            paths = {"deck.pptx": deck}
+            walls = {}
+
+            for name, stage, src, dst, options in suite_runs(workers):
+                paths[dst] = os.path.join(tmp, dst)
+                best = None
+                for _ in range(repeat):
+                    with ProcessPoolExecutor(1, mp_context=spawn) as executor:
+                        wall, cpu, rss = executor.submit(
+                            run_stage, stage, paths[src], paths[dst], options
+                        ).result()
+                    if best is None or wall < best[0]:
+                        best = (wall, cpu, rss)
+                wall, cpu, rss = best
+                walls[name] = wall
+                # as execuções paralelas comparadas com a serial da mesma etapa
+                # (abaixo de 1, o paralelo foi mais lento)
+                serial = walls.get(name.split("[")[0]) if "[workers=" in name else None
+                results.append(
+                    {
+                        "slides": size,
+                        "stage": name,
+                        "wall_s": round(wall, 4),
+                        "cpu_s": round(cpu, 4),
+                        "slides_per_s": round(size / wall, 1),
+                        "peak_rss_mib": round(rss / 2**20, 1) if rss else None,
+                        "speedup": round(serial / wall, 2) if serial else None,
+                    }
+                )
+                logging.info(
+                    f"  {size:>6} slides {name:>20}: {wall:.3f}s "
+                    f"({size / wall:.0f} slides/s), peak RSS "
+                    + (f"{rss / 2**20:.0f} MiB" if rss else "n/a")
+                    + (f", {serial / wall:.2f}x the serial run" if serial else "")
+                )
+
+            if not same_file(paths["deck.txt"], paths["ooxml.txt"]):
+                logging.error(f"  pptx and ooxml outputs differ ({size} slides)")
+            if "parallel.txt" in paths and not same_file(
+                paths["deck.txt"], paths["parallel.txt"]
+            ):
+                logging.error(f"  serial and parallel text differ ({size} slides)")
+            if "parallel.sql" in paths and not same_file(
+                paths["deck.sql"], paths["parallel.sql"]
+            ):
+                logging.error(f"  serial and parallel SQL differ ({size} slides)")
+    finally:
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+    report = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
+    logging.info(f"Results written to {out}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks do ETL dos slides")
+    parser.add_argument(
+        "stage",
+        choices=[
+            "extract",
+            "txt2json",
+            "json2sql",
+            "load",
+            "clean",
+            "duplicates",
+            "structure",
+            "suite",
+        ],
+        help="extract: pptx2txt (python-pptx x OOXML); txt2json: parser do .txt; "
+        "json2sql: leitura do intermediário (.json x .ndjson); "
+        "load: carga no SQLite (migrações x executemany); "
+        "clean: limpeza das tags (saída de referência e tempo); "
+        "duplicates: quase duplicatas (MinHash/LSH x Jaccard exato); "
+        "structure: estrutura dos hinos (trechos de referência e tempo); "
+        "suite: todas as etapas em apresentações sintéticas",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="arquivos de entrada (padrão: os das migrações 003 e 004)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="suite: números de slides das apresentações sintéticas",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="suite: mede também o pptx2txt e o json2sql paralelos com esse "
+        "número de processos",
+    )
+    parser.add_argument(
+        "--out",
+        default="benchmark.json",
+        help="suite: arquivo JSON com os resultados",
+    )
+    parser.add_argument(
+        "--decks",
+        help="suite: pasta onde guardar (e reaproveitar) as apresentações sintéticas",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.stage == "extract":
+        files = args.files or [f for f in DECKS_PADRAO if glob.glob(f)]
+        if not bench_extract(files, args.repeat):
+            raise SystemExit(1)
+    elif args.stage == "txt2json":
+        files = args.files or [f for f in DUMPS_PADRAO if glob.glob(f)]
+        bench_txt2json(files, args.repeat)
+    elif args.stage == "json2sql":
+        files = args.files or [f for f in INTERMEDIARIOS_PADRAO if glob.glob(f)]
+        bench_json2sql(files, args.repeat)
+    elif args.stage == "load":
+        files = args.files or [f for f in INTERMEDIARIOS_PADRAO if glob.glob(f)]
+        bench_load(files, args.repeat)
+    elif args.stage == "clean":
+        files = args.files or glob.glob("slides_json\\*.ndjson")
+        if not bench_clean(files, args.repeat):
+            raise SystemExit(1)
+    elif args.stage == "duplicates":
+        files = args.files or glob.glob("slides_json\\*.ndjson")
+        if not bench_duplicates(files, args.repeat):
+            raise SystemExit(1)
+    elif args.stage == "structure":
+        files = args.files or glob.glob("slides_json\\*.ndjson")
+        if not bench_structure(files, args.repeat):
+            raise SystemExit(1)
+    elif args.stage == "suite":
+        bench_suite(args.sizes, args.repeat, args.workers, args.out, args.decks)
+
+
+if __name__ == "__main__":
+    main()
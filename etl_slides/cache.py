@@ -0,0 +1,95 @@
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from manifest import file_hash
+
+CACHE = "praise_cache.db"
+# chaves por consulta (abaixo do limite de variáveis do SQLite)
+LOOKUP_SIZE = 500
+
+
+class PraiseCache:
+    """Cache persistente dos hinos estruturados, endereçado pelo conteúdo.
+
+    A chave de um louvor é o hash dos seus fragmentos de texto, na ordem, e da
+    versão do código que estrutura (hash dos módulos em code); o mesmo louvor
+    em outra coletânea ou numa revisão da mesma não é processado de novo.
+    Entradas de outras versões do código são descartadas ao abrir o cache.
+    """
+
+    def __init__(self, path=CACHE, code=None):
+        self.path = path
+        self.version = hashlib.sha256(
+            "".join(file_hash(module) for module in code or []).encode()
+        ).hexdigest()
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS praise "
+            "(key TEXT PRIMARY KEY, version TEXT NOT NULL, hino TEXT)"
+        )
+        self.conn.execute("DELETE FROM praise WHERE version != ?", (self.version,))
+        self.conn.commit()
+
+    def key(self, fragments):
+        return hashlib.sha256(
+            (self.version + json.dumps(fragments, ensure_ascii=False)).encode()
+        ).hexdigest()
+
+    def get_many(self, keys):
+        """Hinos já estruturados (ou None, louvor sem texto) das chaves
+        encontradas, contando acertos e faltas por louvor."""
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), LOOKUP_SIZE):
+            chunk = unique[start : start + LOOKUP_SIZE]
+            rows = self.conn.execute(
+                "SELECT key, hino FROM praise WHERE key IN ("
+                + ", ".join("?" * len(chunk))
+                + ")",
+                chunk,
+            )
+            found.update((key, json.loads(hino)) for key, hino in rows)
+        hits = sum(key in found for key in keys)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found
+
+    def put_many(self, items):
+        # items: (chave, hino ou None)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO praise (key, version, hino) VALUES (?, ?, ?)",
+            (
+                (key, self.version, json.dumps(hino, ensure_ascii=False))
+                for key, hino in items
+            ),
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+        logging.info(
+            f"Praise cache {self.path}: {self.hits} hits, {self.misses} misses"
+        )
+
+
+@contextmanager
+def counting(cache, entry):
+    """Acertos e faltas do cache durante o bloco, gravados em entry (registro
+    do relatório); sem cache, não faz nada."""
+    if cache is None:
+        yield
+        return
+    hits, misses = cache.hits, cache.misses
+    try:
+        yield
+    finally:
+        cache.commit()
+        entry["cache_hits"] = cache.hits - hits
+        entry["cache_misses"] = cache.misses - misses
@@ -0,0 +1,177 @@
+import csv
+import json
+import logging
+import os
+import re
+import zlib
+import numpy as np
+
+# 128 permutações em 32 faixas de 4 linhas: pares com similaridade de Jaccard
+# acima de ~0,42 ((1/32) ** (1/4)) tendem a cair juntos em alguma faixa
+NUM_PERM = 128
+BANDS = 32
+SHINGLE = 3
+THRESHOLD = 0.5
+REPORT = "duplicados.csv"
+# assinaturas de cada coletânea, ao lado do praise_cache.db
+SIGNATURES = "minhash"
+
+MERSENNE = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+PALAVRA_REGEX = re.compile(r"\w+")
+
+
+def shingles(texto_limpo, size=SHINGLE):
+    """Hashes das sequências de `size` palavras do texto, sem pontuação."""
+    palavras = PALAVRA_REGEX.findall(texto_limpo.upper())
+    return {
+        zlib.crc32(" ".join(palavras[i : i + size]).encode())
+        for i in range(len(palavras) - size + 1)
+    }
+
+
+class DuplicateIndex:
+    """Índice MinHash/LSH dos hinos, para achar quase duplicatas pelo texto.
+
+    Cada hino vira uma assinatura MinHash dos trechos de SHINGLE palavras do
+    texto_limpo; a assinatura é dividida em faixas e só hinos que coincidem
+    em alguma faixa são comparados, sem comparar todos com todos. Os pares
+    com similaridade estimada >= threshold são reportados.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, threshold=THRESHOLD, seed=1):
+        # assinaturas gravadas com outros parâmetros não são comparáveis
+        self.params = [num_perm, bands, seed, SHINGLE]
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, MERSENNE, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, MERSENNE, size=num_perm, dtype=np.uint64)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.keys = []
+        self.signatures = []
+        self.buckets = {}
+
+    def signature(self, hashes):
+        x = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        permuted = (self.a[:, None] * x[None, :] + self.b[:, None]) % MERSENNE
+        return np.bitwise_and(permuted, MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def add(self, key, texto_limpo):
+        hashes = shingles(texto_limpo)
+        if hashes:
+            self.add_signature(key, self.signature(hashes))
+
+    def add_signature(self, key, signature):
+        index = len(self.keys)
+        self.keys.append(key)
+        self.signatures.append(signature)
+        for band in range(self.bands):
+            chunk = signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            self.buckets.setdefault((band, chunk), []).append(index)
+
+    def tee(self, hinos, migration):
+        """Repassa os hinos adiante, indexando cada um com a migração e a
+        posição em que é inserido."""
+        for position, hino in enumerate(hinos, 1):
+            key = {
+                "migracao": migration,
+                "posicao": position,
+                "numero": hino["numero"],
+                "nome": hino["nome"],
+            }
+            self.add(key, hino["texto_limpo"])
+            yield hino
+
+    def extend(self, hinos, migration):
+        # indexa hinos que não vão ser gravados (migração já atualizada)
+        for _ in self.tee(hinos, migration):
+            pass
+
+    def save(self, path, start=0):
+        """Grava as chaves e assinaturas dos hinos indexados a partir de start
+        num .npz, para recarregar com load() sem estruturar o arquivo de novo."""
+        signatures = self.signatures[start:]
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                params=np.array(self.params),
+                keys=np.array(json.dumps(self.keys[start:], ensure_ascii=False)),
+                signatures=(
+                    np.stack(signatures)
+                    if signatures
+                    else np.empty((0, self.rows * self.bands), dtype=np.uint32)
+                ),
+            )
+        os.replace(tmp, path)
+
+    def load(self, path):
+        """Indexa os hinos gravados com save(); False se não há arquivo ou se
+        ele foi gerado com outros parâmetros."""
+        if path is None or not os.path.exists(path):
+            return False
+        with np.load(path) as data:
+            if data["params"].tolist() != self.params:
+                return False
+            keys = json.loads(str(data["keys"]))
+            signatures = data["signatures"]
+        for key, signature in zip(keys, signatures):
+            self.add_signature(key, signature)
+        return True
+
+    def pairs(self):
+        """Pares (similaridade estimada, i, j) acima do limiar, do mais parecido
+        para o menos."""
+        candidates = set()
+        for indexes in self.buckets.values():
+            for n, i in enumerate(indexes):
+                for j in indexes[n + 1 :]:
+                    candidates.add((i, j))
+
+        pairs = []
+        for i, j in candidates:
+            similarity = float(np.mean(self.signatures[i] == self.signatures[j]))
+            if similarity >= self.threshold:
+                pairs.append((similarity, i, j))
+        return sorted(pairs, key=lambda pair: (-pair[0], pair[1], pair[2]))
+
+    def groups(self, pairs):
+        # união dos pares em grupos (um hino repetido em várias coletâneas)
+        parent = {}
+
+        def find(i):
+            parent.setdefault(i, i)
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for _, i, j in pairs:
+            parent[find(i)] = find(j)
+
+        roots = {}
+        return {i: roots.setdefault(find(i), len(roots) + 1) for i in sorted(parent)}
+
+    def write_report(self, path):
+        pairs = self.pairs()
+        groups = self.groups(pairs)
+        columns = ["migracao", "posicao", "numero", "nome"]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["grupo", "similaridade"]
+                + [column + "_a" for column in columns]
+                + [column + "_b" for column in columns]
+            )
+            for similarity, i, j in pairs:
+                writer.writerow(
+                    [groups[i], f"{similarity:.2f}"]
+                    + [self.keys[i][column] for column in columns]
+                    + [self.keys[j][column] for column in columns]
+                )
+        logging.info(
+            f"Duplicates report: {len(pairs)} pairs among {len(self.keys)} hinos "
+            f"written to {path}"
+        )
+        return pairs
@@ -1,219 +1,563 @@
-import logging
-import json
-import re
-import glob
-from tqdm import tqdm
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
-
-erros_conhecidos = [
-    "ABENÇOA-NOS SENHOR, DERRAMA SOBRE NÓS TUA PAZ ABENÇOA-NOS SENHOR, DERRAMA SOBRE NÓS TEU AMOR.",  # indice extra
-    "MEU JESUS, SALVADOR,  OUTRO IGUAL NÃO HÁ. TODOS OS DIAS QUERO LOUVAR  AS MARAVILHAS DE TEU AMOR. CONSOLO, ABRIGO,  FORÇA E REFÚGIO É O SENHOR. COM TODO O MEU SER,  COM TUDO O QUE SOU,  SEMPRE TE ADORAREI.",  # pedaco de louvor
-    "PODES CLAMAR, PODES CHORAR, EU ESTAREI PRONTO PRA TE AJUDAR, E SE O CORAÇÃO DESFALECER, CONFIA EM MIM SOU JESUS  E TE FAÇO VENCER.",  # pedaco de louvor
-    "AO CORDEIRO GLÓRIA E HONRA,  SALVOS NÃO CESSEIS DE DAR. GLÓRIA, HONRA SEMPRE A DEUS ENTOAREI!  AMÉM!",  # indice extra
-]
-TAGS_LITERAIS = [
-    "TODOS",
-    "M",
-    "H",
-    "T",
-    "BIS",
-    "VARÕES",
-    "SERVAS",
-]
-TAGS_CONTROLE = [
-    "ÍNDICE",
-    "CORO (2X)",
-    "\n\nCORO",
-    "CORO\n",
-    "1X",
-    "2X",
-    "3X",
-    "4X",
-    "()",
-    "(TODOS)",
-    "(M)",
-    "(H)",
-    "(T)",
-    "(BIS)",
-    "(VARÕES)",
-    "(SERVAS)",
-    "REPETIR O LOUVOR",
-    "REPETIR 1ª ESTROFE",
-    "REPETIR A 1ª ESTROFE",
-    "REPETIR 2ª ESTROFE",
-    "REPETIR A 2ª ESTROFE",
-    "REPETIR ESTROFE",
-    "REPETIR A ESTROFE",
-    "FINAL:",
-    "BIS NO FINAL",
-    "IGREJA CRISTÃ MARANATA",
-    "ATUALIZAÇÃO",
-    "\nINSTRUMENTOS",
-]
-
-
-def get_texts(d):
-    if isinstance(d, dict):
-        for k, v in d.items():
-            if k == "text":
-                yield v
-            else:
-                yield from get_texts(v)
-    elif isinstance(d, list):
-        for v in d:
-            yield from get_texts(v)
-
-
-def return_possible_title(texts):
-    possible_title = [
-        text
-        for text in texts
-        if all(opt not in text.upper() for opt in TAGS_CONTROLE)
-        and text.strip() != ""
-        and text.upper() not in TAGS_LITERAIS
-    ]
-    if possible_title:
-        min_string = min(possible_title, key=len)
-        title_index = texts.index(min_string)
-        title = min_string.upper().replace("\n", " ")
-        if title not in erros_conhecidos:
-            return title, title_index
-    return None, None
-
-
-def set_text_clean(texts_wo_title):
-    texts_clean = [re.sub(r"[ \t]{2,}", " ", text) for text in texts_wo_title]
-    texts_clean = [line for line in texts_clean if line not in TAGS_LITERAIS]
-    new_texts_clean = []
-    for line in texts_clean:
-        for tag in TAGS_CONTROLE:
-            line = line.upper().replace(tag, "")
-        line = line.strip()
-        if line:
-            new_texts_clean.append(line)
-    texts_clean = new_texts_clean
-    coro_regex = re.compile(r"^CORO\s*")
-    texts_clean = [line for line in texts_clean if not coro_regex.match(line)]
-    texts_clean = " ".join(texts_clean)
-    texts_clean = texts_clean.replace("\n", " ")
-    texts_clean = re.sub(r"[ \t]{2,}", " ", texts_clean)
-    # remove all double quotes
-    texts_clean = texts_clean.replace("“", "")
-    texts_clean = texts_clean.replace("”", "")
-    texts_clean = texts_clean.replace('"', "")
-    return texts_clean
-
-
-def set_text_full(texts_wo_title):
-    texts_full = [
-        line
-        for line in texts_wo_title
-        if line.upper() != "ÍNDICE" and line.strip() != ""
-    ]
-    texts_full = "\n\n".join(texts_full)
-    texts_full = texts_full.replace("\n\nBIS", "\nBIS")
-    texts_full = texts_full.replace('"', "'")
-    return texts_full
-
-
-def return_number(title):
-    if title:
-        for word in title.split(" "):
-            match = re.search(r"\d+", word)
-            if match:
-                numero = match.group()
-                # remove number from title
-                title_clean = title.replace(match.group(), "").strip()
-                # check if string starts with hifen and remove it
-                if title_clean.startswith("-"):
-                    title_clean = title_clean[1:].strip()
-                else:
-                    title_clean = title_clean.strip()
-
-                return numero, title_clean
-            else:
-                return "null", title
-    return "null", None
-
-
-def process_structure(praises):
-    new_structure = []
-    for praise in tqdm(praises, desc="Processing praises", unit="praise"):
-        texts = list(get_texts(praise))
-
-        if not texts:
-            continue
-
-        # clean double or more spaces in string array
-        texts = [text.replace("–", "-") for text in texts]
-
-        title, title_index = return_possible_title(texts)
-        numero, title_clean = return_number(title)
-
-        texts_wo_title = texts.copy()
-        if title_index is not None:
-            texts_wo_title.pop(title_index)
-
-        texts_full = set_text_full(texts_wo_title)
-        texts_clean = set_text_clean(texts_wo_title)
-
-        new_structure.append(
-            {
-                "numero": numero,
-                "nome": title_clean if title_clean is not None else "null",
-                "texto": texts_full,
-                "texto_limpo": texts_clean,
-            }
-        )
-
-    return new_structure
-
-
-def json2sql(inicio: int = 3):
-    logging.info("Starting json2sql conversion...")
-    files_json = glob.glob("slides_json\\*.json")
-    logging.info(f"Files found: {files_json}")
-
-    for index, file in enumerate(files_json):
-        logging.info(f"Processing file: {file}")
-        file_name = (
-            "00"
-            + str(index + inicio)
-            + "-"
-            + file.split("\\")[1].split("pptx")[0].lower().replace(" ", "_")
-            + "sql"
-        )
-
-        with open(file, "r", encoding="utf-8") as f:
-            louvores = json.load(f)
-
-        louvores_estruturados = process_structure(louvores)
-        with open("..\\db\\migrations\\" + file_name, "w", encoding="utf-8") as f:
-            for hino in louvores_estruturados:
-                text = (
-                    "INSERT INTO hino (numero, nome, texto, texto_limpo, coletanea_id, date_insert, date_update) VALUES ('"
-                    + hino["numero"]
-                    + "', '"
-                    + hino["nome"]
-                    + "', '"
-                    + hino["texto"].replace("\n", "\\n").replace("'", "''")
-                    + "', '"
-                    + hino["texto_limpo"].replace("'", "''")
-                    + "', "
-                    + str(index + 1)
-                    + ", CURRENT_TIMESTAMP, CURRENT_TIMESTAMP);\n"
-                )
-                f.write(text)
-
-
-def main():
-    json2sql()
-
-
-if __name__ == "__main__":
-    main()
+import argparse
+import logging
+import re
+import glob
+import gzip
+import os
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from tqdm import tqdm
+from txt2json import read_praises
+from metrics import track, counted
+from duplicates import DuplicateIndex, SIGNATURES, REPORT as DUPLICATES_REPORT
+from cache import PraiseCache, counting
+from structure import texto_estruturado, CODE as STRUCTURE_CODE
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+CODE = [__file__] + STRUCTURE_CODE
+# migrações geradas e relatório de duplicatas (ver output_path)
+OUTPUT = "..\\db\\etl_output"
+
+
+erros_conhecidos = [
+    "ABENÇOA-NOS SENHOR, DERRAMA SOBRE NÓS TUA PAZ ABENÇOA-NOS SENHOR, DERRAMA SOBRE NÓS TEU AMOR.",  # indice extra
+    "MEU JESUS, SALVADOR,  OUTRO IGUAL NÃO HÁ. TODOS OS DIAS QUERO LOUVAR  AS MARAVILHAS DE TEU AMOR. CONSOLO, ABRIGO,  FORÇA E REFÚGIO É O SENHOR. COM TODO O MEU SER,  COM TUDO O QUE SOU,  SEMPRE TE ADORAREI.",  # pedaco de louvor
+    "PODES CLAMAR, PODES CHORAR, EU ESTAREI PRONTO PRA TE AJUDAR, E SE O CORAÇÃO DESFALECER, CONFIA EM MIM SOU JESUS  E TE FAÇO VENCER.",  # pedaco de louvor
+    "AO CORDEIRO GLÓRIA E HONRA,  SALVOS NÃO CESSEIS DE DAR. GLÓRIA, HONRA SEMPRE A DEUS ENTOAREI!  AMÉM!",  # indice extra
+]
+TAGS_LITERAIS = [
+    "TODOS",
+    "M",
+    "H",
+    "T",
+    "BIS",
+    "VARÕES",
+    "SERVAS",
+]
+TAGS_CONTROLE = [
+    "ÍNDICE",
+    "CORO (2X)",
+    "\n\nCORO",
+    "CORO\n",
+    "1X",
+    "2X",
+    "3X",
+    "4X",
+    "()",
+    "(TODOS)",
+    "(M)",
+    "(H)",
+    "(T)",
+    "(BIS)",
+    "(VARÕES)",
+    "(SERVAS)",
+    "REPETIR O LOUVOR",
+    "REPETIR 1ª ESTROFE",
+    "REPETIR A 1ª ESTROFE",
+    "REPETIR 2ª ESTROFE",
+    "REPETIR A 2ª ESTROFE",
+    "REPETIR ESTROFE",
+    "REPETIR A ESTROFE",
+    "FINAL:",
+    "BIS NO FINAL",
+    "IGREJA CRISTÃ MARANATA",
+    "ATUALIZAÇÃO",
+    "\nINSTRUMENTOS",
+]
+
+
+# as tags de controle compiladas numa única alternância, na ordem da lista
+CONTROLE_REGEX = re.compile("|".join(re.escape(tag) for tag in TAGS_CONTROLE))
+ESPACOS_REGEX = re.compile(r"[ \t]{2,}")
+CORO_REGEX = re.compile(r"^CORO\s*")
+
+
+def strip_tags(text):
+    """Remove as tags de controle de um texto já em maiúsculas.
+
+    A regex compilada só decide se há alguma tag; as linhas com tags passam
+    pelos replaces na ordem da lista, como antes, porque o resultado depende
+    da ordem (em "2(H)X", tirar "2X" antes de "(H)" deixa "2X").
+    """
+    if not CONTROLE_REGEX.search(text):
+        return text
+    for tag in TAGS_CONTROLE:
+        text = text.replace(tag, "")
+    return text
+
+
+def return_possible_title(texts):
+    possible_title = []
+    for text in texts:
+        upper = text.upper()
+        if (
+            not CONTROLE_REGEX.search(upper)
+            and text.strip() != ""
+            and upper not in TAGS_LITERAIS
+        ):
+            possible_title.append(text)
+    if possible_title:
+        min_string = min(possible_title, key=len)
+        title_index = texts.index(min_string)
+        title = min_string.upper().replace("\n", " ")
+        if title not in erros_conhecidos:
+            return title, title_index
+    return None, None
+
+
+def set_text_clean(texts_wo_title):
+    texts_clean = []
+    for line in texts_wo_title:
+        line = ESPACOS_REGEX.sub(" ", line)
+        if line in TAGS_LITERAIS:
+            continue
+        line = strip_tags(line.upper()).strip()
+        if line and not CORO_REGEX.match(line):
+            texts_clean.append(line)
+    texts_clean = " ".join(texts_clean)
+    texts_clean = texts_clean.replace("\n", " ")
+    texts_clean = ESPACOS_REGEX.sub(" ", texts_clean)
+    # remove all double quotes
+    texts_clean = texts_clean.replace("“", "")
+    texts_clean = texts_clean.replace("”", "")
+    texts_clean = texts_clean.replace('"', "")
+    return texts_clean
+
+
+def set_text_full(texts_wo_title):
+    texts_full = [
+        line
+        for line in texts_wo_title
+        if line.upper() != "ÍNDICE" and line.strip() != ""
+    ]
+    texts_full = "\n\n".join(texts_full)
+    texts_full = texts_full.replace("\n\nBIS", "\nBIS")
+    texts_full = texts_full.replace('"', "'")
+    return texts_full
+
+
+def return_number(title):
+    if title:
+        for word in title.split(" "):
+            match = re.search(r"\d+", word)
+            if match:
+                numero = match.group()
+                # remove number from title
+                title_clean = title.replace(match.group(), "").strip()
+                # check if string starts with hifen and remove it
+                if title_clean.startswith("-"):
+                    title_clean = title_clean[1:].strip()
+                else:
+                    title_clean = title_clean.strip()
+
+                return numero, title_clean
+            else:
+                return "null", title
+    return "null", None
+
+
+def process_praise(praise):
+    texts = praise.texts
+
+    if not texts:
+        return None
+
+    # clean double or more spaces in string array
+    texts = [text.replace("–", "-") for text in texts]
+
+    title, title_index = return_possible_title(texts)
+    numero, title_clean = return_number(title)
+
+    texts_wo_title = texts.copy()
+    if title_index is not None:
+        texts_wo_title.pop(title_index)
+
+    texts_full = set_text_full(texts_wo_title)
+    texts_clean = set_text_clean(texts_wo_title)
+
+    return {
+        "numero": numero,
+        "nome": title_clean if title_clean is not None else "null",
+        "texto": texts_full,
+        "texto_limpo": texts_clean,
+        "texto_estruturado": texto_estruturado(texts_full),
+    }
+
+
+def iter_structure(praises):
+    for praise in praises:
+        hino = process_praise(praise)
+        if hino is not None:
+            yield hino
+
+
+def process_chunk(praises):
+    return list(iter_structure(praises))
+
+
+def structure_chunk(praises):
+    # como process_chunk, mas mantendo None na posição dos louvores sem texto
+    return [process_praise(praise) for praise in praises]
+
+
+def cache_lookup(chunk, cache):
+    """Chaves do lote, hinos já no cache e louvores que faltam estruturar."""
+    keys = [cache.key(praise.texts) for praise in chunk]
+    found = cache.get_many(keys)
+    misses = [praise for praise, key in zip(chunk, keys) if key not in found]
+    return keys, found, misses
+
+
+def cache_merge(keys, found, structured, cache):
+    """Hinos do lote na ordem de entrada, juntando os do cache com os recém
+    estruturados (que são gravados no cache)."""
+    structured = iter(structured)
+    new = []
+    for key in keys:
+        if key in found:
+            hino = found[key]
+        else:
+            hino = next(structured)
+            new.append((key, hino))
+        if hino is not None:
+            yield hino
+    cache.put_many(new)
+
+
+def process_structure(
+    praises, workers: int = 1, chunk_size: int = 100, cache=None
+):
+    """Estrutura os louvores, na ordem de entrada.
+
+    Com workers > 1, os louvores são divididos em lotes de chunk_size e
+    processados num pool de processos; os resultados saem na ordem dos lotes,
+    e só alguns lotes ficam em andamento por vez, para a entrada continuar
+    sendo lida sob demanda. Com cache (PraiseCache), só os louvores que não
+    estão no cache são estruturados.
+    """
+    praises = tqdm(praises, desc="Processing praises", unit="praise")
+    if workers <= 1 and cache is None:
+        yield from iter_structure(praises)
+        return
+
+    if workers <= 1:
+        for chunk in batches(praises, chunk_size):
+            keys, found, misses = cache_lookup(chunk, cache)
+            yield from cache_merge(keys, found, structure_chunk(misses), cache)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in batches(praises, chunk_size):
+            if cache is None:
+                pending.append((None, executor.submit(process_chunk, chunk)))
+            else:
+                keys, found, misses = cache_lookup(chunk, cache)
+                future = executor.submit(structure_chunk, misses)
+                pending.append(((keys, found), future))
+            if len(pending) > 2 * workers:
+                yield from chunk_result(*pending.popleft(), cache)
+        while pending:
+            yield from chunk_result(*pending.popleft(), cache)
+
+
+def chunk_result(lookup, future, cache):
+    if lookup is None:
+        return future.result()
+    return cache_merge(*lookup, future.result(), cache)
+
+
+def migration_name(file, number, compress=True):
+    # nome do arquivo de origem (pptx, txt ou json) -> nome da migração
+    return (
+        "00"
+        + str(number)
+        + "-"
+        + file.split("\\")[1].split("pptx")[0].lower().replace(" ", "_")
+        + "sql"
+        + (".gz" if compress else "")
+    )
+
+
+HINO_COLUNAS = (
+    "numero, nome, texto, texto_limpo, texto_estruturado, coletanea_id, "
+    "date_insert, date_update"
+)
+# linhas por INSERT nas migrações geradas
+BATCH_SIZE = 500
+
+
+def hino_row(hino, coletanea_id):
+    """Valores de um hino, na forma em que ficam gravados no banco."""
+    return (
+        hino["numero"],
+        hino["nome"],
+        hino["texto"].replace("\n", "\\n"),
+        hino["texto_limpo"],
+        hino["texto_estruturado"],
+        coletanea_id,
+    )
+
+
+def sql_literal(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
+
+def hino_values(hino, coletanea_id):
+    return (
+        "("
+        + ", ".join(sql_literal(value) for value in hino_row(hino, coletanea_id))
+        + ", CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+    )
+
+
+def hinos2sql(hinos, coletanea_id):
+    """Um INSERT de várias linhas com os hinos do lote."""
+    return (
+        "INSERT INTO hino ("
+        + HINO_COLUNAS
+        + ") VALUES\n"
+        + ",\n".join(hino_values(hino, coletanea_id) for hino in hinos)
+        + ";\n"
+    )
+
+
+def batches(items, size=BATCH_SIZE):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def migration_path(file_name):
+    return "..\\db\\migrations\\" + file_name
+
+
+def output_path(file_name):
+    # as migrações completas geradas aqui ficam fora de db/migrations: as de
+    # 003 a 006 já aplicadas aos bancos não podem mudar (o run_migrations
+    # confere o checksum de cada uma). Uma coletânea nova entra em
+    # db/migrations copiada com o próximo número; uma revisada, pelo
+    # revision.py
+    return OUTPUT + "\\" + file_name
+
+
+def save_signatures(manifest, index_duplicates, file_name, start):
+    # assinaturas MinHash dos hinos da migração, num arquivo ao lado do
+    # praise_cache.db; o manifesto guarda só o caminho e o hash
+    if index_duplicates is None:
+        return None
+    os.makedirs(SIGNATURES, exist_ok=True)
+    path = SIGNATURES + "\\" + file_name + ".npz"
+    index_duplicates.save(path, start)
+    return manifest.sidecar_entry(path)
+
+
+def load_sql(conn, hinos, coletanea_id):
+    """Insere os hinos direto no banco, com um INSERT parametrizado."""
+    conn.executemany(
+        "INSERT INTO hino ("
+        + HINO_COLUNAS
+        + ") VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+        [hino_row(hino, coletanea_id) for hino in hinos],
+    )
+
+
+def write_sql(file_name, hinos, coletanea_id, conn=None, skip=0, checkpoint=None):
+    """Grava a migração em lotes de até BATCH_SIZE hinos; com conn, cada lote
+    também é inserido direto no banco.
+
+    Migrações .sql.gz são gravadas com cada lote num membro gzip completo (sem
+    data no cabeçalho, para a saída ser sempre a mesma); o arquivo continua
+    sendo um .gz válido, lido de uma vez pelo gzip.
+
+    Ao retomar, os `skip` primeiros hinos (já gravados) são descartados e a
+    migração continua no fim do arquivo. checkpoint(hinos, bytes) é chamado
+    após cada lote, com a saída já em disco.
+    """
+    compress = file_name.endswith(".gz")
+    mode = ("a" if skip else "w") + ("b" if compress else "")
+    encoding = None if compress else "utf-8"
+    with open(output_path(file_name), mode, encoding=encoding) as f:
+        written = 0
+        for batch in batches(islice(hinos, skip, None)):
+            sql = hinos2sql(batch, coletanea_id)
+            f.write(gzip.compress(sql.encode("utf-8"), mtime=0) if compress else sql)
+            if conn is not None:
+                load_sql(conn, batch, coletanea_id)
+            written += len(batch)
+            if checkpoint is not None:
+                f.flush()
+                checkpoint(written, f.tell())
+
+
+def connect(db):
+    """Abre o banco de destino da carga direta, que já deve ter o esquema."""
+    conn = sqlite3.connect(db)
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'hino'"
+    ).fetchone():
+        conn.close()
+        raise ValueError(f"{db} has no hino table, run the schema migrations first")
+    return conn
+
+
+def json2sql(
+    inicio: int = 3,
+    manifest=None,
+    db=None,
+    workers: int = 1,
+    metrics=None,
+    duplicates: bool = True,
+    compress: bool = True,
+    cache=None,
+):
+    logging.info("Starting json2sql conversion...")
+    files_json = glob.glob("slides_json\\*.ndjson")
+    logging.info(f"Files found: {files_json}")
+
+    os.makedirs(OUTPUT, exist_ok=True)
+    # carga direta: todos os arquivos numa única transação
+    conn = connect(db) if db is not None else None
+    # quase duplicatas entre todas as coletâneas, inclusive as não alteradas
+    index_duplicates = DuplicateIndex() if duplicates else None
+
+    for index, file in enumerate(files_json):
+        file_name = migration_name(file, index + inicio, compress)
+        params = {"migration": file_name, "coletanea_id": index + 1}
+        if (
+            manifest is not None
+            and conn is None
+            and manifest.is_current(
+                "json2sql", file, output_path(file_name), params, CODE
+            )
+        ):
+            # as assinaturas do arquivo ficam em SIGNATURES; só sem elas (ou
+            # alteradas) é preciso estruturar o arquivo de novo
+            if index_duplicates is not None and not index_duplicates.load(
+                manifest.sidecar("json2sql", file)
+            ):
+                start = len(index_duplicates.keys)
+                index_duplicates.extend(
+                    process_structure(read_praises(file), cache=cache), file_name
+                )
+                manifest.record(
+                    "json2sql",
+                    file,
+                    output_path(file_name),
+                    params,
+                    CODE,
+                    save_signatures(manifest, index_duplicates, file_name, start),
+                )
+            continue
+
+        logging.info(f"Processing file: {file}")
+
+        # na carga direta não há retomada: a transação interrompida é desfeita
+        done = 0
+        checkpoint = None
+        if manifest is not None and conn is None:
+            done = manifest.resume(
+                "json2sql", file, output_path(file_name), params, CODE
+            )
+            checkpoint = manifest.checkpointer("json2sql", file, done, params, CODE)
+
+        start = len(index_duplicates.keys) if index_duplicates is not None else 0
+        with track(metrics, "json2sql", file, output_path(file_name)) as entry:
+            louvores = counted(read_praises(file), entry, "records_in")
+            louvores_estruturados = counted(
+                process_structure(louvores, workers, cache=cache),
+                entry,
+                "records_out",
+            )
+            if index_duplicates is not None:
+                louvores_estruturados = index_duplicates.tee(
+                    louvores_estruturados, file_name
+                )
+            with counting(cache, entry):
+                write_sql(
+                    file_name, louvores_estruturados, index + 1, conn, done, checkpoint
+                )
+
+        if manifest is not None:
+            manifest.record(
+                "json2sql",
+                file,
+                output_path(file_name),
+                params,
+                CODE,
+                save_signatures(manifest, index_duplicates, file_name, start),
+            )
+
+    if conn is not None:
+        conn.commit()
+        conn.close()
+        logging.info(f"Loaded praises into {db}")
+
+    if index_duplicates is not None:
+        index_duplicates.write_report(output_path(DUPLICATES_REPORT))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Gera as migrações SQL dos louvores")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="processos usados na estruturação dos louvores (1 = serial)",
+    )
+    parser.add_argument(
+        "--db",
+        help="carrega os louvores também direto neste banco SQLite (que já deve "
+        "ter as tabelas), numa única transação",
+    )
+    parser.add_argument(
+        "--no-duplicates",
+        action="store_true",
+        help="não gera o relatório de quase duplicatas (duplicados.csv)",
+    )
+    parser.add_argument(
+        "--plain-sql",
+        action="store_true",
+        help="grava as migrações em .sql, sem comprimir (padrão: .sql.gz)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="estrutura todos os louvores, sem o cache persistente "
+        "(praise_cache.db)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    cache = None if args.no_cache else PraiseCache(code=CODE)
+    json2sql(
+        db=args.db,
+        workers=args.workers,
+        duplicates=not args.no_duplicates,
+        compress=not args.plain_sql,
+        cache=cache,
+    )
+    if cache is not None:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
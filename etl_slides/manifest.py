@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import os
+
+MANIFEST = "manifest.json"
+# registros (slides, louvores ou hinos) entre dois checkpoints de um arquivo
+CHECKPOINT_EVERY = 100
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class Manifest:
+    """Hashes das entradas e saídas de cada etapa do ETL, por arquivo.
+
+    Uma etapa pode pular um arquivo quando a entrada, os parâmetros e o código
+    da etapa são os mesmos da última execução e a saída gravada não foi
+    alterada. Com force=True nada é pulado, mas o manifesto é atualizado.
+
+    Enquanto um arquivo é processado, a etapa grava checkpoints com quantos
+    registros já foram escritos e o tamanho da saída nesse ponto; se a
+    execução for interrompida, a próxima retoma dali (resume), desde que a
+    entrada, os parâmetros e o código sejam os mesmos.
+    """
+
+    def __init__(self, path=MANIFEST, force=False):
+        self.path = path
+        self.force = force
+        self.data = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        self._hashes = {}
+
+    def _hash(self, path):
+        # cada arquivo é lido uma única vez por execução
+        if path not in self._hashes:
+            self._hashes[path] = file_hash(path)
+        return self._hashes[path]
+
+    def _code_hash(self, code):
+        # code: módulos .py dos quais a saída da etapa depende
+        if not code:
+            return None
+        return hashlib.sha256(
+            "".join(self._hash(path) for path in code).encode()
+        ).hexdigest()
+
+    def is_current(self, stage, source, output, params=None, code=None):
+        if self.force or not os.path.exists(output):
+            return False
+        entry = self.data.get(stage, {}).get(source)
+        if entry is None:
+            return False
+        current = (
+            entry.get("input") == self._hash(source)
+            and entry.get("output") == self._hash(output)
+            and entry.get("params") == params
+            and entry.get("code") == self._code_hash(code)
+        )
+        if current:
+            logging.info(f"Skipping unchanged file: {source} ({stage})")
+        return current
+
+    def resume(self, stage, source, output, params=None, code=None):
+        """Registros já gravados de source numa execução interrompida (0 para
+        começar do zero). A saída é truncada no último checkpoint."""
+        checkpoint = self.data.get("checkpoints", {}).get(stage, {}).get(source)
+        if self.force or checkpoint is None or not os.path.exists(output):
+            return 0
+        if (
+            checkpoint["input"] != self._hash(source)
+            or checkpoint["params"] != params
+            or checkpoint["code"] != self._code_hash(code)
+            or os.path.getsize(output) < checkpoint["bytes"]
+        ):
+            return 0
+        with open(output, "r+b") as f:
+            f.truncate(checkpoint["bytes"])
+        logging.info(
+            f"Resuming {source} ({stage}) after {checkpoint['records']} records"
+        )
+        return checkpoint["records"]
+
+    def checkpoint(self, stage, source, records, offset, params=None, code=None):
+        # offset: tamanho da saída (já gravada em disco) após esses registros
+        self.data.setdefault("checkpoints", {}).setdefault(stage, {})[source] = {
+            "input": self._hash(source),
+            "params": params,
+            "code": self._code_hash(code),
+            "records": records,
+            "bytes": offset,
+        }
+        self.save()
+
+    def checkpointer(self, stage, source, done=0, params=None, code=None):
+        """checkpoint(registros, bytes) de um arquivo, para a etapa chamar
+        durante a escrita; os registros contam a partir dos `done` retomados."""
+
+        def checkpoint(records, offset):
+            self.checkpoint(stage, source, done + records, offset, params, code)
+
+        return checkpoint
+
+    def record(self, stage, source, output, params=None, code=None, extra=None):
+        # extra: dados da etapa derivados da saída, reaproveitados quando o
+        # arquivo é pulado (ver extra())
+        self.data.get("checkpoints", {}).get(stage, {}).pop(source, None)
+        self._hashes.pop(output, None)
+        self.data.setdefault(stage, {})[source] = {
+            "input": self._hash(source),
+            "output": self._hash(output),
+            "params": params,
+            "code": self._code_hash(code),
+        }
+        if extra is not None:
+            self.data[stage][source]["extra"] = extra
+        self.save()
+
+    def extra(self, stage, source):
+        """Dados gravados com record(..., extra=...) para o arquivo, ou None."""
+        return self.data.get(stage, {}).get(source, {}).get("extra")
+
+    def sidecar_entry(self, path):
+        # extra de record() para um arquivo auxiliar: o manifesto guarda só o
+        # caminho e o hash, e não o conteúdo (save() regrava o manifesto a
+        # cada checkpoint)
+        self._hashes.pop(path, None)
+        return {"path": path, "hash": self._hash(path)}
+
+    def sidecar(self, stage, source):
+        """Caminho do arquivo auxiliar registrado com sidecar_entry(), se ele
+        ainda existe sem alterações; senão None."""
+        extra = self.extra(stage, source)
+        if not isinstance(extra, dict) or "path" not in extra:
+            return None
+        path = extra["path"]
+        if not os.path.exists(path) or self._hash(path) != extra["hash"]:
+            return None
+        return path
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=4)
+        os.replace(tmp, self.path)
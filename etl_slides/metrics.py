@@ -0,0 +1,199 @@
+import cProfile
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT = "etl_report.json"
+
+
+def peak_rss():
+    """Pico de memória residente do processo e dos filhos já encerrados, em
+    bytes (None onde o módulo resource não existe)."""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss():
+    """Zera o pico de memória residente do processo (VmHWM), onde o Linux
+    permite (/proc/self/clear_refs); False nos outros sistemas."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_since_reset():
+    """Pico de memória residente do processo desde o último reset_peak_rss(),
+    em bytes (VmHWM de /proc/self/status)."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def file_size(path):
+    return os.path.getsize(path) if path and os.path.exists(path) else None
+
+
+class Metrics:
+    """Métricas de cada etapa do ETL, por arquivo.
+
+    Cada registro guarda tempo de parede e de CPU, registros lidos e gerados
+    (slides, louvores ou hinos, conforme a etapa), bytes lidos e gravados, o
+    pico de memória residente do processo principal durante a etapa (peak_rss,
+    só no Linux; etapas abertas ao mesmo tempo, como na extração paralela,
+    ficam com o pico do intervalo todo) e o pico do processo desde o início
+    da execução (process_peak_rss_so_far). Com profile, o
+    cProfile de cada etapa/arquivo é gravado nessa pasta; só um profiler fica
+    ativo por vez (etapas abertas enquanto outra é perfilada ficam de fora).
+    """
+
+    def __init__(self, profile=None):
+        self.profile = profile
+        self.profiling_active = False
+        self.entries = []
+        # etapas abertas e se o pico de memória foi zerado quando a primeira
+        # delas começou
+        self.open_stages = 0
+        self.peak_reset = False
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+        if profile:
+            os.makedirs(profile, exist_ok=True)
+
+    def enable_profiler(self):
+        # desde o Python 3.12, ativar um segundo cProfile levanta ValueError;
+        # antes, ele substituía o primeiro e os dois .prof saíam errados
+        if not self.profile or self.profiling_active:
+            return None
+        profiler = cProfile.Profile()
+        profiler.enable()
+        self.profiling_active = True
+        return profiler
+
+    def dump_profiler(self, profiler, name):
+        profiler.disable()
+        self.profiling_active = False
+        profiler.dump_stats(os.path.join(self.profile, f"{name}.prof"))
+
+    @contextmanager
+    def profiling(self, name):
+        """cProfile do bloco inteiro, gravado em name.prof."""
+        profiler = self.enable_profiler()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                self.dump_profiler(profiler, name)
+
+    def start(self, stage, source, output=None, profile=True):
+        # profile=False: etapa medida, mas perfilada por quem a abriu (como a
+        # extração paralela, um cProfile só para todos os arquivos)
+        entry = {
+            "stage": stage,
+            "source": source,
+            "output": output,
+            "records_in": 0,
+            "records_out": 0,
+        }
+        if self.open_stages == 0:
+            self.peak_reset = reset_peak_rss()
+        self.open_stages += 1
+        entry["_wall"] = time.perf_counter()
+        entry["_cpu"] = time.process_time()
+        profiler = self.enable_profiler() if profile else None
+        if profiler is not None:
+            entry["_profiler"] = profiler
+        return entry
+
+    def finish(self, entry, cpu=None):
+        # cpu: tempo de CPU medido em outros processos (extração paralela)
+        profiler = entry.pop("_profiler", None)
+        if profiler is not None:
+            name = entry["source"].split("\\")[-1]
+            self.dump_profiler(profiler, f"{entry['stage']}-{name}")
+
+        entry["wall_s"] = round(time.perf_counter() - entry.pop("_wall"), 4)
+        own_cpu = time.process_time() - entry.pop("_cpu")
+        entry["cpu_s"] = round(own_cpu if cpu is None else cpu, 4)
+        entry["bytes_read"] = file_size(entry["source"])
+        entry["bytes_written"] = file_size(entry["output"])
+        entry["peak_rss"] = peak_rss_since_reset() if self.peak_reset else None
+        entry["process_peak_rss_so_far"] = peak_rss()
+        self.open_stages -= 1
+        self.entries.append(entry)
+        logging.info(
+            f"{entry['stage']} {entry['source']}: {entry['wall_s']:.2f}s, "
+            f"{entry['records_in']} in, {entry['records_out']} out"
+        )
+        return entry
+
+    @contextmanager
+    def stage(self, stage, source, output=None):
+        entry = self.start(stage, source, output)
+        try:
+            yield entry
+        finally:
+            self.finish(entry)
+
+    def report(self):
+        return {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "wall_s": round(time.perf_counter() - self.started, 4),
+            "cpu_s": round(time.process_time() - self.started_cpu, 4),
+            "peak_rss": peak_rss(),
+            "stages": self.entries,
+        }
+
+    def save(self, path=REPORT):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=4)
+        logging.info(f"Run report written to {path}")
+
+
+@contextmanager
+def track(metrics, stage, source, output=None):
+    """metrics.stage(...), ou só um registro descartável quando metrics é None."""
+    if metrics is None:
+        yield {"records_in": 0, "records_out": 0}
+    else:
+        with metrics.stage(stage, source, output) as entry:
+            yield entry
+
+
+@contextmanager
+def profiling(metrics, name):
+    """metrics.profiling(name), ou nada quando metrics é None."""
+    if metrics is None:
+        yield
+    else:
+        with metrics.profiling(name):
+            yield
+
+
+def counted(items, entry, key):
+    # repassa os itens adiante, contando-os em entry[key]
+    for item in items:
+        entry[key] += 1
+        yield item
@@ -0,0 +1,265 @@
+import posixpath
+import zipfile
+from xml.parsers import expat
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
+from records import Shape
+
+# Leitura direta do XML dos slides (ppt/slides/slideN.xml), sem montar o modelo
+# de objetos do python-pptx. Gera os mesmos registros de shape_records() em
+# pptx2txt (records.Shape).
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+P_SP = NS_P + " sp"
+P_PIC = NS_P + " pic"
+P_GRPSP = NS_P + " grpSp"
+P_GRAPHIC_FRAME = NS_P + " graphicFrame"
+P_CXNSP = NS_P + " cxnSp"
+P_CONTENT_PART = NS_P + " contentPart"
+SHAPE_TAGS = {P_SP, P_PIC, P_GRPSP, P_GRAPHIC_FRAME, P_CXNSP, P_CONTENT_PART}
+
+P_SPTREE = NS_P + " spTree"
+P_SPPR = NS_P + " spPr"
+P_TXBODY = NS_P + " txBody"
+P_CNVSPPR = NS_P + " cNvSpPr"
+P_NVPR = NS_P + " nvPr"
+P_PH = NS_P + " ph"
+P_OLE_OBJ = NS_P + " oleObj"
+P_EMBED = NS_P + " embed"
+A_PRSTGEOM = NS_A + " prstGeom"
+A_CUSTGEOM = NS_A + " custGeom"
+A_XFRM = NS_A + " xfrm"
+A_OFF = NS_A + " off"
+A_EXT = NS_A + " ext"
+A_P = NS_A + " p"
+A_R = NS_A + " r"
+A_FLD = NS_A + " fld"
+A_BR = NS_A + " br"
+A_T = NS_A + " t"
+A_GRAPHIC_DATA = NS_A + " graphicData"
+A_VIDEO_FILE = NS_A + " videoFile"
+
+URI_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+URI_OLE = "http://schemas.openxmlformats.org/presentationml/2006/ole"
+
+TRUE_VALUES = ("1", "true")
+
+_auto_shape_types = {}
+
+
+def auto_shape_type(prst):
+    if prst not in _auto_shape_types:
+        _auto_shape_types[prst] = MSO_AUTO_SHAPE_TYPE.from_xml(prst)
+    return _auto_shape_types[prst]
+
+
+def slide_parts(z):
+    """Nomes das partes dos slides, na ordem da apresentação."""
+    targets = {}
+    parser = expat.ParserCreate(namespace_separator=" ")
+
+    def rel_start(name, attrs):
+        if name == NS_REL + " Relationship":
+            targets[attrs["Id"]] = attrs["Target"]
+
+    parser.StartElementHandler = rel_start
+    parser.Parse(z.read("ppt/_rels/presentation.xml.rels"), True)
+
+    parts = []
+    parser = expat.ParserCreate(namespace_separator=" ")
+
+    def prs_start(name, attrs):
+        if name == NS_P + " sldId":
+            target = targets[attrs[NS_R + " id"]]
+            if target.startswith("/"):
+                parts.append(target[1:])
+            else:
+                parts.append(posixpath.normpath(posixpath.join("ppt", target)))
+
+    parser.StartElementHandler = prs_start
+    parser.Parse(z.read("ppt/presentation.xml"), True)
+    return parts
+
+
+class _Shape:
+    __slots__ = (
+        "tag",
+        "placeholder",
+        "textbox",
+        "prst",
+        "custom_geometry",
+        "height",
+        "top",
+        "video",
+        "uri",
+        "ole_embedded",
+        "paragraphs",
+    )
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.placeholder = False
+        self.textbox = False
+        self.prst = None
+        self.custom_geometry = False
+        self.height = None
+        self.top = None
+        self.video = False
+        self.uri = None
+        self.ole_embedded = False
+        self.paragraphs = None
+
+    def shape_type(self):
+        # mesma classificação de SlideShapeFactory/shape_type do python-pptx
+        if self.tag == P_SP:
+            if self.placeholder:
+                return MSO_SHAPE_TYPE.PLACEHOLDER
+            if self.custom_geometry:
+                return MSO_SHAPE_TYPE.FREEFORM
+            if self.prst is not None and not self.textbox:
+                return MSO_SHAPE_TYPE.AUTO_SHAPE
+            if self.textbox:
+                return MSO_SHAPE_TYPE.TEXT_BOX
+            raise NotImplementedError("Shape instance of unrecognized shape type")
+        if self.tag == P_PIC:
+            if self.placeholder:
+                return MSO_SHAPE_TYPE.PLACEHOLDER
+            return MSO_SHAPE_TYPE.MEDIA if self.video else MSO_SHAPE_TYPE.PICTURE
+        if self.tag == P_GRPSP:
+            return MSO_SHAPE_TYPE.GROUP
+        if self.tag == P_CXNSP:
+            return MSO_SHAPE_TYPE.LINE
+        if self.tag == P_GRAPHIC_FRAME:
+            # sem olhar o placeholder: um graphicFrame com p:ph vira
+            # PlaceholderGraphicFrame, mas o shape_type dele é o do
+            # GraphicFrame, pelo graphicData (conferido no benchmark extract)
+            if self.uri == URI_CHART:
+                return MSO_SHAPE_TYPE.CHART
+            if self.uri == URI_TABLE:
+                return MSO_SHAPE_TYPE.TABLE
+            if self.uri == URI_OLE:
+                if self.ole_embedded:
+                    return MSO_SHAPE_TYPE.EMBEDDED_OLE_OBJECT
+                return MSO_SHAPE_TYPE.LINKED_OLE_OBJECT
+            return None
+        raise NotImplementedError("BaseShape does not implement `.shape_type`")
+
+    def record(self):
+        shape_type = self.shape_type()
+        auto_shape = height = top = text = None
+        if shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+            auto_shape = auto_shape_type(self.prst)
+            height = self.height
+            top = self.top
+        if self.tag == P_SP:
+            if self.paragraphs:
+                text = "\n".join("".join(p) for p in self.paragraphs)
+            else:
+                text = ""
+        return Shape(shape_type, auto_shape, height, top, text)
+
+
+class _SlideParser:
+    """Parser incremental (expat) de um slide.
+
+    Só acompanha os shapes de primeiro nível de p:spTree e, dentro deles, os
+    poucos elementos usados pelo pptx2txt. Nenhuma árvore XML é montada.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.path = []
+        self.shape = None
+        self.text = None
+        self.parser = expat.ParserCreate(namespace_separator=" ")
+        self.parser.buffer_text = True
+        self.parser.StartElementHandler = self.start
+        self.parser.EndElementHandler = self.end
+        self.parser.CharacterDataHandler = self.data
+
+    def parse(self, stream):
+        self.parser.ParseFile(stream)
+        return self.records
+
+    def start(self, name, attrs):
+        path = self.path
+        path.append(name)
+        depth = len(path)
+
+        # p:sld/p:cSld/p:spTree/<shape>
+        if depth == 4:
+            if name in SHAPE_TAGS and path[2] == P_SPTREE:
+                self.shape = _Shape(name)
+            return
+
+        shape = self.shape
+        if shape is None or depth < 6:
+            return
+
+        # path[3] é o shape; path[4], path[5], ... seus descendentes
+        if depth == 6:
+            parent = path[4]
+            if parent == P_SPPR:
+                if name == A_PRSTGEOM:
+                    shape.prst = attrs.get("prst")
+                elif name == A_CUSTGEOM:
+                    shape.custom_geometry = True
+            elif parent == P_TXBODY:
+                if name == A_P:
+                    if shape.paragraphs is None:
+                        shape.paragraphs = []
+                    shape.paragraphs.append([])
+            elif name == P_CNVSPPR:
+                shape.textbox = attrs.get("txBox", "").lower() in TRUE_VALUES
+            elif name == A_GRAPHIC_DATA:
+                shape.uri = attrs.get("uri")
+        elif depth == 7:
+            parent = path[5]
+            if parent == P_NVPR:
+                # ./*[1]/p:nvPr/p:ph e ./p:nvPicPr/p:nvPr/a:videoFile
+                if name == P_PH:
+                    shape.placeholder = True
+                elif name == A_VIDEO_FILE:
+                    shape.video = True
+            elif parent == A_XFRM and path[4] == P_SPPR:
+                if name == A_OFF:
+                    shape.top = int(attrs["y"])
+                elif name == A_EXT:
+                    shape.height = int(attrs["cy"])
+            elif parent == A_P and path[4] == P_TXBODY:
+                if name == A_BR:
+                    shape.paragraphs[-1].append("\v")
+        elif depth == 8:
+            if name == A_T and path[4] == P_TXBODY:
+                if path[6] == A_R or path[6] == A_FLD:
+                    self.text = []
+            elif name == P_EMBED and path[6] == P_OLE_OBJ:
+                shape.ole_embedded = True
+
+    def data(self, content):
+        if self.text is not None:
+            self.text.append(content)
+
+    def end(self, name):
+        path = self.path
+        depth = len(path)
+        if self.text is not None and depth == 8:
+            self.shape.paragraphs[-1].append("".join(self.text))
+            self.text = None
+        elif depth == 4 and self.shape is not None:
+            self.records.append(self.shape.record())
+            self.shape = None
+        path.pop()
+
+
+def iter_slides(file, start=0, stop=None):
+    """Gera (índice, registros dos shapes) para os slides [start, stop)."""
+    with zipfile.ZipFile(file) as z:
+        parts = slide_parts(z)
+        for i in range(start, len(parts) if stop is None else stop):
+            with z.open(parts[i]) as stream:
+                yield i, _SlideParser().parse(stream)
@@ -1,12 +1,229 @@
-from pptx2txt import pptx2txt
-from txt2json import txt2json
-from json2sql import json2sql
+import argparse
+import glob
+import logging
+import os
+from pptx2txt import pptx2txt, iter_slides, slide2txt, txt_path
+from pptx2txt import CODE as PPTX2TXT_CODE
+from txt2json import txt2json, iter_praises, write_praises, json_path
+from txt2json import CODE as TXT2JSON_CODE
+from json2sql import json2sql, process_structure, migration_name, output_path
+from json2sql import write_sql, connect, save_signatures, OUTPUT
+from json2sql import CODE as JSON2SQL_CODE
+from duplicates import DuplicateIndex, REPORT as DUPLICATES_REPORT
+from manifest import Manifest
+from cache import PraiseCache, counting
+from metrics import Metrics, track, counted, REPORT
+
+CODE = [__file__] + PPTX2TXT_CODE + TXT2JSON_CODE + JSON2SQL_CODE
+
+
+def write_slides(slides, new_file):
+    """Repassa os slides adiante, gravando em new_file o mesmo .txt do pptx2txt."""
+    with open(new_file, "w", encoding="utf-8") as f:
+        for i, shapes in slides:
+            f.write(slide2txt(i, shapes))
+            yield i, shapes
+
+
+def pipeline_stream(
+    inicio: int = 3,
+    engine: str = "pptx",
+    debug_txt: bool = False,
+    debug_json: bool = False,
+    manifest=None,
+    db=None,
+    workers: int = 1,
+    metrics=None,
+    compress: bool = True,
+    cache=None,
+    duplicates: bool = True,
+):
+    """Roda o ETL em memória: cada louvor vai do slide ao SQL sem arquivos
+    intermediários. Os .txt e .json só são gravados se pedidos, para depuração."""
+    logging.info("Starting streaming pipeline...")
+    files = glob.glob("slides_adapt\\*.pptx")
+    logging.info(f"Files found: {files}")
+
+    os.makedirs(OUTPUT, exist_ok=True)
+    conn = connect(db) if db is not None else None
+    # quase duplicatas entre todas as coletâneas, como no json2sql
+    index_duplicates = DuplicateIndex() if duplicates else None
+
+    for index, file in enumerate(files):
+        file_name = migration_name(file, index + inicio, compress)
+        params = {"migration": file_name, "coletanea_id": index + 1}
+        if (
+            manifest is not None
+            and not (debug_txt or debug_json)
+            and conn is None
+            and manifest.is_current(
+                "stream", file, output_path(file_name), params, CODE
+            )
+        ):
+            if index_duplicates is not None and not index_duplicates.load(
+                manifest.sidecar("stream", file)
+            ):
+                start = len(index_duplicates.keys)
+                praises = iter_praises(iter_slides(file, engine=engine))
+                index_duplicates.extend(
+                    process_structure(praises, workers, cache=cache), file_name
+                )
+                manifest.record(
+                    "stream",
+                    file,
+                    output_path(file_name),
+                    params,
+                    CODE,
+                    save_signatures(manifest, index_duplicates, file_name, start),
+                )
+            continue
+
+        logging.info(f"Processing file: {file}")
+
+        start = len(index_duplicates.keys) if index_duplicates is not None else 0
+        with track(metrics, "stream", file, output_path(file_name)) as entry:
+            slides = counted(iter_slides(file, engine=engine), entry, "records_in")
+            if debug_txt:
+                slides = write_slides(slides, txt_path(file))
+
+            praises = iter_praises(slides)
+            if debug_json:
+                praises = write_praises(praises, json_path(txt_path(file)))
+
+            hinos = counted(
+                process_structure(praises, workers, cache=cache), entry, "records_out"
+            )
+            if index_duplicates is not None:
+                hinos = index_duplicates.tee(hinos, file_name)
+            with counting(cache, entry):
+                write_sql(file_name, hinos, index + 1, conn)
+
+        if manifest is not None:
+            manifest.record(
+                "stream",
+                file,
+                output_path(file_name),
+                params,
+                CODE,
+                save_signatures(manifest, index_duplicates, file_name, start),
+            )
+
+    if conn is not None:
+        conn.commit()
+        conn.close()
+        logging.info(f"Loaded praises into {db}")
+
+    if index_duplicates is not None:
+        index_duplicates.write_report(output_path(DUPLICATES_REPORT))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pipeline ETL dos slides")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="processos usados na extração dos slides e na estruturação dos "
+        "louvores (1 = serial)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["pptx", "ooxml"],
+        default="pptx",
+        help="extrator dos slides (ver pptx2txt.py)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="processa em memória, sem os arquivos intermediários .txt/.json",
+    )
+    parser.add_argument(
+        "--debug-txt",
+        action="store_true",
+        help="no modo --stream, grava também os .txt em slides_txt",
+    )
+    parser.add_argument(
+        "--debug-json",
+        action="store_true",
+        help="no modo --stream, grava também os .ndjson em slides_json",
+    )
+    parser.add_argument(
+        "--db",
+        help="carrega os louvores também direto neste banco SQLite (que já deve "
+        "ter as tabelas), numa única transação",
+    )
+    parser.add_argument(
+        "--plain-sql",
+        action="store_true",
+        help="grava as migrações em .sql, sem comprimir (padrão: .sql.gz)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="estrutura todos os louvores, sem o cache persistente "
+        "(praise_cache.db)",
+    )
+    parser.add_argument(
+        "--no-duplicates",
+        action="store_true",
+        help="não gera o relatório de quase duplicatas (duplicados.csv)",
+    )
+    parser.add_argument(
+        "--report",
+        default=REPORT,
+        help="relatório JSON da execução (tempo, CPU, registros, bytes e "
+        "memória por etapa e arquivo)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PASTA",
+        help="grava nessa pasta o cProfile de cada etapa e arquivo "
+        "(só do processo principal)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="reprocessa tudo, mesmo o que não mudou desde a última execução",
+    )
+    return parser.parse_args()
 
 
 def main():
-    pptx2txt()
-    txt2json()
-    json2sql(3)
+    args = parse_args()
+    manifest = Manifest(force=args.force)
+    metrics = Metrics(profile=args.profile)
+    cache = None if args.no_cache else PraiseCache(code=JSON2SQL_CODE)
+    if args.stream:
+        pipeline_stream(
+            3,
+            args.engine,
+            args.debug_txt,
+            args.debug_json,
+            manifest,
+            args.db,
+            args.workers,
+            metrics,
+            not args.plain_sql,
+            cache,
+            not args.no_duplicates,
+        )
+    else:
+        pptx2txt(args.workers, engine=args.engine, manifest=manifest, metrics=metrics)
+        txt2json(manifest, metrics)
+        json2sql(
+            3,
+            manifest,
+            args.db,
+            args.workers,
+            metrics,
+            compress=not args.plain_sql,
+            cache=cache,
+            duplicates=not args.no_duplicates,
+        )
+    if cache is not None:
+        cache.close()
+    metrics.save(args.report)
 
 
 if __name__ == "__main__":
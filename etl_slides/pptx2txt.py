@@ -1,56 +1,289 @@
+import argparse
 import logging
 import glob
+import os
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from tqdm import tqdm
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+import ooxml
+import records
+from records import Shape
+from metrics import track, counted, profiling
+from manifest import CHECKPOINT_EVERY
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 
+CODE = [__file__, ooxml.__file__, records.__file__]
 
-def pptx2txt():
+
+def txt_path(file):
+    return "slides_txt\\" + file.split("\\")[1] + ".txt"
+
+
+def count_slides(file):
+    # conta os slides direto no presentation.xml, sem carregar a apresentação
+    with zipfile.ZipFile(file) as z:
+        return len(ooxml.slide_parts(z))
+
+
+def slide_ranges(file, chunk_size, first=0):
+    total = count_slides(file)
+    return [
+        (start, min(start + chunk_size, total))
+        for start in range(first, total, chunk_size)
+    ]
+
+
+def shape_records(slide):
+    for shape in slide.shapes:
+        shape_type = shape.shape_type
+        auto_shape_type = height = top = text = None
+
+        if shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+            auto_shape_type = shape.auto_shape_type
+            height = shape.height
+            top = shape.top
+
+        if hasattr(shape, "text"):
+            text = shape.text
+
+        yield Shape(shape_type, auto_shape_type, height, top, text)
+
+
+def slide2txt(i, shapes):
+    out = [f"\nSLIDE_{i}\n"]
+
+    for shape in shapes:
+        out.append(f"SHAPE_{shape.shape_type}")
+
+        if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+            out.append(f"_AUTO_SHAPE_{shape.auto_shape}\n")
+            out.append(f"HEIGHT_{shape.height}\n")
+            out.append(f"TOP_{shape.top}\n")
+
+        if shape.text is not None:
+            out.append(f"\nSTART_TEXT\n{shape.text}\nEND_TEXT\n")
+
+        out.append("\n")
+
+    for shape in shapes:
+        if shape.text is not None:
+            if shape.text.lower() == "índice":
+                out.append("\n__END__\n")
+
+    return "".join(out)
+
+
+@lru_cache(maxsize=1)
+def _presentation(file):
+    # cada worker reaproveita a apresentação entre blocos do mesmo arquivo
+    return Presentation(file)
+
+
+def iter_slides(file, start=0, stop=None, engine="pptx"):
+    """Gera (índice, shapes) para os slides [start, stop)."""
+    if engine == "ooxml":
+        yield from ooxml.iter_slides(file, start, stop)
+        return
+
+    prs = _presentation(file)
+    for i, slide in enumerate(islice(prs.slides, start, stop), start):
+        yield i, list(shape_records(slide))
+
+
+def extract_slides(file, start, stop, engine="pptx"):
+    cpu = time.process_time()
+    text = "".join(
+        slide2txt(i, shapes) for i, shapes in iter_slides(file, start, stop, engine)
+    )
+    return os.getpid(), time.process_time() - cpu, text
+
+
+def pptx2txt_parallel(
+    files,
+    workers,
+    chunk_size,
+    engine="pptx",
+    manifest=None,
+    metrics=None,
+    output=txt_path,
+):
+    # output: caminho do .txt de cada arquivo (o benchmark grava em outro lugar)
+    # slides já extraídos numa execução interrompida
+    done = {
+        file: manifest.resume("pptx2txt", file, output(file), code=CODE)
+        if manifest is not None
+        else 0
+        for file in files
+    }
+    ranges = {file: slide_ranges(file, chunk_size, done[file]) for file in files}
+    total = sum(stop - start for r in ranges.values() for start, stop in r)
+    logging.info(
+        f"Extracting {total} slides from {len(files)} files with {workers} workers"
+    )
+
+    # blocos prontos sao escritos em ordem, assim que os anteriores terminam
+    pending = {file: {} for file in files}
+    next_chunk = {file: 0 for file in files}
+    outputs = {}
+    per_worker = Counter()
+    # o tempo de CPU de cada arquivo é o somado nos workers
+    entries = {}
+    cpu = Counter()
+    # um cProfile só para a extração paralela, não um por arquivo: as etapas
+    # dos arquivos ficam abertas ao mesmo tempo
+    if metrics is not None:
+        entries = {
+            file: metrics.start("pptx2txt", file, output(file), profile=False)
+            for file in files
+        }
+
+    with profiling(metrics, "pptx2txt-parallel"), ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        futures = {
+            executor.submit(extract_slides, file, start, stop, engine): (file, index)
+            for file in files
+            for index, (start, stop) in enumerate(ranges[file])
+        }
+        progress = tqdm(total=total, desc="Processing slides", unit="slide")
+        for future in as_completed(futures):
+            file, index = futures[future]
+            start, stop = ranges[file][index]
+            pid, chunk_cpu, text = future.result()
+
+            per_worker[pid] += stop - start
+            cpu[file] += chunk_cpu
+            progress.update(stop - start)
+            logging.info(
+                f"Worker {pid}: {file} slides {start}-{stop - 1} done "
+                f"({per_worker[pid]} slides so far)"
+            )
+
+            pending[file][index] = text
+            while next_chunk[file] in pending[file]:
+                if file not in outputs:
+                    mode = "a" if done[file] else "w"
+                    outputs[file] = open(output(file), mode, encoding="utf-8")
+                outputs[file].write(pending[file].pop(next_chunk[file]))
+                if manifest is not None:
+                    outputs[file].flush()
+                    manifest.checkpoint(
+                        "pptx2txt",
+                        file,
+                        ranges[file][next_chunk[file]][1],
+                        outputs[file].tell(),
+                        code=CODE,
+                    )
+                next_chunk[file] += 1
+            if next_chunk[file] == len(ranges[file]) and file in outputs:
+                outputs.pop(file).close()
+                if file in entries:
+                    slides = ranges[file][-1][1] - done[file]
+                    entries[file]["records_in"] = entries[file]["records_out"] = slides
+                    metrics.finish(entries.pop(file), cpu[file])
+                if manifest is not None:
+                    manifest.record("pptx2txt", file, output(file), code=CODE)
+        progress.close()
+
+    # arquivos sem slides ainda geram um .txt vazio, como no modo serial
+    # (ou, se retomados, já estavam completos)
+    for file in files:
+        if not ranges[file]:
+            if not done[file]:
+                open(output(file), "w", encoding="utf-8").close()
+            if file in entries:
+                metrics.finish(entries.pop(file), 0)
+            if manifest is not None:
+                manifest.record("pptx2txt", file, output(file), code=CODE)
+
+    for pid, slides in sorted(per_worker.items()):
+        logging.info(f"Worker {pid} processed {slides} slides")
+
+
+def pptx2txt(
+    workers: int = 1,
+    chunk_size: int = 500,
+    engine: str = "pptx",
+    manifest=None,
+    metrics=None,
+):
     logging.info("Starting pptx2txt conversion...")
     files = glob.glob("slides_adapt\\*.pptx")
     logging.info(f"Files found: {files}")
 
-    for file in files:
-        logging.info(f"Processing file: {file}")
-        new_file = "slides_txt\\" + file.split("\\")[1] + ".txt"
+    if manifest is not None:
+        files = [
+            file
+            for file in files
+            if not manifest.is_current("pptx2txt", file, txt_path(file), code=CODE)
+        ]
 
-        f = open(new_file, "w", encoding="utf-8")
+    if workers > 1:
+        pptx2txt_parallel(files, workers, chunk_size, engine, manifest, metrics)
+        return
 
-        prs = Presentation(file)
-        for i, slide in tqdm(
-            enumerate(prs.slides), desc="Processing slides", unit="slide"
-        ):
+    for file in files:
+        logging.info(f"Processing file: {file}")
+        new_file = txt_path(file)
 
-            f.write(f"\nSLIDE_{i}\n")
+        done = 0
+        if manifest is not None:
+            done = manifest.resume("pptx2txt", file, new_file, code=CODE)
 
-            for shape in slide.shapes:
-                f.write(f"SHAPE_{shape.shape_type}")
+        with track(metrics, "pptx2txt", file, new_file) as entry:
+            f = open(new_file, "a" if done else "w", encoding="utf-8")
 
-                if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
-                    f.write(f"_AUTO_SHAPE_{shape.auto_shape_type}\n")
-                    f.write(f"HEIGHT_{shape.height}\n")
-                    f.write(f"TOP_{shape.top}\n")
+            slides = counted(iter_slides(file, done, engine=engine), entry, "records_in")
+            for i, shapes in tqdm(slides, desc="Processing slides", unit="slide"):
+                f.write(slide2txt(i, shapes))
+                entry["records_out"] += 1
+                if manifest is not None and (i + 1) % CHECKPOINT_EVERY == 0:
+                    f.flush()
+                    manifest.checkpoint("pptx2txt", file, i + 1, f.tell(), code=CODE)
 
-                if hasattr(shape, "text"):
-                    f.write(f"\nSTART_TEXT\n{shape.text}\nEND_TEXT\n")
+            f.close()
 
-                f.write("\n")
+        if manifest is not None:
+            manifest.record("pptx2txt", file, new_file, code=CODE)
 
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    if shape.text.lower() == "índice":
-                        f.write("\n__END__\n")
 
-        f.close()
+def parse_args():
+    parser = argparse.ArgumentParser(description="Extrai o texto dos slides")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="processos usados na extração (1 = serial)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help="slides por tarefa ao dividir apresentações grandes",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["pptx", "ooxml"],
+        default="pptx",
+        help="pptx: python-pptx; ooxml: leitura direta do XML dos slides",
+    )
+    return parser.parse_args()
 
 
 def main():
-    pptx2txt()
+    args = parse_args()
+    pptx2txt(args.workers, args.chunk_size, args.engine)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+import re
+
+# Registros trocados entre as etapas do ETL (pptx2txt, txt2json e json2sql).
+# Com __slots__, cada registro ocupa bem menos memória que o dicionário
+# equivalente, e o acesso por atributo dispensa o hash das chaves.
+
+AUTO_SHAPE_NAME = re.compile(r"[A-Z_]+")
+
+
+def auto_shape_name(auto_shape):
+    # "RECTANGLE (1)" (tipo do python-pptx) -> "RECTANGLE"; nomes já curtos
+    # ficam como estão
+    return AUTO_SHAPE_NAME.match(str(auto_shape)).group()
+
+
+class Shape:
+    """Um shape de slide.
+
+    Na extração, shape_type e auto_shape guardam os tipos do python-pptx, como
+    gravados no .txt; nos louvores, auto_shape é só o nome ("RECTANGLE") e
+    shape_type fica vazio. height e top só existem nos auto shapes.
+    """
+
+    __slots__ = ("shape_type", "auto_shape", "height", "top", "text")
+
+    def __init__(
+        self, shape_type=None, auto_shape=None, height=None, top=None, text=None
+    ):
+        self.shape_type = shape_type
+        self.auto_shape = auto_shape
+        self.height = height
+        self.top = top
+        self.text = text
+
+    def empty(self):
+        return (
+            self.auto_shape is None
+            and self.height is None
+            and self.top is None
+            and self.text is None
+        )
+
+    def to_dict(self):
+        # formato do .ndjson
+        shape = {}
+        if self.auto_shape is not None:
+            shape["auto_shape"] = auto_shape_name(self.auto_shape)
+            shape["shape"] = "AUTO_SHAPE"
+        if self.height is not None:
+            shape["height"] = self.height
+        if self.top is not None:
+            shape["top"] = self.top
+        if self.text is not None:
+            shape["text"] = self.text
+        return shape
+
+    @classmethod
+    def from_dict(cls, shape):
+        return cls(
+            None,
+            shape.get("auto_shape"),
+            shape.get("height"),
+            shape.get("top"),
+            shape.get("text"),
+        )
+
+
+class Slide:
+    __slots__ = ("slide", "shapes")
+
+    def __init__(self, slide, shapes=None):
+        self.slide = slide
+        self.shapes = shapes if shapes is not None else []
+
+    def to_dict(self):
+        return {"slide": self.slide, "shapes": [s.to_dict() for s in self.shapes]}
+
+    @classmethod
+    def from_dict(cls, slide):
+        return cls(slide["slide"], [Shape.from_dict(s) for s in slide["shapes"]])
+
+
+class Praise:
+    """Um louvor: os slides e, numa lista só, os textos dos shapes na ordem
+    (o que a estruturação do json2sql usa)."""
+
+    __slots__ = ("slides", "texts")
+
+    def __init__(self, slides=None):
+        self.slides = slides if slides is not None else []
+        self.texts = [
+            shape.text
+            for slide in self.slides
+            for shape in slide.shapes
+            if shape.text is not None
+        ]
+
+    def to_dict(self):
+        return {"slides": [slide.to_dict() for slide in self.slides]}
+
+    @classmethod
+    def from_dict(cls, praise):
+        return cls([Slide.from_dict(slide) for slide in praise["slides"]])
@@ -0,0 +1,207 @@
+import argparse
+import glob
+import hashlib
+import logging
+import os
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from txt2json import read_praises
+from json2sql import iter_structure, hino_row, sql_literal, hinos2sql, batches
+from json2sql import migration_path
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+# colunas comparadas entre as duas versões, na ordem de hino_row
+COLUNAS = ("numero", "nome", "texto", "texto_limpo", "texto_estruturado")
+PALAVRA_REGEX = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Texto só com as palavras, sem acentos, pontuação e diferenças de espaço
+    ou caixa."""
+    sem_acentos = "".join(
+        c
+        for c in unicodedata.normalize("NFKD", text or "")
+        if not unicodedata.combining(c)
+    )
+    return " ".join(PALAVRA_REGEX.findall(sem_acentos.upper()))
+
+
+def text_hash(texto_limpo):
+    return hashlib.sha1(normalize(texto_limpo).encode()).hexdigest()
+
+
+def number_or_title(hino):
+    if hino["numero"] != "null":
+        return hino["numero"]
+    return normalize(hino["nome"])
+
+
+def diff_hinos(old, new):
+    """Emparelha os hinos da versão antiga e da nova de uma coletânea.
+
+    Os pares são formados em passadas, da mais para a menos segura: mesmo
+    número (ou título, sem número) e mesmo texto; só o mesmo texto (hino
+    renumerado ou renomeado); só o mesmo número; só o mesmo título. Retorna
+    (pares (antigo, novo), hinos removidos, hinos novos).
+    """
+    keys = [
+        lambda hino: (number_or_title(hino), text_hash(hino["texto_limpo"])),
+        lambda hino: text_hash(hino["texto_limpo"]),
+        lambda hino: hino["numero"] if hino["numero"] != "null" else None,
+        lambda hino: normalize(hino["nome"]) or None,
+    ]
+    old_left = list(range(len(old)))
+    new_left = list(range(len(new)))
+    pairs = []
+    for key in keys:
+        candidates = defaultdict(list)
+        for i in old_left:
+            k = key(old[i])
+            if k is not None:
+                candidates[k].append(i)
+        matched_old = set()
+        unmatched_new = []
+        for j in new_left:
+            same = candidates.get(key(new[j]))
+            if same:
+                i = same.pop(0)
+                matched_old.add(i)
+                pairs.append((i, j))
+            else:
+                unmatched_new.append(j)
+        old_left = [i for i in old_left if i not in matched_old]
+        new_left = unmatched_new
+
+    pairs.sort(key=lambda pair: pair[1])
+    return (
+        [(old[i], new[j]) for i, j in pairs],
+        [old[i] for i in old_left],
+        [new[j] for j in new_left],
+    )
+
+
+def where_hino(hino, coletanea_id, ambiguous):
+    """Condição que localiza o hino antigo no banco: coletânea, número e nome,
+    mais o texto limpo quando número e nome não bastam para distingui-lo."""
+    row = hino_row(hino, coletanea_id)
+    conditions = [
+        f"coletanea_id = {coletanea_id}",
+        f"numero = {sql_literal(row[0])}",
+        f"nome = {sql_literal(row[1])}",
+    ]
+    if (row[0], row[1]) in ambiguous:
+        conditions.append(f"texto_limpo = {sql_literal(row[3])}")
+    return " AND ".join(conditions)
+
+
+def diff2sql(old, new, coletanea_id):
+    """Migração que leva a coletânea da versão antiga para a nova, só com os
+    DELETE, UPDATE e INSERT das diferenças. Retorna (sql, contagens)."""
+    pairs, removed, added = diff_hinos(old, new)
+    changed = [
+        (a, b)
+        for a, b in pairs
+        if hino_row(a, coletanea_id) != hino_row(b, coletanea_id)
+    ]
+
+    # número e nome que aparecem em mais de um hino antigo, ou que um UPDATE
+    # passa a usar, não identificam o hino sozinhos
+    identities = Counter((a["numero"], a["nome"]) for a in old)
+    identities.update(
+        (b["numero"], b["nome"])
+        for a, b in changed
+        if (a["numero"], a["nome"]) != (b["numero"], b["nome"])
+    )
+    ambiguous = {identity for identity, count in identities.items() if count > 1}
+
+    statements = []
+    for hino in removed:
+        statements.append(
+            f"DELETE FROM hino WHERE {where_hino(hino, coletanea_id, ambiguous)};\n"
+        )
+    for a, b in changed:
+        old_row = hino_row(a, coletanea_id)
+        new_row = hino_row(b, coletanea_id)
+        sets = [
+            f"{coluna} = {sql_literal(valor)}"
+            for coluna, antigo, valor in zip(COLUNAS, old_row, new_row)
+            if antigo != valor
+        ]
+        statements.append(
+            "UPDATE hino SET "
+            + ", ".join(sets + ["date_update = CURRENT_TIMESTAMP"])
+            + f" WHERE {where_hino(a, coletanea_id, ambiguous)};\n"
+        )
+    for batch in batches(added):
+        statements.append(hinos2sql(batch, coletanea_id))
+
+    counts = {
+        "unchanged": len(pairs) - len(changed),
+        "updated": len(changed),
+        "deleted": len(removed),
+        "inserted": len(added),
+    }
+    return "".join(statements), counts
+
+
+def next_migration(name):
+    # próximo número livre na pasta das migrações
+    numbers = [
+        int(os.path.basename(path).split("-")[0])
+        for path in glob.glob(migration_path("*.sql*"))
+        if os.path.basename(path).split("-")[0].isdigit()
+    ]
+    return f"{max(numbers, default=0) + 1:03d}-{name}.sql"
+
+
+def revision(old_file, new_file, coletanea_id, name=None):
+    logging.info(f"Comparing {old_file} with {new_file}")
+    old = list(iter_structure(read_praises(old_file)))
+    new = list(iter_structure(read_praises(new_file)))
+    sql, counts = diff2sql(old, new, coletanea_id)
+    logging.info(
+        f"{counts['unchanged']} unchanged, {counts['updated']} updated, "
+        f"{counts['deleted']} deleted, {counts['inserted']} inserted"
+    )
+    if not sql:
+        logging.info("No changes, no migration written")
+        return None
+
+    if name is None:
+        name = next_migration("rev-coletanea-" + str(coletanea_id))
+    with open(migration_path(name), "w", encoding="utf-8") as f:
+        f.write(sql)
+    logging.info(f"Revision migration written to {migration_path(name)}")
+    return name
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Gera a migração com as diferenças entre duas versões de uma "
+        "coletânea (só INSERT, UPDATE e DELETE)"
+    )
+    parser.add_argument("old", help=".ndjson da versão já carregada no banco")
+    parser.add_argument("new", help=".ndjson da versão revisada")
+    parser.add_argument(
+        "coletanea_id", type=int, help="id da coletânea no banco"
+    )
+    parser.add_argument(
+        "--name",
+        help="nome do arquivo da migração (padrão: próximo número, "
+        "rev-coletanea-<id>.sql)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    revision(args.old, args.new, args.coletanea_id, args.name)
+
+
+if __name__ == "__main__":
+    main()
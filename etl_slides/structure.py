@@ -0,0 +1,161 @@
+import argparse
+import gzip
+import json
+import logging
+import re
+import sqlite3
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+CODE = [__file__]
+
+# cabeçalhos de seção: CORO, CORO (2X), FINAL:, INSTRUMENTOS (também em <b>)
+SECAO_REGEX = re.compile(r"^(CORO|FINAL|INSTRUMENTOS)\s*:?\s*(?:\(?(\d+)X\)?)?$")
+VOZ_REGEX = re.compile(r"\s*\((M|H|T|TODOS|SERVAS|VARÕES)\)")
+# voz no fim da linha só logo depois de um parêntese, como em "(Ó DEUS) VARÕES":
+# numa linha comum, TODOS no fim é letra ("BEM-VINDOS SEJAM TODOS")
+VOZ_FINAL_REGEX = re.compile(r"(?<=\))\s+(TODOS|SERVAS|VARÕES)$")
+VEZES_REGEX = re.compile(r"\s*\((\d+)X\)|\s+(\d+)X$")
+NEGRITO_REGEX = re.compile(r"</?b>")
+VOZES = {"M", "H", "T", "TODOS", "SERVAS", "VARÕES"}
+INSTRUCOES = ("REPETIR", "BIS NO FINAL")
+
+
+def parse_line(line):
+    """Texto de uma linha sem as marcas de voz e de repetição, a voz e quantas
+    vezes a linha é cantada."""
+    voz = None
+    match = VOZ_REGEX.search(line) or VOZ_FINAL_REGEX.search(line)
+    if match:
+        voz = match.group(1)
+        line = (line[: match.start()] + line[match.end() :]).strip()
+    vezes = 1
+    match = VEZES_REGEX.search(line)
+    if match:
+        vezes = int(match.group(1) or match.group(2))
+        line = (line[: match.start()] + line[match.end() :]).strip()
+    return line, voz, vezes
+
+
+def parse_texto(texto):
+    """Estrofes de um hino, a partir do texto completo (como em hino.texto).
+
+    Cada estrofe é um dicionário com as linhas e, só quando diferentes do
+    padrão, o tipo ("coro", "final", "instrumentos" ou "instrucao"; o padrão é
+    "estrofe"), quantas vezes é cantada ("vezes"), se tem BIS ("bis") e, em
+    cada linha, a voz ((M), (H), (TODOS), (SERVAS)...) e as repetições.
+    """
+    estrofes = []
+    atual = None
+    voz = None
+
+    def fecha():
+        nonlocal atual, voz
+        if atual is not None and (atual["linhas"] or atual.get("tipo")):
+            estrofes.append(atual)
+        atual = None
+        voz = None
+
+    for line in texto.split("\n"):
+        line = NEGRITO_REGEX.sub("", line).strip().upper()
+        if not line:
+            fecha()
+            continue
+
+        secao = SECAO_REGEX.match(line)
+        if secao:
+            fecha()
+            atual = {"tipo": secao.group(1).lower(), "linhas": []}
+            if secao.group(2):
+                atual["vezes"] = int(secao.group(2))
+            continue
+        if line.startswith(INSTRUCOES):
+            fecha()
+            estrofes.append({"tipo": "instrucao", "texto": line})
+            continue
+
+        if atual is None:
+            atual = {"linhas": []}
+        if line in ("BIS", "(BIS)"):
+            atual["bis"] = True
+            continue
+        if line.strip("()") in VOZES:
+            # marca de voz sozinha: vale para as linhas seguintes da estrofe
+            voz = line.strip("()")
+            continue
+        match = re.fullmatch(r"\(?(\d+)X\)?", line)
+        if match:
+            atual["vezes"] = int(match.group(1))
+            continue
+
+        texto_linha, voz_linha, vezes = parse_line(line)
+        linha = {"texto": texto_linha}
+        if voz_linha or voz:
+            linha["voz"] = voz_linha or voz
+        if vezes != 1:
+            linha["vezes"] = vezes
+        atual["linhas"].append(linha)
+    fecha()
+
+    for estrofe in estrofes:
+        if not estrofe.get("linhas") and "linhas" in estrofe:
+            # seções sem texto (INSTRUMENTOS) não precisam da lista vazia
+            del estrofe["linhas"]
+    return estrofes
+
+
+def texto_estruturado(texto):
+    """Estrutura do hino em JSON compacto, para a coluna texto_estruturado
+    (None para hinos sem texto)."""
+    estrofes = parse_texto(texto or "")
+    if not estrofes:
+        return None
+    return json.dumps(
+        {"estrofes": estrofes}, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def backfill_sql(db):
+    """UPDATEs por id preenchendo texto_estruturado dos hinos já no banco
+    (o texto no banco guarda as quebras de linha como \\n literal)."""
+    conn = sqlite3.connect(db)
+    rows = conn.execute("SELECT id, texto FROM hino ORDER BY id").fetchall()
+    conn.close()
+    for id_hino, texto in rows:
+        estruturado = texto_estruturado((texto or "").replace("\\n", "\n"))
+        if estruturado is not None:
+            yield (
+                "UPDATE hino SET texto_estruturado = '"
+                + estruturado.replace("'", "''")
+                + f"' WHERE id = {id_hino};\n"
+            )
+
+
+def backfill(db, migration):
+    # sem data no cabeçalho gzip, como nas migrações do json2sql
+    sql = "".join(backfill_sql(db))
+    with open(migration, "wb") as f:
+        f.write(gzip.compress(sql.encode("utf-8"), mtime=0))
+    logging.info(f"Backfill of texto_estruturado written to {migration}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Gera a migração que preenche hino.texto_estruturado dos "
+        "hinos já carregados"
+    )
+    parser.add_argument("db", help="banco montado com as migrações atuais")
+    parser.add_argument("migration", help="arquivo .sql.gz da migração")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    backfill(args.db, args.migration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import argparse
+import io
+import logging
+import random
+import zipfile
+from xml.sax.saxutils import escape
+from pptx import Presentation
+from pptx.oxml.ns import qn
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+# O python-pptx leva tempo quadrático para adicionar slides (cada slide novo
+# percorre as relações da apresentação), o que inviabiliza decks de dezenas de
+# milhares de slides. Aqui o python-pptx só fornece o pacote base (mestre,
+# layouts, tema) e o XML dos slides é escrito direto no zip.
+
+NS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+SLIDE_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+)
+LAYOUT_BRANCO = "slideLayout7.xml"
+LAYOUT_TITULO = "slideLayout6.xml"
+
+# posições e tamanhos (EMU) dos shapes das coletâneas reais
+LARGURA = 12192000
+ALTURA = 6858000
+TITULO = (0, 400249, LARGURA, 581728)
+CORPO_TOP = 1959880
+CORPO_HEIGHT = 3138423
+CHAVE = (10515600, 1808821, 228600, 2736304)
+BIS = (10744200, 2808821, 914400, 601662)
+INDICE = (11277600, 6172200, 914400, 369332)
+
+PALAVRAS = (
+    "SENHOR JESUS GLÓRIA LOUVOR AMOR PAZ CÉU CRUZ SANGUE PODER VIDA LUZ "
+    "GRAÇA FÉ ESPÍRITO SANTO REI SALVADOR CORAÇÃO ALMA CAMINHO VERDADE "
+    "DEUS PAI FILHO NOME ALTAR POVO TERRA MAR VENCER CANTAR ADORAR ETERNO"
+).split()
+MARCAS = ["", "", "", "(M) ", "(H) ", "(TODOS) ", "(SERVAS) "]
+
+# graphicData dos graphicFrames: tabela, gráfico e SmartArt (sem shape_type)
+GRAPHIC_URIS = (
+    "http://schemas.openxmlformats.org/drawingml/2006/table",
+    "http://schemas.openxmlformats.org/drawingml/2006/chart",
+    "http://schemas.openxmlformats.org/drawingml/2006/diagram",
+)
+
+# PNG 1x1 mínimo, para os slides com imagem
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d00000000"
+    "49454e44ae426082"
+)
+
+
+def verso(rnd):
+    return " ".join(rnd.choice(PALAVRAS) for _ in range(rnd.randint(4, 8))) + ","
+
+
+def estrofe(rnd, coro=False):
+    linhas = [rnd.choice(MARCAS) + verso(rnd) for _ in range(rnd.randint(3, 5))]
+    if rnd.random() < 0.2:
+        linhas[-1] += " (2X)"
+    if coro:
+        linhas.insert(0, "CORO (2X)" if rnd.random() < 0.3 else "CORO")
+    return "\n".join(linhas)
+
+
+def xml_text(text):
+    paragraphs = "".join(
+        f"<a:p><a:r><a:t>{escape(line)}</a:t></a:r></a:p>" if line else "<a:p/>"
+        for line in text.split("\n")
+    )
+    return f"<p:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</p:txBody>"
+
+
+def xml_xfrm(x, y, cx, cy):
+    return f'<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+
+
+def xml_shape(shape_id, prst, position, text=None):
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Shape {shape_id}"/>'
+        "<p:cNvSpPr/><p:nvPr/></p:nvSpPr>"
+        f'<p:spPr>{xml_xfrm(*position)}<a:prstGeom prst="{prst}"><a:avLst/>'
+        "</a:prstGeom></p:spPr>"
+        + (xml_text(text) if text is not None else "")
+        + "</p:sp>"
+    )
+
+
+def xml_textbox(shape_id, position, text):
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id}"/>'
+        '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr>{xml_xfrm(*position)}<a:prstGeom prst="rect"><a:avLst/>'
+        "</a:prstGeom></p:spPr>" + xml_text(text) + "</p:sp>"
+    )
+
+
+def xml_title(shape_id):
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Title {shape_id}"/>'
+        '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+        '<p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr><p:spPr/>'
+        + xml_text("")
+        + "</p:sp>"
+    )
+
+
+def xml_picture(shape_id):
+    return (
+        f'<p:pic><p:nvPicPr><p:cNvPr id="{shape_id}" name="Picture {shape_id}"/>'
+        '<p:cNvPicPr/><p:nvPr/></p:nvPicPr><p:blipFill><a:blip r:embed="rId2"/>'
+        "<a:stretch><a:fillRect/></a:stretch></p:blipFill>"
+        f'<p:spPr>{xml_xfrm(0, 0, 9525, 9525)}<a:prstGeom prst="rect"><a:avLst/>'
+        "</a:prstGeom></p:spPr></p:pic>"
+    )
+
+
+def slide_xml(shapes):
+    return (
+        "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+        f"<p:sld {NS}><p:cSld><p:spTree><p:nvGrpSpPr>"
+        '<p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        "<p:grpSpPr/>" + "".join(shapes) + "</p:spTree></p:cSld>"
+        "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+    )
+
+
+def slide_rels(layout, picture):
+    rels = [
+        f'<Relationship Id="rId1" Type="{REL}/slideLayout" '
+        f'Target="../slideLayouts/{layout}"/>'
+    ]
+    if picture:
+        rels.append(
+            f'<Relationship Id="rId2" Type="{REL}/image" '
+            'Target="../media/image1.png"/>'
+        )
+    return (
+        "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships">' + "".join(rels) + "</Relationships>"
+    )
+
+
+def praise_slides(rnd, numero, slides):
+    """Gera (layout, tem imagem, shapes) dos slides de um louvor: título no
+    primeiro, estrofes e coro no corpo, marcação de BIS com chave e o
+    "Índice" no último."""
+    titulo = " ".join(rnd.choice(PALAVRAS) for _ in range(rnd.randint(2, 5)))
+    for k in range(slides):
+        shapes = []
+        layout = LAYOUT_BRANCO
+        # alguns slides reais vêm de layouts com placeholder de título
+        if rnd.random() < 0.03:
+            layout = LAYOUT_TITULO
+            shapes.append(xml_title(len(shapes) + 2))
+        if k == 0:
+            shapes.append(
+                xml_shape(len(shapes) + 2, "rect", TITULO, f"{numero:02d} – {titulo}")
+            )
+        corpo = (
+            0,
+            CORPO_TOP + rnd.randint(-600000, 0),
+            LARGURA,
+            CORPO_HEIGHT + rnd.randint(0, 600000),
+        )
+        shapes.append(
+            xml_shape(len(shapes) + 2, "rect", corpo, estrofe(rnd, coro=k % 2 == 1))
+        )
+        if rnd.random() < 0.1:
+            shapes.append(xml_shape(len(shapes) + 2, "rightBrace", CHAVE))
+            shapes.append(xml_shape(len(shapes) + 2, "rect", BIS, "BIS"))
+        picture = rnd.random() < 0.02
+        if picture:
+            shapes.append(xml_picture(len(shapes) + 2))
+        if k == slides - 1:
+            shapes.append(xml_textbox(len(shapes) + 2, INDICE, "Índice"))
+        yield layout, picture, shapes
+
+
+def base_package():
+    """Pacote .pptx vazio do python-pptx, em 16:9 como as coletâneas."""
+    prs = Presentation()
+    prs.slide_width = LARGURA
+    prs.slide_height = ALTURA
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return zipfile.ZipFile(buffer)
+
+
+def make_deck(path, slides, seed=0):
+    """Gera uma apresentação com `slides` slides, parecida com as coletâneas."""
+    rnd = random.Random(seed)
+    base = base_package()
+
+    sld_ids = []
+    rels = []
+    overrides = []
+    numero = 1
+    total = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        while total < slides:
+            count = min(rnd.randint(2, 6), slides - total)
+            for layout, picture, shapes in praise_slides(rnd, numero, count):
+                total += 1
+                name = f"slide{total}.xml"
+                z.writestr(f"ppt/slides/{name}", slide_xml(shapes))
+                z.writestr(
+                    f"ppt/slides/_rels/{name}.rels", slide_rels(layout, picture)
+                )
+                rid = f"rIdS{total}"
+                sld_ids.append(f'<p:sldId id="{255 + total}" r:id="{rid}"/>')
+                rels.append(
+                    f'<Relationship Id="{rid}" Type="{REL}/slide" '
+                    f'Target="slides/{name}"/>'
+                )
+                overrides.append(
+                    f'<Override PartName="/ppt/slides/{name}" '
+                    f'ContentType="{SLIDE_CONTENT_TYPE}"/>'
+                )
+            numero += 1
+
+        z.writestr("ppt/media/image1.png", PNG)
+        for item in base.infolist():
+            data = base.read(item.filename)
+            if item.filename == "ppt/presentation.xml":
+                data = data.replace(
+                    b"</p:sldMasterIdLst>",
+                    b"</p:sldMasterIdLst><p:sldIdLst>"
+                    + "".join(sld_ids).encode()
+                    + b"</p:sldIdLst>",
+                )
+            elif item.filename == "ppt/_rels/presentation.xml.rels":
+                data = data.replace(
+                    b"</Relationships>", "".join(rels).encode() + b"</Relationships>"
+                )
+            elif item.filename == "[Content_Types].xml":
+                data = data.replace(
+                    b"<Default ",
+                    b'<Default Extension="png" ContentType="image/png"/><Default ',
+                    1,
+                ).replace(b"</Types>", "".join(overrides).encode() + b"</Types>")
+            z.writestr(item, data)
+
+    logging.info(f"Synthetic deck {path}: {slides} slides, {numero - 1} praises")
+    return path
+
+
+def make_frames_deck(path):
+    """Apresentação de um slide com um graphicFrame de cada tipo, com e sem
+    placeholder (p:ph), para comparar a classificação dos dois extratores."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for placeholder in (False, True):
+        for uri in GRAPHIC_URIS:
+            frame = slide.shapes.add_table(1, 1, 0, 0, 9525, 9525)._element
+            frame.find(qn("a:graphic")).find(qn("a:graphicData")).set("uri", uri)
+            if placeholder:
+                nv_pr = frame.find(qn("p:nvGraphicFramePr")).find(qn("p:nvPr"))
+                nv_pr.append(nv_pr.makeelement(qn("p:ph"), {"idx": str(len(nv_pr))}))
+    prs.save(path)
+    return path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Gera apresentações sintéticas para os benchmarks do ETL"
+    )
+    parser.add_argument("path", help="arquivo .pptx de saída")
+    parser.add_argument("slides", type=int, help="número de slides")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    make_deck(args.path, args.slides, args.seed)
+
+
+if __name__ == "__main__":
+    main()
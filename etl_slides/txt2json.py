@@ -2,86 +2,174 @@ import logging
 import glob
 import re
 import json
+import records
+from itertools import islice
 from tqdm import tqdm
+from metrics import track
+from manifest import CHECKPOINT_EVERY
+from records import Praise, Slide, Shape, auto_shape_name
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 
-
-def txt2json():
+CODE = [__file__, records.__file__]
+
+
+AUTO_SHAPE_PATTERN = r"_AUTO_SHAPE_([A-Z_]+)"
+
+
+def json_path(file_txt):
+    return "slides_json\\" + file_txt.split("\\")[1] + ".ndjson"
+
+
+def shape_struct(shape):
+    """Shape do louvor a partir de um registro do pptx2txt: o mesmo que o
+    txt2json obtém ao ler o texto desse shape."""
+    shape_struc = Shape()
+    if shape.auto_shape is not None:
+        shape_struc.auto_shape = auto_shape_name(shape.auto_shape)
+        shape_struc.height = int(shape.height)
+        shape_struc.top = int(shape.top)
+    if shape.text is not None:
+        shape_struc.text = shape.text.strip()
+    return shape_struc
+
+
+def iter_praises(slides):
+    """Agrupa os slides (índice, shapes) em louvores, sem passar pelo .txt.
+
+    Cada slide com "Índice" fecha um louvor, como o marcador __END__ do
+    pptx2txt; o que sobra depois do último índice também vira um louvor.
+    """
+    praise_slides = []
+    for i, shapes in slides:
+        slide_struc = Slide(str(i))
+        for shape in shapes:
+            shape_struc = shape_struct(shape)
+            if not shape_struc.empty():
+                slide_struc.shapes.append(shape_struc)
+        praise_slides.append(slide_struc)
+
+        for shape in shapes:
+            if shape.text is not None and shape.text.lower() == "índice":
+                yield Praise(praise_slides)
+                praise_slides = []
+    yield Praise(praise_slides)
+
+
+def parse_txt(lines):
+    """Lê o texto do pptx2txt linha a linha e gera os louvores, numa passada só.
+
+    O estado é o louvor, o slide e o shape correntes; o texto de um shape é
+    acumulado entre START_TEXT e END_TEXT. Como no pptx2txt, cada __END__ fecha
+    um louvor e o que vem depois do último também é um louvor.
+    """
+    praise_slides = []
+    slide_struc = None
+    shape_struc = None
+    text_lines = None
+
+    for line in lines:
+        line = line.rstrip("\n")
+
+        if text_lines is not None:
+            if line == "END_TEXT":
+                if text_lines:
+                    shape_struc.text = "\n".join(text_lines).strip()
+                text_lines = None
+            else:
+                text_lines.append(line)
+        elif line.startswith("SHAPE_"):
+            if shape_struc is not None and not shape_struc.empty():
+                slide_struc.shapes.append(shape_struc)
+            shape_struc = Shape()
+            match = re.search(AUTO_SHAPE_PATTERN, line)
+            if match:
+                shape_struc.auto_shape = match.group(1)
+        elif line.startswith("HEIGHT_"):
+            shape_struc.height = int(line[7:])
+        elif line.startswith("TOP_"):
+            shape_struc.top = int(line[4:])
+        elif line == "START_TEXT":
+            text_lines = []
+        elif line.startswith("SLIDE_"):
+            if shape_struc is not None and not shape_struc.empty():
+                slide_struc.shapes.append(shape_struc)
+            shape_struc = None
+            slide_struc = Slide(line[6:].strip())
+            praise_slides.append(slide_struc)
+        elif line == "__END__":
+            if shape_struc is not None and not shape_struc.empty():
+                slide_struc.shapes.append(shape_struc)
+            shape_struc = None
+            yield Praise(praise_slides)
+            praise_slides = []
+
+    if shape_struc is not None and not shape_struc.empty():
+        slide_struc.shapes.append(shape_struc)
+    yield Praise(praise_slides)
+
+
+def praise2line(praise):
+    return json.dumps(praise.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def write_praises(praises, new_file, mode="w", checkpoint=None):
+    """Repassa os louvores adiante, gravando em new_file um louvor por linha
+    (NDJSON), à medida que são gerados. checkpoint(louvores, bytes) é chamado
+    a cada CHECKPOINT_EVERY louvores, com a saída já em disco."""
+    with open(new_file, mode, encoding="utf-8") as f:
+        for count, praise in enumerate(praises, 1):
+            f.write(praise2line(praise))
+            if checkpoint is not None and count % CHECKPOINT_EVERY == 0:
+                f.flush()
+                checkpoint(count, f.tell())
+            yield praise
+
+
+def read_praises(file_json):
+    """Lê os louvores de um .ndjson um a um, sem carregar o arquivo inteiro."""
+    with open(file_json, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield Praise.from_dict(json.loads(line))
+
+
+def txt2json(manifest=None, metrics=None):
     logging.info("Starting txt2json conversion...")
     files_txt = glob.glob("slides_txt\\*.txt")
     logging.info(f"Files found: {files_txt}")
 
-    auto_shape_pattern = r"_AUTO_SHAPE_([A-Z_]+)"
-
     for file_txt in files_txt:
-        logging.info(f"Processing file: {file_txt}")
-        praises = []
-        with open(file_txt, "r", encoding="utf-8") as f:
-            text = f.read()
-
-        for praise in tqdm(
-            text.split("__END__"), desc="Processing praises", unit="praise"
+        new_file = json_path(file_txt)
+        if manifest is not None and manifest.is_current(
+            "txt2json", file_txt, new_file, code=CODE
         ):
-            praise_struc = {}
-            praise_struc["slides"] = []
-
-            for slide in praise.split("SLIDE_"):
-                slide_struc = {}
-                slide_num = slide.split("\n")[0].strip()
-                if not slide_num:
-                    continue
-
-                slide_struc["slide"] = slide_num
-                slide_struc["shapes"] = []
-
-                for shape in slide.split("\nSHAPE_"):
-                    record_line = False
-                    text_inside = ""
-                    shapes_struc = {}
-
-                    for line in shape.split("\n"):
-                        if "SHAPE_" in line:
-                            match = re.search(auto_shape_pattern, line)
-                            auto_shape = match.group(1)
-
-                            shapes_struc["auto_shape"] = auto_shape
-                            shapes_struc["shape"] = "AUTO_SHAPE"
-
-                        if "HEIGHT_" in line:
-                            height = line.split("_")[1]
-                            shapes_struc["height"] = int(height)
-                        if "TOP_" in line:
-                            top = line.split("_")[1]
-                            shapes_struc["top"] = int(top)
-
-                        if "END_TEXT" in line:
-                            record_line = False
-
-                        if record_line:
-                            text_inside += line + "\n"
-                        else:
-                            if text_inside:
-                                shapes_struc["text"] = text_inside.strip()
-
-                        if "START_TEXT" in line:
-                            text_inside = ""
-                            record_line = True
-
-                    if shapes_struc:
-                        slide_struc["shapes"].append(shapes_struc)
-
-                praise_struc["slides"].append(slide_struc)
-
-            # pegar nome/numero do hino antes de salvar
-            praises.append(praise_struc)
-
-        new_file = "slides_json\\" + file_txt.split("\\")[1] + ".json"
-        with open(new_file, "w", encoding="utf-8") as f:
-            f.write(json.dumps(praises, ensure_ascii=False, indent=4))
+            continue
+
+        logging.info(f"Processing file: {file_txt}")
+        done = 0
+        checkpoint = None
+        if manifest is not None:
+            done = manifest.resume("txt2json", file_txt, new_file, code=CODE)
+            checkpoint = manifest.checkpointer("txt2json", file_txt, done, code=CODE)
+
+        with track(metrics, "txt2json", file_txt, new_file) as entry:
+            with open(file_txt, "r", encoding="utf-8") as f:
+                praises = write_praises(
+                    islice(parse_txt(f), done, None),
+                    new_file,
+                    "a" if done else "w",
+                    checkpoint,
+                )
+                for praise in tqdm(praises, desc="Processing praises", unit="praise"):
+                    entry["records_in"] += len(praise.slides)
+                    entry["records_out"] += 1
+
+        if manifest is not None:
+            manifest.record("txt2json", file_txt, new_file, code=CODE)
 
 
 def main():